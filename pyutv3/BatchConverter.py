@@ -0,0 +1,233 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from logging import Logger
+from logging import INFO
+from logging import WARNING
+from logging import basicConfig
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from os import cpu_count
+from os import makedirs
+from os import path as osPath
+from os import walk
+
+from time import perf_counter
+
+from click import IntRange
+from click import Path
+from click import argument
+from click import command
+from click import echo
+from click import option
+
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+from pyutv3.persistence.ConversionManifest import ConversionManifest
+from pyutv3.persistence.ProjectConverter import ConversionResult
+from pyutv3.persistence.ProjectConverter import convertProject
+
+PROJECT_SUFFIXES: Tuple[str, ...] = ('.put', '.xml')
+
+# (project file, its output directory, the name of its diagrams)
+ConversionJob = Tuple[str, str, str]
+
+
+@dataclass
+class BatchStatistics:
+    """
+    The counts for one batch;  Bytes and classes only count converted projects
+    """
+    converted:  int = 0
+    skipped:    int = 0
+    failed:     int = 0
+    classes:    int = 0
+    inputBytes: int = 0
+
+    def add(self, result: ConversionResult):
+        if result.succeeded is True:
+            self.converted  += 1
+            self.classes    += result.classCount
+            self.inputBytes += result.inputBytes
+        else:
+            self.failed += 1
+
+    def report(self, elapsedSeconds: float) -> str:
+
+        megabytes: float = self.inputBytes / (1024 * 1024)
+        seconds:   float = max(elapsedSeconds, 1e-9)
+
+        return (
+            f'Converted {self.converted}, skipped {self.skipped}, failed {self.failed} in {elapsedSeconds:.2f}s\n'
+            f'{self.converted / seconds:.1f} files/s  {self.classes / seconds:.1f} classes/s  {megabytes / seconds:.2f} MB/s ({megabytes:.2f} MB read)'
+        )
+
+
+class BatchConverter:
+    """
+    Converts Pyut projects to json diagrams on a process pool.  Each project is converted
+    by a single worker (see `ProjectConverter`), so a batch scales with the number of
+    projects, not their size.  Projects whose diagrams are up to date according to the
+    output directory's `ConversionManifest` are skipped.
+
+    Diagrams are named after their project's file name, suffix included.  When two projects
+    would still write the same diagrams, for instance same named files from different input
+    directories, the later one is numbered: `Diagram (2).put.json`
+    """
+    def __init__(self, outputDirectory: str, maxWorkers: int, schemaVersion: int = SCHEMA_VERSION_COMPACT, force: bool = False):
+        """
+        Args:
+            outputDirectory:    Where the diagrams are written;  Directory inputs are mirrored below it
+            maxWorkers:         The number of worker processes
+            schemaVersion:      The json schema to write
+            force:              Convert projects that are up to date
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputDirectory: str                = osPath.abspath(outputDirectory)
+        self._maxWorkers:      int                = maxWorkers
+        self._schemaVersion:   int                = schemaVersion
+        self._force:           bool               = force
+        self._manifest:        ConversionManifest = ConversionManifest(outputDirectory=self._outputDirectory)
+
+    def convert(self, inputPaths: List[str]) -> BatchStatistics:
+        """
+        Args:
+            inputPaths: Project files and directories to search for them
+
+        Returns:  What was done
+        """
+        statistics: BatchStatistics     = BatchStatistics()
+        jobs:       List[ConversionJob] = []
+        for job in self.findJobs(inputPaths):
+            if self._force is False and self._manifest.isUpToDate(job[0], schemaVersion=self._schemaVersion):
+                statistics.skipped += 1
+            else:
+                jobs.append(job)
+
+        try:
+            if len(jobs) > 0:
+                with ProcessPoolExecutor(max_workers=self._maxWorkers) as executor:
+                    futures: Dict[Future, str] = {
+                        executor.submit(convertProject, fqFileName, outputDirectory, outputName, self._schemaVersion): fqFileName
+                        for fqFileName, outputDirectory, outputName in jobs
+                    }
+                    for future in as_completed(futures):
+                        result: ConversionResult = self._result(future=future, fqFileName=futures[future])
+                        statistics.add(result)
+                        if result.record is not None:
+                            self._manifest.update(fqFileName=result.fqFileName, record=result.record)
+                        else:
+                            echo(f'Failed: {result.fqFileName}: {result.errorMessage}', err=True)
+        finally:
+            # Keep what was converted, even when the batch is interrupted
+            self._manifest.save()
+
+        return statistics
+
+    def findJobs(self, inputPaths: List[str]) -> List[ConversionJob]:
+        """
+        Creates the output directories as a side effect
+
+        Args:
+            inputPaths: Project files and directories to search for them
+
+        Returns:  Each project with its output directory and the name of its diagrams
+        """
+        jobs:        List[ConversionJob] = []
+        outputNames: Dict[str, Set[str]] = {}
+        for inputPath in inputPaths:
+            fqInputPath: str = osPath.abspath(inputPath)
+            if osPath.isdir(fqInputPath):
+                for directory, directoryNames, fileNames in walk(fqInputPath):
+                    directoryNames.sort()
+                    outputDirectory: str = osPath.normpath(osPath.join(self._outputDirectory, osPath.relpath(directory, fqInputPath)))
+                    projectNames: List[str] = sorted(fileName for fileName in fileNames if fileName.lower().endswith(PROJECT_SUFFIXES))
+                    if len(projectNames) > 0:
+                        makedirs(outputDirectory, exist_ok=True)
+                    jobs.extend(
+                        (osPath.join(directory, fileName), outputDirectory, self._outputName(fileName=fileName, usedNames=outputNames.setdefault(outputDirectory, set())))
+                        for fileName in projectNames
+                    )
+            else:
+                makedirs(self._outputDirectory, exist_ok=True)
+                fileName: str = osPath.basename(fqInputPath)
+                jobs.append((fqInputPath, self._outputDirectory, self._outputName(fileName=fileName, usedNames=outputNames.setdefault(self._outputDirectory, set()))))
+
+        return jobs
+
+    def _result(self, future: Future, fqFileName: str) -> ConversionResult:
+        """
+        The converter reports its failures;  This covers a worker that could not return one,
+        for instance because it died or its result could not be pickled
+
+        Args:
+            future:     A completed conversion
+            fqFileName: Its project
+
+        Returns:  The outcome
+        """
+        try:
+            return future.result()
+        except Exception as e:
+            self.logger.exception(f'Could not convert {fqFileName}')
+            return ConversionResult(fqFileName=fqFileName, errorMessage=f'{type(e).__name__}: {e}')
+
+    def _outputName(self, fileName: str, usedNames: Set[str]) -> str:
+        """
+        Args:
+            fileName:   The project's file name
+            usedNames:  The names already given in the same output directory;  Updated
+
+        Returns:  A name no other project in the directory writes its diagrams under
+        """
+        baseName, suffix = osPath.splitext(fileName)
+
+        outputName: str = fileName
+        number:     int = 1
+        # Compared without case, for case insensitive file systems;  The names keep the project suffix, so a document number never makes two alike
+        while outputName.lower() in usedNames:
+            number += 1
+            outputName = f'{baseName} ({number}){suffix}'
+
+        usedNames.add(outputName.lower())
+
+        return outputName
+
+
+@command()
+@argument('inputs', nargs=-1, required=True, type=Path(exists=True))
+@option('-o', '--output-directory', required=True, type=Path(file_okay=False), help='Where to write the json diagrams.')
+@option('-w', '--workers', type=IntRange(min=1), default=None, help='The number of worker processes;  Defaults to the number of cores.')
+@option('-s', '--schema-version', type=IntRange(min=SCHEMA_VERSION_LEGACY, max=SCHEMA_VERSION_COMPACT), default=SCHEMA_VERSION_COMPACT,
+        help='The json schema to write.')
+@option('-f', '--force', is_flag=True, help='Convert projects whose diagrams are up to date.')
+@option('-v', '--verbose', is_flag=True, help='Log each conversion.')
+def batchConverter(inputs: Tuple[str, ...], output_directory: str, workers: Optional[int], schema_version: int, force: bool, verbose: bool):
+    """
+    Convert Pyut .put and .xml projects to json diagrams without starting the user interface
+    """
+    basicConfig(level=INFO if verbose is True else WARNING)
+
+    startTime: float          = perf_counter()
+    converter: BatchConverter = BatchConverter(outputDirectory=output_directory, maxWorkers=workers or cpu_count() or 1, schemaVersion=schema_version, force=force)
+
+    statistics: BatchStatistics = converter.convert(list(inputs))
+
+    echo(statistics.report(elapsedSeconds=perf_counter() - startTime))
+    if statistics.failed > 0:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+
+    batchConverter()
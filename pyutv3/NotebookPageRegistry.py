@@ -0,0 +1,124 @@
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TypeVar
+
+from logging import Logger
+from logging import getLogger
+
+Page = TypeVar('Page')
+
+
+class NotebookPageRegistry(Generic[Page]):
+    """
+    Mirrors the pages of a notebook so that finding a page's index, or the page for a tree
+    item, does not ask the notebook for each of its pages.  Every page insert and delete
+    must go through here as well as through the notebook;  Then the indexes match.
+
+    Pages are tracked by `id()`.  A page may also be filed under a key,  for example the
+    document a project tree item stands for
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._pages:       List[Page]           = []
+        self._pageIndexes: Dict[int, int]       = {}
+        self._keyedPages:  Dict[Hashable, Page] = {}
+        self._pageKeys:    Dict[int, Hashable]  = {}
+
+    def __len__(self) -> int:
+        return len(self._pages)
+
+    def __contains__(self, page) -> bool:
+        return id(page) in self._pageIndexes
+
+    def __iter__(self) -> Iterator[Page]:
+        return iter(self._pages)
+
+    def append(self, page: Page, key: Optional[Hashable] = None) -> int:
+        """
+        After `Notebook.AddPage()`
+
+        Args:
+            page:   The new page
+            key:    What else finds the page;  Optional
+
+        Returns:  The page's index
+        """
+        return self.insert(index=len(self._pages), page=page, key=key)
+
+    def insert(self, index: int, page: Page, key: Optional[Hashable] = None) -> int:
+        """
+        After `Notebook.InsertPage()`;  The pages after it move up one
+
+        Args:
+            index:  Where the page was inserted
+            page:   The new page
+            key:    What else finds the page;  Optional
+
+        Returns:  The page's index
+        """
+        assert page not in self, 'The page is already in the notebook'
+
+        self._pages.insert(index, page)
+        self._reindexFrom(index)
+
+        if key is not None:
+            self._keyedPages[key]    = page
+            self._pageKeys[id(page)] = key
+
+        return index
+
+    def remove(self, page: Page) -> Optional[int]:
+        """
+        Before `Notebook.DeletePage()` or `Notebook.RemovePage()`;  The pages after it move down one
+
+        Args:
+            page:   The page to forget
+
+        Returns:  The index to delete;  None if the page is not in the notebook
+        """
+        index: Optional[int] = self._pageIndexes.pop(id(page), None)
+        if index is None:
+            return None
+
+        del self._pages[index]
+        self._reindexFrom(index)
+
+        key: Optional[Hashable] = self._pageKeys.pop(id(page), None)
+        if key is not None:
+            del self._keyedPages[key]
+
+        return index
+
+    def pageIndex(self, page: Page) -> Optional[int]:
+        """
+        Args:
+            page:   A page
+
+        Returns:  Its index in the notebook;  None if it is not there
+        """
+        return self._pageIndexes.get(id(page))
+
+    def page(self, key: Hashable) -> Optional[Page]:
+        """
+        Args:
+            key:    The key the page was added with
+
+        Returns:  The page;  None if there is no page for the key
+        """
+        return self._keyedPages.get(key)
+
+    def pageAt(self, index: int) -> Page:
+        return self._pages[index]
+
+    def _reindexFrom(self, index: int):
+        """
+        Python dictionary updates;  No notebook calls
+        """
+        for pageIndex in range(index, len(self._pages)):
+            self._pageIndexes[id(self._pages[pageIndex])] = pageIndex
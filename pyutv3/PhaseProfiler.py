@@ -0,0 +1,152 @@
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+from contextlib import nullcontext
+
+from os import environ
+from os import getpid
+
+from threading import get_ident
+
+from time import perf_counter_ns
+
+import json
+
+#
+# '1' logs the phases;  Anything else is also the name of the trace file to write
+#
+PROFILE_ENVIRONMENT_VARIABLE: str = 'PYUTV3_PROFILE'
+
+TRACE_EVENTS_KEY: str = 'traceEvents'
+
+# One Chrome trace event;  See the Trace Event Format document
+TraceEvent = Dict[str, Any]
+
+_NO_PHASE: ContextManager = nullcontext()
+
+
+class PhaseProfiler:
+    """
+    Measures the start up and file open phases.  Each phase is logged when the profile
+    is reported and, given a trace file name, written in the Chrome trace format;  Load
+    the file in chrome://tracing or https://ui.perfetto.dev.
+
+    There is a single profiler per process (see `instance()`).  It is off unless enabled
+    by `enable()` or the `PYUTV3_PROFILE` environment variable.  When off `phase()` returns a
+    shared do nothing context manager,  so leaving the phases in place costs one attribute test.
+    Code in loops tests `enabled` once and only reads the clock when it is set
+    """
+    _instance: Optional['PhaseProfiler'] = None
+
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._enabled:       bool             = False
+        self._traceFileName: Optional[str]    = None
+        self._originNs:      int              = perf_counter_ns()
+        self._events:        List[TraceEvent] = []
+        self._reportedCount: int              = 0
+
+        self._enableFromEnvironment()
+
+    @classmethod
+    def instance(cls) -> 'PhaseProfiler':
+
+        if cls._instance is None:
+            cls._instance = PhaseProfiler()
+
+        return cls._instance
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self, traceFileName: Optional[str] = None):
+        """
+        Args:
+            traceFileName:  Where `report()` writes the Chrome trace;  None only logs the phases
+        """
+        self._enabled       = True
+        self._traceFileName = traceFileName
+
+    def phase(self, name: str) -> ContextManager:
+        """
+        Usage:  `with PhaseProfiler.instance().phase('setUpLogging'):`
+
+        Args:
+            name:   The phase name
+
+        Returns:  A context manager that times its block
+        """
+        if self._enabled is False:
+            return _NO_PHASE
+
+        return self._timedPhase(name)
+
+    def addPhase(self, name: str, startNs: int, durationNs: int):
+        """
+        Record a phase measured by the caller;  For work interleaved with other work,
+        like decompressing and parsing a streamed file
+
+        Args:
+            name:       The phase name
+            startNs:    `perf_counter_ns()` when it started
+            durationNs: How long it took in total
+        """
+        if self._enabled is False:
+            return
+
+        self._events.append({
+            'name': name,
+            'cat':  'pyutv3',
+            'ph':   'X',
+            'ts':   (startNs - self._originNs) / 1000,
+            'dur':  durationNs / 1000,
+            'pid':  getpid(),
+            'tid':  get_ident(),
+        })
+
+    def report(self):
+        """
+        Log the phases recorded since the last report and write the trace file, with
+        every phase, if there is one;  Reporting after start up and again at exit
+        gives start up numbers without having to quit
+        """
+        if self._enabled is False:
+            return
+
+        for event in self._events[self._reportedCount:]:
+            self.logger.info(f'{event["name"]}: {event["dur"] / 1000:.1f} ms')
+        self._reportedCount = len(self._events)
+
+        if self._traceFileName is not None:
+            with open(self._traceFileName, 'w') as traceFile:
+                json.dump({TRACE_EVENTS_KEY: self._events, 'displayTimeUnit': 'ms'}, traceFile, indent=1)
+            self.logger.info(f'Wrote {len(self._events)} trace events to {self._traceFileName}')
+
+    @contextmanager
+    def _timedPhase(self, name: str) -> Iterator[None]:
+
+        startNs: int = perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.addPhase(name=name, startNs=startNs, durationNs=perf_counter_ns() - startNs)
+
+    def _enableFromEnvironment(self):
+
+        setting: Optional[str] = environ.get(PROFILE_ENVIRONMENT_VARIABLE)
+        if setting is None or setting == '' or setting == '0':
+            return
+
+        self.enable(traceFileName=None if setting == '1' else cast(str, setting))
@@ -0,0 +1,128 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import cast
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from enum import Enum
+
+from os import path as osPath
+
+#
+# The user interface creates the index at start up;  The models are imported with the first project
+#
+if TYPE_CHECKING:
+    from pyutv3.encoders.ClassRecord import ClassRecord
+    from pyutv3.persistence.PutProject import PutDocument
+    from pyutv3.persistence.PutProject import PutProject
+
+
+class TreeNodeType(Enum):
+    PROJECT  = 'Project'
+    DOCUMENT = 'Document'
+    CLASS    = 'Class'
+
+
+@dataclass
+class ProjectTreeNode:
+    """
+    What a project tree item stands for;  The tree item only carries the node id
+    """
+    nodeId:      int
+    nodeType:    TreeNodeType
+    label:       str
+    project:     'PutProject'
+    document:    Optional['PutDocument'] = None
+    classRecord: Optional['ClassRecord'] = None
+    populated:   bool                    = False
+
+
+class ProjectTreeIndex:
+    """
+    The model behind the project tree.  A node for a project's documents, or a document's
+    classes, is only created when its parent is expanded;  The tree holds an item for what
+    has been seen, not for everything in the project.  Tree items carry a node id, and
+    `node()` maps it back in constant time
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._nodes:      Dict[int, ProjectTreeNode] = {}
+        self._nextNodeId: int                        = 1
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def addProject(self, project: 'PutProject') -> ProjectTreeNode:
+        """
+        Args:
+            project:    A loaded or indexed project
+
+        Returns:  The project's node;  Its children are created by `children()`
+        """
+        return self._createNode(nodeType=TreeNodeType.PROJECT, label=osPath.basename(project.fileName), project=project)
+
+    def node(self, nodeId: int) -> Optional[ProjectTreeNode]:
+        """
+        Args:
+            nodeId:     The id a tree item carries
+
+        Returns:  The node;  None if there is no such node
+        """
+        return self._nodes.get(nodeId)
+
+    def hasChildren(self, node: ProjectTreeNode) -> bool:
+        """
+        Whether to show an expand button;  A document that is not loaded yet may have classes
+        """
+        if node.nodeType == TreeNodeType.PROJECT:
+            return len(node.project.documents) > 0
+        elif node.nodeType == TreeNodeType.DOCUMENT:
+            document: 'PutDocument' = cast('PutDocument', node.document)
+            return document.loaded is False or len(document.classRecords) > 0
+        else:
+            return False
+
+    def children(self, node: ProjectTreeNode) -> List[ProjectTreeNode]:
+        """
+        Creates the node's children the first time it is asked;  After that there are none
+        to create, so the tree does not add the items twice.  The classes of a document that
+        is not loaded yet are unknown;  Load it first
+
+        Args:
+            node:   The node being expanded
+
+        Returns:  The new child nodes
+        """
+        if node.populated is True:
+            return []
+
+        children: List[ProjectTreeNode] = []
+        if node.nodeType == TreeNodeType.PROJECT:
+            children = [self._createNode(nodeType=TreeNodeType.DOCUMENT, label=document.title, project=node.project, document=document)
+                        for document in node.project.documents]
+        elif node.nodeType == TreeNodeType.DOCUMENT:
+            document: 'PutDocument' = cast('PutDocument', node.document)
+            if document.loaded is False:
+                return []
+            children = [self._createNode(nodeType=TreeNodeType.CLASS, label=classRecord.pyutClass.name, project=node.project, document=document, classRecord=classRecord)
+                        for classRecord in document.classRecords]
+
+        node.populated = True
+
+        return children
+
+    def _createNode(self, nodeType: TreeNodeType, label: str, project: 'PutProject', document: Optional['PutDocument'] = None, classRecord: Optional['ClassRecord'] = None) -> ProjectTreeNode:
+
+        node: ProjectTreeNode = ProjectTreeNode(nodeId=self._nextNodeId, nodeType=nodeType, label=label, project=project, document=document, classRecord=classRecord)
+
+        self._nodes[node.nodeId] = node
+        self._nextNodeId += 1
+
+        return node
@@ -1,85 +1,41 @@
-
-import logging
-import logging.config
-
-import json
-
+from click import Path
 from click import command
 from click import option
 from click import version_option
-from pkg_resources import resource_filename
-
-from wx import App
 
-from pyutv3.PyutV3Frame import PyutV3Frame
+from pyutv3.PhaseProfiler import PhaseProfiler
 
 __version__ = "3.0.0"
 
 
-JSON_LOGGING_CONFIG_FILENAME: str = 'loggingConfiguration.json'
-RESOURCES_PACKAGE_NAME:       str = 'pyutv3.resources'
-
-
-class PyutV3(App):
-
-    WINDOW_WIDTH:  int = 900
-    WINDOW_HEIGHT: int = 500
-
-    def __init__(self, redirect: bool = False):
-
-        super(PyutV3, self).__init__(redirect=redirect)
-
-    def OnInit(self) -> bool:
-
-        PyutV3.setUpLogging()
-
-        self._frameTop: PyutV3Frame = PyutV3Frame()
-
-        self._frameTop.Show(True)
-
-        return True
-
-    @classmethod
-    def setUpLogging(cls):
-        """"""
-        loggingConfigFilename: str = cls.findLoggingConfig()
-
-        with open(loggingConfigFilename, 'r') as loggingConfigurationFile:
-            configurationDictionary = json.load(loggingConfigurationFile)
-
-        logging.config.dictConfig(configurationDictionary)
-        logging.logProcesses = False
-        logging.logThreads = False
-
-    @classmethod
-    def findLoggingConfig(cls) -> str:
-
-        fqFileName = resource_filename(RESOURCES_PACKAGE_NAME, JSON_LOGGING_CONFIG_FILENAME)
-
-        return fqFileName
-
-    def loadXmlFile(self, fqFileName: str):
-        """
-
-        Args:
-            fqFileName: full qualified file name
-        """
-        self._frameTop.loadXmlFile(fqFileName=fqFileName)
-
-
 @command()
 @version_option(version=f'{__version__}', message='%(version)s')
 @option('-i', '--input-file', required=False, help='The input .xml file to preload on startup.')
-def commandHandler(input_file: str):
+@option('-p', '--profile', is_flag=True, help='Log the time spent in the start up and file open phases.')
+@option('-t', '--trace-file', required=False, type=Path(dir_okay=False), help='Also write the phases to this Chrome trace file.')
+def commandHandler(input_file: str, profile: bool, trace_file: str):
+    """
+    Only click is imported up front;  `--version` and `--help` exit before wx, ogl and the
+    application modules are imported.  The profiler can also be turned on with the PYUTV3_PROFILE
+    environment variable;  See `PhaseProfiler`
+    """
+    profiler: PhaseProfiler = PhaseProfiler.instance()
+    if profile is True or trace_file is not None:
+        profiler.enable(traceFileName=trace_file)
+
+    with profiler.phase('import PyutV3App'):
+        from pyutv3.PyutV3App import PyutV3App
 
     if input_file is not None:
-        testApp: PyutV3 = PyutV3(redirect=False)
+        testApp: PyutV3App = PyutV3App(redirect=False)
         testApp.loadXmlFile(input_file)
     else:
-        testApp = PyutV3(redirect=False)
+        testApp = PyutV3App(redirect=False)
 
     testApp.MainLoop()
 
+    profiler.report()
+
 
 if __name__ == "__main__":
 
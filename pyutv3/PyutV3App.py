@@ -0,0 +1,93 @@
+import logging
+
+import json
+
+from importlib.resources import files
+
+from time import perf_counter_ns
+
+from wx import EVT_IDLE
+from wx import App
+from wx import IdleEvent
+
+from pyutv3.PhaseProfiler import PhaseProfiler
+from pyutv3.PyutV3Frame import PyutV3Frame
+from pyutv3.QueuedLogging import QueuedLogging
+
+JSON_LOGGING_CONFIG_FILENAME: str = 'loggingConfiguration.json'
+RESOURCES_PACKAGE_NAME:       str = 'pyutv3.resources'
+
+
+class PyutV3App(App):
+    """
+    The wx application;  Only imported once the command line says we are going to show a user interface
+    """
+    WINDOW_WIDTH:  int = 900
+    WINDOW_HEIGHT: int = 500
+
+    def __init__(self, redirect: bool = False):
+
+        super(PyutV3App, self).__init__(redirect=redirect)
+
+    def OnInit(self) -> bool:
+
+        profiler: PhaseProfiler = PhaseProfiler.instance()
+        self._initStartNs: int  = perf_counter_ns()
+
+        with profiler.phase('setUpLogging'):
+            PyutV3App.setUpLogging()
+
+        with profiler.phase('PyutV3Frame.__init__'):
+            self._frameTop: PyutV3Frame = PyutV3Frame()
+
+        self._frameTop.Show(True)
+
+        if profiler.enabled is True:
+            self.Bind(EVT_IDLE, self._onFirstIdle)
+
+        return True
+
+    def _onFirstIdle(self, event: IdleEvent):
+        """
+        The first idle event comes once the shown frame's paint events are handled;  That
+        is as close to the first paint as wx lets us see
+        """
+        self.Unbind(EVT_IDLE, handler=self._onFirstIdle)
+
+        profiler: PhaseProfiler = PhaseProfiler.instance()
+        profiler.addPhase(name='firstPaint', startNs=self._initStartNs, durationNs=perf_counter_ns() - self._initStartNs)
+        profiler.report()
+
+        event.Skip()
+
+    def OnExit(self) -> int:
+        # Flush the log records still in the queue
+        QueuedLogging.stop()
+        return super().OnExit()
+
+    @classmethod
+    def setUpLogging(cls):
+        """
+        The configuration asks for queued handlers;  The console and the log file are
+        written on a listener thread, not the GUI thread.  See `QueuedLogging`
+        """
+        configurationDictionary = json.loads(cls.findLoggingConfig())
+
+        QueuedLogging.configure(configurationDictionary)
+        logging.logProcesses = False
+        logging.logThreads = False
+
+    @classmethod
+    def findLoggingConfig(cls) -> str:
+        """
+        Returns:  The logging configuration;  `importlib.resources` reads it without the start up cost of `pkg_resources`
+        """
+        return files(RESOURCES_PACKAGE_NAME).joinpath(JSON_LOGGING_CONFIG_FILENAME).read_text()
+
+    def loadXmlFile(self, fqFileName: str):
+        """
+
+        Args:
+            fqFileName: full qualified file name
+        """
+        self._frameTop.loadXmlFile(fqFileName=fqFileName)
@@ -1,5 +1,7 @@
 from typing import List
 from typing import Callable
+from typing import Optional
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
@@ -10,11 +12,17 @@ from dataclasses import dataclass
 from typing import cast
 
 from wx import ACCEL_CTRL
-from wx import CommandProcessor
+from wx import CallAfter
+from wx import EVT_CLOSE
 from wx import EVT_MENU_RANGE
+from wx import EVT_UPDATE_UI
 from wx import EVT_WINDOW_DESTROY
 from wx import FD_FILE_MUST_EXIST
 from wx import FD_OPEN
+from wx import FD_OVERWRITE_PROMPT
+from wx import FD_SAVE
+from wx import ID_CLOSE
+from wx import ID_DELETE
 from wx import FH_PATH_SHOW_ALWAYS
 from wx import FileHistory
 from wx import ID_EXIT
@@ -24,13 +32,18 @@ from wx import ID_OPEN
 from wx import ID_SELECTALL
 from wx import ID_OK
 from wx import ID_REDO
+from wx import ID_SAVEAS
 from wx import ID_UNDO
+from wx import ID_YES
 from wx import OK
 from wx import ICON_ERROR
+from wx import ICON_QUESTION
+from wx import YES_NO
 from wx import DEFAULT_FRAME_STYLE
 from wx import EVT_MENU
 
 from wx import FileDialog
+from wx import CloseEvent
 from wx import CommandEvent
 from wx import Frame
 from wx import Menu
@@ -41,11 +54,37 @@ from wx import AcceleratorTable
 
 from wx import MessageDialog
 from wx import NewIdRef
+from wx import TextEntryDialog
+from wx import UpdateUIEvent
 from wx import WindowDestroyEvent
 
 from pyutv3.FileHistoryConfiguration import FileHistoryConfiguration
+from pyutv3.PhaseProfiler import PhaseProfiler
 from pyutv3.PyutV3UI import PyutV3UI
 
+#
+# The encoders, persistence and ogl modules are imported when first needed;  Not at start up
+#
+if TYPE_CHECKING:
+    from miniogl.DiagramFrame import DiagramFrame
+    from pyutv3.commands.CommandHistory import CommandAction
+    from pyutv3.commands.CommandHistory import CommandHistory
+    from pyutv3.commands.ClassMemberCommand import MemberKind
+    from pyutv3.commands.DiagramCommand import DiagramCommand
+    from pyutv3.diagram.DiagramPage import DiagramPage
+    from pyutv3.encoders.EncoderCache import EncoderCache
+    from pyutv3.persistence.AutosaveJournal import AutosaveJournal
+    from pyutv3.persistence.BackgroundSaver import BackgroundSaver
+    from pyutv3.persistence.PutProject import PutProject
+
+SAVE_WILDCARD: str = 'Pyut json (*.json)|*.json|Pyut compressed (*.pyutz)|*.pyutz'
+
+NEW_CLASS_NAME:   str = 'ClassName'
+NEW_CLASS_WIDTH:  int = 100
+NEW_CLASS_HEIGHT: int = 100
+# From the top left of the visible part of the diagram
+NEW_CLASS_OFFSET: int = 50
+
 
 @dataclass
 class RequestResponse:
@@ -75,20 +114,65 @@ class PyutV3Frame(Frame):
         self._fileHistory: FileHistory = FileHistory(idBase=ID_FILE1)
         self._fileHistory.SetMenuPathStyle(style=FH_PATH_SHOW_ALWAYS)
 
-        self._commandProcessor: CommandProcessor = CommandProcessor()
+        self._backgroundSaver: Optional['BackgroundSaver'] = None
+        self._encoderCache:    Optional['EncoderCache']    = None
+        self._autosaveJournal: Optional['AutosaveJournal'] = None
+
+        self._scaffoldUI.addCommandListener(self._onCommand)
 
         self._fileMenu: Menu = cast(Menu, None)
         self._editMenu: Menu = cast(Menu, None)
 
-        self._createApplicationMenuBar()
+        with PhaseProfiler.instance().phase('_createApplicationMenuBar'):
+            self._createApplicationMenuBar()
 
         self.__setupKeyboardShortCuts()
 
+        self.Bind(EVT_CLOSE,          self._onClose)
         self.Bind(EVT_WINDOW_DESTROY, self._cleanupFileHistory)
+        # The journal touches the disk and may recover a session;  Do it once the frame is up
+        CallAfter(self._startAutosave)
+
+    def _onClose(self, event: CloseEvent):
+        """
+        The Exit menu and the title bar close button both end here
+        """
+        # Let pending saves finish;  Do not lose the user's work
+        if self._backgroundSaver is not None:
+            self._backgroundSaver.shutdown()
+        # A normal exit;  Nothing to recover next time
+        if self._autosaveJournal is not None:
+            self._autosaveJournal.close(discardSession=True)
+            self._autosaveJournal = None
+        # The default handler destroys the frame
+        event.Skip()
 
     # noinspection PyUnusedLocal
-    def Close(self, force=False):
-        self.Destroy()
+    def _onExit(self, event: CommandEvent):
+        self.Close()
+
+    def saveDiagram(self, fqFileName: str, diagramFrame: 'DiagramFrame'):
+        """
+        Saves in the background;  The status bar reports the progress
+
+        Args:
+            fqFileName:     Fully qualified file name;  The suffix picks the format
+            diagramFrame:   The frame with the diagram to save
+        """
+        self._getBackgroundSaver().save(fileName=fqFileName, oglObjects=diagramFrame.GetDiagram().GetShapes())
+
+    def _getBackgroundSaver(self) -> 'BackgroundSaver':
+        """
+        The saver, its encoder cache and its thread are created by the first save
+        """
+        if self._backgroundSaver is None:
+            from pyutv3.encoders.EncoderCache import EncoderCache
+            from pyutv3.persistence.BackgroundSaver import BackgroundSaver
+
+            self._encoderCache    = EncoderCache()
+            self._backgroundSaver = BackgroundSaver(statusListener=self._onSaveStatus, cache=self._encoderCache)
+
+        return self._backgroundSaver
 
     # noinspection PyUnusedLocal
     def _cleanupFileHistory(self, event: WindowDestroyEvent):
@@ -111,12 +195,13 @@ class PyutV3Frame(Frame):
 
     def loadXmlFile(self, fqFileName: str):
         """
+        Preload a project;  Only the selected document's classes are built right away
 
         Args:
             fqFileName: full qualified file name
         """
-        # self._loadXmlFile(fqFileName=fqFileName)
-        pass
+        if self._loadProject(fqFileName=fqFileName) is True:
+            self._fileHistory.AddFileToHistory(filename=fqFileName)
 
     def _createApplicationMenuBar(self):
 
@@ -126,6 +211,10 @@ class PyutV3Frame(Frame):
         self._newUseCaseDiagramWxId:  int = NewIdRef()
         self._newSequenceDiagramWxId: int = NewIdRef()
 
+        self._addClassWxId:  int = NewIdRef()
+        self._addFieldWxId:  int = NewIdRef()
+        self._addMethodWxId: int = NewIdRef()
+
         menuBar:   MenuBar = MenuBar()
         fileMenu:  Menu = Menu()
         editMenu:  Menu = Menu()
@@ -138,7 +227,7 @@ class PyutV3Frame(Frame):
 
         self.SetMenuBar(menuBar)
 
-        self.Bind(EVT_MENU, self.Close, id=ID_EXIT)
+        self.Bind(EVT_MENU, self._onExit, id=ID_EXIT)
 
         # Set to class protected variables
         self._fileMenu = fileMenu
@@ -150,23 +239,34 @@ class PyutV3Frame(Frame):
 
         fileMenu.AppendSubMenu(newDiagramSubMenu, 'New')
         fileMenu.Append(ID_OPEN)
+        fileMenu.Append(ID_SAVEAS)
+        fileMenu.Append(ID_CLOSE)
         fileMenu.Append(self._loadXmlFileWxId, 'Load Xml Diagram')
 
         self._fileHistory.UseMenu(fileMenu)
-        fileHistoryConfiguration: FileHistoryConfiguration = FileHistoryConfiguration(appName='pyutV3',
-                                                                                      vendorName='ElGatoMalo',
-                                                                                      localFilename='pyutRecentFiles.ini')
-        entryCount: int = fileHistoryConfiguration.GetNumberOfEntries()
-        file1:      str = fileHistoryConfiguration.Read('file1')
-        self.logger.info(f'{entryCount=} - {file1=}')
-        self._fileHistory.Load(fileHistoryConfiguration)
+        # Reading the history touches the disk;  Do it once the frame is up
+        CallAfter(self._loadFileHistory)
 
         self.Bind(EVT_MENU, self._onFileOpen,    id=ID_OPEN)
+        self.Bind(EVT_MENU, self._onFileSaveAs,  id=ID_SAVEAS)
+        self.Bind(EVT_MENU, self._onFileClose,   id=ID_CLOSE)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateClose, id=ID_CLOSE)
         self.Bind(EVT_MENU, self._onLoadXmlFile, id=self._loadXmlFileWxId)
         self._bindRecentlyOpenedFileIds()
 
         return fileMenu
 
+    def _loadFileHistory(self):
+
+        fileHistoryConfiguration: FileHistoryConfiguration = FileHistoryConfiguration(appName='pyutV3',
+                                                                                      vendorName='ElGatoMalo',
+                                                                                      localFilename='pyutRecentFiles.ini')
+        entryCount: int = fileHistoryConfiguration.GetNumberOfEntries()
+        file1:      str = fileHistoryConfiguration.Read('file1')
+        self.logger.info(f'{entryCount=} - {file1=}')
+        with PhaseProfiler.instance().phase('FileHistory.Load'):
+            self._fileHistory.Load(fileHistoryConfiguration)
+
     def _bindRecentlyOpenedFileIds(self):
         """
         Assumes
@@ -191,11 +291,25 @@ class PyutV3Frame(Frame):
         editMenu.Append(ID_UNDO)
         editMenu.Append(ID_REDO)
         editMenu.Append(ID_SELECTALL)
+        editMenu.AppendSeparator()
+        editMenu.Append(self._addClassWxId,  'Add Class')
+        editMenu.Append(self._addFieldWxId,  'Add Field...')
+        editMenu.Append(self._addMethodWxId, 'Add Method...')
+        editMenu.Append(ID_DELETE)
 
         self.Bind(EVT_MENU, self._onUndo, id=ID_UNDO)
         self.Bind(EVT_MENU, self._onRedo, id=ID_REDO)
-
-        self._commandProcessor.SetEditMenu(editMenu)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateUndo, id=ID_UNDO)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateRedo, id=ID_REDO)
+
+        self.Bind(EVT_MENU, self._onAddClass,  id=self._addClassWxId)
+        self.Bind(EVT_MENU, self._onAddField,  id=self._addFieldWxId)
+        self.Bind(EVT_MENU, self._onAddMethod, id=self._addMethodWxId)
+        self.Bind(EVT_MENU, self._onDelete,    id=ID_DELETE)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateAddClass,     id=self._addClassWxId)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateSingleSelect, id=self._addFieldWxId)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateSingleSelect, id=self._addMethodWxId)
+        self.Bind(EVT_UPDATE_UI, self._onUpdateDelete,       id=ID_DELETE)
 
         return editMenu
 
@@ -207,9 +321,44 @@ class PyutV3Frame(Frame):
             # Only allowed single file loads
             filenames: List[str] = dlg.GetPaths()
             self.logger.info(f'Opened file name: {filenames[0]}')
-            self._fileHistory.AddFileToHistory(filename=filenames[0])
+            if self._loadProject(fqFileName=filenames[0]) is True:
+                self._fileHistory.AddFileToHistory(filename=filenames[0])
+        dlg.Destroy()
+
+    # noinspection PyUnusedLocal
+    def _onFileSaveAs(self, event: CommandEvent):
+
+        diagramFrame: Optional['DiagramFrame'] = self._scaffoldUI.currentDiagramFrame
+        if diagramFrame is None:
+            self._displayError(message='There is no diagram to save')
+            return
+
+        dlg: FileDialog = FileDialog(self, message='Save diagram as', wildcard=SAVE_WILDCARD, style=FD_SAVE | FD_OVERWRITE_PROMPT)
+        if dlg.ShowModal() == ID_OK:
+            fqFileName: str = dlg.GetPath()
+            self.saveDiagram(fqFileName=fqFileName, diagramFrame=diagramFrame)
+            self._fileHistory.AddFileToHistory(filename=fqFileName)
         dlg.Destroy()
 
+    # noinspection PyUnusedLocal
+    def _onFileClose(self, event: CommandEvent):
+
+        self._scaffoldUI.closeCurrentPage()
+
+    def _onUpdateClose(self, event: UpdateUIEvent):
+
+        event.Enable(self._scaffoldUI.hasPages)
+
+    def _onSaveStatus(self, message: str):
+        """
+        Called on the GUI thread by the background saver;  A save may finish after the frame is gone
+
+        Args:
+            message: The save progress
+        """
+        if self:
+            self._status.SetStatusText(message)
+
     # noinspection PyUnusedLocal
     def _onLoadXmlFile(self, event: CommandEvent):
 
@@ -221,16 +370,212 @@ class PyutV3Frame(Frame):
 
         self.logger.info(f'{event=} - filename: {path}')
 
-        # add it back to the history; then it will be moved up the list
-        self._fileHistory.AddFileToHistory(path)
+        if self._loadProject(fqFileName=path) is True:
+            # add it back to the history; then it will be moved up the list
+            self._fileHistory.AddFileToHistory(path)
+        else:
+            self._fileHistory.RemoveFileFromHistory(fileNum)
+
+    def _loadProject(self, fqFileName: str) -> bool:
+        """
+        Reads the project index and shows its documents;  A document's classes are
+        loaded when its page is first shown
+
+        Args:
+            fqFileName: Fully qualified name of a .put or .xml file
+
+        Returns:  'True' if the project loaded
+        """
+        from pyutv3.persistence.PutLoader import PutLoader
+        from pyutv3.persistence.PutLoader import PutLoaderException
+
+        self._status.SetStatusText(f'Loading {fqFileName}...')
+        try:
+            project: 'PutProject' = PutLoader().loadIndex(fqFileName)
+        except (OSError, PutLoaderException) as e:
+            self.logger.error(f'{e}')
+            self._status.SetStatusText('Ready!')
+            self._displayError(message=f'Unable to load {fqFileName}: {e}')
+            return False
+
+        self._scaffoldUI.addProject(project)
+        self._status.SetStatusText(f'Loaded {fqFileName}')
+
+        return True
 
     # noinspection PyUnusedLocal
     def _onUndo(self, event: CommandEvent):
-        self.logger.info(f'Invoked Undo')
+
+        commandHistory: Optional['CommandHistory'] = self._scaffoldUI.currentCommandHistory
+        if commandHistory is not None and commandHistory.undo() is not None:
+            self._refreshDiagram()
 
     # noinspection PyUnusedLocal
     def _onRedo(self, event: CommandEvent):
-        self.logger.info(f'Invoked Redo')
+
+        commandHistory: Optional['CommandHistory'] = self._scaffoldUI.currentCommandHistory
+        if commandHistory is not None and commandHistory.redo() is not None:
+            self._refreshDiagram()
+
+    def _onUpdateUndo(self, event: UpdateUIEvent):
+
+        commandHistory: Optional['CommandHistory'] = self._scaffoldUI.currentCommandHistory
+        event.Enable(commandHistory is not None and commandHistory.canUndo)
+
+    def _onUpdateRedo(self, event: UpdateUIEvent):
+
+        commandHistory: Optional['CommandHistory'] = self._scaffoldUI.currentCommandHistory
+        event.Enable(commandHistory is not None and commandHistory.canRedo)
+
+    # noinspection PyUnusedLocal
+    def _onAddClass(self, event: CommandEvent):
+        """
+        A new class near the top left of what is on screen
+        """
+        page: Optional['DiagramPage'] = self._scaffoldUI.currentPage
+        if page is None or page.diagramFrame is None:
+            return
+
+        from pyutmodel.PyutClass import PyutClass
+
+        from pyutv3.commands.AddClassCommand import AddClassCommand
+        from pyutv3.encoders.ClassRecord import ClassRecord
+        from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+        pyutClass: PyutClass = PyutClass(name=NEW_CLASS_NAME)
+        pyutClass.id = page.unusedClassId()
+
+        x, y = page.diagramFrame.CalcUnscrolledPosition(NEW_CLASS_OFFSET, NEW_CLASS_OFFSET)
+        classRecord: ClassRecord = ClassRecord(pyutClass=pyutClass, geometry=ShapeGeometry(x=x, y=y, width=NEW_CLASS_WIDTH, height=NEW_CLASS_HEIGHT))
+
+        page.commandHistory.submit(AddClassCommand(diagramClasses=page, classRecord=classRecord))
+        self._refreshDiagram()
+
+    # noinspection PyUnusedLocal
+    def _onAddField(self, event: CommandEvent):
+
+        from pyutv3.commands.ClassMemberCommand import MemberKind
+
+        self._addMember(memberKind=MemberKind.FIELD)
+
+    # noinspection PyUnusedLocal
+    def _onAddMethod(self, event: CommandEvent):
+
+        from pyutv3.commands.ClassMemberCommand import MemberKind
+
+        self._addMember(memberKind=MemberKind.METHOD)
+
+    # noinspection PyUnusedLocal
+    def _onDelete(self, event: CommandEvent):
+        """
+        Each selected class is removed by its own command
+        """
+        page: Optional['DiagramPage'] = self._scaffoldUI.currentPage
+        if page is None:
+            return
+
+        from pyutv3.commands.RemoveClassCommand import RemoveClassCommand
+
+        for classRecord in page.selectedClasses:
+            page.commandHistory.submit(RemoveClassCommand(diagramClasses=page, classRecord=classRecord))
+        self._refreshDiagram()
+
+    def _onUpdateAddClass(self, event: UpdateUIEvent):
+
+        event.Enable(self._scaffoldUI.currentDiagramFrame is not None)
+
+    def _onUpdateSingleSelect(self, event: UpdateUIEvent):
+
+        page: Optional['DiagramPage'] = self._scaffoldUI.currentPage
+        event.Enable(page is not None and page.selectedClassCount == 1)
+
+    def _onUpdateDelete(self, event: UpdateUIEvent):
+
+        page: Optional['DiagramPage'] = self._scaffoldUI.currentPage
+        event.Enable(page is not None and page.selectedClassCount > 0)
+
+    def _addMember(self, memberKind: 'MemberKind'):
+        """
+        Ask for the member's name and append it to the selected class
+
+        Args:
+            memberKind:     A field or a method
+        """
+        page: Optional['DiagramPage'] = self._scaffoldUI.currentPage
+        if page is None or page.selectedClassCount != 1:
+            return
+
+        from pyutmodel.PyutClass import PyutClass
+        from pyutmodel.PyutField import PyutField
+        from pyutmodel.PyutMethod import PyutMethod
+
+        from pyutv3.commands.ClassMemberCommand import ClassMember
+        from pyutv3.commands.ClassMemberCommand import ClassMemberCommand
+        from pyutv3.commands.ClassMemberCommand import MemberKind
+
+        pyutClass: PyutClass = page.selectedClasses[0].pyutClass
+
+        dlg: TextEntryDialog = TextEntryDialog(self, message=f'{memberKind.value} name', caption=f'Add {memberKind.value}')
+        if dlg.ShowModal() == ID_OK and dlg.GetValue().strip() != '':
+            name: str = dlg.GetValue().strip()
+            if memberKind == MemberKind.FIELD:
+                members:   List        = pyutClass.fields
+                newMember: ClassMember = PyutField(name=name)
+            else:
+                members   = pyutClass.methods
+                newMember = PyutMethod(name=name)
+            page.commandHistory.submit(ClassMemberCommand(pyutClass=pyutClass, memberKind=memberKind, index=len(members), oldMember=None, newMember=newMember))
+            self._refreshDiagram()
+        dlg.Destroy()
+
+    def _onCommand(self, page: 'DiagramPage', command: 'DiagramCommand', action: 'CommandAction'):
+        """
+        A command changed a diagram;  The change goes to the autosave journal.  The encoder
+        cache notices changed models by itself
+
+        Args:
+            page:       The diagram's page
+            command:    The command
+            action:     Whether it was done, undone or redone
+        """
+        if self._autosaveJournal is not None:
+            self._autosaveJournal.record(project=page.project, document=page.document, command=command, action=action)
+
+    def _startAutosave(self):
+        """
+        Offer to recover a session that did not end normally;  Then journal this one
+        """
+        from pyutv3.persistence.AutosaveJournal import AutosaveJournal
+        from pyutv3.persistence.PutLoader import PutLoaderException
+
+        try:
+            autosaveJournal: AutosaveJournal = AutosaveJournal()
+        except (OSError, ValueError) as e:
+            self.logger.error(f'Autosave is off: {e}')
+            return
+
+        if autosaveJournal.hasSession is True:
+            dlg: MessageDialog = MessageDialog(parent=self, message='The last session did not end normally.  Recover its changes?', caption='Recover', style=YES_NO | ICON_QUESTION)
+            if dlg.ShowModal() == ID_YES:
+                try:
+                    for project in autosaveJournal.recover():
+                        self._scaffoldUI.addProject(project)
+                    self._status.SetStatusText('Recovered the last session')
+                except (OSError, ValueError, PutLoaderException) as e:
+                    self.logger.error(f'{e}')
+                    self._displayError(message=f'Unable to recover the last session: {e}')
+                    autosaveJournal.discard()
+            else:
+                autosaveJournal.discard()
+            dlg.Destroy()
+
+        self._autosaveJournal = autosaveJournal
+
+    def _refreshDiagram(self):
+
+        diagramFrame: Optional['DiagramFrame'] = self._scaffoldUI.currentDiagramFrame
+        if diagramFrame is not None:
+            diagramFrame.Refresh()
 
     def _askForXMLFileToImport(self) -> RequestResponse:
         """
@@ -266,6 +611,9 @@ class PyutV3Frame(Frame):
         lst = [
             (ACCEL_CTRL, ord('l'), self._loadXmlFileWxId),
             (ACCEL_CTRL, ord('a'), ID_SELECTALL),
+            (ACCEL_CTRL, ord('w'), ID_CLOSE),
+            (ACCEL_CTRL, ord('z'), ID_UNDO),
+            (ACCEL_CTRL, ord('y'), ID_REDO),
             ]
         acc = []
         for el in lst:
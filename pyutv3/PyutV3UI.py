@@ -1,10 +1,19 @@
 
+from typing import Callable
+from typing import List
+from typing import Optional
 from typing import cast
+from typing import TYPE_CHECKING
 
 from logging import Logger
 from logging import getLogger
 
+from functools import partial
+
 from wx import CLIP_CHILDREN
+from wx import EVT_NOTEBOOK_PAGE_CHANGED
+from wx import EVT_TREE_ITEM_ACTIVATED
+from wx import EVT_TREE_ITEM_EXPANDING
 from wx import EVT_TREE_SEL_CHANGED
 from wx import ID_ANY
 from wx import TR_HAS_BUTTONS
@@ -15,10 +24,33 @@ from wx import Notebook
 from wx import SplitterWindow
 from wx import TreeCtrl
 
+from wx import BookCtrlEvent
 from wx import TreeEvent
 
 from wx import TreeItemId
 
+from pyutv3.NotebookPageRegistry import NotebookPageRegistry
+from pyutv3.diagram.DiagramPageManager import DiagramPageManager
+from pyutv3.ProjectTreeIndex import ProjectTreeIndex
+from pyutv3.ProjectTreeIndex import ProjectTreeNode
+from pyutv3.ProjectTreeIndex import TreeNodeType
+
+#
+# ogl and the persistence modules are imported when the first project is added;  Not at start up
+#
+if TYPE_CHECKING:
+    from miniogl.DiagramFrame import DiagramFrame
+    from pyutv3.commands.CommandHistory import CommandAction
+    from pyutv3.commands.CommandHistory import CommandHistory
+    from pyutv3.commands.DiagramCommand import DiagramCommand
+    from pyutv3.diagram.DiagramPage import DiagramPage
+    from pyutv3.persistence.PutLoader import PutLoader
+    from pyutv3.persistence.PutProject import PutDocument
+    from pyutv3.persistence.PutProject import PutProject
+
+# A command listener that is also told the page
+PageCommandListener = Callable[['DiagramPage', 'DiagramCommand', 'CommandAction'], None]
+
 
 class PyutV3UI:
     """
@@ -35,12 +67,231 @@ class PyutV3UI:
         self._projectTree: TreeCtrl       = cast(TreeCtrl, None)
         self._notebook:    Notebook       = cast(Notebook, None)
 
-        self._projectsRoot: TreeItemId   = cast(TreeItemId, None)
+        self._projectsRoot:     TreeItemId       = cast(TreeItemId, None)
+        self._projectTreeIndex: ProjectTreeIndex = ProjectTreeIndex()
+        #
+        # The notebook's pages;  Filed under id(document), documents are not hashable
+        #
+        self._pageRegistry: NotebookPageRegistry['DiagramPage'] = NotebookPageRegistry()
+        self._pageManager:  DiagramPageManager['DiagramPage']   = DiagramPageManager()
+        #
+        # Told about the commands of every page
+        #
+        self._commandListeners: List[PageCommandListener] = []
+
+        self._putLoader: Optional['PutLoader'] = None
 
         self._initializeUIElements()
 
         self._notebookCurrentPage: int = -1
 
+    @property
+    def currentPage(self) -> Optional['DiagramPage']:
+        """
+        Returns:  The selected notebook page;  None if there are no pages
+        """
+        return self._currentPage()
+
+    @property
+    def currentDiagramFrame(self) -> Optional['DiagramFrame']:
+        """
+        Returns:  The diagram frame of the selected notebook page;  None if there are no pages
+        """
+        page: Optional['DiagramPage'] = self._currentPage()
+        if page is None:
+            return None
+
+        return page.diagramFrame
+
+    @property
+    def currentCommandHistory(self) -> Optional['CommandHistory']:
+        """
+        Returns:  The undo and redo history of the selected notebook page;  None if there are no pages
+        """
+        page: Optional['DiagramPage'] = self._currentPage()
+        if page is None:
+            return None
+
+        return page.commandHistory
+
+    @property
+    def hasPages(self) -> bool:
+        """
+        Returns:  'True' if the notebook has a page to close
+        """
+        return len(self._pageRegistry) > 0
+
+    def addCommandListener(self, listener: PageCommandListener):
+        """
+        Args:
+            listener:   Called with the page for each command done, undone or redone on any page
+        """
+        self._commandListeners.append(listener)
+        for page in self._pageRegistry:
+            page.commandHistory.addListener(partial(listener, page))
+
+    def addProject(self, project: 'PutProject'):
+        """
+        Add the project to the project tree.  A document gets its notebook page when it is
+        first selected or opened in the tree;  The classes of documents that are not loaded
+        yet (see `PutLoader.loadIndex()`) are loaded then.
+
+        The tree only gets the project item here;  Document and class items are created
+        when their parent is expanded
+
+        Args:
+            project:  A loaded or indexed project
+        """
+        projectItem: TreeItemId = self._appendTreeItem(parentItem=self._projectsRoot, node=self._projectTreeIndex.addProject(project))
+
+        self._populateTreeItem(projectItem)
+        self._projectTree.Expand(projectItem)
+
+    def closeCurrentPage(self):
+        """
+        Close the selected notebook page;  Its document stays in the project tree and
+        nothing is saved.  Selecting the document again opens a new page for it.  Does
+        nothing if there are no pages
+        """
+        page: Optional['DiagramPage'] = self._currentPage()
+        if page is not None:
+            self._removeDocumentPage(page)
+
+    def _openDocumentPage(self, project: 'PutProject', document: 'PutDocument'):
+        """
+        Select the document's notebook page;  The page is created the first time
+
+        Args:
+            project:    The document's project
+            document:   The document
+        """
+        page: Optional['DiagramPage'] = self._pageRegistry.page(id(document))
+        if page is None:
+            page = self._addDocumentPage(project=project, document=document)
+
+        self._syncPageFrameAndNotebook(page)
+        # Adding the first page does not always send a page changed event
+        self._activatePage(self._currentPage())
+
+    def _addDocumentPage(self, project: 'PutProject', document: 'PutDocument') -> 'DiagramPage':
+
+        from pyutv3.diagram.DiagramPage import DiagramPage
+
+        page: DiagramPage = DiagramPage(self._notebook, project=project, document=document)
+        for listener in self._commandListeners:
+            page.commandHistory.addListener(partial(listener, page))
+
+        # Adding the first page may send the page changed event before AddPage() returns
+        self._pageRegistry.append(page=page, key=id(document))
+        self._notebook.AddPage(page, document.title)
+
+        return page
+
+    def _removeDocumentPage(self, page: 'DiagramPage'):
+        """
+        Delete the page from the notebook and the registry;  The pages after it move down one.
+        If the tree's selection is the page's document it is cleared;  Otherwise selecting
+        the same item again would not reopen the page
+
+        Args:
+            page:   The page to delete
+        """
+        pageIndex: Optional[int] = self._pageRegistry.remove(page)
+        if pageIndex is None:
+            return
+
+        self._pageManager.forget(page)
+        self._notebook.DeletePage(pageIndex)
+
+        selectedItem: TreeItemId = self._projectTree.GetSelection()
+        if selectedItem.IsOk() is True:
+            node: Optional[ProjectTreeNode] = self._treeNode(selectedItem)
+            if node is not None and node.document is page.document:
+                self._projectTree.UnselectAll()
+
+    def _currentPage(self) -> Optional['DiagramPage']:
+
+        pageIndex: int = self._notebook.GetSelection()
+        if pageIndex < 0:
+            return None
+
+        return self._pageRegistry.pageAt(pageIndex)
+
+    def _activatePage(self, page: Optional['DiagramPage']):
+        """
+        Show the page's diagram;  The page manager creates it if need be, and may evict the
+        diagrams of pages not shown for a while
+
+        Args:
+            page:   The page being shown
+        """
+        if page is None:
+            return
+
+        self._loadDocument(project=page.project, document=page.document)
+        self._pageManager.activate(page)
+
+    def _loadDocument(self, project: 'PutProject', document: 'PutDocument'):
+        """
+        Load the classes of a document from a project index;  It needs no page
+
+        Args:
+            project:    The document's project
+            document:   The document
+        """
+        if document.loaded is True:
+            return
+
+        from pyutv3.persistence.PutLoader import PutLoader
+        from pyutv3.persistence.PutLoader import PutLoaderException
+
+        if self._putLoader is None:
+            self._putLoader = PutLoader()
+
+        try:
+            self._putLoader.loadDocument(project=project, document=document)
+        except (OSError, PutLoaderException) as e:
+            self.logger.error(f'Unable to load {document.title} from {project.fileName}: {e}')
+
+    def _appendTreeItem(self, parentItem: TreeItemId, node: ProjectTreeNode) -> TreeItemId:
+
+        treeItem: TreeItemId = self._projectTree.AppendItem(parentItem, node.label, data=node.nodeId)
+        self._projectTree.SetItemHasChildren(treeItem, self._projectTreeIndex.hasChildren(node))
+
+        return treeItem
+
+    def _populateTreeItem(self, treeItem: TreeItemId):
+        """
+        Create the item's children the first time it is expanded;  A document's classes
+        are only known once it is loaded, so expanding a document loads it
+
+        Args:
+            treeItem:   The item being expanded
+        """
+        node: Optional[ProjectTreeNode] = self._treeNode(treeItem)
+        if node is None or node.populated is True:
+            return
+
+        if node.nodeType == TreeNodeType.DOCUMENT:
+            self._loadDocument(project=node.project, document=cast('PutDocument', node.document))
+
+        children: List[ProjectTreeNode] = self._projectTreeIndex.children(node)
+        for child in children:
+            self._appendTreeItem(parentItem=treeItem, node=child)
+
+        if len(children) == 0:
+            self._projectTree.SetItemHasChildren(treeItem, False)
+
+    def _treeNode(self, treeItem: TreeItemId) -> Optional[ProjectTreeNode]:
+        """
+        Returns:  The node the item stands for;  None for the hidden root
+        """
+        nodeId: Optional[int] = self._projectTree.GetItemData(treeItem)
+        if nodeId is None:
+            return None
+
+        return self._projectTreeIndex.node(nodeId)
+
     def _initializeUIElements(self):
         """
         Instantiate all the UI elements
@@ -55,31 +306,49 @@ class PyutV3UI:
         self._projectsRoot = self._projectTree.AddRoot("Ozzee")
 
         # Callbacks
-        # self._parent.Bind(EVT_NOTEBOOK_PAGE_CHANGED, self._onNotebookPageChanged)
+        self._notebook.Bind(EVT_NOTEBOOK_PAGE_CHANGED, self._onNotebookPageChanged)
         self._topLevelFrame.Bind(EVT_TREE_SEL_CHANGED, self._onProjectTreeSelChanged)
+        self._projectTree.Bind(EVT_TREE_ITEM_EXPANDING, self._onProjectTreeItemExpanding)
+        self._projectTree.Bind(EVT_TREE_ITEM_ACTIVATED, self._onProjectTreeSelChanged)
         # self._projectTree.Bind(EVT_TREE_ITEM_RIGHT_CLICK, self.__onProjectTreeRightClick)
 
-    def _syncPageFrameAndNotebook(self, frame):
-        for i in range(self._notebook.GetPageCount()):
-            pageFrame = self._notebook.GetPage(i)
-            if pageFrame is frame:
-                self._notebook.SetSelection(i)
-                break
+    def _syncPageFrameAndNotebook(self, page: 'DiagramPage'):
+        """
+        Select the notebook page
+
+        Args:
+            page:   A page in the notebook
+        """
+        pageIndex: Optional[int] = self._pageRegistry.pageIndex(page)
+        if pageIndex is not None and pageIndex != self._notebook.GetSelection():
+            self._notebook.SetSelection(pageIndex)
 
     def _onProjectTreeSelChanged(self, event: TreeEvent):
         """
-        Callback for tree node selection changed
+        Callback for tree node selection changed, or an item opened;  Opens the page of
+        the item's document
 
         Args:
             event:
         """
         itm:      TreeItemId   = event.GetItem()
-        self.logger.debug(f'Clicked on: {itm=}')
+        self.logger.debug('Clicked on: %s', itm)
+        # Clearing the selection sends an invalid item
+        if itm.IsOk() is False:
+            return
+
+        node: Optional[ProjectTreeNode] = self._treeNode(itm)
+        if node is None or node.document is None:
+            return
+
+        self._openDocumentPage(project=node.project, document=node.document)
+
+    def _onProjectTreeItemExpanding(self, event: TreeEvent):
+
+        self._populateTreeItem(event.GetItem())
+        event.Skip()
 
-    def __syncPageFrameAndNotebook(self, frame):
+    def _onNotebookPageChanged(self, event: BookCtrlEvent):
 
-        for i in range(self._notebook.GetPageCount()):
-            pageFrame = self._notebook.GetPage(i)
-            if pageFrame is frame:
-                self._notebook.SetSelection(i)
-                break
+        self._activatePage(self._pageRegistry.pageAt(event.GetSelection()))
+        event.Skip()
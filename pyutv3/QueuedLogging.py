@@ -0,0 +1,104 @@
+from typing import Any
+from typing import Dict
+from typing import List
+
+from logging import Handler
+from logging import LogRecord
+from logging import Logger
+from logging import getLogger
+
+from logging.config import dictConfig
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
+
+from atexit import register as atExitRegister
+
+from queue import SimpleQueue
+
+#
+# A `dictConfig` extension;  When true the configured handlers do their I/O on a listener thread
+#
+QUEUE_HANDLERS_KEY: str = 'queueHandlers'
+
+ROOT_LOGGER_NAME: str = 'root'
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    The stock `prepare()` formats the message on the logging thread so that the record
+    can be pickled.  Our queue never leaves the process;  Leave the formatting to the
+    listener thread.  Log arguments are therefore formatted a little later;  Do not log
+    objects that are about to change
+    """
+    def prepare(self, record: LogRecord) -> LogRecord:
+        return record
+
+
+class QueuedLogging:
+    """
+    Applies a `logging.config.dictConfig` configuration, and then, if the configuration
+    asks for it with `"queueHandlers": true`, moves the configured handlers behind a queue.
+    Each logger with handlers gets a single `QueueHandler` that only enqueues the record;  A
+    `QueueListener` thread formats it and does the stream and file I/O.  Logging from the
+    GUI thread then never waits for the console or the disk.
+
+    The `queue_handler` support in `dictConfig` only arrived with Python 3.12;  This does
+    the same for the versions we run on.  Call `stop()` at exit to flush the queue;  It is
+    also registered with `atexit`
+    """
+    _listeners:  List[QueueListener] = []
+    _registered: bool                = False
+
+    @classmethod
+    def configure(cls, configuration: Dict[str, Any]):
+        """
+        Args:
+            configuration:  A `dictConfig` dictionary;  Possibly with the `queueHandlers` key
+        """
+        cls.stop()
+
+        dictConfig(configuration)
+
+        if configuration.get(QUEUE_HANDLERS_KEY, False) is True:
+            # The root logger may also be configured under 'loggers';  Queue it only once
+            loggerNames: Dict[str, None] = dict.fromkeys([ROOT_LOGGER_NAME] + list(configuration.get('loggers', {}).keys()))
+            for loggerName in loggerNames:
+                cls._queueHandlers(logger=getLogger() if loggerName == ROOT_LOGGER_NAME else getLogger(loggerName))
+
+            if cls._registered is False:
+                atExitRegister(cls.stop)
+                cls._registered = True
+
+    @classmethod
+    def stop(cls):
+        """
+        Writes out whatever is still queued;  Safe to call when not started.  Listeners stop
+        in the reverse order they started
+        """
+        for listener in reversed(cls._listeners):
+            listener.stop()
+        cls._listeners = []
+
+    @classmethod
+    def _queueHandlers(cls, logger: Logger):
+        """
+        Each logger gets its own queue and listener;  A listener hands every record to all
+        its handlers, so sharing one would send records to other loggers' handlers
+
+        Args:
+            logger:  A configured logger;  Left alone when its handlers are already queued
+        """
+        handlers: List[Handler] = list(logger.handlers)
+        if len(handlers) == 0 or all(isinstance(handler, QueueHandler) for handler in handlers):
+            return
+
+        logQueue: SimpleQueue = SimpleQueue()
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(DeferredQueueHandler(logQueue))
+
+        # Each handler keeps its own level;  The logger already filtered by its own
+        listener: QueueListener = QueueListener(logQueue, *handlers, respect_handler_level=True)
+        listener.start()
+
+        cls._listeners.append(listener)
@@ -0,0 +1,55 @@
+from typing import Optional
+
+from pyutv3.commands.DiagramClasses import DiagramClasses
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+from pyutv3.encoders.ClassRecord import ClassRecord
+
+
+class AddClassCommand(DiagramCommand):
+    """
+    A class added to a diagram;  The command keeps the model class and its geometry to add it back
+    """
+    def __init__(self, diagramClasses: DiagramClasses, classRecord: ClassRecord, name: str = 'Add Class'):
+        """
+
+        Args:
+            diagramClasses: The diagram
+            classRecord:    The class and where it is
+            name:           What the Edit menu calls the command
+        """
+        super().__init__(name=name)
+
+        self._diagramClasses: DiagramClasses = diagramClasses
+        self._classRecord:    ClassRecord    = classRecord
+
+    def doIt(self):
+        self._add()
+
+    def undo(self):
+        self._remove()
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+        return self._removeRecord() if undone is True else self._addRecord()
+
+    def _add(self):
+        self._diagramClasses.addClass(self._classRecord)
+
+    def _remove(self):
+        """
+        Keeps where the class was;  Adding it back puts it there
+        """
+        classRecord: Optional[ClassRecord] = self._diagramClasses.removeClass(self._classRecord.pyutClass.id)
+        if classRecord is not None:
+            self._classRecord = classRecord
+
+    def _addRecord(self) -> JournalRecord:
+        """
+        The whole class;  Replaying the journal has nothing else to create it from
+        """
+        return {JOURNAL_RECORD_TYPE_KEY: JournalRecordType.ADD_CLASS.value, 'classRecord': self._classRecord}
+
+    def _removeRecord(self) -> JournalRecord:
+        return {JOURNAL_RECORD_TYPE_KEY: JournalRecordType.REMOVE_CLASS.value, 'classId': self._classRecord.pyutClass.id}
@@ -0,0 +1,101 @@
+from typing import List
+from typing import Optional
+from typing import Union
+
+from sys import getsizeof
+
+from enum import Enum
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+
+ClassMember = Union[PyutField, PyutMethod]
+
+
+class MemberKind(Enum):
+    FIELD  = 'Field'
+    METHOD = 'Method'
+
+
+class ClassMemberCommand(DiagramCommand):
+    """
+    A field or method added to, removed from, or replaced in a class.  The command keeps the
+    one member before and after the edit and where it is;  Not the class's member lists
+    """
+    def __init__(self, pyutClass: PyutClass, memberKind: MemberKind, index: int, oldMember: Optional[ClassMember], newMember: Optional[ClassMember]):
+        """
+
+        Args:
+            pyutClass:  The edited class
+            memberKind: Which member list
+            index:      The member's position in the list
+            oldMember:  The member before the edit;  None to add one
+            newMember:  The member after the edit;  None to remove one
+        """
+        if oldMember is None:
+            action: str = 'Add'
+        elif newMember is None:
+            action = 'Remove'
+        else:
+            action = 'Edit'
+        super().__init__(name=f'{action} {memberKind.value}')
+
+        self._pyutClass:  PyutClass             = pyutClass
+        self._memberKind: MemberKind            = memberKind
+        self._index:      int                   = index
+        self._oldMember:  Optional[ClassMember] = oldMember
+        self._newMember:  Optional[ClassMember] = newMember
+
+    @property
+    def sizeInBytes(self) -> int:
+        """
+        A replaced or removed member is only kept alive by the command
+        """
+        memberSizes: int = sum(getsizeof(member) + getsizeof(vars(member)) for member in (self._oldMember, self._newMember) if member is not None)
+
+        return super().sizeInBytes + memberSizes
+
+    @property
+    def changedClasses(self) -> List[PyutClass]:
+        return [self._pyutClass]
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+        """
+        Undoing is the same edit the other way
+        """
+        oldMember: Optional[ClassMember] = self._newMember if undone is True else self._oldMember
+        newMember: Optional[ClassMember] = self._oldMember if undone is True else self._newMember
+
+        return {
+            JOURNAL_RECORD_TYPE_KEY: JournalRecordType.MEMBER.value,
+            'classId':    self._pyutClass.id,
+            'memberKind': self._memberKind.value,
+            'index':      self._index,
+            'oldMember':  oldMember,
+            'newMember':  newMember,
+        }
+
+    def doIt(self):
+        self._replace(current=self._oldMember, replacement=self._newMember)
+
+    def undo(self):
+        self._replace(current=self._newMember, replacement=self._oldMember)
+
+    def _replace(self, current: Optional[ClassMember], replacement: Optional[ClassMember]):
+        """
+        The model's member lists are used directly;  They are changed in place
+        """
+        members: List = self._pyutClass.fields if self._memberKind == MemberKind.FIELD else self._pyutClass.methods
+
+        if current is None:
+            members.insert(self._index, replacement)
+        elif replacement is None:
+            del members[self._index]
+        else:
+            members[self._index] = replacement
@@ -0,0 +1,188 @@
+from typing import Callable
+from typing import Deque
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from collections import deque
+
+from enum import Enum
+
+from pyutv3.commands.DiagramCommand import DiagramCommand
+
+DEFAULT_MAXIMUM_STEPS: int = 1000
+DEFAULT_MAXIMUM_BYTES: int = 8 * 1024 * 1024
+
+
+class CommandAction(Enum):
+    DONE   = 'Done'
+    UNDONE = 'Undone'
+    REDONE = 'Redone'
+
+
+CommandListener = Callable[[DiagramCommand, CommandAction], None]
+
+
+class CommandHistory:
+    """
+    The undo and redo stacks of a diagram.  The history is bounded;  When it holds more than
+    `maximumSteps` commands, or its commands keep more than `maximumBytes` alive, the oldest
+    commands are forgotten.  The most recent command is always kept.
+
+    A command that continues the previous one (see `DiagramCommand.mergeWith()`) is merged
+    into it;  A whole drag is then a single undo step.
+
+    Listeners are told about every command done, undone or redone.  A `mergeable` command is
+    told about once it is complete;  At `endMerge()`, or when another command, an undo or a
+    redo comes first.  Listeners then get the whole drag as one command,  not every step
+    """
+    def __init__(self, maximumSteps: int = DEFAULT_MAXIMUM_STEPS, maximumBytes: int = DEFAULT_MAXIMUM_BYTES):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._maximumSteps: int = max(1, maximumSteps)
+        self._maximumBytes: int = maximumBytes
+
+        self._undoCommands: Deque[DiagramCommand] = deque()
+        self._redoCommands: List[DiagramCommand]  = []
+        self._byteCount:    int                   = 0
+
+        self._listeners: List[CommandListener] = []
+        #
+        # The last command done;  Later ones may still merge into it, so listeners have not been told
+        #
+        self._openCommand: Optional[DiagramCommand] = None
+
+    @property
+    def byteCount(self) -> int:
+        """
+        Returns:  About how much memory the undo and redo commands keep alive
+        """
+        return self._byteCount
+
+    @property
+    def undoCount(self) -> int:
+        return len(self._undoCommands)
+
+    @property
+    def redoCount(self) -> int:
+        return len(self._redoCommands)
+
+    @property
+    def canUndo(self) -> bool:
+        return len(self._undoCommands) > 0
+
+    @property
+    def canRedo(self) -> bool:
+        return len(self._redoCommands) > 0
+
+    @property
+    def undoName(self) -> str:
+        return self._undoCommands[-1].name if self.canUndo else ''
+
+    @property
+    def redoName(self) -> str:
+        return self._redoCommands[-1].name if self.canRedo else ''
+
+    def addListener(self, listener: CommandListener):
+        self._listeners.append(listener)
+
+    def submit(self, command: DiagramCommand):
+        """
+        Do the command and record it
+
+        Args:
+            command:    A new command
+        """
+        command.doIt()
+        self.record(command)
+
+    def record(self, command: DiagramCommand):
+        """
+        Record a change that is already made;  For example a drag step the diagram frame did
+
+        Args:
+            command:    The change
+        """
+        for redoCommand in self._redoCommands:
+            self._byteCount -= redoCommand.sizeInBytes
+        self._redoCommands.clear()
+
+        openCommand: Optional[DiagramCommand] = self._openCommand
+        if openCommand is not None:
+            openSize: int = openCommand.sizeInBytes
+            if openCommand.mergeWith(command) is True:
+                self._byteCount += openCommand.sizeInBytes - openSize
+                return
+            self.endMerge()
+
+        self._undoCommands.append(command)
+        self._byteCount += command.sizeInBytes
+        self._trim()
+
+        if command.mergeable is True:
+            self._openCommand = command
+        else:
+            self._notify(command=command, action=CommandAction.DONE)
+
+    def endMerge(self):
+        """
+        Nothing more merges into the last command;  For example the drag ended.  Listeners
+        are told about it now
+        """
+        openCommand: Optional[DiagramCommand] = self._openCommand
+        if openCommand is not None:
+            self._openCommand = None
+            self._notify(command=openCommand, action=CommandAction.DONE)
+
+    def undo(self) -> Optional[DiagramCommand]:
+        """
+        Returns:  The command undone;  None if there is nothing to undo
+        """
+        if self.canUndo is False:
+            return None
+        self.endMerge()
+
+        command: DiagramCommand = self._undoCommands.pop()
+        command.undo()
+        self._redoCommands.append(command)
+
+        self._notify(command=command, action=CommandAction.UNDONE)
+
+        return command
+
+    def redo(self) -> Optional[DiagramCommand]:
+        """
+        Returns:  The command redone;  None if there is nothing to redo
+        """
+        if self.canRedo is False:
+            return None
+        self.endMerge()
+
+        command: DiagramCommand = self._redoCommands.pop()
+        command.doIt()
+        self._undoCommands.append(command)
+
+        self._notify(command=command, action=CommandAction.REDONE)
+
+        return command
+
+    def clear(self):
+
+        self._openCommand = None
+        self._undoCommands.clear()
+        self._redoCommands.clear()
+        self._byteCount = 0
+
+    def _trim(self):
+
+        while len(self._undoCommands) > 1 and (len(self._undoCommands) > self._maximumSteps or self._byteCount > self._maximumBytes):
+            oldestCommand: DiagramCommand = self._undoCommands.popleft()
+            self._byteCount -= oldestCommand.sizeInBytes
+
+    def _notify(self, command: DiagramCommand, action: CommandAction):
+
+        for listener in self._listeners:
+            listener(command, action)
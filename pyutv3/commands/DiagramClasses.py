@@ -0,0 +1,34 @@
+from typing import List
+from typing import Optional
+from typing import Protocol
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+
+class DiagramClasses(Protocol):
+    """
+    What commands change;  The classes of a diagram by model id.  `DiagramPage` in the
+    application,  with or without its canvas.  A command refers to nothing else,  so it
+    outlives the shapes that draw the classes
+    """
+    def classGeometry(self, classId: int) -> Optional[ShapeGeometry]:
+        """
+        Returns:  Where the class is;  None if it is not in the diagram
+        """
+        pass
+
+    def moveClasses(self, classIds: List[int], deltaX: int, deltaY: int):
+        pass
+
+    def setClassGeometry(self, classId: int, geometry: ShapeGeometry):
+        pass
+
+    def addClass(self, classRecord: ClassRecord):
+        pass
+
+    def removeClass(self, classId: int) -> Optional[ClassRecord]:
+        """
+        Returns:  The class and where it was;  None if it is not in the diagram
+        """
+        pass
@@ -0,0 +1,108 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TYPE_CHECKING
+
+from sys import getsizeof
+
+from enum import Enum
+
+if TYPE_CHECKING:
+    from pyutmodel.PyutClass import PyutClass
+
+#
+# The model objects in a record are encoded by `ModelEncoder`;  Classes are identified by their model id
+#
+JournalRecord = Dict[str, Any]
+
+JOURNAL_RECORD_TYPE_KEY: str = 'record'
+
+
+class JournalRecordType(Enum):
+    MOVE         = 'move'
+    RESIZE       = 'resize'
+    ADD_CLASS    = 'addClass'
+    REMOVE_CLASS = 'removeClass'
+    MEMBER       = 'member'
+
+
+class DiagramCommand:
+    """
+    A change to a diagram that can be undone.  A command holds the change itself, for
+    example the distance some classes moved;  Never a copy of the diagram,  so undoing and
+    redoing it costs what the change costs however large the diagram is.  Classes are
+    referred to by model id through `DiagramClasses`,  never by shape;  The history
+    survives the page's canvas being evicted and rebuilt.
+
+    Subclasses override `doIt()` and `undo()` and, if they keep more than references to
+    the models, `sizeInBytes`.  `journalRecord()` describes the change to the
+    document's classes for the autosave journal
+    """
+    def __init__(self, name: str):
+        """
+
+        Args:
+            name:   What the Edit menu calls the command;  For example 'Move'
+        """
+        self._name: str = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def sizeInBytes(self) -> int:
+        """
+        Returns:  About how much memory the command keeps alive;  The models it refers
+        to belong to the diagram and are not counted
+        """
+        return getsizeof(self) + getsizeof(self.__dict__)
+
+    @property
+    def mergeable(self) -> bool:
+        """
+        Returns:  'True' if later commands may merge into this one;  See `mergeWith()`
+        """
+        return False
+
+    @property
+    def changedClasses(self) -> List['PyutClass']:
+        """
+        Returns:  The model classes that doing or undoing the command changes;  Their
+        encoded form changes with them
+        """
+        return []
+
+    def doIt(self):
+        """
+        Apply the change;  Also to redo it
+        """
+        pass
+
+    def undo(self):
+        """
+        Reverse the change
+        """
+        pass
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+        """
+        Args:
+            undone:     'True' to describe undoing the command
+
+        Returns:  The change to the document's classes;  None if it does not change them
+        """
+        return None
+
+    def mergeWith(self, command: 'DiagramCommand') -> bool:
+        """
+        Fold a command that continues this one, such as the next step of the same drag,
+        into this command
+
+        Args:
+            command:    The command that was just recorded;  It is already done
+
+        Returns:  'True' if the command was merged and should not be kept on its own
+        """
+        return False
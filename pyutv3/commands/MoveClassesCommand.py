@@ -0,0 +1,78 @@
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from sys import getsizeof
+
+from pyutv3.commands.DiagramClasses import DiagramClasses
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+
+
+class MoveClassesCommand(DiagramCommand):
+    """
+    Classes moved by the same distance;  Only their model ids and the distance are kept,
+    not their shapes or positions
+    """
+    def __init__(self, diagramClasses: DiagramClasses, classIds: List[int], deltaX: int, deltaY: int, dragId: int = 0):
+        """
+
+        Args:
+            diagramClasses: The classes' diagram
+            classIds:       The model ids of the moved classes
+            deltaX:         How far right they moved
+            deltaY:         How far down they moved
+            dragId:         The drag that moved them;  The moves of a drag merge into one command
+        """
+        super().__init__(name='Move')
+
+        self._diagramClasses: DiagramClasses = diagramClasses
+        self._classIds:       List[int]      = classIds
+        self._deltaX:         int            = deltaX
+        self._deltaY:         int            = deltaY
+        self._dragId:         int            = dragId
+
+    @property
+    def delta(self) -> Tuple[int, int]:
+        return self._deltaX, self._deltaY
+
+    @property
+    def mergeable(self) -> bool:
+        return self._dragId != 0
+
+    @property
+    def sizeInBytes(self) -> int:
+        return super().sizeInBytes + getsizeof(self._classIds)
+
+    def doIt(self):
+        self._diagramClasses.moveClasses(classIds=self._classIds, deltaX=self._deltaX, deltaY=self._deltaY)
+
+    def undo(self):
+        self._diagramClasses.moveClasses(classIds=self._classIds, deltaX=-self._deltaX, deltaY=-self._deltaY)
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+
+        sign: int = -1 if undone is True else 1
+
+        return {
+            JOURNAL_RECORD_TYPE_KEY: JournalRecordType.MOVE.value,
+            'classIds': self._classIds,
+            'deltaX':   sign * self._deltaX,
+            'deltaY':   sign * self._deltaY,
+        }
+
+    def mergeWith(self, command: DiagramCommand) -> bool:
+        """
+        The next step of the same drag of the same classes
+        """
+        if not isinstance(command, MoveClassesCommand) or command._dragId != self._dragId or self._dragId == 0:
+            return False
+        if command._classIds != self._classIds:
+            return False
+
+        self._deltaX += command._deltaX
+        self._deltaY += command._deltaY
+
+        return True
@@ -0,0 +1,24 @@
+from typing import Optional
+
+from pyutv3.commands.AddClassCommand import AddClassCommand
+from pyutv3.commands.DiagramClasses import DiagramClasses
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.encoders.ClassRecord import ClassRecord
+
+
+class RemoveClassCommand(AddClassCommand):
+    """
+    A class removed from a diagram;  The reverse of `AddClassCommand`
+    """
+    def __init__(self, diagramClasses: DiagramClasses, classRecord: ClassRecord):
+
+        super().__init__(diagramClasses=diagramClasses, classRecord=classRecord, name='Remove Class')
+
+    def doIt(self):
+        self._remove()
+
+    def undo(self):
+        self._add()
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+        return self._addRecord() if undone is True else self._removeRecord()
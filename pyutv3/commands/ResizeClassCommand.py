@@ -0,0 +1,62 @@
+from typing import Optional
+
+from pyutv3.commands.DiagramClasses import DiagramClasses
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+
+class ResizeClassCommand(DiagramCommand):
+    """
+    A class resized by one of its sizers;  Dragging a top or left sizer also moves it
+    """
+    def __init__(self, diagramClasses: DiagramClasses, classId: int, oldGeometry: ShapeGeometry, newGeometry: ShapeGeometry, dragId: int = 0):
+        """
+
+        Args:
+            diagramClasses: The class's diagram
+            classId:        The model id of the resized class
+            oldGeometry:    Its position and size before
+            newGeometry:    Its position and size after
+            dragId:         The drag that resized it;  The steps of a drag merge into one command
+        """
+        super().__init__(name='Resize')
+
+        self._diagramClasses: DiagramClasses = diagramClasses
+        self._classId:        int            = classId
+        self._oldGeometry:    ShapeGeometry  = oldGeometry
+        self._newGeometry:    ShapeGeometry  = newGeometry
+        self._dragId:         int            = dragId
+
+    @property
+    def mergeable(self) -> bool:
+        return self._dragId != 0
+
+    def doIt(self):
+        self._diagramClasses.setClassGeometry(classId=self._classId, geometry=self._newGeometry)
+
+    def undo(self):
+        self._diagramClasses.setClassGeometry(classId=self._classId, geometry=self._oldGeometry)
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+
+        return {
+            JOURNAL_RECORD_TYPE_KEY: JournalRecordType.RESIZE.value,
+            'classId':  self._classId,
+            'geometry': self._oldGeometry if undone is True else self._newGeometry,
+        }
+
+    def mergeWith(self, command: DiagramCommand) -> bool:
+        """
+        The next step of the same drag of the same sizer
+        """
+        if not isinstance(command, ResizeClassCommand) or command._dragId != self._dragId or self._dragId == 0:
+            return False
+        if command._classId != self._classId:
+            return False
+
+        self._newGeometry = command._newGeometry
+
+        return True
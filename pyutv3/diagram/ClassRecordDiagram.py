@@ -0,0 +1,70 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.persistence.PutProject import PutDocument
+
+
+class ClassRecordDiagram:
+    """
+    The `DiagramClasses` of a document without a canvas;  Commands change the document's
+    class records.  `DiagramPage` hands its commands to one of these while it is evicted.
+    Needs no wx
+    """
+    def __init__(self, document: PutDocument):
+        """
+
+        Args:
+            document:   A loaded document;  Its class records may be replaced,  they are looked up on each call
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._document: PutDocument = document
+
+    def classGeometry(self, classId: int) -> Optional[ShapeGeometry]:
+
+        classRecord: Optional[ClassRecord] = self._classRecords().get(classId)
+        if classRecord is None:
+            return None
+
+        return classRecord.geometry
+
+    def moveClasses(self, classIds: List[int], deltaX: int, deltaY: int):
+
+        classRecords: Dict[int, ClassRecord] = self._classRecords()
+        for classId in classIds:
+            classRecord: Optional[ClassRecord] = classRecords.get(classId)
+            if classRecord is not None:
+                geometry: ShapeGeometry = classRecord.geometry
+                classRecord.geometry = geometry._replace(x=geometry.x + deltaX, y=geometry.y + deltaY)
+
+    def setClassGeometry(self, classId: int, geometry: ShapeGeometry):
+
+        classRecord: Optional[ClassRecord] = self._classRecords().get(classId)
+        if classRecord is not None:
+            classRecord.geometry = geometry
+
+    def addClass(self, classRecord: ClassRecord):
+        self._document.classRecords.append(classRecord)
+
+    def removeClass(self, classId: int) -> Optional[ClassRecord]:
+
+        classRecords: List[ClassRecord] = self._document.classRecords
+        for index, classRecord in enumerate(classRecords):
+            if classRecord.pyutClass.id == classId:
+                del classRecords[index]
+                return classRecord
+
+        return None
+
+    def _classRecords(self) -> Dict[int, ClassRecord]:
+        """
+        Commands are undone and redone one at a time;  A lookup per call is cheaper than
+        keeping an index in step with the document
+        """
+        return {classRecord.pyutClass.id: classRecord for classRecord in self._document.classRecords}
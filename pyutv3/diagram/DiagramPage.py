@@ -0,0 +1,215 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from wx import EXPAND
+from wx import VERTICAL
+
+from wx import BoxSizer
+from wx import Panel
+from wx import Window
+
+from ogl.OglClass import OglClass
+
+from pyutv3.commands.CommandHistory import CommandHistory
+from pyutv3.diagram.ClassRecordDiagram import ClassRecordDiagram
+from pyutv3.diagram.IndexedDiagram import IndexedDiagram
+from pyutv3.diagram.IndexedDiagramFrame import IndexedDiagramFrame
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+
+class DiagramPage(Panel):
+    """
+    A notebook page for a document.  The page itself is an empty panel;  The diagram canvas,
+    and the OGL shapes on it, only exist between `materialize()` and `evict()`.  Otherwise the
+    document's class records are all there is.  `DiagramPageManager` decides when.
+
+    The page is the `DiagramClasses` of its commands.  It changes the shapes while it has a
+    canvas and the class records otherwise,  so the undo and redo history outlives the canvas
+    """
+    def __init__(self, parent: Window, project: PutProject, document: PutDocument):
+
+        super().__init__(parent)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._project:            PutProject                    = project
+        self._document:           PutDocument                   = document
+        self._diagramFrame:       Optional[IndexedDiagramFrame] = None
+        self._commandHistory:     CommandHistory                = CommandHistory()
+        self._classRecordDiagram: ClassRecordDiagram            = ClassRecordDiagram(document)
+        #
+        # The shapes on the canvas by model id
+        #
+        self._oglClasses: Dict[int, OglClass] = {}
+
+        self.SetSizer(BoxSizer(VERTICAL))
+
+    @property
+    def project(self) -> PutProject:
+        return self._project
+
+    @property
+    def document(self) -> PutDocument:
+        return self._document
+
+    @property
+    def diagramFrame(self) -> Optional[IndexedDiagramFrame]:
+        """
+        Returns:  The canvas;  None when the page is not materialized
+        """
+        return self._diagramFrame
+
+    @property
+    def commandHistory(self) -> CommandHistory:
+        return self._commandHistory
+
+    @property
+    def materialized(self) -> bool:
+        return self._diagramFrame is not None
+
+    @property
+    def selectedClasses(self) -> List[ClassRecord]:
+        """
+        Returns:  The selected classes and where they are;  None without a canvas
+        """
+        if self._diagramFrame is None:
+            return []
+
+        return [ClassRecord(pyutClass=oglClass.pyutObject, geometry=OglClassEncoder.shapeGeometry(oglClass)) for oglClass in self._diagramFrame.selectedClasses]
+
+    @property
+    def selectedClassCount(self) -> int:
+        """
+        Returns:  How many classes are selected;  Cheaper than `selectedClasses` for menu updates
+        """
+        if self._diagramFrame is None:
+            return 0
+
+        return len(self._diagramFrame.selectedClasses)
+
+    def unusedClassId(self) -> int:
+        """
+        Classes loaded from a project keep the ids they were saved with;  A new class
+        needs one none of them has
+
+        Returns:  A model id for a new class
+        """
+        if self._diagramFrame is None:
+            classIds: List[int] = [classRecord.pyutClass.id for classRecord in self._document.classRecords]
+        else:
+            classIds = list(self._oglClasses.keys())
+
+        return max(classIds, default=0) + 1
+
+    def materialize(self):
+        """
+        Create the canvas and a shape for each of the document's classes;  The document
+        must be loaded for it to have any
+        """
+        if self._diagramFrame is not None:
+            return
+
+        diagramFrame: IndexedDiagramFrame = IndexedDiagramFrame(self, commandHistory=self._commandHistory, diagramClasses=self)
+        for classRecord in self._document.classRecords:
+            self._addShape(diagram=diagramFrame.indexedDiagram, classRecord=classRecord)
+
+        self.GetSizer().Add(diagramFrame, 1, EXPAND)
+        self.Layout()
+
+        self._diagramFrame = diagramFrame
+
+    def evict(self):
+        """
+        Copy the classes, where the user left them, back to the document's class records;
+        Then destroy the canvas and its shapes
+        """
+        diagramFrame: Optional[IndexedDiagramFrame] = self._diagramFrame
+        if diagramFrame is None:
+            return
+
+        if self._document.loaded is True:
+            self._document.classRecords = self._classRecords(diagramFrame)
+
+        self._diagramFrame = None
+        self._oglClasses.clear()
+
+        self.GetSizer().Detach(diagramFrame)
+        diagramFrame.Destroy()
+
+    def classGeometry(self, classId: int) -> Optional[ShapeGeometry]:
+
+        if self._diagramFrame is None:
+            return self._classRecordDiagram.classGeometry(classId)
+
+        oglClass: Optional[OglClass] = self._oglClasses.get(classId)
+        if oglClass is None:
+            return None
+
+        return OglClassEncoder.shapeGeometry(oglClass)
+
+    def moveClasses(self, classIds: List[int], deltaX: int, deltaY: int):
+
+        if self._diagramFrame is None:
+            self._classRecordDiagram.moveClasses(classIds=classIds, deltaX=deltaX, deltaY=deltaY)
+            return
+
+        for classId in classIds:
+            oglClass: Optional[OglClass] = self._oglClasses.get(classId)
+            if oglClass is not None:
+                x, y = oglClass.GetPosition()
+                oglClass.SetPosition(x + deltaX, y + deltaY)
+                self._diagramFrame.indexedDiagram.shapeChanged(oglClass)
+
+    def setClassGeometry(self, classId: int, geometry: ShapeGeometry):
+
+        if self._diagramFrame is None:
+            self._classRecordDiagram.setClassGeometry(classId=classId, geometry=geometry)
+            return
+
+        oglClass: Optional[OglClass] = self._oglClasses.get(classId)
+        if oglClass is not None:
+            oglClass.SetPosition(geometry.x, geometry.y)
+            oglClass.SetSize(geometry.width, geometry.height)
+            self._diagramFrame.indexedDiagram.shapeChanged(oglClass)
+
+    def addClass(self, classRecord: ClassRecord):
+
+        if self._diagramFrame is None:
+            self._classRecordDiagram.addClass(classRecord)
+        else:
+            self._addShape(diagram=self._diagramFrame.indexedDiagram, classRecord=classRecord)
+
+    def removeClass(self, classId: int) -> Optional[ClassRecord]:
+
+        if self._diagramFrame is None:
+            return self._classRecordDiagram.removeClass(classId)
+
+        oglClass: Optional[OglClass] = self._oglClasses.pop(classId, None)
+        if oglClass is None:
+            return None
+
+        classRecord: ClassRecord = ClassRecord(pyutClass=oglClass.pyutObject, geometry=OglClassEncoder.shapeGeometry(oglClass))
+        self._diagramFrame.removeShape(oglClass)
+
+        return classRecord
+
+    def _addShape(self, diagram: IndexedDiagram, classRecord: ClassRecord):
+
+        oglClass: OglClass = OglClass(pyutClass=classRecord.pyutClass, w=classRecord.geometry.width, h=classRecord.geometry.height)
+        oglClass.SetPosition(x=classRecord.geometry.x, y=classRecord.geometry.y)
+        diagram.AddShape(oglClass)
+
+        self._oglClasses[classRecord.pyutClass.id] = oglClass
+
+    def _classRecords(self, diagramFrame: IndexedDiagramFrame) -> List[ClassRecord]:
+
+        return [ClassRecord(pyutClass=shape.pyutObject, geometry=OglClassEncoder.shapeGeometry(shape))
+                for shape in diagramFrame.indexedDiagram.GetShapes() if isinstance(shape, OglClass)]
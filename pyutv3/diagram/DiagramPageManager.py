@@ -0,0 +1,124 @@
+from typing import Generic
+from typing import Optional
+from typing import Protocol
+from typing import TypeVar
+
+from logging import Logger
+from logging import getLogger
+
+from collections import OrderedDict
+
+from os import environ
+
+#
+# The number of diagram canvases to keep;  Overrides the default
+#
+PAGE_BUDGET_ENVIRONMENT_VARIABLE: str = 'PYUTV3_PAGE_BUDGET'
+
+DEFAULT_PAGE_BUDGET: int = 8
+
+
+class ManagedPage(Protocol):
+    """
+    What the manager needs of a page;  `DiagramPage` in the application
+    """
+    def materialize(self):
+        pass
+
+    def evict(self):
+        pass
+
+
+Page = TypeVar('Page', bound=ManagedPage)
+
+
+class DiagramPageManager(Generic[Page]):
+    """
+    Decides which notebook pages have a diagram canvas.  A page gets its canvas, and its
+    OGL shapes, the first time it is activated.  When more than `budget` pages have one,
+    the pages used least recently give theirs up and keep just the document model;  The
+    next activation rebuilds the canvas from the model.  The active page is never evicted.
+
+    The budget comes from the `PYUTV3_PAGE_BUDGET` environment variable unless it is given
+    """
+    def __init__(self, budget: Optional[int] = None):
+        """
+
+        Args:
+            budget:     How many pages may have a canvas;  At least one
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._budget: int = DEFAULT_PAGE_BUDGET
+        #
+        # The pages with a canvas by id();  The most recently used is last
+        #
+        self._materializedPages: OrderedDict[int, Page] = OrderedDict()
+
+        self.budget = self._budgetFromEnvironment() if budget is None else budget
+
+    @property
+    def budget(self) -> int:
+        return self._budget
+
+    @budget.setter
+    def budget(self, newValue: int):
+        """
+        A smaller budget evicts the pages over it now
+        """
+        self._budget = max(1, newValue)
+        self._evictOverBudget()
+
+    @property
+    def materializedCount(self) -> int:
+        return len(self._materializedPages)
+
+    def activate(self, page: Page):
+        """
+        The page is shown;  Give it a canvas if it has none and evict the least recently
+        used pages over the budget
+
+        Args:
+            page:   The selected page
+        """
+        pageId: int = id(page)
+        if pageId in self._materializedPages:
+            self._materializedPages.move_to_end(pageId)
+            return
+
+        page.materialize()
+        self._materializedPages[pageId] = page
+
+        self._evictOverBudget()
+
+    def forget(self, page: Page):
+        """
+        The page is deleted;  Its canvas goes with it, so there is nothing to evict
+
+        Args:
+            page:   A page that may have been activated
+        """
+        self._materializedPages.pop(id(page), None)
+
+    def _evictOverBudget(self):
+        """
+        Least recently used first;  The last page is the active one
+        """
+        for pageId, page in list(self._materializedPages.items())[:-1]:
+            if len(self._materializedPages) <= self._budget:
+                break
+            del self._materializedPages[pageId]
+            self.logger.debug(f'Evicting page {pageId}')
+            page.evict()
+
+    def _budgetFromEnvironment(self) -> int:
+
+        setting: Optional[str] = environ.get(PAGE_BUDGET_ENVIRONMENT_VARIABLE)
+        if setting is None or setting == '':
+            return DEFAULT_PAGE_BUDGET
+
+        try:
+            return int(setting)
+        except ValueError:
+            self.logger.warning(f'{PAGE_BUDGET_ENVIRONMENT_VARIABLE}={setting} is not a number;  Using {DEFAULT_PAGE_BUDGET}')
+            return DEFAULT_PAGE_BUDGET
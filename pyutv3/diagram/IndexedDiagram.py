@@ -0,0 +1,172 @@
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from miniogl.Diagram import Diagram
+from miniogl.Shape import Shape
+
+from ogl.OglObject import OglObject
+
+from pyutv3.diagram.SpatialIndex import SpatialIndex
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+
+class IndexedDiagram(Diagram):
+    """
+    A diagram that files its OGL objects (classes, notes and the like) in a `SpatialIndex`
+    so that finding the shapes at a point or in a rectangle does not look at every shape.
+    Everything else, links, anchors, sizers and the selection rectangle, is an overlay
+    shape.  There are few of those, and they are checked one by one.
+
+    The diagram also keeps the display order of every shape,  so the results come back in
+    the order the shapes are drawn;  The top most shape is last.
+
+    Moving or resizing an indexed shape must be reported with `shapeChanged()`;
+    `IndexedDiagramFrame` does that for mouse drags and zooms.
+
+    Shapes are tracked by `id()`;  Some shapes compare equal by value or hash on their
+    name, so they cannot be dictionary keys
+    """
+    def __init__(self, panel):
+
+        super().__init__(panel)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._shapeIndex:    SpatialIndex[int]    = SpatialIndex()
+        self._indexedShapes: Dict[int, OglObject] = {}
+        self._overlayShapes: Dict[int, Shape]     = {}
+        self._displayOrder:  Dict[int, int]       = {}
+        self._frontOrder:    int                  = 0
+        self._backOrder:     int                  = 0
+
+    def AddShape(self, shape, withModelUpdate: bool = True):
+        """
+        The same as `Diagram.AddShape()`;  Except that it knows the shapes already added
+        without searching the shape list.  The search makes loading a large diagram quadratic
+        """
+        shapeId: int = id(shape)
+        if shapeId not in self._displayOrder:
+            self._shapes.append(shape)
+            if shape.GetParent() is None:
+                self._parentShapes.append(shape)
+            self._frontOrder += 1
+            self._displayOrder[shapeId] = self._frontOrder
+
+        shape.Attach(self)
+        if withModelUpdate:
+            shape.UpdateModel()
+
+        if isinstance(shape, OglObject):
+            self._indexedShapes[shapeId] = shape
+            self._shapeIndex.update(shapeId, OglClassEncoder.shapeGeometry(shape))
+        else:
+            self._overlayShapes[shapeId] = shape
+
+    def RemoveShape(self, shape):
+
+        super().RemoveShape(shape)
+
+        shapeId: int = id(shape)
+        self._displayOrder.pop(shapeId, None)
+        self._overlayShapes.pop(shapeId, None)
+        if self._indexedShapes.pop(shapeId, None) is not None:
+            self._shapeIndex.remove(shapeId)
+
+    def DeleteAllShapes(self):
+
+        super().DeleteAllShapes()
+
+        self._shapeIndex.clear()
+        self._indexedShapes.clear()
+        self._overlayShapes.clear()
+        self._displayOrder.clear()
+
+    def MoveToFront(self, shape: Shape):
+
+        super().MoveToFront(shape)
+
+        for frontShape in [shape] + shape.GetAllChildren():
+            self._frontOrder += 1
+            self._displayOrder[id(frontShape)] = self._frontOrder
+
+    def MoveToBack(self, shape: Shape):
+
+        super().MoveToBack(shape)
+
+        for backShape in reversed([shape] + shape.GetAllChildren()):
+            self._backOrder -= 1
+            self._displayOrder[id(backShape)] = self._backOrder
+
+    @property
+    def indexedShapeCount(self) -> int:
+        return len(self._shapeIndex)
+
+    def shapeChanged(self, shape: Shape):
+        """
+        Report that a shape moved or changed size
+
+        Args:
+            shape:  Any shape in the diagram;  Only indexed shapes need the update
+        """
+        if id(shape) in self._indexedShapes:
+            self._shapeIndex.update(id(shape), OglClassEncoder.shapeGeometry(shape))
+
+    def reindex(self):
+        """
+        After a change to every shape;  For example a zoom
+        """
+        for shapeId, shape in self._indexedShapes.items():
+            self._shapeIndex.update(shapeId, OglClassEncoder.shapeGeometry(shape))
+
+    def shapesAt(self, x: int, y: int) -> List[Shape]:
+        """
+        Args:
+            x:  Diagram abscissa
+            y:  Diagram ordinate
+
+        Returns:  The shapes the point is inside of;  The top most shape is last
+        """
+        shapes: List[Shape] = [shape for shape in self._indexed(self._shapeIndex.itemsAt(x, y)) if shape.Inside(x, y)]
+        shapes.extend(shape for shape in self._overlayShapes.values() if shape.Inside(x, y))
+
+        return self._inDisplayOrder(shapes)
+
+    def indexedShapesInside(self, x: int, y: int, width: int, height: int) -> List[Shape]:
+        """
+        The candidates for a rubber band selection;  The overlay shapes are not included
+
+        Returns:  The indexed shapes whose rectangle is within the given one
+        """
+        return self._inDisplayOrder(self._indexed(self._shapeIndex.itemsInside(x, y, width, height)))
+
+    @property
+    def overlayShapes(self) -> List[Shape]:
+        """
+        Returns:  A copy of the shapes that are not indexed
+        """
+        return list(self._overlayShapes.values())
+
+    def visibleShapes(self, x: int, y: int, width: int, height: int) -> List[Shape]:
+        """
+        Args:
+            x:          Left of the visible rectangle
+            y:          Top of the visible rectangle
+            width:      Its width
+            height:     Its height
+
+        Returns:  The shapes to draw in the order to draw them;  All the overlay shapes
+        and the indexed shapes that overlap the rectangle
+        """
+        shapes: List[Shape] = self._indexed(self._shapeIndex.itemsIntersecting(x, y, width, height))
+        shapes.extend(self._overlayShapes.values())
+
+        return self._inDisplayOrder(shapes)
+
+    def _indexed(self, shapeIds: List[int]) -> List[Shape]:
+        return [self._indexedShapes[shapeId] for shapeId in shapeIds]
+
+    def _inDisplayOrder(self, shapes: List[Shape]) -> List[Shape]:
+        return sorted(shapes, key=lambda shape: self._displayOrder.get(id(shape), 0))
@@ -0,0 +1,243 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from wx import EVT_MOTION
+
+from wx import ClientDC
+from wx import DC
+from wx import MouseEvent
+from wx import Window
+
+from miniogl.DiagramFrame import DiagramFrame
+from miniogl.RectangleShape import RectangleShape
+from miniogl.Shape import Shape
+from miniogl.SizerShape import SizerShape
+
+from ogl.OglClass import OglClass
+
+from pyutv3.commands.CommandHistory import CommandHistory
+from pyutv3.commands.DiagramClasses import DiagramClasses
+from pyutv3.commands.MoveClassesCommand import MoveClassesCommand
+from pyutv3.commands.ResizeClassCommand import ResizeClassCommand
+from pyutv3.diagram.IndexedDiagram import IndexedDiagram
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+
+class IndexedDiagramFrame(DiagramFrame):
+    """
+    A diagram frame for large diagrams.  Hit testing, rubber band selection and drawing
+    ask the frame's `IndexedDiagram` for the shapes near the mouse or on screen instead of
+    going through every shape in the diagram.  The frame reports the shapes that mouse
+    drags move or resize, and zooms, so the index stays current.
+
+    Given a command history, and the classes the commands change, the frame records each
+    drag of classes as a move or resize command
+    """
+    def __init__(self, parent: Window, commandHistory: Optional[CommandHistory] = None, diagramClasses: Optional[DiagramClasses] = None):
+
+        super().__init__(parent)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._commandHistory: Optional[CommandHistory] = commandHistory if diagramClasses is not None else None
+        self._diagramClasses: Optional[DiagramClasses] = diagramClasses
+        self._dragId:         int                      = 0
+
+        self.diagram = IndexedDiagram(self)
+
+    @property
+    def indexedDiagram(self) -> IndexedDiagram:
+        return cast(IndexedDiagram, self._diagram)
+
+    @property
+    def selectedClasses(self) -> List[OglClass]:
+        return [shape for shape in self._selectedShapes if isinstance(shape, OglClass)]
+
+    def FindShape(self, x: int, y: int) -> Optional[Shape]:
+        """
+        Args:
+            x: Diagram abscissa
+            y: Diagram ordinate
+
+        Returns:  The top most shape at the point or None
+        """
+        shapes: List[Shape] = self.indexedDiagram.shapesAt(x, y)
+        if len(shapes) == 0:
+            return None
+
+        return shapes[-1]
+
+    def OnLeftDown(self, event: MouseEvent):
+        """
+        A new drag;  Its moves are not merged with the previous drag's
+        """
+        self._dragId += 1
+        super().OnLeftDown(event)
+
+    def OnLeftUp(self, event: MouseEvent):
+        """
+        Select what the rubber band encloses from the index;  Then leave the rest of
+        the button handling to `DiagramFrame`.  The drag is over;  Its command is complete
+        """
+        if self._selector is not None:
+            self.Bind(EVT_MOTION, self._NullCallback)
+            self._selectEnclosedShapes(self._selector)
+            self._selector.Detach()
+            self._selector = cast(RectangleShape, None)
+
+        super().OnLeftUp(event)
+
+        if self._commandHistory is not None:
+            self._commandHistory.endMerge()
+
+    def OnDrag(self, event: MouseEvent):
+        """
+        Dragging a sizer resizes its parent;  Update both
+        """
+        geometries: Dict[int, Tuple[Shape, ShapeGeometry]] = self._dragGeometries()
+
+        super().OnDrag(event)
+
+        for shape in self._selectedShapes:
+            self.indexedDiagram.shapeChanged(shape)
+            parent: Optional[Shape] = shape.GetParent()
+            if parent is not None:
+                self.indexedDiagram.shapeChanged(parent)
+
+        if self._commandHistory is not None:
+            self._recordDrag(geometries)
+
+    def removeShape(self, shape: Shape):
+        """
+        Detach the shape from the diagram and drop it from the selection;  Otherwise the
+        next drag would move it
+
+        Args:
+            shape:  A shape in the diagram
+        """
+        shape.SetSelected(False)
+        self._selectedShapes = [selectedShape for selectedShape in self._selectedShapes if selectedShape is not shape]
+        shape.Detach()
+
+    def DoZoomIn(self, ax, ay, width=0, height=0):
+
+        super().DoZoomIn(ax, ay, width, height)
+        self.indexedDiagram.reindex()
+
+    def DoZoomOut(self, ax: int, ay: int):
+
+        super().DoZoomOut(ax, ay)
+        self.indexedDiagram.reindex()
+
+    def Redraw(self, dc: DC = None, full: bool = True, saveBackground: bool = False, useBackground: bool = False):
+        """
+        `DiagramFrame.Redraw()` for just the shapes on screen
+        """
+        needBlit = False
+        w, h = self.GetSize()
+
+        if dc is None:
+            dc = self.CreateDC(useBackground, w, h)
+            needBlit = True
+
+        dc.SetFont(self._defaultFont)
+
+        x, y = self.CalcUnscrolledPosition(0, 0)
+        shapes: List[Shape] = self.indexedDiagram.visibleShapes(x, y, w, h)
+        if full:
+            if saveBackground:
+                # The shapes that are not moving are the background
+                for shape in shapes:
+                    if not shape.IsMoving():
+                        shape.Draw(dc)
+                self.SaveBackground(dc)
+                for shape in shapes:
+                    if shape.IsMoving():
+                        shape.Draw(dc)
+            if useBackground:
+                for shape in shapes:
+                    if shape.IsMoving():
+                        shape.Draw(dc)
+            else:
+                for shape in shapes:
+                    shape.Draw(dc)
+        else:
+            for shape in shapes:
+                shape.DrawBorder(dc)
+                shape.DrawAnchors(dc)
+
+        if needBlit:
+            client = ClientDC(self)
+            client.Blit(0, 0, w, h, dc, x, y)
+
+    def _selectEnclosedShapes(self, selector: RectangleShape):
+        """
+        Selects the top level shapes entirely inside the selector;  The index only narrows
+        down the candidates, `DiagramFrame` decides
+
+        Args:
+            selector:   The rubber band
+        """
+        x, y = selector.GetTopLeft()
+        w, h = selector.GetSize()
+
+        candidates: List[Shape] = self.indexedDiagram.indexedShapesInside(x, y, abs(w), abs(h)) + self.indexedDiagram.overlayShapes
+        for shape in candidates:
+            if shape is selector or shape.GetParent() is not None:
+                continue
+            x0, y0 = shape.GetTopLeft()
+            w0, h0 = shape.GetSize()
+            if self._isShapeInRectangle(selector, x0=x0, y0=y0, w0=w0, h0=h0):
+                shape.SetSelected(True)
+                shape.SetMoving(True)
+                self._selectedShapes.append(shape)
+
+    def _dragGeometries(self) -> Dict[int, Tuple[OglClass, ShapeGeometry]]:
+        """
+        The classes a drag step can move or resize;  The selected ones, the one about to be
+        dragged, and the parents of sizers
+
+        Returns:  Each class shape and its geometry by model id
+        """
+        if self._commandHistory is None:
+            return {}
+
+        shapes: List[Shape] = self._selectedShapes + ([] if self._clickedShape is None else [self._clickedShape])
+
+        geometries: Dict[int, Tuple[OglClass, ShapeGeometry]] = {}
+        for shape in shapes:
+            target: Optional[Shape] = shape.GetParent() if isinstance(shape, SizerShape) else shape
+            if isinstance(target, OglClass):
+                geometries[target.pyutObject.id] = (target, OglClassEncoder.shapeGeometry(target))
+
+        return geometries
+
+    def _recordDrag(self, geometries: Dict[int, Tuple[OglClass, ShapeGeometry]]):
+        """
+        Record what the drag step changed;  The history merges the steps of a drag
+
+        Args:
+            geometries:     The classes and their geometry before the step
+        """
+        commandHistory: CommandHistory = cast(CommandHistory, self._commandHistory)
+        diagramClasses: DiagramClasses = cast(DiagramClasses, self._diagramClasses)
+
+        movedClassIds: Dict[Tuple[int, int], List[int]] = {}
+        for classId, (oglClass, oldGeometry) in geometries.items():
+            newGeometry: ShapeGeometry = OglClassEncoder.shapeGeometry(oglClass)
+            if newGeometry == oldGeometry:
+                continue
+            if (newGeometry.width, newGeometry.height) == (oldGeometry.width, oldGeometry.height):
+                movedClassIds.setdefault((newGeometry.x - oldGeometry.x, newGeometry.y - oldGeometry.y), []).append(classId)
+            else:
+                commandHistory.record(ResizeClassCommand(diagramClasses=diagramClasses, classId=classId, oldGeometry=oldGeometry, newGeometry=newGeometry, dragId=self._dragId))
+
+        for (deltaX, deltaY), classIds in movedClassIds.items():
+            commandHistory.record(MoveClassesCommand(diagramClasses=diagramClasses, classIds=classIds, deltaX=deltaX, deltaY=deltaY, dragId=self._dragId))
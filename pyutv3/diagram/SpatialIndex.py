@@ -0,0 +1,203 @@
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Set
+from typing import Tuple
+from typing import TypeVar
+
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+DEFAULT_CELL_SIZE: int = 256
+
+Item = TypeVar('Item', bound=Hashable)
+
+# (column, row)
+Cell = Tuple[int, int]
+
+# (left, top, right, bottom);  right and bottom are inclusive
+Bounds = Tuple[int, int, int, int]
+
+
+class SpatialIndex(Generic[Item]):
+    """
+    A uniform grid over diagram coordinates.  Each item is filed under every cell its
+    rectangle touches,  so a query only looks at the items in the cells it overlaps
+    instead of at every item in the diagram.  Cells are created as needed;  The grid has
+    no bounds and negative coordinates are fine.
+
+    Rectangles are `ShapeGeometry`s, the same position and size the encoders read.  A
+    negative width or height extends to the left or above the position, as it does for
+    a miniogl rectangle.  Query results are in the order the items were first added
+    """
+    def __init__(self, cellSize: int = DEFAULT_CELL_SIZE):
+        """
+
+        Args:
+            cellSize:   The width and height of a grid cell;  About the size of a typical item works best
+        """
+        self._cellSize:  int                   = cellSize
+        self._cells:     Dict[Cell, Set[Item]] = {}
+        self._bounds:    Dict[Item, Bounds]    = {}
+        self._order:     Dict[Item, int]       = {}
+        self._nextOrder: int                   = 0
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, item) -> bool:
+        return item in self._bounds
+
+    def update(self, item: Item, geometry: ShapeGeometry):
+        """
+        Add the item or, if it is already indexed, move it to its new rectangle
+
+        Args:
+            item:       The item
+            geometry:   Its position and size
+        """
+        bounds:    Bounds = self._toBounds(x=geometry.x, y=geometry.y, width=geometry.width, height=geometry.height)
+        oldBounds: Bounds = self._bounds.get(item, bounds)
+
+        if item not in self._bounds:
+            self._order[item] = self._nextOrder
+            self._nextOrder  += 1
+            oldCells: Set[Cell] = set()
+        elif oldBounds == bounds:
+            return
+        else:
+            oldCells = set(self._cellsOf(oldBounds))
+
+        # Small moves stay in the same cells
+        newCells: Set[Cell] = set(self._cellsOf(bounds))
+        for cell in oldCells - newCells:
+            self._removeFromCell(cell=cell, item=item)
+        for cell in newCells - oldCells:
+            self._cells.setdefault(cell, set()).add(item)
+
+        self._bounds[item] = bounds
+
+    def remove(self, item: Item):
+        """
+        Args:
+            item:   An indexed item;  Anything else is ignored
+        """
+        bounds = self._bounds.pop(item, None)
+        if bounds is None:
+            return
+
+        del self._order[item]
+        for cell in self._cellsOf(bounds):
+            self._removeFromCell(cell=cell, item=item)
+
+    def clear(self):
+
+        self._cells.clear()
+        self._bounds.clear()
+        self._order.clear()
+
+    def itemsAt(self, x: int, y: int) -> List[Item]:
+        """
+        Args:
+            x:  Diagram abscissa
+            y:  Diagram ordinate
+
+        Returns:  The items whose rectangle contains the point;  The last added is last
+        """
+        candidates: Set[Item] = self._cells.get((self._cellIndex(x), self._cellIndex(y)), set())
+
+        return self._ordered(item for item in candidates if self._contains(self._bounds[item], x, y))
+
+    def itemsIntersecting(self, x: int, y: int, width: int, height: int) -> List[Item]:
+        """
+        For drawing only what is visible
+
+        Args:
+            x:          Left of the query rectangle
+            y:          Top of the query rectangle
+            width:      Its width
+            height:     Its height
+
+        Returns:  The items that overlap the rectangle
+        """
+        query: Bounds = self._toBounds(x=x, y=y, width=width, height=height)
+
+        return self._ordered(item for item in self._candidates(query) if self._overlaps(self._bounds[item], query))
+
+    def itemsInside(self, x: int, y: int, width: int, height: int) -> List[Item]:
+        """
+        For rubber band selection
+
+        Args:
+            x:          Left of the query rectangle
+            y:          Top of the query rectangle
+            width:      Its width
+            height:     Its height
+
+        Returns:  The items that are entirely within the rectangle
+        """
+        query: Bounds = self._toBounds(x=x, y=y, width=width, height=height)
+
+        return self._ordered(item for item in self._candidates(query) if self._encloses(query, self._bounds[item]))
+
+    def _candidates(self, query: Bounds) -> Set[Item]:
+        """
+        A zoomed out view can cover more cells than are in use;  Then only look at the ones in use
+        """
+        left, top, right, bottom = (self._cellIndex(coordinate) for coordinate in query)
+
+        candidates: Set[Item] = set()
+        if (right - left + 1) * (bottom - top + 1) > len(self._cells):
+            for (column, row), items in self._cells.items():
+                if left <= column <= right and top <= row <= bottom:
+                    candidates.update(items)
+        else:
+            for cell in self._cellsOf(query):
+                candidates.update(self._cells.get(cell, ()))
+
+        return candidates
+
+    def _cellsOf(self, bounds: Bounds) -> Iterable[Cell]:
+
+        left, top, right, bottom = bounds
+        for column in range(self._cellIndex(left), self._cellIndex(right) + 1):
+            for row in range(self._cellIndex(top), self._cellIndex(bottom) + 1):
+                yield column, row
+
+    def _cellIndex(self, coordinate: float) -> int:
+        """
+        Zooming scales the shapes;  Coordinates are not always integers
+        """
+        return int(coordinate // self._cellSize)
+
+    def _removeFromCell(self, cell: Cell, item: Item):
+
+        items: Set[Item] = self._cells[cell]
+        items.discard(item)
+        if len(items) == 0:
+            del self._cells[cell]
+
+    def _ordered(self, items: Iterable[Item]) -> List[Item]:
+        return sorted(items, key=self._order.__getitem__)
+
+    def _toBounds(self, x: int, y: int, width: int, height: int) -> Bounds:
+
+        left: int = x + width  if width  < 0 else x
+        top:  int = y + height if height < 0 else y
+
+        return left, top, left + abs(width), top + abs(height)
+
+    def _contains(self, bounds: Bounds, x: int, y: int) -> bool:
+
+        left, top, right, bottom = bounds
+
+        return left <= x <= right and top <= y <= bottom
+
+    def _overlaps(self, bounds: Bounds, query: Bounds) -> bool:
+
+        return bounds[0] <= query[2] and query[0] <= bounds[2] and bounds[1] <= query[3] and query[1] <= bounds[3]
+
+    def _encloses(self, query: Bounds, bounds: Bounds) -> bool:
+
+        return query[0] <= bounds[0] and bounds[2] <= query[2] and query[1] <= bounds[1] and bounds[3] <= query[3]
@@ -0,0 +1,116 @@
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelEncoder import ModelEncoder
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+
+DEFAULT_CHUNK_SIZE:      int = 250
+DEFAULT_MINIMUM_CLASSES: int = 500
+
+
+def serializeClassRecords(classRecords: List[ClassRecord], indent: int, level: int, schemaVersion: int) -> List[str]:
+    """
+    Runs in the worker processes, so it is a module function and nothing here may touch wx
+
+    Args:
+        classRecords:   The classes to serialize
+        indent:         The json indentation
+        level:          The nesting level of the classes in the document
+        schemaVersion:  The encoding schema
+
+    Returns:  The serialized classes in the same order
+    """
+    encoder: ModelEncoder = ModelEncoder(indent=indent, schemaVersion=schemaVersion)
+    newLine: str          = f'\n{" " * (indent * level)}'
+
+    serialized: List[str] = []
+    for classRecord in classRecords:
+        encodedValue: str = ''.join(encoder.iterencode(classRecord))
+        if level > 0:
+            encodedValue = encodedValue.replace('\n', newLine)
+        serialized.append(encodedValue)
+
+    return serialized
+
+
+class BulkEncoder:
+    """
+    Serializes many classes at once by fanning them out over a pool of workers.
+
+    The caller captures each class as a `ClassRecord`,  its copied geometry and its
+    model;  That is cheap and is all that happens on the calling thread.  The records
+    are split into chunks and each chunk is encoded with a `ModelEncoder` in a worker.
+    The chunks are stitched back together in submission order,  so the text is identical
+    to what `OglDiagramWriter` writes serially.
+
+    Small batches are serialized in line;  Shipping them to the pool costs more than it saves.
+    Processes are the default since the GIL serializes json encoding threads;  The models
+    are pickled to reach them.  Call `shutdown()` when done with the encoder
+    """
+    def __init__(self, maxWorkers: Optional[int] = None, chunkSize: int = DEFAULT_CHUNK_SIZE,
+                 minimumClasses: int = DEFAULT_MINIMUM_CLASSES, useProcesses: bool = True):
+        """
+
+        Args:
+            maxWorkers:     The pool size;  The executor picks one when None
+            chunkSize:      The number of classes handed to a worker at once
+            minimumClasses: Fewer classes than this are serialized in line
+            useProcesses:   Use a process pool;  Otherwise, a thread pool
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxWorkers:     Optional[int]      = maxWorkers
+        self._chunkSize:      int                = chunkSize
+        self._minimumClasses: int                = minimumClasses
+        self._useProcesses:   bool               = useProcesses
+        self._executor:       Optional[Executor] = None
+
+    def serialize(self, classRecords: List[ClassRecord], indent: int, level: int = 0, schemaVersion: int = SCHEMA_VERSION_LEGACY) -> List[str]:
+        """
+        Args:
+            classRecords:   The classes to serialize
+            indent:         The json indentation
+            level:          The nesting level of the classes in the document
+            schemaVersion:  The encoding schema
+
+        Returns:  The serialized classes in the same order
+        """
+        if len(classRecords) < self._minimumClasses:
+            return serializeClassRecords(classRecords, indent=indent, level=level, schemaVersion=schemaVersion)
+
+        chunks: List[List[ClassRecord]] = [classRecords[idx:idx + self._chunkSize] for idx in range(0, len(classRecords), self._chunkSize)]
+        self.logger.debug('Serializing %s classes in %s chunks', len(classRecords), len(chunks))
+
+        executor: Executor = self._getExecutor()
+
+        serialized: List[str] = []
+        for chunk in executor.map(serializeClassRecords, chunks, [indent] * len(chunks), [level] * len(chunks), [schemaVersion] * len(chunks)):
+            serialized.extend(chunk)
+
+        return serialized
+
+    def shutdown(self):
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _getExecutor(self) -> Executor:
+        """
+        The pool is created on first use and then kept;  Starting workers is not cheap
+        """
+        if self._executor is None:
+            if self._useProcesses is True:
+                self._executor = ProcessPoolExecutor(max_workers=self._maxWorkers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._maxWorkers)
+
+        return self._executor
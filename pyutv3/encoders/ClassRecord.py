@@ -0,0 +1,25 @@
+from typing import NamedTuple
+
+from dataclasses import dataclass
+
+from pyutmodel.PyutClass import PyutClass
+
+
+class ShapeGeometry(NamedTuple):
+    """
+    Where a class is drawn;  Compares equal to the plain `(x, y, width, height)` tuple
+    """
+    x:      int
+    y:      int
+    width:  int
+    height: int
+
+
+@dataclass
+class ClassRecord:
+    """
+    A model class and its geometry;  Everything needed to encode a diagram class
+    without creating its OGL shape, and so without wx
+    """
+    pyutClass: PyutClass
+    geometry:  ShapeGeometry
@@ -0,0 +1,42 @@
+from typing import BinaryIO
+
+from io import TextIOBase
+
+import zlib
+
+
+class CompressedTextStream(TextIOBase):
+    """
+    A write only text stream that zlib compresses the text into a binary file as it
+    is written;  The uncompressed document never exists in memory.  The compressed
+    bytes are what `zlib.compress()` produces for the complete text.
+
+    Closing the stream flushes the compressor;  The binary file stays open
+    """
+    def __init__(self, binaryFile: BinaryIO, encoding: str = 'utf-8'):
+        """
+
+        Args:
+            binaryFile: The file to write the compressed bytes to
+            encoding:   The text encoding
+        """
+        super().__init__()
+
+        self._binaryFile: BinaryIO = binaryFile
+        self._encoding:   str      = encoding
+        self._compressor           = zlib.compressobj()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:     # type: ignore[override]
+
+        self._binaryFile.write(self._compressor.compress(text.encode(self._encoding)))
+
+        return len(text)
+
+    def close(self):
+
+        if self.closed is False:
+            self._binaryFile.write(self._compressor.flush())
+        super().close()
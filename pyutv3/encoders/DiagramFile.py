@@ -0,0 +1,63 @@
+from typing import Any
+from typing import Dict
+from typing import Iterable
+
+from logging import Logger
+from logging import getLogger
+
+import json
+import zlib
+
+from miniogl.Shape import Shape
+
+from pyutv3.encoders.CompressedTextStream import CompressedTextStream
+from pyutv3.encoders.DiagramFormat import DiagramFormat
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.OglDecoder import OglClassDecoder
+from pyutv3.encoders.OglDiagramWriter import OglDiagramWriter
+
+DiagramDocument = Dict[str, Any]
+
+
+class DiagramFile:
+    """
+    Saves and loads diagrams;  The file name suffix selects the encoding (see `DiagramFormat`).
+    Every encoding holds the same document,  so a diagram can be converted by loading it
+    from one and saving it to the other.  Diagrams are saved in the compact schema;  Legacy
+    diagrams still load
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def save(self, fileName: str, oglObjects: Iterable[Shape]):
+        """
+        Args:
+            fileName:   The file to write
+            oglObjects: The diagram's shapes
+        """
+        diagramFormat: DiagramFormat = DiagramFormat.fromFileName(fileName)
+        self.logger.info(f'Saving {fileName} as {diagramFormat.name}')
+
+        if diagramFormat == DiagramFormat.COMPRESSED:
+            with open(fileName, 'wb') as compressedFile, CompressedTextStream(binaryFile=compressedFile) as jsonStream:
+                OglDiagramWriter(stream=jsonStream, schemaVersion=SCHEMA_VERSION_COMPACT).writeDiagram(oglObjects)
+        else:
+            with open(fileName, 'w', encoding='utf-8') as jsonFile:
+                OglDiagramWriter(stream=jsonFile, schemaVersion=SCHEMA_VERSION_COMPACT).writeDiagram(oglObjects)
+
+    def load(self, fileName: str) -> DiagramDocument:
+        """
+        Args:
+            fileName:   The file to read
+
+        Returns:  The diagram document;  The classes are OGL classes, everything else is still a dictionary
+        """
+        diagramFormat: DiagramFormat = DiagramFormat.fromFileName(fileName)
+        self.logger.info(f'Loading {fileName} as {diagramFormat.name}')
+
+        if diagramFormat == DiagramFormat.COMPRESSED:
+            with open(fileName, 'rb') as compressedFile:
+                return json.loads(zlib.decompress(compressedFile.read()).decode('utf-8'), cls=OglClassDecoder)
+        else:
+            with open(fileName, 'r', encoding='utf-8') as jsonFile:
+                return json.load(jsonFile, cls=OglClassDecoder)
@@ -0,0 +1,27 @@
+from enum import Enum
+
+from os import path as osPath
+
+
+class DiagramFormat(Enum):
+    """
+    The on-disk diagram encodings;  The value is the file name suffix that selects it.
+    Compressed is zlib compressed compact json
+    """
+    JSON       = '.json'
+    COMPRESSED = '.pyutz'
+
+    @classmethod
+    def fromFileName(cls, fileName: str) -> 'DiagramFormat':
+        """
+        Args:
+            fileName:   A diagram file name
+
+        Returns:  The format that the file name suffix selects;  Unknown suffixes are json
+        """
+        suffix: str = osPath.splitext(fileName)[1].lower()
+        for diagramFormat in cls:
+            if diagramFormat.value == suffix:
+                return diagramFormat
+
+        return cls.JSON
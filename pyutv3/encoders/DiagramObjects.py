@@ -0,0 +1,88 @@
+from typing import Iterable
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from miniogl.Shape import Shape
+
+from ogl.OglClass import OglClass
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+from ogl.OglObject import OglObject
+
+from pyutv3.encoders.ModelDiagramWriter import OGL_CLASSES_KEY
+from pyutv3.encoders.ModelDiagramWriter import OGL_INTERFACES_KEY
+from pyutv3.encoders.ModelDiagramWriter import OGL_LINKS_KEY
+from pyutv3.encoders.ModelDiagramWriter import OGL_NOTES_KEY
+
+
+def createOglClasses() -> List[OglClass]:
+    return []
+
+
+def createOglNotes() -> List[OglNote]:
+    return []
+
+
+def createOglInterfaces() -> List[OglInterface2]:
+    return []
+
+
+def createOglLinks() -> List[OglLink]:
+    return []
+
+
+@dataclass
+class DiagramObjects:
+    """
+    A diagram's OGL objects sorted by kind, in the order that they are written to a
+    document;  Links come after the objects they connect
+    """
+    oglClasses:    List[OglClass]      = field(default_factory=createOglClasses)
+    oglNotes:      List[OglNote]       = field(default_factory=createOglNotes)
+    oglInterfaces: List[OglInterface2] = field(default_factory=createOglInterfaces)
+    oglLinks:      List[OglLink]       = field(default_factory=createOglLinks)
+
+    @classmethod
+    def fromShapes(cls, oglObjects: Iterable[Shape]) -> 'DiagramObjects':
+        """
+        Args:
+            oglObjects:  The diagram's shapes;  For example, `Diagram.GetShapes()`
+
+        Returns:  The sorted objects
+        """
+        logger:         Logger         = getLogger(__name__)
+        diagramObjects: DiagramObjects = cls()
+
+        for oglObject in oglObjects:
+            if isinstance(oglObject, OglClass):
+                diagramObjects.oglClasses.append(oglObject)
+            elif isinstance(oglObject, OglNote):
+                diagramObjects.oglNotes.append(oglObject)
+            elif isinstance(oglObject, OglInterface2):
+                diagramObjects.oglInterfaces.append(oglObject)
+            elif isinstance(oglObject, OglLink):
+                diagramObjects.oglLinks.append(oglObject)
+            elif isinstance(oglObject, OglObject):
+                logger.warning(f'Unable to encode: {oglObject}')
+            else:
+                # anchors, control points, and the like are encoded with their owners
+                pass
+
+        return diagramObjects
+
+    def sections(self) -> List:
+        """
+        Returns:  The document (key, objects) pairs in document order
+        """
+        return [
+            (OGL_CLASSES_KEY,    self.oglClasses),
+            (OGL_NOTES_KEY,      self.oglNotes),
+            (OGL_INTERFACES_KEY, self.oglInterfaces),
+            (OGL_LINKS_KEY,      self.oglLinks),
+        ]
@@ -0,0 +1,210 @@
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from weakref import WeakKeyDictionary
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.ModelEncoder import EncodedModel
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+
+
+def fieldFingerprint(field: PyutField) -> Tuple:
+    return field.name, field.visibility, field.type.value, field.defaultValue
+
+
+def methodFingerprint(method: PyutMethod) -> Tuple:
+    return (
+        method.name, method.visibility, method.returnType.value,
+        tuple(modifier.name for modifier in method.modifiers),
+        tuple((parameter.name, parameter.type.value, parameter.defaultValue) for parameter in method.parameters),
+        tuple(method.sourceCode),
+    )
+
+
+def modelFingerprint(pyutClass: PyutClass) -> int:
+    """
+    Hashes everything `ModelEncoder` writes for a model class;  It costs a fraction of
+    encoding the class, so every cache lookup checks it
+
+    Args:
+        pyutClass:  The model class
+
+    Returns:  A value that changes whenever the encoded model would
+    """
+    return hash((
+        pyutClass.name, pyutClass.id, pyutClass.stereotype.name, pyutClass.fileName, pyutClass.description,
+        pyutClass.showMethods, pyutClass.showFields, pyutClass.displayStereoType, pyutClass.displayParameters,
+        tuple(fieldFingerprint(field) for field in pyutClass.fields),
+        tuple(methodFingerprint(method) for method in pyutClass.methods),
+    ))
+
+
+@dataclass
+class CacheEntry:
+    fingerprint:   int                     = 0
+    schemaVersion: int                     = SCHEMA_VERSION_LEGACY
+    encodedModel:  Optional[EncodedModel]  = None
+    geometry:      Optional[ShapeGeometry] = None
+    level:         int                     = 0
+    encodedText:   Optional[str]           = None
+
+
+class EncoderCache:
+    """
+    Remembers the encoded form of each class so that re-serializing a large diagram
+    only re-encodes the classes that changed.
+
+    Two things are cached per model class:
+
+    * The encoded model dictionary;  It stays valid as long as the model does not change
+    * The complete serialized json text of the class;  It also depends on the shape
+      position and size,  so it is dropped whenever the geometry differs
+
+    An entry holds a single schema version;  Asking for another version is a miss and
+    replaces the entry.
+
+    There is no change notification in the model layer,  so each entry keeps a fingerprint
+    of the model (see `modelFingerprint()`).  A lookup whose model no longer matches its
+    fingerprint is a miss and drops the entry;  Edits made anywhere are noticed.  The
+    fingerprint is taken at the lookup,  before the class is encoded,  so an edit made
+    while encoding is caught by the next lookup.  `invalidate()` drops an entry at once.
+    Entries disappear on their own when a model class is garbage collected
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._entries: WeakKeyDictionary = WeakKeyDictionary()
+
+        self._textHits:    int = 0
+        self._textMisses:  int = 0
+        self._modelHits:   int = 0
+        self._modelMisses: int = 0
+
+    @property
+    def textHits(self) -> int:
+        return self._textHits
+
+    @property
+    def textMisses(self) -> int:
+        return self._textMisses
+
+    @property
+    def modelHits(self) -> int:
+        return self._modelHits
+
+    @property
+    def modelMisses(self) -> int:
+        return self._modelMisses
+
+    @property
+    def statistics(self) -> Dict[str, int]:
+        return {
+            'textHits':    self._textHits,
+            'textMisses':  self._textMisses,
+            'modelHits':   self._modelHits,
+            'modelMisses': self._modelMisses,
+        }
+
+    def encodedModel(self, pyutClass: PyutClass, schemaVersion: int = SCHEMA_VERSION_LEGACY) -> Optional[EncodedModel]:
+        """
+        Args:
+            pyutClass:      The model class
+            schemaVersion:  The schema the model is encoded with
+
+        Returns:  The cached encoded model or None if it must be encoded
+        """
+        entry: CacheEntry = self._currentEntry(pyutClass, schemaVersion=schemaVersion)
+
+        if entry.encodedModel is None:
+            self._modelMisses += 1
+            return None
+
+        self._modelHits += 1
+        return entry.encodedModel
+
+    def storeEncodedModel(self, pyutClass: PyutClass, encodedModel: EncodedModel, schemaVersion: int = SCHEMA_VERSION_LEGACY):
+
+        self._getEntry(pyutClass, schemaVersion=schemaVersion).encodedModel = encodedModel
+
+    def encodedText(self, pyutClass: PyutClass, geometry: ShapeGeometry, level: int, schemaVersion: int = SCHEMA_VERSION_LEGACY) -> Optional[str]:
+        """
+        Args:
+            pyutClass:      The model class
+            geometry:       The current position and size of its shape
+            level:          The json nesting level the text is written at
+            schemaVersion:  The schema the text is encoded with
+
+        Returns:  The cached serialized class or None if it must be serialized
+        """
+        entry: CacheEntry = self._currentEntry(pyutClass, schemaVersion=schemaVersion)
+
+        if entry.encodedText is None or entry.geometry != geometry or entry.level != level:
+            self._textMisses += 1
+            return None
+
+        self._textHits += 1
+        return entry.encodedText
+
+    def storeEncodedText(self, pyutClass: PyutClass, geometry: ShapeGeometry, level: int, encodedText: str, schemaVersion: int = SCHEMA_VERSION_LEGACY):
+
+        entry: CacheEntry = self._getEntry(pyutClass, schemaVersion=schemaVersion)
+
+        entry.geometry    = geometry
+        entry.level       = level
+        entry.encodedText = encodedText
+
+    def invalidate(self, pyutClass: PyutClass):
+        """
+        Call when the model class, its fields, or its methods change
+
+        Args:
+            pyutClass: The modified model class
+        """
+        self._entries.pop(pyutClass, None)
+
+    def clear(self):
+        self._entries.clear()
+
+    def resetStatistics(self):
+
+        self._textHits    = 0
+        self._textMisses  = 0
+        self._modelHits   = 0
+        self._modelMisses = 0
+
+    def _currentEntry(self, pyutClass: PyutClass, schemaVersion: int) -> CacheEntry:
+        """
+        Args:
+            pyutClass:      The model class
+            schemaVersion:  The schema the caller encodes with
+
+        Returns:  The class entry;  A new, empty one if the model changed or the schema differs
+        """
+        fingerprint: int                  = modelFingerprint(pyutClass)
+        entry:       Optional[CacheEntry] = self._entries.get(pyutClass)
+        if entry is None or entry.fingerprint != fingerprint or entry.schemaVersion != schemaVersion:
+            entry = CacheEntry(fingerprint=fingerprint, schemaVersion=schemaVersion)
+            self._entries[pyutClass] = entry
+
+        return entry
+
+    def _getEntry(self, pyutClass: PyutClass, schemaVersion: int) -> CacheEntry:
+        """
+        Stores go to the entry the preceding lookup left;  Its fingerprint is the one taken before encoding
+        """
+        entry: Optional[CacheEntry] = self._entries.get(pyutClass)
+        if entry is None or entry.schemaVersion != schemaVersion:
+            entry = self._currentEntry(pyutClass, schemaVersion=schemaVersion)
+
+        return entry
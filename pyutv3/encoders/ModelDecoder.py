@@ -0,0 +1,233 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Union
+
+from logging import Logger
+from logging import getLogger
+
+from json import JSONDecoder
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutModifiers
+from pyutmodel.PyutMethod import PyutParameters
+from pyutmodel.PyutMethod import SourceCode
+from pyutmodel.PyutModifier import PyutModifier
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutStereotype import PyutStereotype
+from pyutmodel.PyutType import PyutType
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.ModelEncoder import EncodedGraphicClass
+from pyutv3.encoders.ModelEncoder import INTERNED_STRING_KEY
+from pyutv3.encoders.ModelEncoder import InternedString
+
+JsonObject = Dict[str, Any]
+
+
+class ModelDecoder(JSONDecoder):
+    """
+    Knows how to turn the json that `ModelEncoder` creates back into the model;  A class
+    decodes to a `ClassRecord`,  its model and its geometry.  Nothing here imports wx,
+    so journals and conversion workers can decode diagrams off the GUI thread.
+
+    The json decoder calls the object hook inner-most object first, so by the
+    time a class dictionary is seen its fields and methods are already model objects.
+    Notes, links and interfaces are left as dictionaries
+
+    Documents with interned strings (see `ModelEncoder`) decode as well;  A string definition
+    is entered in the table when its object is decoded,  which is in document order.  Either way,
+    fields, methods and parameters of the same type share one `PyutType` and methods
+    share their `PyutModifier`s,  so a large diagram loads far fewer objects.  An instance
+    decodes a single document.
+
+    Both the legacy and the compact schema decode;  A method's modifiers are either
+    modifier dictionaries or plain names
+    """
+    def __init__(self, *args, **kwargs):
+
+        kwargs['object_hook'] = self._objectHook
+        super().__init__(*args, **kwargs)
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._strings:   List[str]               = []
+        self._types:     Dict[str, PyutType]     = {}
+        self._modifiers: Dict[str, PyutModifier] = {}
+
+    def _objectHook(self, jsonObject: JsonObject) -> Any:
+        """
+        Identify each json object by its keys and convert it
+
+        Args:
+            jsonObject: A decoded json dictionary
+
+        Returns:  The decoded model object or the dictionary itself
+        """
+        if INTERNED_STRING_KEY in jsonObject and len(jsonObject) == 1:
+            return self._defineString(jsonObject[INTERNED_STRING_KEY])
+        elif 'graphicClass' in jsonObject:
+            return self._decodeClass(jsonObject)
+        elif 'stereotype' in jsonObject:
+            return self._decodeModelClass(jsonObject)
+        elif 'returnType' in jsonObject:
+            return self._decodeMethod(jsonObject)
+        elif 'visibility' in jsonObject:
+            return self._decodeField(jsonObject)
+        elif 'defaultValue' in jsonObject:
+            return self._decodeParameter(jsonObject)
+        elif 'code' in jsonObject:
+            return jsonObject['code']
+        elif len(jsonObject) == 1 and 'name' in jsonObject:
+            return self._sharedModifier(self._resolveString(jsonObject['name']))
+        else:
+            return jsonObject
+
+    def _decodeClass(self, jsonObject: JsonObject) -> Any:
+        """
+        Args:
+            jsonObject:  The encoded class with its geometry and its model
+
+        Returns:  The class record;  Subclasses may build something else from it
+        """
+        graphicClass: EncodedGraphicClass = jsonObject['graphicClass']
+        pyutClass:    PyutClass           = jsonObject['modelClass']
+
+        geometry: ShapeGeometry = ShapeGeometry(x=graphicClass['x'], y=graphicClass['y'], width=graphicClass['width'], height=graphicClass['height'])
+
+        return ClassRecord(pyutClass=pyutClass, geometry=geometry)
+
+    def _decodeModelClass(self, jsonObject: JsonObject) -> PyutClass:
+        """
+        Decodes the class including its fields, and methods
+
+        Args:
+            jsonObject:  The encoded model dictionary
+
+        Returns:  A nice model class
+        """
+        pyutClass: PyutClass = PyutClass(name=jsonObject['name'])
+
+        pyutClass.id                = jsonObject['id']
+        pyutClass.stereotype        = PyutStereotype(name=jsonObject['stereotype'])
+        pyutClass.fileName          = jsonObject['fileName']
+        pyutClass.description       = jsonObject['description']
+        pyutClass.showMethods       = jsonObject['showMethods']
+        pyutClass.showFields        = jsonObject['showFields']
+        pyutClass.displayStereoType = jsonObject['displayStereoType']
+        pyutClass.displayParameters = PyutDisplayParameters.toEnum(jsonObject['displayParameters'])
+
+        pyutClass.fields  = jsonObject['fields']
+        pyutClass.methods = jsonObject['methods']
+
+        return pyutClass
+
+    def _decodeField(self, jsonObject: JsonObject) -> PyutField:
+        """
+        Fields are encoded with the visibility value, e.g. '+'
+
+        Args:
+            jsonObject:  The encoded field
+
+        Returns:  The model field
+        """
+        visibility: str = self._resolveString(jsonObject['visibility'])
+        fieldType:  str = self._resolveString(jsonObject['type'])
+
+        return PyutField(name=jsonObject['name'],
+                         fieldType=self._sharedType(fieldType),
+                         defaultValue=jsonObject['defaultValue'],
+                         visibility=PyutVisibilityEnum.toEnum(visibility))
+
+    def _decodeMethod(self, jsonObject: JsonObject) -> PyutMethod:
+        """
+        Methods are encoded with the visibility name, e.g. 'PUBLIC'
+
+        Args:
+            jsonObject: The encoded method
+
+        Returns:  The model method
+        """
+        modifiers:  List[PyutModifier] = [self._decodeModifier(modifier) for modifier in jsonObject['modifiers']]
+        visibility: str                = self._resolveString(jsonObject['visibility'])
+        returnType: str                = self._resolveString(jsonObject['returnType'])
+
+        pyutMethod: PyutMethod = PyutMethod(name=jsonObject['name'],
+                                            visibility=PyutVisibilityEnum.toEnum(visibility),
+                                            returnType=self._sharedType(returnType))
+
+        parameters: List[PyutParameter] = jsonObject['parameters']
+        sourceCode: List[str]           = jsonObject['sourceCode']
+
+        pyutMethod.modifiers  = PyutModifiers(modifiers)
+        pyutMethod.parameters = PyutParameters(parameters)
+        pyutMethod.sourceCode = SourceCode(sourceCode)
+
+        return pyutMethod
+
+    def _decodeModifier(self, modifier: Union[PyutModifier, InternedString]) -> PyutModifier:
+        """
+        Args:
+            modifier: A legacy modifier that the object hook already decoded or a compact modifier name
+
+        Returns:  The model modifier
+        """
+        if isinstance(modifier, PyutModifier):
+            return modifier
+
+        return self._sharedModifier(self._resolveString(modifier))
+
+    def _decodeParameter(self, jsonObject: JsonObject) -> PyutParameter:
+
+        return PyutParameter(name=jsonObject['name'],
+                             parameterType=self._sharedType(self._resolveString(jsonObject['type'])),
+                             defaultValue=jsonObject['defaultValue'])
+
+    def _defineString(self, value: str) -> str:
+        """
+        Definitions are entered in the table in the order the object hook sees them;  That
+        is the order they are written in, the order the encoder numbered them in
+
+        Args:
+            value:  The defined string
+
+        Returns:  The string
+        """
+        self._strings.append(value)
+        return value
+
+    def _resolveString(self, value: InternedString) -> str:
+        """
+        Args:
+            value:  A string or a string table index;  Definitions are already resolved
+
+        Returns:  The string
+        """
+        if isinstance(value, int):
+            return self._strings[value]
+
+        return value
+
+    def _sharedType(self, typeValue: str) -> PyutType:
+
+        pyutType: Optional[PyutType] = self._types.get(typeValue)
+        if pyutType is None:
+            pyutType = PyutType(value=typeValue)
+            self._types[typeValue] = pyutType
+
+        return pyutType
+
+    def _sharedModifier(self, modifierName: str) -> PyutModifier:
+
+        pyutModifier: Optional[PyutModifier] = self._modifiers.get(modifierName)
+        if pyutModifier is None:
+            pyutModifier = PyutModifier(modifierTypeName=modifierName)
+            self._modifiers[modifierName] = pyutModifier
+
+        return pyutModifier
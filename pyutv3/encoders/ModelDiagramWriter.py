@@ -0,0 +1,156 @@
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+from typing import TYPE_CHECKING
+
+from logging import Logger
+from logging import getLogger
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelEncoder import ModelEncoder
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_KEY
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+
+if TYPE_CHECKING:
+    from pyutv3.encoders.EncoderCache import EncoderCache
+
+OGL_CLASSES_KEY:    str = 'oglClasses'
+OGL_NOTES_KEY:      str = 'oglNotes'
+OGL_INTERFACES_KEY: str = 'oglInterfaces'
+OGL_LINKS_KEY:      str = 'oglLinks'
+
+DEFAULT_INDENT: int = 4
+
+# The top level document key and its serialized objects
+EncodedSection = Tuple[str, Iterator[str]]
+# Notes, links and interfaces that were already encoded to json dictionaries
+EncodedObjects = List[Dict[str, Any]]
+
+
+class ModelDiagramWriter:
+    """
+    Streams a diagram document made of `ClassRecord`s;  Model classes and their geometry.
+    Nothing here imports wx, so headless converters can write diagrams.  The document
+    is byte for byte what `OglDiagramWriter` writes for the equivalent OGL classes.
+
+    This is also where the document layout lives;  `OglDiagramWriter` writes its sections
+    with the same methods
+    """
+    def __init__(self, stream: TextIO, indent: int = DEFAULT_INDENT, internStrings: bool = False, schemaVersion: int = SCHEMA_VERSION_LEGACY,
+                 cache: Optional['EncoderCache'] = None):
+        """
+
+        Args:
+            stream:         The text stream to write to
+            indent:         The json indentation
+            internStrings:  Write repeated type, visibility and modifier names as string table references
+            schemaVersion:  The encoding schema;  See `ModelEncoder`
+            cache:          Reuses the encoded models of unchanged classes
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._stream:        TextIO                   = stream
+        self._indent:        int                      = indent
+        self._internStrings: bool                     = internStrings
+        self._schemaVersion: int                      = schemaVersion
+        self._cache:         Optional['EncoderCache'] = cache
+        self._encoder:       ModelEncoder             = self._createEncoder()
+
+    def writeClassRecords(self, classRecords: Iterable[ClassRecord], oglNotes: Optional[EncodedObjects] = None, oglInterfaces: Optional[EncodedObjects] = None,
+                          oglLinks: Optional[EncodedObjects] = None):
+        """
+        Write the classes as a single json document;  Each class is encoded just before it is written
+
+        Args:
+            classRecords:   The diagram's classes
+            oglNotes:       The already encoded notes;  None for no notes
+            oglInterfaces:  The already encoded interface lollipops;  None for none
+            oglLinks:       The already encoded links;  None for no links
+        """
+        self._encoder = self._createEncoder()
+
+        self._writeDocument([
+            (OGL_CLASSES_KEY,    (self._serialize(oglObject=classRecord, level=2) for classRecord in classRecords)),
+            (OGL_NOTES_KEY,      self._encodedObjects(oglNotes)),
+            (OGL_INTERFACES_KEY, self._encodedObjects(oglInterfaces)),
+            (OGL_LINKS_KEY,      self._encodedObjects(oglLinks)),
+        ])
+
+    def _writeDocument(self, sections: List[EncodedSection]):
+        """
+        Args:
+            sections:   The document sections in order;  Each section's objects are consumed as they are written
+        """
+        self._stream.write('{')
+        if self._schemaVersion != SCHEMA_VERSION_LEGACY:
+            self._stream.write(f'{self._newLine(level=1)}"{SCHEMA_VERSION_KEY}": {self._schemaVersion},')
+        for idx, (key, encodedObjects) in enumerate(sections):
+            self._writeSection(key=key, encodedObjects=encodedObjects, isLast=idx == len(sections) - 1)
+        self._stream.write('\n}')
+
+    def _writeSection(self, key: str, encodedObjects: Iterator[str], isLast: bool):
+        """
+        Write a top level document key and its list of encoded objects
+
+        Args:
+            key:            The top level document key
+            encodedObjects: The serialized objects in the list;  Consumed as they are written
+            isLast:         'True' if no other section follows this one
+        """
+        self._stream.write(f'{self._newLine(level=1)}"{key}": [')
+
+        count: int = 0
+        for encodedObject in encodedObjects:
+            if count > 0:
+                self._stream.write(',')
+            self._stream.write(self._newLine(level=2))
+            self._stream.write(encodedObject)
+            count += 1
+
+        if count > 0:
+            self._stream.write(self._newLine(level=1))
+        self._stream.write(']')
+
+        if isLast is False:
+            self._stream.write(',')
+
+    def _serialize(self, oglObject, level: int) -> str:
+        """
+        The encoder always starts at the left margin;  Shift the encoded object
+        over to the nesting level it occupies in the document.  Json strings escape
+        their new lines,  so every raw new line comes from the indentation
+
+        Args:
+            oglObject:  The object to encode
+            level:      The nesting level of the object in the document
+
+        Returns:  The serialized object
+        """
+        encodedValue: str = ''.join(self._encoder.iterencode(oglObject))
+        if level > 0:
+            encodedValue = encodedValue.replace('\n', self._newLine(level=level))
+
+        return encodedValue
+
+    def _encodedObjects(self, encodedObjects: Optional[EncodedObjects]) -> Iterator[str]:
+        """
+        The dictionaries are already encoded;  Serializing them only lays them out
+        """
+        if encodedObjects is None:
+            return iter([])
+
+        return (self._serialize(oglObject=encodedObject, level=2) for encodedObject in encodedObjects)
+
+    def _createEncoder(self) -> ModelEncoder:
+        """
+        The encoder remembers which strings it already wrote;  Each document needs a new one
+        """
+        return ModelEncoder(indent=self._indent, cache=self._cache, internStrings=self._internStrings, schemaVersion=self._schemaVersion)
+
+    def _newLine(self, level: int) -> str:
+        return f'\n{" " * (self._indent * level)}'
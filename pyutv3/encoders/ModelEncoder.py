@@ -0,0 +1,361 @@
+from typing import Dict
+from typing import List
+from typing import NewType
+from typing import Optional
+from typing import Set
+from typing import Union
+from typing import TYPE_CHECKING
+
+from json import JSONEncoder
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutInterface import PyutInterface
+from pyutmodel.PyutLink import PyutLink
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutModifiers
+from pyutmodel.PyutMethod import SourceCode
+from pyutmodel.PyutModifier import PyutModifier
+from pyutmodel.PyutNote import PyutNote
+from pyutmodel.PyutParameter import PyutParameter
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+if TYPE_CHECKING:
+    from pyutv3.encoders.EncoderCache import EncoderCache
+
+#
+# Legacy wraps every modifier and source line in its own dictionary;  Compact writes
+# modifiers as a list of names and source code as a list of lines
+#
+SCHEMA_VERSION_KEY:     str = 'schemaVersion'
+SCHEMA_VERSION_LEGACY:  int = 1
+SCHEMA_VERSION_COMPACT: int = 2
+
+EncodedGraphicClass = NewType('EncodedGraphicClass', Dict[str, int])
+
+#
+# When interning, the first occurrence of a string is wrapped in a definition, e.g.
+# {"string": "int"}, that enters it in the document string table;  Every later
+# occurrence is replaced by its index in the table
+#
+INTERNED_STRING_KEY: str = 'string'
+
+EncodedStringDefinition = NewType('EncodedStringDefinition', Dict[str, str])
+
+InternedString = Union[str, int, EncodedStringDefinition]
+
+EncodedField  = NewType('EncodedField',  Dict[str, InternedString])
+EncodedFields = NewType('EncodedFields', List[EncodedField])
+
+EncodedModifier  = NewType('EncodedModifier',  Dict[str, InternedString])
+EncodedModifiers = NewType('EncodedModifiers', List[Union[EncodedModifier, InternedString]])
+
+EncodedParameter  = NewType('EncodedParameter',  Dict[str, InternedString])
+EncodedParameters = NewType('EncodedParameters', List[EncodedParameter])
+
+EncodedSourceLine = NewType('EncodedSourceLine', Dict[str, str])
+EncodedSourceCode = NewType('EncodedSourceCode', List[Union[EncodedSourceLine, str]])
+
+MethodValueTypes = Union[InternedString, EncodedModifiers, EncodedParameters, EncodedSourceCode]
+
+EncodedMethod  = NewType('EncodedMethod',  Dict[str, MethodValueTypes])
+EncodedMethods = NewType('EncodedMethods', List[EncodedMethod])
+
+ModelValueTypes = Union[int, str, float, bool, EncodedFields, EncodedMethods]
+EncodedModel    = NewType('EncodedModel', Dict[str, ModelValueTypes])
+
+EncodedNote = NewType('EncodedNote', Dict[str, Union[int, str]])
+
+EncodedPoint  = NewType('EncodedPoint',  Dict[str, int])
+EncodedPoints = NewType('EncodedPoints', List[EncodedPoint])
+
+GraphicLinkValueTypes = Union[int, bool, EncodedPoint, EncodedPoints]
+
+EncodedGraphicLink = NewType('EncodedGraphicLink', Dict[str, GraphicLinkValueTypes])
+EncodedModelLink   = NewType('EncodedModelLink',   Dict[str, Union[str, bool]])
+
+EncodedGraphicLollipop = NewType('EncodedGraphicLollipop', Dict[str, Union[int, str]])
+
+InterfaceValueTypes = Union[int, str, List[str], EncodedMethods]
+EncodedInterface    = NewType('EncodedInterface', Dict[str, InterfaceValueTypes])
+
+
+class ModelEncoder(JSONEncoder):
+    """
+    Encodes the model half of a diagram;  Classes, notes, links and interfaces as the
+    `pyutmodel` objects describe them.  Nothing here imports wx,  so conversion workers
+    and servers can encode diagrams without an application object or a display.
+
+    A class is encoded from a `ClassRecord`,  its model and its geometry;  The output is
+    exactly what `OglClassEncoder` writes for the equivalent `OglClass`.  A lone field or
+    method is encoded as it is within its class
+
+    With `internStrings=True` the type, visibility and modifier names go into a document
+    level string table.  The first occurrence of a string is written as a definition that
+    gets the next index;  Every later occurrence is written as that index.  Strings are
+    numbered in document order,  so a reader that sees the definitions in the order they
+    are written resolves every index.  Interned models depend on what came before
+    them in the document,  so they are never cached
+
+    `schemaVersion` selects the legacy or the compact schema;  `ModelDecoder` reads both
+    """
+    def __init__(self, *args, cache: Optional['EncoderCache'] = None, internStrings: bool = False, schemaVersion: int = SCHEMA_VERSION_LEGACY, **kwargs):
+
+        super().__init__(*args, **kwargs)
+
+        self._cache:               Optional['EncoderCache'] = cache
+        self._internStrings:       bool                     = internStrings
+        self._schemaVersion:       int                      = schemaVersion
+        self._encodedInterfaceIds: Set[int]                 = set()
+        self._stringIds:           Dict[str, int]           = {}
+
+    @property
+    def internStrings(self) -> bool:
+        return self._internStrings
+
+    @property
+    def schemaVersion(self) -> int:
+        return self._schemaVersion
+
+    def default(self, o):
+
+        if isinstance(o, ClassRecord):
+            return self._encodeClassRecord(classRecord=o)
+        elif isinstance(o, PyutField):
+            return self._encodeField(field=o)
+        elif isinstance(o, PyutMethod):
+            return self._encodeMethod(pyutMethod=o)
+        else:
+            return super().default(o)
+
+    def _encodeClassRecord(self, classRecord: ClassRecord):
+
+        return {
+            'graphicClass': self._encodeGeometry(geometry=classRecord.geometry),
+            'modelClass':   self._encodeCachedModelClass(pyutClass=classRecord.pyutClass),
+        }
+
+    def _encodeGeometry(self, geometry: ShapeGeometry) -> EncodedGraphicClass:
+
+        return EncodedGraphicClass({'width': geometry.width, 'height': geometry.height, 'x': geometry.x, 'y': geometry.y})
+
+    def _encodeCachedModelClass(self, pyutClass: PyutClass) -> EncodedModel:
+        """
+        Only encodes the model class if the cache does not already have it
+
+        Args:
+            pyutClass:  The model class to encode
+
+        Returns:  The encoded model
+        """
+        if self._cache is None or self._internStrings is True:
+            return self._encodeModelClass(pyutClass=pyutClass)
+
+        encodedModel: Optional[EncodedModel] = self._cache.encodedModel(pyutClass, schemaVersion=self._schemaVersion)
+        if encodedModel is None:
+            encodedModel = self._encodeModelClass(pyutClass=pyutClass)
+            self._cache.storeEncodedModel(pyutClass, encodedModel, schemaVersion=self._schemaVersion)
+
+        return encodedModel
+
+    def _encodeModelClass(self, pyutClass: PyutClass) -> EncodedModel:
+        """
+        Encodes the class to include its fields, methods, & source code
+        Args:
+            pyutClass:  The model class to encode
+
+        Returns:  A nice model dictionary
+        """
+        encodedFields:  EncodedFields  = self._encodeClassFields(pyutClass.fields)
+        encodedMethods: EncodedMethods = self._encodeMethods(pyutClass.methods)
+
+        encodedModel: EncodedModel = EncodedModel (
+            {
+                'name':              pyutClass.name,
+                'id':                pyutClass.id,
+                'stereotype':        pyutClass.stereotype.name,
+                'fileName':          pyutClass.fileName,
+
+                'description':       pyutClass.description,
+                'showMethods':       pyutClass.showMethods,
+                'showFields':        pyutClass.showFields,
+                'displayStereoType': pyutClass.displayStereoType,
+                'displayParameters': pyutClass.displayParameters.value,
+                'fields':            encodedFields,
+                'methods':           encodedMethods,
+            }
+        )
+        return encodedModel
+
+    def _encodeModelNote(self, pyutNote: PyutNote) -> EncodedNote:
+
+        return EncodedNote(
+            {
+                'id':       pyutNote.id,
+                'content':  pyutNote.content,
+                'fileName': pyutNote.fileName,
+            }
+        )
+
+    def _encodeModelLink(self, pyutLink: PyutLink) -> EncodedModelLink:
+
+        return EncodedModelLink(
+            {
+                'name':                   pyutLink.name,
+                'linkType':               pyutLink.linkType.name,
+                'sourceCardinality':      pyutLink.sourceCardinality,
+                'destinationCardinality': pyutLink.destinationCardinality,
+                'bidirectional':          pyutLink.getBidir(),
+            }
+        )
+
+    def _encodeModelInterface(self, pyutInterface: PyutInterface) -> EncodedInterface:
+
+        return EncodedInterface(
+            {
+                'name':         pyutInterface.name,
+                'id':           pyutInterface.id,
+                'description':  pyutInterface.description,
+                'implementors': list(pyutInterface.implementors),
+                'methods':      self._encodeMethods(pyutInterface.methods),
+            }
+        )
+
+    def _encodeClassFields(self, fields: List[PyutField]) -> EncodedFields:
+        """
+        Encodes the fields associated with a model class
+        Args:
+            fields:  The list of data model fields
+
+        Returns:    A list of encoded data class model fields
+        """
+        encodedFields: EncodedFields = EncodedFields([])
+        for field in fields:
+            encodedField: EncodedField = self._encodeField(field=field)
+            encodedFields.append(encodedField)
+        return encodedFields
+
+    def _encodeField(self, field: PyutField) -> EncodedField:
+        """
+        Encode a specific field
+        Args:
+            field:  The model field
+
+        Returns:    Encoded field
+        """
+        return EncodedField(
+            {
+                'name':         field.name,
+                'visibility':   self._internString(field.visibility.value),
+                'type':         self._internString(field.type.value),
+                'defaultValue': field.defaultValue
+            }
+        )
+
+    def _encodeMethods(self, pyutMethods: List[PyutMethod]):
+
+        encodedMethods: EncodedMethods = EncodedMethods([])
+        for method in pyutMethods:
+            encodedMethod: EncodedMethod = self._encodeMethod(method)
+            encodedMethods.append(encodedMethod)
+
+        return encodedMethods
+
+    def _encodeMethod(self, pyutMethod: PyutMethod) -> EncodedMethod:
+        """
+        The values are encoded in key order;  Interned strings are numbered in the order
+        they are written
+
+        Args:
+            pyutMethod:  The model method
+
+        Returns:  The encoded method
+        """
+        return EncodedMethod(
+            {
+                'name':       pyutMethod.name,
+                'visibility': self._internString(pyutMethod.visibility.name),
+                'returnType': self._internString(pyutMethod.returnType.value),
+                'modifiers':  self._encodeModifiers(pyutMethod.modifiers),
+                'parameters': self._encodeParameters(pyutMethod.parameters),
+                'sourceCode': self._encodeSourceCode(pyutMethod.sourceCode),
+            }
+        )
+
+    def _encodeModifiers(self, pyutModifiers: PyutModifiers) -> EncodedModifiers:
+
+        if self._schemaVersion == SCHEMA_VERSION_COMPACT:
+            return EncodedModifiers([self._internString(modifier.name) for modifier in pyutModifiers])
+
+        encodedModifiers: EncodedModifiers = EncodedModifiers([])
+
+        for modifier in pyutModifiers:
+            encodedModifier = self._encodeModifier(modifier)
+            encodedModifiers.append(encodedModifier)
+
+        return encodedModifiers
+
+    def _encodeModifier(self, pyutModifier: PyutModifier) -> EncodedModifier:
+        return EncodedModifier({
+            'name': self._internString(pyutModifier.name)
+        })
+
+    def _encodeParameters(self, pyutParameters: List[PyutParameter]) -> EncodedParameters:
+
+        encodedParameters: EncodedParameters = EncodedParameters([])
+        for parameter in pyutParameters:
+            encodedParameter: EncodedParameter = self._encodeParameter(parameter)
+            encodedParameters.append(encodedParameter)
+
+        return encodedParameters
+
+    def _encodeParameter(self, pyutParameter: PyutParameter) -> EncodedParameter:
+
+        return EncodedParameter(
+            {
+                'name':         pyutParameter.name,
+                'type':         self._internString(self.__toSafeString(pyutParameter.type.value)),
+                'defaultValue': self.__toSafeString(pyutParameter.defaultValue),
+            }
+        )
+
+    def _encodeSourceCode(self, sourceCode: SourceCode) -> EncodedSourceCode:
+
+        if self._schemaVersion == SCHEMA_VERSION_COMPACT:
+            return EncodedSourceCode(list(sourceCode))
+
+        encodedSourceCode: EncodedSourceCode = EncodedSourceCode([])
+        for code in sourceCode:
+            encodedLine: EncodedSourceLine = self._encodeCodeLine(code)
+            encodedSourceCode.append(encodedLine)
+
+        return encodedSourceCode
+
+    def _encodeCodeLine(self, codeLine: str) -> EncodedSourceLine:
+        return EncodedSourceLine({
+            'code': codeLine
+        })
+
+    def _internString(self, value: str) -> InternedString:
+        """
+        Args:
+            value:  A type, visibility or modifier name
+
+        Returns:  The value itself,  its string table definition or its string table index if it was already defined
+        """
+        if self._internStrings is False:
+            return value
+
+        stringId: Optional[int] = self._stringIds.get(value)
+        if stringId is None:
+            self._stringIds[value] = len(self._stringIds)
+            return EncodedStringDefinition({INTERNED_STRING_KEY: value})
+
+        return stringId
+
+    def __toSafeString(self, string) -> str:
+        if string is None:
+            string = ''
+        return string
@@ -0,0 +1,23 @@
+from typing import Any
+
+from ogl.OglClass import OglClass
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelDecoder import JsonObject
+from pyutv3.encoders.ModelDecoder import ModelDecoder
+
+
+class OglClassDecoder(ModelDecoder):
+    """
+    Knows how to turn the json that `OglClassEncoder` creates back into OGL classes.  The
+    models are decoded by `ModelDecoder`;  This builds the shape from the geometry, so it
+    needs wx.  See `ModelDecoder` for interned strings and the schema versions
+    """
+    def _decodeClass(self, jsonObject: JsonObject) -> Any:
+
+        classRecord: ClassRecord = super()._decodeClass(jsonObject)
+
+        oglClass: OglClass = OglClass(pyutClass=classRecord.pyutClass, w=classRecord.geometry.width, h=classRecord.geometry.height)
+        oglClass.SetPosition(x=classRecord.geometry.x, y=classRecord.geometry.y)
+
+        return oglClass
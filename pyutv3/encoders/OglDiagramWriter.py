@@ -0,0 +1,166 @@
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import cast
+
+from logging import getLogger
+
+from miniogl.Shape import Shape
+
+from ogl.OglClass import OglClass
+
+from pyutv3.encoders.BulkEncoder import BulkEncoder
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.DiagramObjects import DiagramObjects
+from pyutv3.encoders.DiagramObjects import OGL_CLASSES_KEY
+from pyutv3.encoders.EncoderCache import EncoderCache
+from pyutv3.encoders.ModelDiagramWriter import DEFAULT_INDENT
+from pyutv3.encoders.ModelDiagramWriter import EncodedSection
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+
+class OglDiagramWriter(ModelDiagramWriter):
+    """
+    Streams a diagram's OGL objects as json.  Each class is encoded and written
+    as soon as it is reached, so peak memory stays near a single encoded class
+    instead of the whole document.
+
+    The output is byte for byte what `json.dumps(..., cls=OglClassEncoder, indent=4)`
+    would produce for the same objects.
+
+    The stream can be anything with a text `write()` method;  For example, an open
+    file or `socket.makefile('w', encoding='utf-8')`
+
+    When given an `EncoderCache` the serialized text of classes whose model and
+    geometry did not change is written straight from the cache;  Except when interning
+    strings,  since then the text of a class depends on the classes written before it
+
+    Diagrams in any schema but the legacy one start with the schema version
+
+    Given a `BulkEncoder` the classes are serialized all at once on its worker pool before
+    the document is streamed;  The output does not change.  Interned documents are always
+    written serially
+    """
+    def __init__(self, stream: TextIO, indent: int = DEFAULT_INDENT, cache: Optional[EncoderCache] = None, internStrings: bool = False,
+                 schemaVersion: int = SCHEMA_VERSION_LEGACY, bulkEncoder: Optional[BulkEncoder] = None):
+        """
+
+        Args:
+            stream:         The text stream to write to
+            indent:         The json indentation
+            cache:          An optional cache of encoded classes
+            internStrings:  Write repeated type, visibility and modifier names as string table references
+            schemaVersion:  The encoding schema;  See `OglClassEncoder`
+            bulkEncoder:    Optionally, serializes the classes in parallel
+        """
+        self._bulkEncoder: Optional[BulkEncoder] = bulkEncoder
+
+        super().__init__(stream=stream, indent=indent, internStrings=internStrings, schemaVersion=schemaVersion, cache=cache)
+
+        self.logger = getLogger(__name__)
+
+    def writeOglClass(self, oglClass: OglClass):
+        """
+        Write a single class as a top level json document
+
+        Args:
+            oglClass:   The class to write
+        """
+        self._encoder = self._createEncoder()
+        self._stream.write(self._encodeObject(oglObject=oglClass, level=0))
+
+    def writeDiagram(self, oglObjects: Iterable[Shape]):
+        """
+        Write all the diagram objects as a single json document.  The objects are
+        sorted by kind, so that links come after the objects they connect;  Each
+        object is encoded exactly once
+
+        Args:
+            oglObjects:  The diagram's shapes;  For example, `Diagram.GetShapes()`
+        """
+        diagramObjects: DiagramObjects = DiagramObjects.fromShapes(oglObjects)
+
+        self._encoder = self._createEncoder()
+
+        sections: List[EncodedSection] = []
+        for key, sectionObjects in diagramObjects.sections():
+            if key == OGL_CLASSES_KEY and self._bulkEncoder is not None and self._internStrings is False:
+                encodedObjects: Iterator[str] = iter(self._encodeClassesInBulk(oglClasses=sectionObjects, level=2))
+            else:
+                encodedObjects = self._encodeObjects(sectionObjects=sectionObjects, level=2)
+            sections.append((key, encodedObjects))
+        self._writeDocument(sections)
+
+    def _encodeObjects(self, sectionObjects: List, level: int) -> Iterator[str]:
+        """
+        Lazily, so that each object is encoded just before it is written
+        """
+        return (self._encodeObject(oglObject=oglObject, level=level) for oglObject in sectionObjects)
+
+    def _encodeObject(self, oglObject, level: int) -> str:
+        """
+        Args:
+            oglObject:  The object to encode
+            level:      The nesting level of the object in the document
+
+        Returns:  The serialized object
+        """
+        if self._cache is None or self._internStrings is True or isinstance(oglObject, OglClass) is False:
+            return self._serialize(oglObject=oglObject, level=level)
+
+        geometry:    ShapeGeometry = self._shapeGeometry(oglObject)
+        encodedText: Optional[str] = self._cache.encodedText(oglObject.pyutObject, geometry=geometry, level=level, schemaVersion=self._schemaVersion)
+        if encodedText is None:
+            encodedText = self._serialize(oglObject=oglObject, level=level)
+            self._cache.storeEncodedText(oglObject.pyutObject, geometry=geometry, level=level, encodedText=encodedText, schemaVersion=self._schemaVersion)
+
+        return encodedText
+
+    def _encodeClassesInBulk(self, oglClasses: List[OglClass], level: int) -> List[str]:
+        """
+        Only the classes that are not in the cache are captured as class records and serialized
+
+        Args:
+            oglClasses: The diagram classes
+            level:      The nesting level of the classes in the document
+
+        Returns:  The serialized classes in document order
+        """
+        assert self._bulkEncoder is not None, 'Only for bulk encoding'
+
+        encodedTexts:  List[Optional[str]] = []
+        missedIndices: List[int]           = []
+        missedClasses: List[OglClass]      = []
+        for idx, oglClass in enumerate(oglClasses):
+            encodedText: Optional[str] = None
+            if self._cache is not None:
+                encodedText = self._cache.encodedText(oglClass.pyutObject, geometry=self._shapeGeometry(oglClass), level=level, schemaVersion=self._schemaVersion)
+            if encodedText is None:
+                missedIndices.append(idx)
+                missedClasses.append(oglClass)
+            encodedTexts.append(encodedText)
+
+        classRecords: List[ClassRecord] = [ClassRecord(pyutClass=oglClass.pyutObject, geometry=self._shapeGeometry(oglClass)) for oglClass in missedClasses]
+        serialized:   List[str]         = self._bulkEncoder.serialize(classRecords, indent=self._indent, level=level, schemaVersion=self._schemaVersion)
+
+        for idx, oglClass, encodedText in zip(missedIndices, missedClasses, serialized):
+            encodedTexts[idx] = encodedText
+            if self._cache is not None:
+                self._cache.storeEncodedText(oglClass.pyutObject, geometry=self._shapeGeometry(oglClass), level=level, encodedText=encodedText,
+                                             schemaVersion=self._schemaVersion)
+
+        return cast(List[str], encodedTexts)
+
+    def _shapeGeometry(self, oglObject: OglClass) -> ShapeGeometry:
+        return OglClassEncoder.shapeGeometry(oglObject)
+
+    def _createEncoder(self) -> OglClassEncoder:
+        """
+        The encoder remembers which interfaces and strings it already wrote;  Each document needs a new one
+        """
+        return OglClassEncoder(indent=self._indent, cache=self._cache, internStrings=self._internStrings, schemaVersion=self._schemaVersion)
@@ -1,214 +1,162 @@
-
 from typing import Dict
 from typing import List
-from typing import NewType
 from typing import Union
 
-from json import JSONEncoder
-
+from miniogl.ControlPoint import ControlPoint
+from miniogl.SelectAnchorPoint import SelectAnchorPoint
 from miniogl.Shape import Shape
 
 from ogl.OglClass import OglClass
 from ogl.OglInterface2 import OglInterface2
 from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
 from ogl.OglObject import OglObject
 
-from pyutmodel.PyutClass import PyutClass
-from pyutmodel.PyutField import PyutField
-from pyutmodel.PyutMethod import PyutMethod
-from pyutmodel.PyutMethod import PyutModifiers
-from pyutmodel.PyutMethod import SourceCode
-from pyutmodel.PyutModifier import PyutModifier
-from pyutmodel.PyutParameter import PyutParameter
-
-EncodedGraphicClass = NewType('EncodedGraphicClass', Dict[str, int])
-
-EncodedField  = NewType('EncodedField',  Dict[str, str])
-EncodedFields = NewType('EncodedFields', List[EncodedField])
-
-EncodedModifier  = NewType('EncodedModifier',  Dict[str, str])
-EncodedModifiers = NewType('EncodedModifiers', List[EncodedModifier])
-
-EncodedParameter  = NewType('EncodedParameter',  Dict[str, str])
-EncodedParameters = NewType('EncodedParameters', List[EncodedParameter])
+from pyutmodel.PyutInterface import PyutInterface
 
-EncodedSourceLine = NewType('EncodedSourceLine', Dict[str, str])
-EncodedSourceCode = NewType('EncodedSourceCode', List[EncodedSourceLine])
-
-MethodValueTypes = Union[str, EncodedModifiers, EncodedParameters, EncodedSourceCode]
-
-EncodedMethod  = NewType('EncodedMethod',  Dict[str, MethodValueTypes])
-EncodedMethods = NewType('EncodedMethods', List[EncodedMethod])
-
-ModelValueTypes = Union[int, str, float, bool, EncodedFields, EncodedMethods]
-EncodedModel    = NewType('EncodedModel', Dict[str, ModelValueTypes])
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.ModelEncoder import EncodedGraphicClass
+from pyutv3.encoders.ModelEncoder import EncodedGraphicLink
+from pyutv3.encoders.ModelEncoder import EncodedGraphicLollipop
+from pyutv3.encoders.ModelEncoder import EncodedInterface
+from pyutv3.encoders.ModelEncoder import EncodedPoint
+from pyutv3.encoders.ModelEncoder import EncodedPoints
+from pyutv3.encoders.ModelEncoder import ModelEncoder
 
 Serializable  = Union[OglObject, OglLink, OglInterface2]
 
 
-class OglClassEncoder(JSONEncoder):
-    """
-    Knows how to turn OGL Classes into json
+class OglClassEncoder(ModelEncoder):
     """
+    Knows how to turn OGL Classes, Notes, Links and Interfaces into json.  The models
+    are encoded by `ModelEncoder`;  This adds the shape geometry
+
+    Links and interface lollipops refer to the objects they connect by the model id;  They
+    never nest them.  An interface model is encoded the first time a lollipop refers to it;
+    Later lollipops only carry its id
 
+    Pass an `EncoderCache` (e.g. `json.dumps(o, cls=OglClassEncoder, cache=cache)`) to reuse
+    the encoded models of unchanged classes.  See `ModelEncoder` for `internStrings` and
+    `schemaVersion`
+    """
     def default(self, o: Serializable):
 
         if isinstance(o, OglClass):
-            pyutClass: PyutClass = o.pyutObject
-
-            graphicDictionary: EncodedGraphicClass = self._encodeGraphicClass(o)
-            modelDictionary:   EncodedModel   = self._encodeModelClass(pyutClass=pyutClass)
+            return self._encodeClassRecord(classRecord=ClassRecord(pyutClass=o.pyutObject, geometry=OglClassEncoder.shapeGeometry(o)))
+        elif isinstance(o, OglNote):
+            return {
+                'graphicNote': self._encodeGraphicClass(o),
+                'modelNote':   self._encodeModelNote(pyutNote=o.pyutObject),
+            }
+        elif isinstance(o, OglInterface2):
+            return self._encodeOglInterface(oglInterface=o)
+        elif isinstance(o, OglLink):
             return {
-                'graphicClass': graphicDictionary,
-                'modelClass':   modelDictionary,
+                'graphicLink': self._encodeGraphicLink(oglLink=o),
+                'modelLink':   self._encodeModelLink(pyutLink=o.pyutObject),
             }
         else:
-            super().__init__()
+            return super().default(o)
 
-    def _encodeGraphicClass(self, shape: Shape) -> EncodedGraphicClass:
+    @classmethod
+    def shapeGeometry(cls, shape: Shape) -> ShapeGeometry:
         """
-
         Args:
-            shape:  The basic shap class which is root of all
+            shape:  The basic shape class which is root of all
 
-        Returns:  A dictionary with the graphic class attributes
+        Returns:  The shape's position and size
         """
-        w, h = shape.GetSize()
         x, y = shape.GetPosition()
+        w, h = shape.GetSize()
 
-        return EncodedGraphicClass({'width': w, 'height': h, 'x': x, 'y': y})
+        return ShapeGeometry(x=x, y=y, width=w, height=h)
 
-    def _encodeModelClass(self, pyutClass: PyutClass) -> EncodedModel:
+    def _encodeGraphicClass(self, shape: Shape) -> EncodedGraphicClass:
         """
-        Encodes the class to include its fields, methods, & source code
+
         Args:
-            pyutClass:  The model class to encode
+            shape:  The basic shap class which is root of all
 
-        Returns:  A nice model dictionary
+        Returns:  A dictionary with the graphic class attributes
         """
-        encodedFields:  EncodedFields  = self._encodeClassFields(pyutClass.fields)
-        encodedMethods: EncodedMethods = self._encodeMethods(pyutClass.methods)
-
-        encodedModel: EncodedModel = EncodedModel (
-            {
-                'name':              pyutClass.name,
-                'id':                pyutClass.id,
-                'stereotype':        pyutClass.stereotype.name,
-                'fileName':          pyutClass.fileName,
-
-                'description':       pyutClass.description,
-                'showMethods':       pyutClass.showMethods,
-                'showFields':        pyutClass.showFields,
-                'displayStereoType': pyutClass.displayStereoType,
-                'displayParameters': pyutClass.displayParameters.value,
-                'fields':            encodedFields,
-                'methods':           encodedMethods,
-            }
-        )
-        return encodedModel
+        return self._encodeGeometry(geometry=OglClassEncoder.shapeGeometry(shape))
 
-    def _encodeClassFields(self, fields: List[PyutField]) -> EncodedFields:
+    def _encodeGraphicLink(self, oglLink: OglLink) -> EncodedGraphicLink:
         """
-        Encodes the fields associated with a model class
+        The anchor positions are relative to the shapes they are attached to
+
         Args:
-            fields:  The list of data model fields
+            oglLink: The graphic link
 
-        Returns:    A list of encoded data class model fields
+        Returns:  The link geometry and the ids of the objects it connects
         """
-        encodedFields: EncodedFields = EncodedFields([])
-        for field in fields:
-            encodedField: EncodedField = self._encodeField(field=field)
-            encodedFields.append(encodedField)
-        return encodedFields
+        sourceShape:      OglObject = oglLink.getSourceShape()
+        destinationShape: OglObject = oglLink.getDestinationShape()
 
-    def _encodeField(self, field: PyutField) -> EncodedField:
-        """
-        Encode a specific field
-        Args:
-            field:  The model field
+        srcX, srcY = oglLink.sourceAnchor.GetRelativePosition()
+        dstX, dstY = oglLink.destinationAnchor.GetRelativePosition()
 
-        Returns:    Encoded field
-        """
-        return EncodedField(
+        return EncodedGraphicLink(
             {
-                'name':         field.name,
-                'visibility':   field.visibility.value,
-                'type':         field.type.value,
-                'defaultValue': field.defaultValue
+                'sourceId':          sourceShape.pyutObject.id,
+                'destinationId':     destinationShape.pyutObject.id,
+                'sourceAnchor':      EncodedPoint({'x': srcX, 'y': srcY}),
+                'destinationAnchor': EncodedPoint({'x': dstX, 'y': dstY}),
+                'spline':            oglLink.GetSpline(),
+                'controlPoints':     self._encodeControlPoints(oglLink.GetControlPoints()),
             }
         )
 
-    def _encodeMethods(self, pyutMethods: List[PyutMethod]):
+    def _encodeControlPoints(self, controlPoints: List[ControlPoint]) -> EncodedPoints:
 
-        encodedMethods: EncodedMethods = EncodedMethods([])
-        for method in pyutMethods:
-            encodedMethod: EncodedMethod = self._encodeMethod(method)
-            encodedMethods.append(encodedMethod)
+        encodedPoints: EncodedPoints = EncodedPoints([])
+        for controlPoint in controlPoints:
+            x, y = controlPoint.GetPosition()
+            encodedPoints.append(EncodedPoint({'x': x, 'y': y}))
 
-        return encodedMethods
+        return encodedPoints
 
-    def _encodeMethod(self, pyutMethod: PyutMethod) -> EncodedMethod:
-        encodedModifiers:  EncodedModifiers  = self._encodeModifiers(pyutMethod.modifiers)
-        encodedParameters: EncodedParameters = self._encodeParameters(pyutMethod.parameters)
-        encodedSourceCode: EncodedSourceCode = self._encodeSourceCode(pyutMethod.sourceCode)
-        return EncodedMethod(
-            {
-                'name':       pyutMethod.name,
-                'visibility': pyutMethod.visibility.name,
-                'returnType': pyutMethod.returnType.value,
-                'modifiers':  encodedModifiers,
-                'parameters': encodedParameters,
-                'sourceCode': encodedSourceCode,
-            }
-        )
+    def _encodeOglInterface(self, oglInterface: OglInterface2) -> Dict[str, Union[EncodedGraphicLollipop, EncodedInterface]]:
+        """
+        Only the first lollipop for an interface includes the interface model
 
-    def _encodeModifiers(self, pyutModifiers: PyutModifiers) -> EncodedModifiers:
-        encodedModifiers: EncodedModifiers = EncodedModifiers([])
+        Args:
+            oglInterface:  The interface lollipop
 
-        for modifier in pyutModifiers:
-            encodedModifier = self._encodeModifier(modifier)
-            encodedModifiers.append(encodedModifier)
+        Returns:  The encoded lollipop and possibly the interface model
+        """
+        pyutInterface: PyutInterface = oglInterface.pyutInterface
 
-        return encodedModifiers
+        encodedLollipop: Dict[str, Union[EncodedGraphicLollipop, EncodedInterface]] = {
+            'graphicLollipop': self._encodeGraphicLollipop(oglInterface=oglInterface)
+        }
+        if pyutInterface.id not in self._encodedInterfaceIds:
+            self._encodedInterfaceIds.add(pyutInterface.id)
+            encodedLollipop['modelInterface'] = self._encodeModelInterface(pyutInterface=pyutInterface)
 
-    def _encodeModifier(self, pyutModifier: PyutModifier) -> EncodedModifier:
-        return EncodedModifier({
-            'name': pyutModifier.name
-        })
+        return encodedLollipop
 
-    def _encodeParameters(self, pyutParameters: List[PyutParameter]) -> EncodedParameters:
+    def _encodeGraphicLollipop(self, oglInterface: OglInterface2) -> EncodedGraphicLollipop:
+        """
+        The anchor position is relative to the implementing class
 
-        encodedParameters: EncodedParameters = EncodedParameters([])
-        for parameter in pyutParameters:
-            encodedParameter: EncodedParameter = self._encodeParameter(parameter)
-            encodedParameters.append(encodedParameter)
+        Args:
+            oglInterface:  The interface lollipop
 
-        return encodedParameters
+        Returns:  The lollipop geometry and the ids of the interface and its implementor
+        """
+        destinationAnchor: SelectAnchorPoint = oglInterface.destinationAnchor
+        implementor:       OglObject         = destinationAnchor.GetParent()
 
-    def _encodeParameter(self, pyutParameter: PyutParameter) -> EncodedParameter:
+        x, y = destinationAnchor.GetRelativePosition()
 
-        return EncodedParameter(
+        return EncodedGraphicLollipop(
             {
-                'name':         pyutParameter.name,
-                'type':         self.__toSafeString(pyutParameter.type.value),
-                'defaultValue': self.__toSafeString(pyutParameter.defaultValue),
+                'interfaceId':     oglInterface.pyutInterface.id,
+                'implementorId':   implementor.pyutObject.id,
+                'attachmentPoint': destinationAnchor.attachmentPoint.name,
+                'x':               x,
+                'y':               y,
             }
         )
-
-    def _encodeSourceCode(self, sourceCode: SourceCode) -> EncodedSourceCode:
-        encodedSourceCode: EncodedSourceCode = EncodedSourceCode([])
-        for code in sourceCode:
-            encodedLine: EncodedSourceLine = self._encodeCodeLine(code)
-            encodedSourceCode.append(encodedLine)
-
-        return encodedSourceCode
-
-    def _encodeCodeLine(self, codeLine: str) -> EncodedSourceLine:
-        return EncodedSourceLine({
-            'code': codeLine
-        })
-
-    def __toSafeString(self, string) -> str:
-        if string is None:
-            string = ''
-        return string
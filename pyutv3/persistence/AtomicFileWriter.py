@@ -0,0 +1,110 @@
+from typing import IO
+from typing import Iterator
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from contextlib import contextmanager
+
+from os import O_RDONLY
+from os import chmod
+from os import close
+from os import fsync
+from os import name as osName
+from os import open as osOpen
+from os import path as osPath
+from os import remove
+from os import replace
+from os import stat
+from os import umask
+
+from tempfile import NamedTemporaryFile
+
+#
+# Temporary files are created readable by their owner only;  A new file gets the permissions
+# open() would give it.  The umask can only be read by setting it,  so read it once at import
+#
+_UMASK: int = umask(0o022)
+umask(_UMASK)
+
+NEW_FILE_MODE: int = 0o666 & ~_UMASK
+
+
+class AtomicFileWriter:
+    """
+    Writes a file so that readers see either the old or the new contents,  never a
+    partial file.  The data goes to a temporary file in the same directory, which is
+    flushed to disk and then renamed over the target.  The new file keeps the permissions
+    of the file it replaces.  On POSIX the directory is flushed as well, so the rename
+    itself survives a crash
+    """
+    def __init__(self):
+        self.logger: Logger = getLogger(__name__)
+
+    def write(self, fileName: str, data: bytes):
+        """
+        Args:
+            fileName:   The file to create or replace
+            data:       The complete new contents
+        """
+        with self.open(fileName=fileName, mode='wb', encoding=None) as binaryFile:
+            binaryFile.write(data)
+
+        self.logger.debug('Wrote %s bytes to %s', len(data), fileName)
+
+    @contextmanager
+    def open(self, fileName: str, mode: str = 'w', encoding: Optional[str] = 'utf-8') -> Iterator[IO]:
+        """
+        Streams the new contents;  The target is only replaced when the `with` block
+        completes.  If it raises, the temporary file is removed and the target is untouched
+
+        Args:
+            fileName:   The file to create or replace
+            mode:       'w' for text or 'wb' for bytes
+            encoding:   The text encoding;  None in binary mode
+
+        Returns:  The temporary file to write to
+        """
+        directory: str = osPath.dirname(osPath.abspath(fileName))
+
+        temporaryFile = NamedTemporaryFile(mode=mode, encoding=encoding, dir=directory, prefix=f'.{osPath.basename(fileName)}.', suffix='.tmp', delete=False)
+        temporaryName: str = temporaryFile.name
+        try:
+            with temporaryFile:
+                yield temporaryFile
+                temporaryFile.flush()
+                chmod(temporaryName, self._fileMode(fileName))
+                fsync(temporaryFile.fileno())
+            replace(temporaryName, fileName)
+        except BaseException:
+            if osPath.exists(temporaryName):
+                remove(temporaryName)
+            raise
+
+        self._syncDirectory(directory)
+
+    def _fileMode(self, fileName: str) -> int:
+        """
+        Args:
+            fileName:   The file to create or replace
+
+        Returns:  The permission bits of the existing file;  Or the default ones for a new file
+        """
+        try:
+            return stat(fileName).st_mode & 0o7777
+        except FileNotFoundError:
+            return NEW_FILE_MODE
+
+    def _syncDirectory(self, directory: str):
+        """
+        Flushes the directory entry of the renamed file;  Windows cannot open a directory and does not need it
+        """
+        if osName != 'posix':
+            return
+
+        directoryFd: int = osOpen(directory, O_RDONLY)
+        try:
+            fsync(directoryFd)
+        finally:
+            close(directoryFd)
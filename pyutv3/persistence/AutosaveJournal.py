@@ -0,0 +1,604 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from json import JSONDecodeError
+
+from os import SEEK_END
+from os import fsync
+from os import makedirs
+from os import path as osPath
+from os import remove
+from os import scandir
+
+from shutil import rmtree
+
+from tempfile import mkdtemp
+
+import json
+
+from pyutv3.commands.ClassMemberCommand import ClassMemberCommand
+from pyutv3.commands.ClassMemberCommand import MemberKind
+from pyutv3.commands.CommandHistory import CommandAction
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.encoders.ModelDecoder import ModelDecoder
+from pyutv3.encoders.ModelEncoder import ModelEncoder
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.persistence.AtomicFileWriter import AtomicFileWriter
+from pyutv3.persistence.PutLoader import PutLoader
+from pyutv3.persistence.PutLoader import PutLoaderException
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+from pyutv3.persistence.SessionLock import SessionLock
+
+DEFAULT_JOURNAL_DIRECTORY: str = osPath.join(osPath.expanduser('~'), '.pyutV3', 'autosave')
+DEFAULT_COMPACT_AFTER:     int = 500
+
+SESSION_DIRECTORY_PREFIX: str = 'session-'
+# Another instance may remove a session directory just created;  Then another is tried
+SESSION_ATTEMPTS: int = 3
+
+SNAPSHOT_FILE_NAME: str = 'snapshot.json'
+JOURNAL_FILE_NAME:  str = 'journal.jsonl'
+LOCK_FILE_NAME:     str = 'session.lock'
+
+# How much of the end of the journal is read at a time to find its last record
+TAIL_BLOCK_SIZE: int = 4096
+
+SEQUENCE_KEY:       str = 'sequence'
+PROJECTS_KEY:       str = 'projects'
+PROJECT_KEY:        str = 'project'
+DOCUMENT_INDEX_KEY: str = 'documentIndex'
+
+# A document is identified by its project's file name and its position in the project
+DocumentKey = Tuple[str, int]
+# A document's classes by model id;  In document order
+DocumentClasses = Dict[int, ClassRecord]
+
+
+class AutosaveJournal:
+    """
+    Keeps the edits of a session on disk so they survive a crash.  Each command done, undone
+    or redone appends one line to a journal;  Its cost depends on the edit, not on the
+    size of the project.  The appends run on a worker thread and are flushed to disk.
+
+    Every `compactAfter` records the worker compacts the journal:  It writes a new snapshot of
+    the edited documents,  then empties the journal.  The worker keeps the compacted state in
+    memory, the last snapshot with the records appended since applied to it;  Only the first
+    compaction of a session reads it back from the files.  Records carry a sequence number and
+    the snapshot the last one it includes;  A crash between writing the snapshot and emptying
+    the journal does not apply an edit twice.
+
+    The snapshot only holds the documents that were edited.  Their starting point is the project
+    file;  `recover()` loads the projects and replays the session onto them.  A session that
+    ends normally is discarded with `close()`.
+
+    Each session has its own directory, locked with a `SessionLock` while it runs;  Several
+    instances of the application can journal at once.  A session whose lock can be taken is
+    over.  If it did not end normally it can be recovered;  The one changed last is offered
+    """
+    def __init__(self, directory: str = DEFAULT_JOURNAL_DIRECTORY, compactAfter: int = DEFAULT_COMPACT_AFTER):
+        """
+
+        Args:
+            directory:      Where the session directories are
+            compactAfter:   How many records to append before compacting
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        makedirs(directory, exist_ok=True)
+
+        self._directory:    str = directory
+        self._compactAfter: int = compactAfter
+
+        self._sessionDirectory, self._sessionLock = self._createSession()
+        self._snapshotFileName: str = osPath.join(self._sessionDirectory, SNAPSHOT_FILE_NAME)
+        self._journalFileName:  str = osPath.join(self._sessionDirectory, JOURNAL_FILE_NAME)
+        #
+        # A session that is over and can be recovered;  Locked, so no other instance offers it too
+        #
+        self._recoverableDirectory, self._recoverableLock = self._findRecoverableSession()
+
+        self._fileWriter:  AtomicFileWriter   = AtomicFileWriter()
+        self._executor:    ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='PyutAutosave')
+        self._journalFile: Optional[TextIO]   = None
+        #
+        # The position of each document of the projects seen;  By id(), documents are not hashable
+        #
+        self._documentKeys: Dict[int, DocumentKey] = {}
+
+        self._sequence:         int = 0
+        self._uncompactedCount: int = 0
+        #
+        # The session as of the last record appended;  Only the worker thread touches it.  None
+        # until the first compaction reads it
+        #
+        self._sessionProjects: Dict[str, PutProject]                        = {}
+        self._sessionClasses:  Optional[Dict[DocumentKey, DocumentClasses]] = None
+        self._sessionSequence: int                                          = 0
+
+    @property
+    def hasSession(self) -> bool:
+        """
+        Returns:  'True' if a previous session did not end normally and can be recovered
+        """
+        return self._recoverableDirectory is not None
+
+    @property
+    def sessionDirectory(self) -> str:
+        """
+        Returns:  Where this session's snapshot and journal are
+        """
+        return self._sessionDirectory
+
+    def record(self, project: PutProject, document: PutDocument, command: DiagramCommand, action: CommandAction):
+        """
+        Call on the GUI thread;  The command is encoded here, so later edits do not change the record
+
+        Args:
+            project:    The document's project
+            document:   The edited document
+            command:    What was done
+            action:     Whether it was done, undone or redone
+        """
+        journalRecord: Optional[JournalRecord] = command.journalRecord(undone=action == CommandAction.UNDONE)
+        if journalRecord is None:
+            return
+
+        fileName, documentIndex = self._documentKey(project=project, document=document)
+
+        self._sequence += 1
+        journalRecord[SEQUENCE_KEY]       = self._sequence
+        journalRecord[PROJECT_KEY]        = fileName
+        journalRecord[DOCUMENT_INDEX_KEY] = documentIndex
+
+        line: str = json.dumps(journalRecord, cls=ModelEncoder, schemaVersion=SCHEMA_VERSION_COMPACT)
+        self._executor.submit(self._append, line)
+
+        self._uncompactedCount += 1
+        if self._uncompactedCount >= self._compactAfter:
+            self._uncompactedCount = 0
+            self._executor.submit(self._compact)
+
+    def compact(self) -> Future:
+        """
+        Returns:  The future of the compaction;  It runs after the records already submitted
+        """
+        self._uncompactedCount = 0
+
+        return self._executor.submit(self._compact)
+
+    def recover(self) -> List[PutProject]:
+        """
+        Load the projects of the previous session and replay its edits onto them.  The
+        session continues;  New records are appended to its journal
+
+        Returns:  The recovered projects;  The edited documents are loaded
+        """
+        if self._recoverableDirectory is None:
+            return []
+
+        self._executor.submit(self._adoptRecoverableSession).result()
+
+        projects, documentClasses, _ = self._readSession()
+        for (fileName, documentIndex), classes in documentClasses.items():
+            project: PutProject = projects[fileName]
+            if documentIndex < len(project.documents):
+                document: PutDocument = project.documents[documentIndex]
+                document.classRecords = list(classes.values())
+                document.loaded       = True
+
+        self.logger.info(f'Recovered {len(documentClasses)} documents of {len(projects)} projects')
+
+        return list(projects.values())
+
+    def close(self, discardSession: bool):
+        """
+        Finish the pending appends, stop the worker and unlock the session
+
+        Args:
+            discardSession: 'True' when the session ends normally;  There is then nothing to recover
+        """
+        if discardSession is True:
+            self._executor.submit(self._removeSession)
+        else:
+            self._executor.submit(self._closeSession)
+
+        self._executor.shutdown(wait=True)
+
+        # Not recovered;  The next start offers it again
+        if self._recoverableLock is not None:
+            self._recoverableLock.release()
+
+    def discard(self):
+        """
+        Forget the previous session;  For example when the user does not want it recovered.
+        Once recovered it is this session,  and its edits so far are forgotten
+        """
+        if self._recoverableDirectory is not None:
+            self._removeRecoverableSession()
+        else:
+            self._executor.submit(self._discard).result()
+
+    def _documentKey(self, project: PutProject, document: PutDocument) -> DocumentKey:
+        """
+        The first document of a project that is seen files all of them;  Then it is a lookup
+        """
+        documentKey: Optional[DocumentKey] = self._documentKeys.get(id(document))
+        if documentKey is None:
+            fileName: str = osPath.abspath(project.fileName)
+            for documentIndex, projectDocument in enumerate(project.documents):
+                self._documentKeys[id(projectDocument)] = (fileName, documentIndex)
+            documentKey = self._documentKeys[id(document)]
+
+        return documentKey
+
+    def _append(self, line: str):
+        """
+        Runs on the worker thread
+        """
+        if self._journalFile is None:
+            self._journalFile = open(self._journalFileName, 'a', encoding='utf-8')
+
+        self._journalFile.write(f'{line}\n')
+        self._journalFile.flush()
+        fsync(self._journalFile.fileno())
+
+        if self._sessionClasses is not None:
+            self._applyToSession(json.loads(line, cls=ModelDecoder))
+
+    def _applyToSession(self, journalRecord: JournalRecord):
+        """
+        Runs on the worker thread.  A document that cannot be loaded leaves the session unknown;
+        The next compaction reads it from the files again
+
+        Args:
+            journalRecord:  The record just appended
+        """
+        assert self._sessionClasses is not None, 'There is no session to apply to'
+        try:
+            self._applyJournalRecord(projects=self._sessionProjects, documentClasses=self._sessionClasses, putLoader=PutLoader(), journalRecord=journalRecord)
+        except (OSError, PutLoaderException) as e:
+            self.logger.warning(f'Unable to apply a record to the autosave session: {e}')
+            self._sessionProjects = {}
+            self._sessionClasses  = None
+            return
+
+        self._sessionSequence = journalRecord[SEQUENCE_KEY]
+
+    def _compact(self):
+        """
+        Runs on the worker thread;  The GUI is never involved
+        """
+        self._closeJournalFile()
+        if self._sessionClasses is None:
+            try:
+                self._sessionProjects, self._sessionClasses, self._sessionSequence = self._readSession()
+            except (OSError, PutLoaderException) as e:
+                self.logger.error(f'Unable to compact the autosave journal: {e}')
+                return
+
+        projectDocuments: Dict[str, Dict[str, List[ClassRecord]]] = {}
+        for (fileName, documentIndex), classes in self._sessionClasses.items():
+            projectDocuments.setdefault(fileName, {})[str(documentIndex)] = list(classes.values())
+
+        snapshot: Dict[str, Any] = {SEQUENCE_KEY: self._sessionSequence, PROJECTS_KEY: projectDocuments}
+        self._fileWriter.write(fileName=self._snapshotFileName, data=json.dumps(snapshot, cls=ModelEncoder, schemaVersion=SCHEMA_VERSION_COMPACT).encode('utf-8'))
+
+        # The snapshot has every record;  A crash before this replays none of them again
+        open(self._journalFileName, 'w').close()
+
+        self.logger.info(f'Compacted the autosave journal to {len(self._sessionClasses)} documents')
+
+    def _discard(self):
+
+        self._closeJournalFile()
+        for fileName in (self._snapshotFileName, self._journalFileName):
+            if osPath.exists(fileName):
+                remove(fileName)
+
+        self._sequence        = 0
+        self._sessionProjects = {}
+        self._sessionClasses  = {}
+        self._sessionSequence = 0
+
+    def _createSession(self) -> Tuple[str, SessionLock]:
+        """
+        Another instance looking for sessions to recover can lock a new directory before its
+        owner does;  It then removes it,  as there is nothing to recover
+
+        Returns:  The new session's directory and its lock;  Locked
+        """
+        for _ in range(SESSION_ATTEMPTS):
+            sessionDirectory: str         = mkdtemp(prefix=SESSION_DIRECTORY_PREFIX, dir=self._directory)
+            sessionLock:      SessionLock = SessionLock(osPath.join(sessionDirectory, LOCK_FILE_NAME))
+            try:
+                if sessionLock.acquire() is True:
+                    return sessionDirectory, sessionLock
+            except FileNotFoundError:
+                pass
+
+        raise OSError(f'Unable to lock an autosave session in {self._directory}')
+
+    def _findRecoverableSession(self) -> Tuple[Optional[str], Optional[SessionLock]]:
+        """
+        Sessions that are over with nothing to recover ended normally or before their first
+        edit;  They are removed
+
+        Returns:  The directory of the session changed last and its lock;  None and None if
+        there is nothing to recover
+        """
+        recoverableSessions: List[Tuple[float, str, SessionLock]] = []
+        for entry in scandir(self._directory):
+            if not entry.is_dir() or not entry.name.startswith(SESSION_DIRECTORY_PREFIX) or entry.path == self._sessionDirectory:
+                continue
+            sessionLock: SessionLock = SessionLock(osPath.join(entry.path, LOCK_FILE_NAME))
+            try:
+                if sessionLock.acquire() is False:
+                    continue
+            except FileNotFoundError:
+                # Removed by another instance while looking
+                continue
+
+            lastChanged: Optional[float] = self._lastChanged(entry.path)
+            if lastChanged is None:
+                sessionLock.release()
+                rmtree(entry.path, ignore_errors=True)
+            else:
+                recoverableSessions.append((lastChanged, entry.path, sessionLock))
+
+        if len(recoverableSessions) == 0:
+            return None, None
+
+        recoverableSessions.sort(key=lambda recoverableSession: recoverableSession[0])
+        for _, _, olderLock in recoverableSessions[:-1]:
+            olderLock.release()
+        _, sessionDirectory, sessionLock = recoverableSessions[-1]
+
+        self.logger.info(f'{len(recoverableSessions)} autosave sessions can be recovered;  Offering {sessionDirectory}')
+
+        return sessionDirectory, sessionLock
+
+    def _lastChanged(self, sessionDirectory: str) -> Optional[float]:
+        """
+        Returns:  When the session last wrote its snapshot or journal;  None if it has nothing to recover
+        """
+        snapshotFileName: str = osPath.join(sessionDirectory, SNAPSHOT_FILE_NAME)
+        journalFileName:  str = osPath.join(sessionDirectory, JOURNAL_FILE_NAME)
+
+        changeTimes: List[float] = []
+        if osPath.exists(snapshotFileName):
+            changeTimes.append(osPath.getmtime(snapshotFileName))
+        if osPath.exists(journalFileName) and osPath.getsize(journalFileName) > 0:
+            changeTimes.append(osPath.getmtime(journalFileName))
+
+        return max(changeTimes, default=None)
+
+    def _adoptRecoverableSession(self):
+        """
+        Runs on the worker thread;  The recovered session replaces the one just started,
+        which has no records yet
+        """
+        assert self._recoverableDirectory is not None and self._recoverableLock is not None, 'There is no session to recover'
+
+        self._removeSession()
+
+        self._sessionDirectory, self._sessionLock = self._recoverableDirectory, self._recoverableLock
+        self._recoverableDirectory, self._recoverableLock = None, None
+
+        self._snapshotFileName = osPath.join(self._sessionDirectory, SNAPSHOT_FILE_NAME)
+        self._journalFileName  = osPath.join(self._sessionDirectory, JOURNAL_FILE_NAME)
+
+        lastRecord, recordsEnd = self._journalTail()
+        self._dropIncompleteEnd(recordsEnd)
+        self._sequence = self._lastSequence(lastRecord)
+
+    def _removeRecoverableSession(self):
+
+        assert self._recoverableDirectory is not None and self._recoverableLock is not None, 'There is no session to recover'
+
+        self._recoverableLock.release()
+        rmtree(self._recoverableDirectory, ignore_errors=True)
+
+        self._recoverableDirectory, self._recoverableLock = None, None
+
+    def _removeSession(self):
+        """
+        Runs on the worker thread;  The lock file is closed first,  Windows cannot remove an open file
+        """
+        self._closeSession()
+        rmtree(self._sessionDirectory, ignore_errors=True)
+
+    def _closeSession(self):
+
+        self._closeJournalFile()
+        self._sessionLock.release()
+
+    def _closeJournalFile(self):
+
+        if self._journalFile is not None:
+            self._journalFile.close()
+            self._journalFile = None
+
+    def _readSession(self) -> Tuple[Dict[str, PutProject], Dict[DocumentKey, DocumentClasses], int]:
+        """
+        The snapshot and then the journal records it does not include
+
+        Returns:  The session's projects by file name, the classes of each edited document,
+        and the sequence number of the last record
+        """
+        projects:        Dict[str, PutProject]              = {}
+        documentClasses: Dict[DocumentKey, DocumentClasses] = {}
+        putLoader:       PutLoader                          = PutLoader()
+
+        snapshotSequence: int = 0
+        if osPath.exists(self._snapshotFileName):
+            with open(self._snapshotFileName, encoding='utf-8') as snapshotFile:
+                snapshot: Dict[str, Any] = json.load(snapshotFile, cls=ModelDecoder)
+            snapshotSequence = snapshot[SEQUENCE_KEY]
+            for fileName, documents in snapshot[PROJECTS_KEY].items():
+                projects[fileName] = putLoader.loadIndex(fileName)
+                for documentIndex, classRecords in documents.items():
+                    documentClasses[(fileName, int(documentIndex))] = {classRecord.pyutClass.id: classRecord for classRecord in classRecords}
+
+        sequence: int = snapshotSequence
+        for journalRecord in self._journalRecords():
+            sequence = journalRecord[SEQUENCE_KEY]
+            if sequence <= snapshotSequence:
+                continue
+
+            self._applyJournalRecord(projects=projects, documentClasses=documentClasses, putLoader=putLoader, journalRecord=journalRecord)
+
+        return projects, documentClasses, sequence
+
+    def _applyJournalRecord(self, projects: Dict[str, PutProject], documentClasses: Dict[DocumentKey, DocumentClasses], putLoader: PutLoader, journalRecord: JournalRecord):
+        """
+        The first record of a document loads it from its project
+
+        Args:
+            projects:           The session's projects by file name;  Updated
+            documentClasses:    The classes of each edited document;  Updated
+            putLoader:          Loads what is not there yet
+            journalRecord:      The record to apply
+        """
+        fileName: str = journalRecord[PROJECT_KEY]
+        if fileName not in projects:
+            projects[fileName] = putLoader.loadIndex(fileName)
+
+        documentKey: DocumentKey = (fileName, journalRecord[DOCUMENT_INDEX_KEY])
+        if documentKey not in documentClasses:
+            documentClasses[documentKey] = self._loadDocumentClasses(putLoader=putLoader, project=projects[fileName], documentIndex=documentKey[1])
+
+        self._applyRecord(classes=documentClasses[documentKey], journalRecord=journalRecord)
+
+    def _journalRecords(self) -> List[JournalRecord]:
+        """
+        A crash can leave the last line incomplete;  Reading stops there
+        """
+        journalRecords: List[JournalRecord] = []
+        if not osPath.exists(self._journalFileName):
+            return journalRecords
+
+        with open(self._journalFileName, encoding='utf-8') as journalFile:
+            for line in journalFile:
+                try:
+                    journalRecords.append(json.loads(line, cls=ModelDecoder))
+                except JSONDecodeError:
+                    self.logger.warning(f'Ignoring the incomplete end of {self._journalFileName}')
+                    break
+
+        return journalRecords
+
+    def _loadDocumentClasses(self, putLoader: PutLoader, project: PutProject, documentIndex: int) -> DocumentClasses:
+
+        if documentIndex >= len(project.documents):
+            return {}
+
+        document: PutDocument = project.documents[documentIndex]
+        putLoader.loadDocument(project=project, document=document)
+
+        return {classRecord.pyutClass.id: classRecord for classRecord in document.classRecords}
+
+    def _applyRecord(self, classes: DocumentClasses, journalRecord: JournalRecord):
+        """
+        Records for classes that are not in the document are ignored
+        """
+        recordType: JournalRecordType = JournalRecordType(journalRecord[JOURNAL_RECORD_TYPE_KEY])
+
+        if recordType == JournalRecordType.MOVE:
+            for classId in journalRecord['classIds']:
+                classRecord: Optional[ClassRecord] = classes.get(classId)
+                if classRecord is not None:
+                    geometry: ShapeGeometry = classRecord.geometry
+                    classRecord.geometry = geometry._replace(x=geometry.x + journalRecord['deltaX'], y=geometry.y + journalRecord['deltaY'])
+        elif recordType == JournalRecordType.RESIZE:
+            classRecord = classes.get(journalRecord['classId'])
+            if classRecord is not None:
+                classRecord.geometry = ShapeGeometry(*journalRecord['geometry'])
+        elif recordType == JournalRecordType.ADD_CLASS:
+            addedClass: ClassRecord = journalRecord['classRecord']
+            classes[addedClass.pyutClass.id] = addedClass
+        elif recordType == JournalRecordType.REMOVE_CLASS:
+            classes.pop(journalRecord['classId'], None)
+        elif recordType == JournalRecordType.MEMBER:
+            classRecord = classes.get(journalRecord['classId'])
+            if classRecord is not None:
+                ClassMemberCommand(pyutClass=classRecord.pyutClass,
+                                   memberKind=MemberKind(journalRecord['memberKind']),
+                                   index=journalRecord['index'],
+                                   oldMember=journalRecord['oldMember'],
+                                   newMember=journalRecord['newMember']).doIt()
+
+    def _lastSequence(self, lastRecord: Optional[JournalRecord]) -> int:
+        """
+        A recovered session continues its numbering
+
+        Args:
+            lastRecord:     The journal's last record;  None if it is empty
+        """
+        if lastRecord is not None:
+            return lastRecord[SEQUENCE_KEY]
+        if osPath.exists(self._snapshotFileName):
+            with open(self._snapshotFileName, encoding='utf-8') as snapshotFile:
+                return json.load(snapshotFile)[SEQUENCE_KEY]
+
+        return 0
+
+    def _journalTail(self) -> Tuple[Optional[JournalRecord], int]:
+        """
+        Reads back from the end of the journal,  not the whole of it.  A crash can leave the
+        last line incomplete;  Then the record is the one before
+
+        Returns:  The last complete record, and where the complete records end;  None and 0
+        if there is none
+        """
+        if not osPath.exists(self._journalFileName):
+            return None, 0
+
+        with open(self._journalFileName, 'rb') as journalFile:
+            end:       int = journalFile.seek(0, SEEK_END)
+            blockSize: int = TAIL_BLOCK_SIZE
+            while True:
+                start: int = max(0, end - blockSize)
+                journalFile.seek(start)
+                lines: List[bytes] = journalFile.read(end - start).split(b'\n')
+                # Unless the block starts the file, its first line started before it
+                firstLine: int = 0 if start == 0 else 1
+                lineEnd:   int = end
+                for line in reversed(lines[firstLine:]):
+                    if line.strip() != b'':
+                        try:
+                            return json.loads(line), min(lineEnd + 1, end)
+                        except (JSONDecodeError, UnicodeDecodeError):
+                            # The incomplete end a crash left
+                            pass
+                    lineEnd -= len(line) + 1
+                if start == 0:
+                    return None, 0
+                blockSize *= 2
+
+    def _dropIncompleteEnd(self, recordsEnd: int):
+        """
+        Records appended after an incomplete line would be lost with it
+
+        Args:
+            recordsEnd:     Where the journal's complete records end
+        """
+        if osPath.exists(self._journalFileName) and osPath.getsize(self._journalFileName) > recordsEnd:
+            self.logger.warning(f'Dropping the incomplete end of {self._journalFileName}')
+            with open(self._journalFileName, 'r+b') as journalFile:
+                journalFile.truncate(recordsEnd)
@@ -0,0 +1,100 @@
+from typing import Callable
+from typing import Iterable
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+
+from os import path as osPath
+from os import stat
+
+from time import perf_counter
+
+from wx import CallAfter
+
+from miniogl.Shape import Shape
+
+from pyutv3.encoders.CompressedTextStream import CompressedTextStream
+from pyutv3.encoders.DiagramFormat import DiagramFormat
+from pyutv3.encoders.EncoderCache import EncoderCache
+from pyutv3.persistence.AtomicFileWriter import AtomicFileWriter
+from pyutv3.persistence.DiagramSnapshot import DiagramSnapshot
+
+StatusListener = Callable[[str], None]
+
+
+class BackgroundSaver:
+    """
+    Saves diagrams without blocking the wx main loop.
+
+    * The diagram is captured as plain data on the GUI thread;  See `DiagramSnapshot`
+    * A worker thread encodes it with the wx free encoders and streams it, compressed for
+      the compressed format, into an atomically replaced file
+    * Progress and completion messages are delivered to the status listener on the GUI
+      thread with `wx.CallAfter`
+
+    There is a single worker,  so saves complete in the order they were requested.
+    Call `shutdown()` before the frame goes away;  It waits for pending saves
+    """
+    def __init__(self, statusListener: StatusListener, cache: Optional[EncoderCache] = None):
+        """
+
+        Args:
+            statusListener: Receives the progress messages;  For example, the status bar `SetStatusText`
+            cache:          Speeds up the encoding of unchanged classes;  Only the worker uses it
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._statusListener: StatusListener         = statusListener
+        self._cache:          Optional[EncoderCache] = cache
+        self._fileWriter:     AtomicFileWriter       = AtomicFileWriter()
+        self._executor:       ThreadPoolExecutor     = ThreadPoolExecutor(max_workers=1, thread_name_prefix='PyutSave')
+
+    def save(self, fileName: str, oglObjects: Iterable[Shape]) -> Future:
+        """
+        Call on the GUI thread;  Returns as soon as the diagram is captured
+
+        Args:
+            fileName:   The file to save to;  Its suffix picks the format
+            oglObjects: The diagram's shapes
+
+        Returns:  The future of the save;  It raises what the save raised
+        """
+        snapshot: DiagramSnapshot = DiagramSnapshot.create(fileName=fileName, oglObjects=oglObjects)
+
+        self._reportStatus(f'Saving {osPath.basename(fileName)}...')
+
+        return self._executor.submit(self.writeSnapshot, snapshot)
+
+    def writeSnapshot(self, snapshot: DiagramSnapshot):
+        """
+        Runs on the worker thread
+
+        Args:
+            snapshot:   The diagram to encode and write
+        """
+        baseName:  str   = osPath.basename(snapshot.fileName)
+        startTime: float = perf_counter()
+        try:
+            if snapshot.diagramFormat == DiagramFormat.COMPRESSED:
+                with self._fileWriter.open(fileName=snapshot.fileName, mode='wb', encoding=None) as binaryFile:
+                    with CompressedTextStream(binaryFile=binaryFile) as textStream:
+                        snapshot.write(stream=textStream, cache=self._cache)
+            else:
+                with self._fileWriter.open(fileName=snapshot.fileName) as textFile:
+                    snapshot.write(stream=textFile, cache=self._cache)
+        except Exception as e:
+            self.logger.error(f'Save of {snapshot.fileName} failed: {e}')
+            self._reportStatus(f'Save of {baseName} failed: {e}')
+            raise
+
+        self._reportStatus(f'Saved {baseName} ({stat(snapshot.fileName).st_size:,} bytes) in {perf_counter() - startTime:.2f} seconds')
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True)
+
+    def _reportStatus(self, message: str):
+        CallAfter(self._statusListener, message)
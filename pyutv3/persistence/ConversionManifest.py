@@ -0,0 +1,118 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+
+from hashlib import sha256
+
+from os import makedirs
+from os import path as osPath
+
+import json
+
+from pyutv3.persistence.AtomicFileWriter import AtomicFileWriter
+
+MANIFEST_FILENAME: str = '.pyutv3-conversions.json'
+
+# Records written before the schema version was kept;  Matches no schema, so they are converted again
+UNKNOWN_SCHEMA_VERSION: int = 0
+
+HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+def createFqOutputNames() -> List[str]:
+    return []
+
+
+@dataclass
+class ConversionRecord:
+    """
+    What a converted project looked like when it was last converted, and the json schema
+    its diagrams were written in
+    """
+    modificationTime: float     = 0.0
+    contentHash:      str       = ''
+    schemaVersion:    int       = UNKNOWN_SCHEMA_VERSION
+    fqOutputNames:    List[str] = field(default_factory=createFqOutputNames)
+
+
+class ConversionManifest:
+    """
+    Remembers which projects an output directory holds conversions of.  A project is up
+    to date when all its outputs exist in the requested schema and either its modification
+    time or its content hash is unchanged;  The hash is only computed when the modification time differs, so
+    a copied or touched archive is not converted again
+    """
+    def __init__(self, outputDirectory: str):
+        """
+        Args:
+            outputDirectory:    The directory the converted diagrams are written to
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName: str                         = osPath.join(outputDirectory, MANIFEST_FILENAME)
+        self._records:  Dict[str, ConversionRecord] = self._read()
+
+    def isUpToDate(self, fqFileName: str, schemaVersion: int) -> bool:
+        """
+        Args:
+            fqFileName:     A project file
+            schemaVersion:  The json schema its diagrams must be in
+
+        Returns:  True if its conversion does not need to be redone
+        """
+        record: Optional[ConversionRecord] = self._records.get(fqFileName)
+        if record is None or record.schemaVersion != schemaVersion:
+            return False
+
+        if not all(osPath.exists(fqOutputName) for fqOutputName in record.fqOutputNames):
+            return False
+
+        if osPath.getmtime(fqFileName) == record.modificationTime:
+            return True
+        if ConversionManifest.contentHash(fqFileName) == record.contentHash:
+            record.modificationTime = osPath.getmtime(fqFileName)
+            return True
+
+        return False
+
+    def update(self, fqFileName: str, record: ConversionRecord):
+        """
+        Args:
+            fqFileName: A project file that was just converted
+            record:     The state it was converted in
+        """
+        self._records[fqFileName] = record
+
+    def save(self):
+
+        makedirs(osPath.dirname(self._fileName), exist_ok=True)
+        with AtomicFileWriter().open(fileName=self._fileName) as manifestFile:
+            json.dump({fqFileName: asdict(record) for fqFileName, record in self._records.items()}, manifestFile, indent=4)
+
+    @classmethod
+    def contentHash(cls, fqFileName: str) -> str:
+
+        digest = sha256()
+        with open(fqFileName, 'rb') as projectFile:
+            for chunk in iter(lambda: projectFile.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    def _read(self) -> Dict[str, ConversionRecord]:
+
+        if not osPath.exists(self._fileName):
+            return {}
+        try:
+            with open(self._fileName, 'r', encoding='utf-8') as manifestFile:
+                return {fqFileName: ConversionRecord(**record) for fqFileName, record in json.load(manifestFile).items()}
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f'Ignoring unreadable manifest {self._fileName}: {e}')
+            return {}
@@ -0,0 +1,84 @@
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from miniogl.Shape import Shape
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.DiagramFormat import DiagramFormat
+from pyutv3.encoders.DiagramObjects import DiagramObjects
+from pyutv3.encoders.EncoderCache import EncoderCache
+from pyutv3.encoders.ModelDiagramWriter import DEFAULT_INDENT
+from pyutv3.encoders.ModelDiagramWriter import EncodedObjects
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+
+@dataclass
+class DiagramSnapshot:
+    """
+    A diagram captured as plain data;  Once created nothing in it refers to an OGL
+    object,  so it can be encoded and written on another thread while the user keeps
+    editing.
+
+    Classes are captured as `ClassRecord`s;  The shape geometry is copied and the model
+    class is referenced.  Taking the snapshot encodes nothing,  so its cost does not grow
+    with the size of the classes.  Notes, lollipops and links are few;  They are encoded
+    to dictionaries while the snapshot is taken because their geometry lives in the shapes
+    """
+    fileName:      str
+    diagramFormat: DiagramFormat
+    schemaVersion: int
+    classRecords:  List[ClassRecord]
+    oglNotes:      EncodedObjects
+    oglInterfaces: EncodedObjects
+    oglLinks:      EncodedObjects
+
+    @classmethod
+    def create(cls, fileName: str, oglObjects: Iterable[Shape], schemaVersion: int = SCHEMA_VERSION_COMPACT) -> 'DiagramSnapshot':
+        """
+        Must run on the GUI thread
+
+        Args:
+            fileName:       The file the diagram is saved to;  Its suffix picks the format
+            oglObjects:     The diagram's shapes
+            schemaVersion:  The encoding schema
+
+        Returns:  The snapshot
+        """
+        logger:         Logger          = getLogger(__name__)
+        encoder:        OglClassEncoder = OglClassEncoder(schemaVersion=schemaVersion)
+        diagramObjects: DiagramObjects  = DiagramObjects.fromShapes(oglObjects)
+
+        classRecords: List[ClassRecord] = [
+            ClassRecord(pyutClass=oglClass.pyutObject, geometry=OglClassEncoder.shapeGeometry(oglClass)) for oglClass in diagramObjects.oglClasses
+        ]
+        logger.debug('Snapshot of %s classes for %s', len(classRecords), fileName)
+
+        return cls(fileName=fileName,
+                   diagramFormat=DiagramFormat.fromFileName(fileName),
+                   schemaVersion=schemaVersion,
+                   classRecords=classRecords,
+                   oglNotes=[encoder.default(oglNote) for oglNote in diagramObjects.oglNotes],
+                   oglInterfaces=[encoder.default(oglInterface) for oglInterface in diagramObjects.oglInterfaces],
+                   oglLinks=[encoder.default(oglLink) for oglLink in diagramObjects.oglLinks])
+
+    def write(self, stream: TextIO, cache: Optional[EncoderCache] = None):
+        """
+        Streams the document;  It is what `DiagramFile.save()` writes for the same diagram,
+        before any compression.  Nothing here needs wx
+
+        Args:
+            stream: The text stream to write to
+            cache:  Reuses the encoded models of unchanged classes
+        """
+        writer: ModelDiagramWriter = ModelDiagramWriter(stream=stream, indent=DEFAULT_INDENT, schemaVersion=self.schemaVersion, cache=cache)
+
+        writer.writeClassRecords(self.classRecords, oglNotes=self.oglNotes, oglInterfaces=self.oglInterfaces, oglLinks=self.oglLinks)
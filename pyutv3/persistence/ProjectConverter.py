@@ -0,0 +1,149 @@
+from typing import Dict
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+
+from os import path as osPath
+
+from time import perf_counter
+
+from pyutv3.encoders.DiagramFormat import DiagramFormat
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.persistence.AtomicFileWriter import AtomicFileWriter
+from pyutv3.persistence.ConversionManifest import ConversionManifest
+from pyutv3.persistence.ConversionManifest import ConversionRecord
+from pyutv3.persistence.PutLoader import PutLoader
+from pyutv3.persistence.PutLoader import PutLoaderException
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+@dataclass
+class ConversionResult:
+    """
+    The outcome of converting one project;  Crosses the process boundary, so keep it small
+    """
+    fqFileName:     str                        = ''
+    inputBytes:     int                        = 0
+    classCount:     int                        = 0
+    elapsedSeconds: float                      = 0.0
+    errorMessage:   Optional[str]              = None
+    record:         Optional[ConversionRecord] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.errorMessage is None
+
+
+def convertProject(fqFileName: str, outputDirectory: str, outputName: Optional[str] = None, schemaVersion: int = SCHEMA_VERSION_COMPACT) -> ConversionResult:
+    """
+    Module level so that a process pool can pickle it
+
+    Args:
+        fqFileName:         The .put or .xml project
+        outputDirectory:    Where to write its diagrams
+        outputName:         What to name them;  See `ProjectConverter.convert()`
+        schemaVersion:      The json schema to write
+
+    Returns:  The outcome;  Failures are reported, not raised
+    """
+    return ProjectConverter(outputDirectory=outputDirectory, schemaVersion=schemaVersion).convert(fqFileName, outputName=outputName)
+
+
+class ProjectConverter:
+    """
+    Converts a Pyut project into one json diagram per document.  The project is streamed
+    in with a `PutLoader` and each diagram is streamed out with a `ModelDiagramWriter`;  No
+    OGL shapes are created, so a converter never needs wx or a display.  A
+    project with a single document becomes `<output name>.json`;  Otherwise each document
+    becomes `<output name>-<document number>.json`.  The output name is the project's file
+    name, suffix included,  so `Diagram.put` and `Diagram.xml` do not overwrite each other.
+
+    Only classes can be converted;  A project with links, notes or any other diagram
+    element fails and nothing is written for it, rather than losing those elements
+    """
+    def __init__(self, outputDirectory: str, schemaVersion: int = SCHEMA_VERSION_COMPACT):
+        """
+        Args:
+            outputDirectory:    Where to write the diagrams
+            schemaVersion:      The json schema to write;  See `OglClassEncoder`
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._outputDirectory: str = outputDirectory
+        self._schemaVersion:   int = schemaVersion
+
+    def convert(self, fqFileName: str, outputName: Optional[str] = None) -> ConversionResult:
+        """
+        Args:
+            fqFileName: The .put or .xml project
+            outputName: What to name its diagrams;  Defaults to the project's file name
+
+        Returns:  The outcome;  Failures are reported, not raised
+        """
+        if outputName is None:
+            outputName = osPath.basename(fqFileName)
+
+        startTime: float            = perf_counter()
+        result:    ConversionResult = ConversionResult(fqFileName=fqFileName)
+        try:
+            result.inputBytes = osPath.getsize(fqFileName)
+            record:  ConversionRecord = ConversionRecord(modificationTime=osPath.getmtime(fqFileName), contentHash=ConversionManifest.contentHash(fqFileName),
+                                                         schemaVersion=self._schemaVersion)
+            project: PutProject       = PutLoader().load(fqFileName)
+
+            self._checkConvertible(project)
+            for documentNumber, document in enumerate(project.documents):
+                fqOutputName: str = osPath.join(self._outputDirectory, self._documentName(outputName=outputName, documentNumber=documentNumber, documentCount=len(project.documents)))
+                self._writeDocument(document=document, fqOutputName=fqOutputName)
+
+                result.classCount += len(document.classRecords)
+                record.fqOutputNames.append(fqOutputName)
+
+            result.record = record
+        except (OSError, PutLoaderException) as e:
+            result.errorMessage = str(e)
+            self.logger.error(f'Could not convert {fqFileName}: {e}')
+        except Exception as e:
+            # One bad project must not stop a batch of thousands
+            result.errorMessage = f'{type(e).__name__}: {e}'
+            self.logger.exception(f'Could not convert {fqFileName}')
+
+        result.elapsedSeconds = perf_counter() - startTime
+
+        return result
+
+    def _checkConvertible(self, project: PutProject):
+        """
+        Raises:
+            PutLoaderException:  If any document has elements that would be lost
+        """
+        skippedElements: Dict[str, int] = {}
+        for document in project.documents:
+            for tag, count in document.skippedElements.items():
+                skippedElements[tag] = skippedElements.get(tag, 0) + count
+
+        if len(skippedElements) > 0:
+            elementCounts: str = ', '.join(f'{count} {tag}' for tag, count in sorted(skippedElements.items()))
+            raise PutLoaderException(f'{project.fileName} has diagram elements that cannot be converted: {elementCounts}')
+
+    def _writeDocument(self, document: PutDocument, fqOutputName: str):
+        """
+        The diagram is written to a temporary file beside the output and then moved over it;  An
+        interrupted batch never leaves a truncated diagram
+        """
+        writer: AtomicFileWriter = AtomicFileWriter()
+        with writer.open(fileName=fqOutputName) as outputFile:
+            ModelDiagramWriter(stream=outputFile, schemaVersion=self._schemaVersion).writeClassRecords(document.classRecords)
+
+    def _documentName(self, outputName: str, documentNumber: int, documentCount: int) -> str:
+
+        suffix: str = cast(str, DiagramFormat.JSON.value)
+        if documentCount == 1:
+            return f'{outputName}{suffix}'
+        else:
+            return f'{outputName}-{documentNumber}{suffix}'
@@ -0,0 +1,209 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from re import Match
+from re import Pattern
+from re import compile as regExCompile
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import ParseError
+from xml.etree.ElementTree import fromstring
+
+from pyutv3.persistence.PutProject import DocumentLocation
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+DEFAULT_ENCODING: str = 'utf-8'
+
+#
+# Only the project and document tags are read.  A '<' in the text is always a tag, except
+# inside comments, CDATA sections and processing instructions;  Those are stepped over
+#
+INDEX_TOKEN:  Pattern = regExCompile(rb'<(?:PyutProject(?=[\s/>])|PyutDocument(?=[\s/>])|/PyutDocument\s*>|!--|!\[CDATA\[|\?)')
+START_TAG:    Pattern = regExCompile(rb'<(PyutProject|PyutDocument)(?:\s+[^\s=/>]+\s*=\s*(?:"[^"]*"|\'[^\']*\'))*\s*(/?)>')
+XML_ENCODING: Pattern = regExCompile(rb'<\?xml\s[^?]*?encoding\s*=\s*["\']([A-Za-z][A-Za-z0-9._-]*)')
+
+SKIPPED_SECTION_ENDS: Dict[bytes, bytes] = {b'<!--': b'-->', b'<![CDATA[': b']]>', b'<?': b'?>'}
+#
+# When no tag is found the end of the text is kept;  A tag may start there
+#
+TOKEN_LOOK_BEHIND: int = 64
+
+#
+# Where reading the file again gives a piece of text:  The file offset, a copy of the
+# decompressor at that offset, and the offset of the piece in the decompressed text
+#
+TextCheckpoint = Tuple[int, Any, int]
+
+
+class ProjectIndexScanner:
+    """
+    Finds the project header and the list of documents of a Pyut project without parsing
+    the xml.  The decompressed text is fed in pieces;  Between the tags of interest it is
+    only searched, so the scan costs little more than the decompression.  The attributes
+    of those tags do go through the xml parser.
+
+    Each document is given its location (see `DocumentLocation`) so that its text can later
+    be parsed on its own.  Malformed text raises a `ParseError`, like the xml parser does
+    """
+    def __init__(self, project: PutProject):
+        """
+
+        Args:
+            project:    Receives the header and the documents
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._project:  PutProject = project
+        self._encoding: str        = DEFAULT_ENCODING
+
+        self._text:        bytes                = b''
+        self._textOffset:  int                  = 0
+        self._textLength:  int                  = 0
+        self._checkpoints: List[TextCheckpoint] = []
+
+        self._projectFound:  bool                  = False
+        self._openDocument:  Optional[PutDocument] = None
+        self._documentStart: int                   = 0
+
+    def feed(self, text: bytes, fileOffset: int, decompressor: Any):
+        """
+        Args:
+            text:           The next piece of the decompressed text
+            fileOffset:     Where in the file the piece starts
+            decompressor:   A copy of the decompressor before the piece;  None for plain xml
+        """
+        self._checkpoints.append((fileOffset, decompressor, self._textLength))
+        self._textLength += len(text)
+        self._text       += text
+
+        self._discardText(self._scan(final=False))
+
+    def close(self):
+        """
+        The whole text was fed
+        """
+        self._scan(final=True)
+
+        if self._openDocument is not None:
+            raise ParseError(f'Document {self._openDocument.title} is not closed')
+        if self._projectFound is False:
+            raise ParseError('No PyutProject element')
+
+    def _scan(self, final: bool) -> int:
+        """
+        Args:
+            final:  No more text follows
+
+        Returns:  Where in the text the scan stopped;  A tag that is not complete yet starts there
+        """
+        text:     bytes = self._text
+        position: int   = 0
+        while True:
+            match: Optional[Match] = INDEX_TOKEN.search(text, position)
+            if match is None:
+                return len(text) if final is True else max(position, len(text) - TOKEN_LOOK_BEHIND)
+
+            token:      bytes           = match.group(0)
+            sectionEnd: Optional[bytes] = SKIPPED_SECTION_ENDS.get(token)
+            if sectionEnd is not None:
+                endPosition: int = text.find(sectionEnd, match.end())
+                if endPosition == -1:
+                    return self._incomplete(token=token, position=match.start(), final=final)
+                if token == b'<?' and self._textOffset + match.start() == 0:
+                    self._readEncoding(text[:endPosition])
+                position = endPosition + len(sectionEnd)
+            elif token.startswith(b'</'):
+                self._endDocument(textEnd=self._textOffset + match.end())
+                position = match.end()
+            else:
+                startTag: Optional[Match] = START_TAG.match(text, match.start())
+                if startTag is None:
+                    return self._incomplete(token=token, position=match.start(), final=final)
+                self._startElement(startTag)
+                position = startTag.end()
+
+    def _incomplete(self, token: bytes, position: int, final: bool) -> int:
+
+        if final is True:
+            raise ParseError(f'{token.decode("ascii")} at {self._textOffset + position} is not complete')
+
+        return position
+
+    def _startElement(self, startTag: Match):
+
+        selfClosing: bool    = startTag.group(2) == b'/'
+        element:     Element = self._parseStartTag(startTag.group(0), selfClosing=selfClosing)
+
+        if element.tag == 'PyutProject':
+            self._project.version  = element.get('version', '')
+            self._project.codePath = element.get('CodePath', '')
+            self._projectFound = True
+            return
+
+        if self._openDocument is not None:
+            raise ParseError(f'Document {self._openDocument.title} is not closed')
+
+        textStart: int         = self._textOffset + startTag.start()
+        document:  PutDocument = PutDocument(documentType=element.get('type', ''), title=element.get('title', ''), location=self._location(textStart))
+        self._project.documents.append(document)
+
+        if selfClosing is True:
+            document.loaded = True
+        else:
+            self._openDocument  = document
+            self._documentStart = textStart
+
+    def _endDocument(self, textEnd: int):
+
+        document: Optional[PutDocument] = self._openDocument
+        if document is None or document.location is None:
+            raise ParseError(f'Document end at {textEnd} without a start')
+
+        document.location.length = textEnd - self._documentStart
+        self._openDocument = None
+
+    def _location(self, textStart: int) -> DocumentLocation:
+        """
+        Args:
+            textStart:  Where the document starts in the decompressed text
+
+        Returns:  The location to read the document from;  Its length is not known yet
+        """
+        for fileOffset, decompressor, checkpointOffset in reversed(self._checkpoints):
+            if checkpointOffset <= textStart:
+                return DocumentLocation(fileOffset=fileOffset, skip=textStart - checkpointOffset, encoding=self._encoding, decompressor=decompressor)
+
+        raise ParseError(f'No checkpoint before {textStart}')
+
+    def _parseStartTag(self, startTag: bytes, selfClosing: bool) -> Element:
+        """
+        The tag is closed and given the file's xml declaration;  Then the parser decodes
+        the attributes and their entities
+        """
+        if selfClosing is False:
+            startTag = startTag[:-1] + b'/>'
+
+        return fromstring(f'<?xml version="1.0" encoding="{self._encoding}"?>'.encode('ascii') + startTag)
+
+    def _readEncoding(self, declaration: bytes):
+
+        match: Optional[Match] = XML_ENCODING.match(declaration)
+        if match is not None:
+            self._encoding = match.group(1).decode('ascii')
+
+    def _discardText(self, position: int):
+        """
+        Drop the text before the position and the checkpoints that only cover what was dropped
+        """
+        self._text        = self._text[position:]
+        self._textOffset += position
+
+        while len(self._checkpoints) > 1 and self._checkpoints[1][2] <= self._textOffset:
+            self._checkpoints.pop(0)
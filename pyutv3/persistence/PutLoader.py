@@ -0,0 +1,346 @@
+from typing import Any
+from typing import BinaryIO
+from typing import Iterator
+from typing import Optional
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import XMLPullParser
+
+import zlib
+
+from time import perf_counter_ns
+
+from pyutv3.PhaseProfiler import PhaseProfiler
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.persistence.ProjectIndexScanner import ProjectIndexScanner
+from pyutv3.persistence.PutProject import DocumentLocation
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+from pyutv3.persistence.XmlClassBuilder import ELEMENT_GRAPHIC_CLASS
+from pyutv3.persistence.XmlClassBuilder import XmlClassBuilder
+
+ELEMENT_PROJECT:  str = 'PyutProject'
+ELEMENT_DOCUMENT: str = 'PyutDocument'
+
+# Every diagram element of a document;  GraphicClass, GraphicLink, GraphicNote, GraphicLollipop, ...
+GRAPHIC_ELEMENT_PREFIX: str = 'Graphic'
+
+XML_SIGNATURE: bytes = b'<'
+
+DEFAULT_CHUNK_SIZE: int = 64 * 1024
+
+XmlEvent = Tuple[str, Element]
+#
+# A piece of the project text:  Where its chunk starts in the file, a copy of the decompressor
+# before the chunk when asked for, and the text
+#
+TextChunk = Tuple[int, Any, bytes]
+
+
+class PutLoaderException(Exception):
+    pass
+
+
+class PutLoader:
+    """
+    Loads Pyut `.put` projects;  zlib compressed xml.  Plain xml files load as well.
+
+    The file is read in chunks, each chunk is decompressed with a `zlib.decompressobj`, and
+    the result is fed to an `XMLPullParser`.  Each `GraphicClass` is turned into a class record
+    as soon as its end tag arrives and its element is then cleared.  Neither the
+    decompressed text nor the complete element tree ever exists;  Memory stays near a
+    chunk plus the model being built.
+
+    An index does not parse the xml;  `ProjectIndexScanner` finds the documents and where
+    each one starts.  Loading a document then resumes the file, and the decompressor, at its start.
+
+    Only classes are loaded;  Other diagram elements are skipped and counted in the
+    document's `skippedElements`
+    """
+    def __init__(self, chunkSize: int = DEFAULT_CHUNK_SIZE):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._chunkSize: int = chunkSize
+        #
+        # Time spent decompressing, parsing and building;  Only measured when profiling
+        #
+        self._profiling:    bool = False
+        self._decompressNs: int  = 0
+        self._parseNs:      int  = 0
+        self._buildNs:      int  = 0
+
+    def load(self, fqFileName: str) -> PutProject:
+        """
+        Args:
+            fqFileName: Fully qualified name of a .put or .xml file
+
+        Returns:  The project and all its documents
+        """
+        project:  PutProject            = PutProject(fileName=fqFileName)
+        builder:  XmlClassBuilder       = XmlClassBuilder()
+        document: Optional[PutDocument] = None
+
+        startNs: int = self._startProfiling()
+        with open(project.fileName, 'rb') as projectFile:
+            text: Iterator[bytes] = (textChunk for _, _, textChunk in self._projectText(projectFile, checkpoints=False))
+            for event, element in self._elementEvents(text=text, fileName=project.fileName):
+                if event == 'start':
+                    if element.tag == ELEMENT_PROJECT:
+                        project.version  = element.get('version', '')
+                        project.codePath = element.get('CodePath', '')
+                    elif element.tag == ELEMENT_DOCUMENT:
+                        document = PutDocument(documentType=element.get('type', ''), title=element.get('title', ''), loaded=True)
+                        project.documents.append(document)
+                elif element.tag.startswith(GRAPHIC_ELEMENT_PREFIX):
+                    if document is not None:
+                        self._addElement(document=document, builder=builder, element=element, fileName=project.fileName)
+                    element.clear()
+                elif element.tag == ELEMENT_DOCUMENT:
+                    element.clear()
+                    document = None
+        self._stopProfiling(startNs=startNs, phaseNames=('decompress', 'parse', 'build'))
+
+        self.logger.info(f'Loaded {fqFileName}: {len(project.documents)} documents')
+
+        return project
+
+    def loadIndex(self, fqFileName: str) -> PutProject:
+        """
+        Reads the project header and its list of documents;  No classes are built and the
+        xml is not parsed, so this costs little more than the decompression.  Use
+        `loadDocument()` to fill in a document
+
+        Args:
+            fqFileName: Fully qualified name of a .put or .xml file
+
+        Returns:  The project with documents that are not loaded yet
+        """
+        project: PutProject          = PutProject(fileName=fqFileName)
+        scanner: ProjectIndexScanner = ProjectIndexScanner(project=project)
+
+        startNs: int = self._startProfiling()
+        with open(project.fileName, 'rb') as projectFile:
+            try:
+                for fileOffset, decompressor, text in self._projectText(projectFile, checkpoints=True):
+                    self._scan(scanner=scanner, text=text, fileOffset=fileOffset, decompressor=decompressor)
+                scanner.close()
+            except (zlib.error, SyntaxError) as e:
+                raise PutLoaderException(f'{fqFileName} is not a Pyut project: {e}') from e
+        self._stopProfiling(startNs=startNs, phaseNames=('decompress', 'index'))
+
+        self.logger.info(f'Indexed {fqFileName}: {len(project.documents)} documents')
+
+        return project
+
+    def loadDocument(self, project: PutProject, document: PutDocument):
+        """
+        Builds the classes of a single document from an indexed project.  Only the document's
+        text is read;  From where the index found it to its end
+
+        Args:
+            project:    The indexed project
+            document:   One of its documents
+        """
+        if document.loaded is True:
+            return
+        if document.location is None:
+            raise PutLoaderException(f'{document.title} is not from an index of {project.fileName}')
+
+        builder: XmlClassBuilder = XmlClassBuilder()
+
+        startNs: int = self._startProfiling()
+        with open(project.fileName, 'rb') as projectFile:
+            text: Iterator[bytes] = self._documentText(projectFile=projectFile, location=document.location)
+            for event, element in self._elementEvents(text=text, fileName=project.fileName):
+                if event == 'end' and element.tag.startswith(GRAPHIC_ELEMENT_PREFIX):
+                    self._addElement(document=document, builder=builder, element=element, fileName=project.fileName)
+                    element.clear()
+        self._stopProfiling(startNs=startNs, phaseNames=('decompress', 'parse', 'build'))
+
+        document.loaded = True
+        self.logger.info(f'Loaded {document.title}: {len(document.classRecords)} classes')
+
+    def _addElement(self, document: PutDocument, builder: XmlClassBuilder, element: Element, fileName: str):
+        """
+        Args:
+            document:   The document the element is in
+            builder:    The document's class builder
+            element:    A complete diagram element
+            fileName:   The project file;  For the error message
+        """
+        if element.tag == ELEMENT_GRAPHIC_CLASS:
+            document.classRecords.append(self._buildClass(builder=builder, element=element, fileName=fileName))
+        else:
+            document.skippedElements[element.tag] = document.skippedElements.get(element.tag, 0) + 1
+
+    def _buildClass(self, builder: XmlClassBuilder, element: Element, fileName: str) -> ClassRecord:
+        """
+        A missing or malformed attribute surfaces as whatever the conversion raised;  The
+        callers only expect a `PutLoaderException` for a bad project
+
+        Args:
+            builder:    The document's class builder
+            element:    A complete `GraphicClass` element
+            fileName:   The project file;  For the error message
+
+        Returns:  The class record
+        """
+        startNs: int = perf_counter_ns() if self._profiling is True else 0
+        try:
+            classRecord: ClassRecord = builder.build(element)
+        except (AssertionError, AttributeError, TypeError, ValueError) as e:
+            raise PutLoaderException(f'{fileName} has a malformed class: {e}') from e
+
+        if self._profiling is True:
+            self._buildNs += perf_counter_ns() - startNs
+
+        return classRecord
+
+    def _projectText(self, projectFile: BinaryIO, checkpoints: bool) -> Iterator[TextChunk]:
+        """
+        Args:
+            projectFile:    The open project file
+            checkpoints:    Copy the decompressor before each chunk;  So the index can resume there
+
+        Returns:  The text of each chunk as it is read
+        """
+        decompressor: Any = None
+        fileOffset:   int = projectFile.tell()
+
+        chunk: bytes = projectFile.read(self._chunkSize)
+        if chunk and chunk.lstrip()[:1] != XML_SIGNATURE:
+            decompressor = zlib.decompressobj()
+
+        while chunk:
+            checkpoint: Any = decompressor.copy() if checkpoints is True and decompressor is not None else None
+            # A chunk may inflate to nothing;  Only the file read decides when we are done
+            yield fileOffset, checkpoint, chunk if decompressor is None else self._decompress(decompressor, chunk)
+
+            fileOffset += len(chunk)
+            chunk = projectFile.read(self._chunkSize)
+
+        if decompressor is not None:
+            checkpoint = decompressor.copy() if checkpoints is True else None
+            yield fileOffset, checkpoint, decompressor.flush()
+
+    def _documentText(self, projectFile: BinaryIO, location: DocumentLocation) -> Iterator[bytes]:
+        """
+        The document on its own, after an xml declaration with the project's encoding
+
+        Args:
+            projectFile:    The open project file
+            location:       Where the index found the document
+
+        Returns:  The document text in chunks
+        """
+        yield f'<?xml version="1.0" encoding="{location.encoding}"?>'.encode('ascii')
+
+        projectFile.seek(location.fileOffset)
+        # The location may be read again;  Leave its decompressor where it is
+        decompressor: Any = None if location.decompressor is None else location.decompressor.copy()
+        skip:         int = location.skip
+        remaining:    int = location.length
+
+        while remaining > 0:
+            chunk: bytes = projectFile.read(self._chunkSize)
+            if decompressor is None:
+                text: bytes = chunk
+            elif chunk:
+                text = self._decompress(decompressor, chunk)
+            else:
+                text = decompressor.flush()
+
+            if skip > 0:
+                skipped: int = min(skip, len(text))
+                text = text[skipped:]
+                skip -= skipped
+            text = text[:remaining]
+            remaining -= len(text)
+            yield text
+
+            if not chunk:
+                # The file is shorter than the index says;  The parser reports it
+                break
+
+    def _elementEvents(self, text: Iterator[bytes], fileName: str) -> Iterator[XmlEvent]:
+        """
+        Args:
+            text:       The xml in chunks
+            fileName:   The project file;  For the error message
+
+        Returns:  The parser start and end events as the chunks arrive
+        """
+        parser: XMLPullParser = XMLPullParser(events=('start', 'end'))
+        try:
+            for textChunk in text:
+                self._parse(parser, textChunk)
+                yield from cast(Iterator[XmlEvent], parser.read_events())
+
+            parser.close()
+            yield from cast(Iterator[XmlEvent], parser.read_events())
+        except (zlib.error, SyntaxError) as e:
+            # the xml ParseError is a SyntaxError
+            raise PutLoaderException(f'{fileName} is not a Pyut project: {e}') from e
+
+    def _decompress(self, decompressor: Any, chunk: bytes) -> bytes:
+
+        if self._profiling is False:
+            return decompressor.decompress(chunk)
+
+        startNs:      int   = perf_counter_ns()
+        decompressed: bytes = decompressor.decompress(chunk)
+        self._decompressNs += perf_counter_ns() - startNs
+
+        return decompressed
+
+    def _parse(self, parser: XMLPullParser, data: bytes):
+        """
+        Feeding the parser does the parsing;  Reading the events only hands them out
+        """
+        if self._profiling is False:
+            parser.feed(data)
+            return
+
+        startNs: int = perf_counter_ns()
+        parser.feed(data)
+        self._parseNs += perf_counter_ns() - startNs
+
+    def _scan(self, scanner: ProjectIndexScanner, text: bytes, fileOffset: int, decompressor: Any):
+        """
+        Like `_parse()` for the index
+        """
+        if self._profiling is False:
+            scanner.feed(text=text, fileOffset=fileOffset, decompressor=decompressor)
+            return
+
+        startNs: int = perf_counter_ns()
+        scanner.feed(text=text, fileOffset=fileOffset, decompressor=decompressor)
+        self._parseNs += perf_counter_ns() - startNs
+
+    def _startProfiling(self) -> int:
+
+        self._profiling    = PhaseProfiler.instance().enabled
+        self._decompressNs = 0
+        self._parseNs      = 0
+        self._buildNs      = 0
+
+        return perf_counter_ns()
+
+    def _stopProfiling(self, startNs: int, phaseNames: Tuple[str, ...]):
+        """
+        Args:
+            startNs:    When the load started
+            phaseNames: The names of the decompress, parse or index, and build phases;  As many as there were
+        """
+        if self._profiling is False:
+            return
+
+        profiler: PhaseProfiler = PhaseProfiler.instance()
+        for phaseName, durationNs in zip(phaseNames, (self._decompressNs, self._parseNs, self._buildNs)):
+            profiler.addPhase(name=phaseName, startNs=startNs, durationNs=durationNs)
@@ -0,0 +1,64 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+
+
+def createClassRecords() -> List[ClassRecord]:
+    return []
+
+
+def createPutDocuments() -> List['PutDocument']:
+    return []
+
+
+def createSkippedElements() -> Dict[str, int]:
+    return {}
+
+
+@dataclass
+class DocumentLocation:
+    """
+    Where a document is in its project file;  `PutLoader.loadDocument()` starts reading
+    there instead of at the top.  Offsets and lengths count decompressed bytes, except for
+    `fileOffset`.  For a compressed file the decompressor is a copy of its state at
+    `fileOffset`;  For plain xml it is None
+    """
+    fileOffset:   int = 0
+    skip:         int = 0
+    length:       int = 0
+    encoding:     str = 'utf-8'
+    decompressor: Any = None
+
+
+@dataclass
+class PutDocument:
+    """
+    A `PyutDocument` element;  A single diagram.  The classes of a document from a
+    project index are only present once it is `loaded`;  The index gives it a location.
+    They are records, not OGL shapes;  Whoever displays the document creates those.
+    The diagram elements that are not loaded, links and notes for example, are counted
+    by tag in `skippedElements`
+    """
+    documentType:    str                        = ''
+    title:           str                        = ''
+    loaded:          bool                       = False
+    classRecords:    List[ClassRecord]          = field(default_factory=createClassRecords)
+    skippedElements: Dict[str, int]             = field(default_factory=createSkippedElements)
+    location:        Optional[DocumentLocation] = field(default=None, compare=False, repr=False)
+
+
+@dataclass
+class PutProject:
+    """
+    A `PyutProject` element and its diagrams
+    """
+    fileName:  str = ''
+    version:   str = ''
+    codePath:  str = ''
+    documents: List[PutDocument] = field(default_factory=createPutDocuments)
@@ -0,0 +1,80 @@
+from typing import Optional
+from typing import TextIO
+
+from logging import Logger
+from logging import getLogger
+
+from os import getpid
+from os import name as osName
+
+#
+# Only one of them is available;  fcntl on POSIX and msvcrt on Windows
+#
+if osName == 'posix':
+    import fcntl
+else:
+    import msvcrt
+
+
+class SessionLock:
+    """
+    An exclusive lock on a file for as long as a session runs.  The operating system drops it
+    when the process ends,  however it ends;  A lock that can be taken belongs to a session
+    that is over.  The file holds the owner's process id,  for people looking at it.
+
+    POSIX locks with `flock()`;  Two opens of the file conflict even in the same process
+    """
+    def __init__(self, fileName: str):
+        """
+
+        Args:
+            fileName:   The lock file;  Created if need be
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._fileName: str              = fileName
+        self._lockFile: Optional[TextIO] = None
+
+    @property
+    def locked(self) -> bool:
+        """
+        Returns:  'True' while this object holds the lock
+        """
+        return self._lockFile is not None
+
+    def acquire(self) -> bool:
+        """
+        Does not wait
+
+        Returns:  'True' if the lock was taken;  'False' if another session holds it
+        """
+        if self._lockFile is not None:
+            return True
+
+        lockFile: TextIO = open(self._fileName, 'a+')
+        try:
+            if osName == 'posix':
+                fcntl.flock(lockFile.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                lockFile.seek(0)
+                msvcrt.locking(lockFile.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lockFile.close()
+            return False
+
+        lockFile.seek(0)
+        lockFile.truncate()
+        lockFile.write(f'{getpid()}\n')
+        lockFile.flush()
+
+        self._lockFile = lockFile
+
+        return True
+
+    def release(self):
+        """
+        Closing the file drops the lock
+        """
+        if self._lockFile is not None:
+            self._lockFile.close()
+            self._lockFile = None
@@ -0,0 +1,146 @@
+from typing import Dict
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from xml.etree.ElementTree import Element
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutModifiers
+from pyutmodel.PyutMethod import PyutParameters
+from pyutmodel.PyutMethod import SourceCode
+from pyutmodel.PyutModifier import PyutModifier
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutStereotype import PyutStereotype
+from pyutmodel.PyutType import PyutType
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+ELEMENT_GRAPHIC_CLASS: str = 'GraphicClass'
+ELEMENT_CLASS:         str = 'Class'
+ELEMENT_METHOD:        str = 'Method'
+ELEMENT_MODIFIER:      str = 'Modifier'
+ELEMENT_RETURN:        str = 'Return'
+ELEMENT_PARAMETER:     str = 'Param'
+ELEMENT_SOURCE_CODE:   str = 'SourceCode'
+ELEMENT_CODE:          str = 'Code'
+ELEMENT_FIELD:         str = 'Field'
+
+
+class XmlClassBuilder:
+    """
+    Builds a class record, the model class and its geometry, from a complete Pyut xml
+    `GraphicClass` element;  No OGL shape is created, so it runs without wx.  Like
+    `ModelDecoder`, the classes built by an instance share their `PyutType`s and
+    `PyutModifier`s
+    """
+    def __init__(self):
+
+        self.logger: Logger = getLogger(__name__)
+
+        self._types:     Dict[str, PyutType]     = {}
+        self._modifiers: Dict[str, PyutModifier] = {}
+
+    def build(self, graphicClass: Element) -> ClassRecord:
+        """
+        Args:
+            graphicClass:   A `GraphicClass` element and all its children
+
+        Returns:  The model class with its geometry
+        """
+        pyutClass: PyutClass     = self._buildModelClass(graphicClass.find(ELEMENT_CLASS))
+        geometry:  ShapeGeometry = ShapeGeometry(x=int(graphicClass.get('x')), y=int(graphicClass.get('y')),
+                                                 width=int(graphicClass.get('width')), height=int(graphicClass.get('height')))
+
+        return ClassRecord(pyutClass=pyutClass, geometry=geometry)
+
+    def _buildModelClass(self, classElement: Element) -> PyutClass:
+
+        pyutClass: PyutClass = PyutClass(name=classElement.get('name'))
+
+        pyutClass.id                = int(classElement.get('id'))
+        pyutClass.stereotype        = PyutStereotype(name=classElement.get('stereotype', ''))
+        pyutClass.fileName          = classElement.get('filename', '')
+        pyutClass.description       = classElement.get('description', '')
+        pyutClass.showMethods       = self._toBoolean(classElement.get('showMethods'))
+        pyutClass.showFields        = self._toBoolean(classElement.get('showFields'))
+        pyutClass.displayStereoType = self._toBoolean(classElement.get('showStereotype'))
+        pyutClass.displayParameters = PyutDisplayParameters.toEnum(classElement.get('displayParameters', 'Unspecified'))
+
+        pyutClass.methods = [self._buildMethod(methodElement) for methodElement in classElement.iterfind(ELEMENT_METHOD)]
+        pyutClass.fields  = [self._buildField(fieldElement) for fieldElement in classElement.iterfind(ELEMENT_FIELD)]
+
+        return pyutClass
+
+    def _buildMethod(self, methodElement: Element) -> PyutMethod:
+
+        returnElement: Optional[Element] = methodElement.find(ELEMENT_RETURN)
+        returnType:    str               = '' if returnElement is None else returnElement.get('type', '')
+
+        pyutMethod: PyutMethod = PyutMethod(name=methodElement.get('name'),
+                                            visibility=PyutVisibilityEnum.toEnum(methodElement.get('visibility', 'PUBLIC')),
+                                            returnType=self._sharedType(returnType))
+
+        # Some Pyut versions wrote all the modifiers into a single comma separated element
+        modifiers = [
+            self._sharedModifier(modifierName.strip())
+            for modifierElement in methodElement.iterfind(ELEMENT_MODIFIER)
+            for modifierName in modifierElement.get('name', '').split(',') if modifierName.strip() != ''
+        ]
+        parameters = [self._buildParameter(parameterElement) for parameterElement in methodElement.iterfind(ELEMENT_PARAMETER)]
+        sourceCode = [codeElement.text or '' for codeElement in methodElement.iterfind(f'{ELEMENT_SOURCE_CODE}/{ELEMENT_CODE}')]
+
+        pyutMethod.modifiers  = PyutModifiers(modifiers)
+        pyutMethod.parameters = PyutParameters(parameters)
+        pyutMethod.sourceCode = SourceCode(sourceCode)
+
+        return pyutMethod
+
+    def _buildParameter(self, parameterElement: Element) -> PyutParameter:
+
+        return PyutParameter(name=parameterElement.get('name'),
+                             parameterType=self._sharedType(parameterElement.get('type', '')),
+                             defaultValue=parameterElement.get('defaultValue', ''))
+
+    def _buildField(self, fieldElement: Element) -> PyutField:
+        """
+        The field name, type and default value are in a nested `Param` element
+
+        Args:
+            fieldElement:   A `Field` element
+
+        Returns:  The model field
+        """
+        parameterElement: Element = fieldElement.find(ELEMENT_PARAMETER)
+
+        return PyutField(name=parameterElement.get('name'),
+                         fieldType=self._sharedType(parameterElement.get('type', '')),
+                         defaultValue=parameterElement.get('defaultValue', ''),
+                         visibility=PyutVisibilityEnum.toEnum(fieldElement.get('visibility', 'PRIVATE')))
+
+    def _sharedType(self, typeValue: str) -> PyutType:
+
+        pyutType: Optional[PyutType] = self._types.get(typeValue)
+        if pyutType is None:
+            pyutType = PyutType(value=typeValue)
+            self._types[typeValue] = pyutType
+
+        return pyutType
+
+    def _sharedModifier(self, modifierName: str) -> PyutModifier:
+
+        pyutModifier: Optional[PyutModifier] = self._modifiers.get(modifierName)
+        if pyutModifier is None:
+            pyutModifier = PyutModifier(modifierTypeName=modifierName)
+            self._modifiers[modifierName] = pyutModifier
+
+        return pyutModifier
+
+    def _toBoolean(self, value: Optional[str]) -> bool:
+        return value is not None and value.lower() in ('true', '1')
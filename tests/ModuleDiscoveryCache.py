@@ -0,0 +1,132 @@
+from typing import Callable
+from typing import Dict
+from typing import List
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from os import path as osPath
+from os import stat as osStat
+from os import walk as osWalk
+
+from tempfile import gettempdir
+
+CACHE_FILENAME: str = 'pyutv3TestDiscovery.json'
+
+ROOT_DIRECTORY_KEY: str = 'rootDirectory'
+DIRECTORIES_KEY:    str = 'directories'
+MODULES_KEY:        str = 'modules'
+DURATIONS_KEY:      str = 'durations'
+
+# Directory name to its modification time in nanoseconds
+DirectoryStamps = Dict[str, int]
+
+
+class ModuleDiscoveryCache:
+    """
+    Remembers which test modules exist so that a run does not have to walk the test
+    directories again.  Adding, removing or renaming a file changes the modification time
+    of its directory, and a new directory changes its parent's;  So the cache is good as
+    long as none of the directories it saw has changed.
+
+    It also remembers how long each module took in the last parallel run;  The
+    slowest modules are started first
+    """
+    def __init__(self, rootDirectory: str, cacheFileName: str = osPath.join(gettempdir(), CACHE_FILENAME)):
+        """
+
+        Args:
+            rootDirectory:  The directory the test modules are discovered in
+            cacheFileName:  Where the cache is kept between runs
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._rootDirectory: str              = osPath.abspath(rootDirectory)
+        self._cacheFileName: str              = cacheFileName
+        self._directories:   DirectoryStamps  = {}
+        self._modules:       List[str]        = []
+        self._durations:     Dict[str, float] = {}
+
+        self._load()
+
+    @property
+    def durations(self) -> Dict[str, float]:
+        """
+        Returns:  The seconds each module took the last time it ran in parallel
+        """
+        return self._durations
+
+    def moduleNames(self, discover: Callable[[], List[str]]) -> List[str]:
+        """
+        Args:
+            discover:   Finds the test modules when the cache is out of date
+
+        Returns:  The test module names
+        """
+        if self._isUpToDate() is True:
+            self.logger.debug(f'{len(self._modules)} cached test modules')
+            return list(self._modules)
+
+        self._directories = self._directoryStamps()
+        self._modules     = discover()
+        self._save()
+
+        return list(self._modules)
+
+    def updateDurations(self, durations: Dict[str, float]):
+        """
+        Args:
+            durations:  The seconds each module took;  Modules that no longer exist are forgotten
+        """
+        self._durations.update(durations)
+        self._durations = {moduleName: seconds for moduleName, seconds in self._durations.items() if moduleName in self._modules}
+        self._save()
+
+    def _isUpToDate(self) -> bool:
+
+        if len(self._directories) == 0:
+            return False
+
+        for directoryName, modificationTime in self._directories.items():
+            try:
+                if osStat(directoryName).st_mtime_ns != modificationTime:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+    def _directoryStamps(self) -> DirectoryStamps:
+
+        return {dirName: osStat(dirName).st_mtime_ns for dirName, _, _ in osWalk(self._rootDirectory) if '__pycache__' not in dirName}
+
+    def _load(self):
+
+        try:
+            with open(self._cacheFileName, 'r') as cacheFile:
+                cache = json.load(cacheFile)
+        except (OSError, ValueError):
+            return
+
+        if cache.get(ROOT_DIRECTORY_KEY) != self._rootDirectory:
+            return
+
+        self._directories = cache.get(DIRECTORIES_KEY, {})
+        self._modules     = cache.get(MODULES_KEY, [])
+        self._durations   = cache.get(DURATIONS_KEY, {})
+
+    def _save(self):
+
+        cache = {
+            ROOT_DIRECTORY_KEY: self._rootDirectory,
+            DIRECTORIES_KEY:    self._directories,
+            MODULES_KEY:        self._modules,
+            DURATIONS_KEY:      self._durations,
+        }
+        try:
+            with open(self._cacheFileName, 'w') as cacheFile:
+                json.dump(cache, cacheFile, indent=1)
+        except OSError as e:
+            self.logger.warning(f'Could not save the test discovery cache: {e}')
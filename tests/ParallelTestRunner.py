@@ -0,0 +1,217 @@
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from logging import Logger
+from logging import getLogger
+
+from dataclasses import dataclass
+from dataclasses import field
+
+from enum import Enum
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+
+from multiprocessing import get_context
+
+from datetime import datetime
+
+from html import escape
+
+from importlib import import_module
+
+from os import makedirs
+from os import path as osPath
+
+from time import perf_counter
+
+from unittest import TestCase
+from unittest import TestResult
+from unittest.suite import TestSuite
+
+REPORT_DIRECTORY: str = 'reports'
+
+
+class TestOutcome(Enum):
+    SUCCESS             = 'success'
+    FAILURE             = 'failure'
+    ERROR               = 'error'
+    SKIPPED             = 'skipped'
+    EXPECTED_FAILURE    = 'expectedFailure'
+    UNEXPECTED_SUCCESS  = 'unexpectedSuccess'
+
+
+@dataclass
+class TestRecord:
+    testId:  str
+    outcome: TestOutcome
+    seconds: float = 0.0
+    details: str   = ''
+
+
+@dataclass
+class ModuleResult:
+    """
+    What a worker sends back for one test module;  Plain data, so that it pickles
+    """
+    moduleName: str
+    seconds:    float            = 0.0
+    records:    List[TestRecord] = field(default_factory=list)
+
+    def count(self, outcome: TestOutcome) -> int:
+        return len([record for record in self.records if record.outcome == outcome])
+
+
+class RecordingTestResult(TestResult):
+    """
+    Keeps every test's outcome as a `TestRecord`;  The tracebacks become text in the worker
+    """
+    def __init__(self):
+
+        super().__init__()
+
+        self.records:    List[TestRecord] = []
+        self._startTime: float            = 0.0
+
+    def startTest(self, test: TestCase):
+        super().startTest(test)
+        self._startTime = perf_counter()
+
+    def addSuccess(self, test: TestCase):
+        super().addSuccess(test)
+        self._record(test, TestOutcome.SUCCESS)
+
+    def addFailure(self, test: TestCase, err):
+        super().addFailure(test, err)
+        self._record(test, TestOutcome.FAILURE, details=self.failures[-1][1])
+
+    def addError(self, test: TestCase, err):
+        super().addError(test, err)
+        self._record(test, TestOutcome.ERROR, details=self.errors[-1][1])
+
+    def addSkip(self, test: TestCase, reason: str):
+        super().addSkip(test, reason)
+        self._record(test, TestOutcome.SKIPPED, details=reason)
+
+    def addExpectedFailure(self, test: TestCase, err):
+        super().addExpectedFailure(test, err)
+        self._record(test, TestOutcome.EXPECTED_FAILURE)
+
+    def addUnexpectedSuccess(self, test: TestCase):
+        super().addUnexpectedSuccess(test)
+        self._record(test, TestOutcome.UNEXPECTED_SUCCESS)
+
+    def addSubTest(self, test: TestCase, subtest: TestCase, err):
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            failed: bool = issubclass(err[0], test.failureException)
+            self._record(subtest, TestOutcome.FAILURE if failed else TestOutcome.ERROR, details=(self.failures if failed else self.errors)[-1][1])
+
+    def _record(self, test: TestCase, outcome: TestOutcome, details: str = ''):
+        self.records.append(TestRecord(testId=test.id(), outcome=outcome, seconds=perf_counter() - self._startTime, details=details))
+
+
+def _initializeWorker():
+    """
+    Every worker is a new interpreter;  Tests that need a wx application make their own
+    """
+    from tests.TestBase import TestBase
+
+    TestBase.setUpLogging()
+
+
+def runTestModule(moduleName: str) -> ModuleResult:
+    """
+    Runs in a worker process
+
+    Args:
+        moduleName:     A test module as a path without the extension;  For example `tests/ogljson/TestOglClassDecoder`
+
+    Returns:  The outcome of each test in the module
+    """
+    startTime: float = perf_counter()
+
+    result: RecordingTestResult = RecordingTestResult()
+    try:
+        testSuite: TestSuite = import_module(moduleName.replace('/', '.')).suite()
+        testSuite.run(result)
+    except (ValueError, Exception) as e:
+        result.records.append(TestRecord(testId=moduleName, outcome=TestOutcome.ERROR, details=f'Module import problem with: {moduleName}:  {e}'))
+
+    return ModuleResult(moduleName=moduleName, seconds=perf_counter() - startTime, records=result.records)
+
+
+class ParallelTestRunner:
+    """
+    Runs test modules in worker processes.  The workers are started fresh (`spawn`), never
+    forked, so no worker inherits wx state;  Each test builds its wx application in its own
+    process.  Modules are handed out one at a time, the slowest first, so that no worker is
+    left with a long module at the end
+    """
+    def __init__(self, maxWorkers: Optional[int] = None):
+        """
+
+        Args:
+            maxWorkers:     The number of worker processes;  None for one per CPU
+        """
+        self.logger: Logger = getLogger(__name__)
+
+        self._maxWorkers: Optional[int] = maxWorkers
+
+    def run(self, moduleNames: List[str], durations: Dict[str, float]) -> List[ModuleResult]:
+        """
+        Args:
+            moduleNames:    The test modules
+            durations:      How long modules took before;  Unknown modules are assumed to be slow
+
+        Returns:  The module results in the order the modules were given
+        """
+        ordered: List[str] = sorted(moduleNames, key=lambda moduleName: durations.get(moduleName, float('inf')), reverse=True)
+
+        moduleResults: Dict[str, ModuleResult] = {}
+        with ProcessPoolExecutor(max_workers=self._maxWorkers, mp_context=get_context('spawn'), initializer=_initializeWorker) as executor:
+            futures = [executor.submit(runTestModule, moduleName) for moduleName in ordered]
+            for future in as_completed(futures):
+                moduleResult: ModuleResult = future.result()
+                self.logger.debug(f'{moduleResult.moduleName}: {moduleResult.seconds:.2f} seconds')
+                moduleResults[moduleResult.moduleName] = moduleResult
+
+        return [moduleResults[moduleName] for moduleName in moduleNames]
+
+    def writeHtmlReport(self, moduleResults: List[ModuleResult], reportName: str, runSeconds: float) -> str:
+        """
+        One report for all the workers
+
+        Args:
+            moduleResults:  The results of the run
+            reportName:     The report file name prefix;  A time stamp is added
+            runSeconds:     How long the whole run took
+
+        Returns:  The report's file name
+        """
+        timeStamp:      str = datetime.now().strftime('%Y-%m-%d_%H-%M-%S')
+        reportFileName: str = osPath.join(REPORT_DIRECTORY, f'{reportName}_{timeStamp}.html')
+
+        rows: List[str] = []
+        for moduleResult in moduleResults:
+            rows.append(f'<tr class="module"><th colspan="3">{escape(moduleResult.moduleName)}</th><th>{moduleResult.seconds:.2f}s</th></tr>')
+            for record in moduleResult.records:
+                details: str = '' if record.details == '' else f'<pre>{escape(record.details)}</pre>'
+                rows.append(f'<tr class="{record.outcome.value}"><td>{escape(record.testId)}</td><td>{record.outcome.value}</td><td>{details}</td><td>{record.seconds:.3f}s</td></tr>')
+
+        counts: str = ', '.join(f'{outcome.value}: {sum(moduleResult.count(outcome) for moduleResult in moduleResults)}' for outcome in TestOutcome)
+
+        makedirs(REPORT_DIRECTORY, exist_ok=True)
+        with open(reportFileName, 'w') as reportFile:
+            reportFile.write(
+                f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>{escape(reportName)}</title>\n'
+                f'<style>\n'
+                f'body {{ font-family: sans-serif; }} td, th {{ text-align: left; vertical-align: top; padding: 2px 8px; }}\n'
+                f'.module {{ background: #ddd; }} .failure, .error, .unexpectedSuccess {{ background: #fcc; }} .skipped {{ background: #ffc; }}\n'
+                f'</style></head><body>\n'
+                f'<h1>{escape(reportName)}</h1>\n<p>{timeStamp}  {len(moduleResults)} modules in {runSeconds:.2f} seconds;  {counts}</p>\n'
+                f'<table>\n' + '\n'.join(rows) + '\n</table>\n</body></html>\n'
+            )
+
+        return reportFileName
@@ -1,5 +1,7 @@
 
+from typing import Dict
 from typing import List
+from typing import Optional
 
 from logging import Logger
 from logging import getLogger
@@ -14,12 +16,21 @@ from os import sep as osSep
 
 from re import search as regExSearch
 
+from time import perf_counter
+
 from unittest import TestResult
 from unittest import TextTestRunner
 from unittest.suite import TestSuite
 
 from HtmlTestRunner import HTMLTestRunner
 
+from tests.ModuleDiscoveryCache import ModuleDiscoveryCache
+from tests.ParallelTestRunner import ModuleResult
+from tests.ParallelTestRunner import ParallelTestRunner
+from tests.ParallelTestRunner import TestOutcome
+
+REPORT_NAME: str = 'PyutTestResults'
+
 
 class TestAll:
     """
@@ -28,6 +39,8 @@ class TestAll:
     #
     NOT_TESTS: List[str] = ['TestAll', 'TestBase', 'TestTemplate']
 
+    ROOT_DIRECTORY: str = 'tests'
+
     VERBOSITY_QUIET:   int = 0  # Print the total numbers of tests executed and the global result
     VERBOSITY_DEFAULT: int = 1  # VERBOSITY_QUIET plus a dot for every successful test or an F for every failure
     VERBOSITY_VERBOSE: int = 2  # Print help string of every test and the result
@@ -39,12 +52,12 @@ class TestAll:
 
         self.logger: Logger = getLogger(__name__)
 
-        self._testSuite: TestSuite = self._getTestSuite()
+        self._discoveryCache: ModuleDiscoveryCache = ModuleDiscoveryCache(rootDirectory=TestAll.ROOT_DIRECTORY)
 
     def runTextTestRunner(self) -> int:
 
         runner: TextTestRunner = TextTestRunner(verbosity=TestAll.VERBOSITY_DEFAULT)
-        status: TestResult     = runner.run(self._testSuite)
+        status: TestResult     = runner.run(self._getTestSuite())
         print(f"THE RESULTS ARE IN:")
         print(f"run: {status.testsRun} errors: {len(status.errors)} failures: {len(status.failures)} skipped: {len(status.skipped)}")
         if len(status.failures) != 0:
@@ -54,13 +67,56 @@ class TestAll:
 
     def runHtmlTestRunner(self) -> int:
 
-        runner = HTMLTestRunner(report_name='PyutTestResults', combine_reports=True, add_timestamp=True)
-        status = runner.run(self._testSuite)
+        runner = HTMLTestRunner(report_name=REPORT_NAME, combine_reports=True, add_timestamp=True)
+        status = runner.run(self._getTestSuite())
         if len(status.failures) != 0:
             return 1
         else:
             return 0
 
+    def runParallel(self, maxWorkers: Optional[int] = None, produceHtmlResults: bool = False) -> int:
+        """
+        Run the test modules in worker processes and merge their results;  The modules are
+        not imported here,  so this process never creates a wx application
+
+        Args:
+            maxWorkers:         The number of worker processes;  None for one per CPU
+            produceHtmlResults: Also write a single HTML report for all the workers
+        """
+        startTime: float = perf_counter()
+
+        runner:        ParallelTestRunner = ParallelTestRunner(maxWorkers=maxWorkers)
+        moduleResults: List[ModuleResult] = runner.run(moduleNames=self.__getTestableModuleNames(), durations=self._discoveryCache.durations)
+
+        runSeconds: float = perf_counter() - startTime
+        self._discoveryCache.updateDurations({moduleResult.moduleName: moduleResult.seconds for moduleResult in moduleResults})
+
+        for moduleResult in moduleResults:
+            for record in moduleResult.records:
+                if record.outcome in (TestOutcome.FAILURE, TestOutcome.ERROR):
+                    print(f'{"=" * 70}\n{record.outcome.name}: {record.testId}\n{"-" * 70}\n{record.details}')
+
+        counts: Dict[TestOutcome, int] = {outcome: sum(moduleResult.count(outcome) for moduleResult in moduleResults) for outcome in TestOutcome}
+        testsRun: int = sum(len(moduleResult.records) for moduleResult in moduleResults) - self._importProblemCount(moduleResults)
+
+        print(f'Ran {testsRun} tests from {len(moduleResults)} modules in {runSeconds:.3f}s')
+        print(f"THE RESULTS ARE IN:")
+        print(f"run: {testsRun} errors: {counts[TestOutcome.ERROR]} failures: {counts[TestOutcome.FAILURE]} skipped: {counts[TestOutcome.SKIPPED]}")
+
+        if produceHtmlResults is True:
+            print(f'HTML report: {runner.writeHtmlReport(moduleResults=moduleResults, reportName=REPORT_NAME, runSeconds=runSeconds)}')
+
+        if counts[TestOutcome.FAILURE] != 0:
+            return 1
+        else:
+            return 0
+
+    def _importProblemCount(self, moduleResults: List[ModuleResult]) -> int:
+        """
+        A module that does not import is reported as an error with the module's name
+        """
+        return len([record for moduleResult in moduleResults for record in moduleResult.records if record.testId == moduleResult.moduleName])
+
     def _setupSystemLogging(self):
         """
         Read the unit test logging configuration file
@@ -95,7 +151,7 @@ class TestAll:
             A list of testable module names
         """
 
-        allModules: List[str] = self.__getModuleNames()
+        allModules: List[str] = self._discoveryCache.moduleNames(discover=self.__getModuleNames)
 
         self.logger.debug(f'{allModules=}')
 
@@ -115,7 +171,7 @@ class TestAll:
             A list of module names that we can find in this package
         """
         testFilenames: List[str] = []
-        rootDir = 'tests'
+        rootDir = TestAll.ROOT_DIRECTORY
         for dirName, subdirList, fileList in osWalk(rootDir):
             if '__pycache__' in dirName:
                 continue
@@ -151,13 +207,27 @@ def main():
 
     testAll: TestAll = TestAll()
     status: int = 0
-    if len(sysArgv) < 2:
-        status = testAll.runTextTestRunner()
+
+    produceHtmlResults: bool          = False
+    parallel:           bool          = False
+    maxWorkers:         Optional[int] = None
+    for param in sysArgv[1:]:
+        if param[:22] == "--produce-html-results":
+            produceHtmlResults = True
+        elif param[:10] == "--parallel":
+            # --parallel or --parallel=<worker count>
+            parallel = True
+            if param[10:11] == '=':
+                maxWorkers = int(param[11:])
+
+    if parallel is True:
+        print(f'Running Tests in parallel')
+        status = testAll.runParallel(maxWorkers=maxWorkers, produceHtmlResults=produceHtmlResults)
+    elif produceHtmlResults is True:
+        print(f'Running HTML Tests')
+        status = testAll.runHtmlTestRunner()
     else:
-        for param in sysArgv[1:]:
-            if param[:22] == "--produce-html-results":
-                print(f'Running HTML Tests')
-                status = testAll.runHtmlTestRunner()
+        status = testAll.runTextTestRunner()
 
     return status
 
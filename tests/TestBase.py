@@ -1,28 +1,38 @@
 
+from typing import Any
+from typing import List
+from typing import Union
+
 import logging
 import logging.config
 
-from os import system as osSystem
-
 import json
 
-from unittest import TestCase
+from difflib import unified_diff
 
-from pkg_resources import resource_filename
+from functools import lru_cache
 
-from wx import App
-from wx import Frame
-from wx import ID_ANY
+from unittest import TestCase
 
-from miniogl.DiagramFrame import DiagramFrame
+from pkg_resources import resource_filename
 
 JSON_LOGGING_CONFIG_FILENAME: str = "testLoggingConfig.json"
 TEST_DIRECTORY:               str = 'tests'
 
+# Longer differences are cut short;  The start is enough to see what went wrong
+MAXIMUM_DIFF_LINES: int = 200
 
-class DummyApp(App):
-    def OnInit(self):
-        return True
+# Golden file contents as bytes or text
+Contents = Union[str, bytes]
+
+
+@lru_cache(maxsize=None)
+def _readTestFileBytes(fqFileName: str) -> bytes:
+    """
+    A test file is read once per test run no matter how many tests compare against it
+    """
+    with open(fqFileName, 'rb') as testFile:
+        return testFile.read()
 
 
 class TestBase(TestCase):
@@ -30,10 +40,18 @@ class TestBase(TestCase):
     RESOURCES_PACKAGE_NAME:                   str = 'tests.resources'
     RESOURCES_TEST_FILES_PACKAGE_NAME:        str = f'{RESOURCES_PACKAGE_NAME}.testfiles'
 
-    EXTERNAL_DIFF_PROGRAM:    str = 'diff'
-
     def setUp(self):
-        self._app:   DummyApp = DummyApp()
+        """
+        Only tests of OGL shapes need an application and a frame;  wx is imported here
+        so that model and encoder tests run without it
+        """
+        from wx import App
+        from wx import Frame
+        from wx import ID_ANY
+
+        from miniogl.DiagramFrame import DiagramFrame
+
+        self._app:   App = App()
 
         #  Create frame
         baseFrame: Frame = Frame(None, ID_ANY, "", size=(10, 10))
@@ -72,8 +90,72 @@ class TestBase(TestCase):
         fqFileName: str = resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, testFileName)
         return fqFileName
 
-    def _runDiff(self, expectedContentsFileName: str, actualContentsFileName) -> int:
-
-        status: int = osSystem(f'{TestBase.EXTERNAL_DIFF_PROGRAM} {expectedContentsFileName} {actualContentsFileName}')
-
-        return status
+    def _readTestFile(self, testFileName: str) -> str:
+        """
+        Args:
+            testFileName:   A file in the test files package
+
+        Returns:  Its text
+        """
+        return _readTestFileBytes(self._getFullyQualifiedTestFilePath(testFileName=testFileName)).decode('utf-8')
+
+    def _assertSameAsTestFile(self, testFileName: str, actualContents: Contents, structural: bool = False):
+        """
+        Compare generated contents with a golden test file;  Everything happens in memory
+
+        Args:
+            testFileName:   A file in the test files package
+            actualContents: What the code under test produced
+            structural:     'True' compares the parsed json so that formatting and key order do not matter
+        """
+        expectedContents: bytes = _readTestFileBytes(self._getFullyQualifiedTestFilePath(testFileName=testFileName))
+        if structural is True:
+            self._assertSameJson(expectedJson=expectedContents, actualJson=actualContents, expectedName=testFileName)
+        else:
+            self._assertSameContents(expectedContents=expectedContents, actualContents=actualContents, expectedName=testFileName)
+
+    def _assertSameJson(self, expectedJson: Contents, actualJson: Contents, expectedName: str = 'expected', actualName: str = 'actual'):
+        """
+        Compares the parsed documents;  On failure the difference is shown between the documents
+        rewritten with sorted keys, so that only real differences show up
+
+        Args:
+            expectedJson:   The expected json document
+            actualJson:     The json document to check
+            expectedName:   What to call the expected document in the difference
+            actualName:     What to call the actual document in the difference
+        """
+        expectedValue: Any = json.loads(expectedJson)
+        actualValue:   Any = json.loads(actualJson)
+        if expectedValue != actualValue:
+            self.fail(self._unifiedDiff(expectedText=json.dumps(expectedValue, indent=4, sort_keys=True),
+                                        actualText=json.dumps(actualValue, indent=4, sort_keys=True),
+                                        expectedName=expectedName, actualName=actualName))
+
+    def _assertSameContents(self, expectedContents: Contents, actualContents: Contents, expectedName: str = 'expected', actualName: str = 'actual'):
+        """
+        Byte for byte comparison;  Text is compared as its UTF-8 encoding
+
+        Args:
+            expectedContents:   The expected contents
+            actualContents:     The contents to check
+            expectedName:       What to call the expected contents in the difference
+            actualName:         What to call the actual contents in the difference
+        """
+        expectedBytes: bytes = expectedContents.encode('utf-8') if isinstance(expectedContents, str) else expectedContents
+        actualBytes:   bytes = actualContents.encode('utf-8') if isinstance(actualContents, str) else actualContents
+        if expectedBytes != actualBytes:
+            self.fail(self._unifiedDiff(expectedText=expectedBytes.decode('utf-8', errors='replace'),
+                                        actualText=actualBytes.decode('utf-8', errors='replace'),
+                                        expectedName=expectedName, actualName=actualName))
+
+    def _unifiedDiff(self, expectedText: str, actualText: str, expectedName: str, actualName: str) -> str:
+
+        diffLines: List[str] = list(unified_diff(expectedText.splitlines(), actualText.splitlines(), fromfile=expectedName, tofile=actualName, lineterm=''))
+        if len(diffLines) == 0:
+            # Only the line endings or the final new line differ
+            diffLines = [f'{expectedName} and {actualName} differ in their line endings']
+        elif len(diffLines) > MAXIMUM_DIFF_LINES:
+            diffLines = diffLines[:MAXIMUM_DIFF_LINES] + [f'... {len(diffLines) - MAXIMUM_DIFF_LINES} more lines']
+
+        return '\n'.join(diffLines)
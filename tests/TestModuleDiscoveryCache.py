@@ -0,0 +1,83 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+from os import utime
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from tests.ModuleDiscoveryCache import ModuleDiscoveryCache
+from tests.TestBase import TestBase
+
+
+class TestModuleDiscoveryCache(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestModuleDiscoveryCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestModuleDiscoveryCache.clsLogger
+
+        self._discoveryCount: int = 0
+
+    def tearDown(self):
+        pass
+
+    def testCachedBetweenRuns(self):
+
+        with TemporaryDirectory() as rootDirectory, TemporaryDirectory() as cacheDirectory:
+            cacheFileName: str = osPath.join(cacheDirectory, 'cache.json')
+
+            firstNames:  List[str] = ModuleDiscoveryCache(rootDirectory=rootDirectory, cacheFileName=cacheFileName).moduleNames(discover=self._discover)
+            secondCache: ModuleDiscoveryCache = ModuleDiscoveryCache(rootDirectory=rootDirectory, cacheFileName=cacheFileName)
+            secondNames: List[str] = secondCache.moduleNames(discover=self._discover)
+
+            self.assertEqual(firstNames, secondNames, 'The cache lost modules')
+            self.assertEqual(1, self._discoveryCount, 'The second run should not have discovered again')
+
+            secondCache.updateDurations({'tests/TestGato': 1.5, 'tests/TestGone': 3.0})
+            self.assertEqual({'tests/TestGato': 1.5}, ModuleDiscoveryCache(rootDirectory=rootDirectory, cacheFileName=cacheFileName).durations, 'Durations not kept')
+
+    def testChangedDirectoryDiscoversAgain(self):
+
+        with TemporaryDirectory() as rootDirectory, TemporaryDirectory() as cacheDirectory:
+            cacheFileName: str = osPath.join(cacheDirectory, 'cache.json')
+
+            ModuleDiscoveryCache(rootDirectory=rootDirectory, cacheFileName=cacheFileName).moduleNames(discover=self._discover)
+            # Not every file system has a fine grained time stamp;  Pretend a test file was added
+            utime(rootDirectory, ns=(0, 0))
+            ModuleDiscoveryCache(rootDirectory=rootDirectory, cacheFileName=cacheFileName).moduleNames(discover=self._discover)
+
+            self.assertEqual(2, self._discoveryCount, 'A changed directory must be walked again')
+
+    def _discover(self) -> List[str]:
+
+        self._discoveryCount += 1
+
+        return ['tests/TestGato']
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestModuleDiscoveryCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
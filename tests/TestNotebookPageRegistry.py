@@ -0,0 +1,84 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.NotebookPageRegistry import NotebookPageRegistry
+
+from tests.TestBase import TestBase
+
+
+class Page:
+    """
+    Stands in for a diagram frame;  The registry only needs its identity
+    """
+    def __init__(self, title: str):
+        self.title: str = title
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Page) and self.title == other.title
+
+    __hash__ = None     # type: ignore
+
+
+class TestNotebookPageRegistry(TestBase):
+    """
+    No wx application;  The registry mirrors a notebook's page order
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestNotebookPageRegistry.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestNotebookPageRegistry.clsLogger
+
+        self._ozzee: Page = Page('Ozzee')
+        self._fran:  Page = Page('Fran')
+        self._gato:  Page = Page('Gato')
+
+        self._pageRegistry: NotebookPageRegistry[Page] = NotebookPageRegistry()
+        self._pageRegistry.append(page=self._ozzee, key='ozzee.document')
+        self._pageRegistry.append(page=self._fran,  key='fran.document')
+
+    def tearDown(self):
+        pass
+
+    def testLookups(self):
+
+        self.assertEqual(1, self._pageRegistry.pageIndex(self._fran), 'Wrong page index')
+        self.assertIs(self._ozzee, self._pageRegistry.page('ozzee.document'), 'Wrong page for the key')
+        self.assertIsNone(self._pageRegistry.pageIndex(Page('Fran')), 'An equal page is not the same page')
+
+    def testInsertAndRemove(self):
+
+        self._pageRegistry.insert(index=0, page=self._gato)
+
+        self.assertEqual(1, self._pageRegistry.pageIndex(self._ozzee), 'An insert moves the later pages up')
+        self.assertEqual(2, self._pageRegistry.pageIndex(self._fran),  'An insert moves the later pages up')
+
+        self.assertEqual(1, self._pageRegistry.remove(self._ozzee), 'The index to delete')
+        self.assertEqual(1, self._pageRegistry.pageIndex(self._fran), 'A delete moves the later pages down')
+        self.assertIsNone(self._pageRegistry.page('ozzee.document'), 'The key goes with the page')
+        self.assertIsNone(self._pageRegistry.remove(self._ozzee), 'Already removed')
+        self.assertEqual(2, len(self._pageRegistry), 'Wrong page count')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestNotebookPageRegistry))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,84 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.PhaseProfiler import PhaseProfiler
+from pyutv3.PhaseProfiler import TRACE_EVENTS_KEY
+from pyutv3.persistence.PutLoader import PutLoader
+
+from tests.TestBase import TestBase
+
+PUT_TEST_FILENAME: str = 'JsonTestClass.put'
+
+
+class TestPhaseProfiler(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPhaseProfiler.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPhaseProfiler.clsLogger
+
+        self._savedInstance = PhaseProfiler._instance
+
+    def tearDown(self):
+        PhaseProfiler._instance = self._savedInstance
+
+    def testDisabledPhasesAreFree(self):
+
+        profiler: PhaseProfiler = PhaseProfiler()
+        profiler._enabled = False
+
+        self.assertIs(profiler.phase('first'), profiler.phase('second'), 'Disabled phases should share one context manager')
+
+    def testChromeTrace(self):
+
+        with TemporaryDirectory() as directory:
+            traceFileName: str = osPath.join(directory, 'trace.json')
+
+            profiler: PhaseProfiler = PhaseProfiler()
+            profiler.enable(traceFileName=traceFileName)
+            PhaseProfiler._instance = profiler
+
+            with profiler.phase('setUpLogging'):
+                pass
+            PutLoader().load(self._getFullyQualifiedTestFilePath(PUT_TEST_FILENAME))
+            profiler.report()
+
+            with open(traceFileName) as traceFile:
+                traceEvents = json.load(traceFile)[TRACE_EVENTS_KEY]
+
+            names: List[str] = [traceEvent['name'] for traceEvent in traceEvents]
+            self.assertEqual(['setUpLogging', 'decompress', 'parse', 'build'], names, 'Incorrect phases')
+            self.assertTrue(all(traceEvent['ph'] == 'X' and traceEvent['dur'] >= 0 for traceEvent in traceEvents), 'Not complete events')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPhaseProfiler))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,88 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.ProjectTreeIndex import ProjectTreeIndex
+from pyutv3.ProjectTreeIndex import ProjectTreeNode
+from pyutv3.ProjectTreeIndex import TreeNodeType
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+from tests.TestBase import TestBase
+from tests.benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+
+
+class TestProjectTreeIndex(TestBase):
+    """
+    No wx application;  The index is what the tree shows, not the tree
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestProjectTreeIndex.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestProjectTreeIndex.clsLogger
+
+        documents: List[PutDocument] = [PutDocument(documentType='CLASS_DIAGRAM', title=f'Diagram{idx}') for idx in range(1000)]
+        documents[0].classRecords = SyntheticDiagramGenerator().generate(classCount=500)
+        documents[0].loaded       = True
+
+        self._project: PutProject = PutProject(fileName='/tmp/Gato.put', documents=documents)
+
+    def tearDown(self):
+        pass
+
+    def testNodesCreatedOnExpansion(self):
+
+        treeIndex:   ProjectTreeIndex = ProjectTreeIndex()
+        projectNode: ProjectTreeNode  = treeIndex.addProject(self._project)
+
+        self.assertEqual('Gato.put', projectNode.label, 'Project label is the file name')
+        self.assertEqual(1, len(treeIndex), 'Only the project node until it is expanded')
+
+        documentNodes: List[ProjectTreeNode] = treeIndex.children(projectNode)
+        self.assertEqual(1001, len(treeIndex),                    'A node per document')
+        self.assertEqual([], treeIndex.children(projectNode),     'Children are only created once')
+        self.assertEqual(documentNodes[1], treeIndex.node(documentNodes[1].nodeId), 'Node ids map back to their node')
+
+        classNodes: List[ProjectTreeNode] = treeIndex.children(documentNodes[0])
+        self.assertEqual(500, len(classNodes), 'A node per class')
+        self.assertEqual(TreeNodeType.CLASS, classNodes[0].nodeType, 'Wrong node type')
+        self.assertFalse(treeIndex.hasChildren(classNodes[0]), 'Classes are leaves')
+
+    def testUnloadedDocument(self):
+
+        treeIndex:    ProjectTreeIndex = ProjectTreeIndex()
+        documentNode: ProjectTreeNode  = treeIndex.children(treeIndex.addProject(self._project))[1]
+
+        self.assertTrue(treeIndex.hasChildren(documentNode), 'An unloaded document may have classes')
+        self.assertEqual([], treeIndex.children(documentNode), 'The classes are not known yet')
+
+        document: PutDocument = cast(PutDocument, documentNode.document)
+        document.classRecords = SyntheticDiagramGenerator().generate(classCount=3)
+        document.loaded       = True
+
+        self.assertEqual(3, len(treeIndex.children(documentNode)), 'Once loaded the classes show')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestProjectTreeIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
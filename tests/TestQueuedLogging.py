@@ -0,0 +1,144 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from logging.handlers import BufferingHandler
+
+import json
+
+from contextlib import redirect_stdout
+
+from io import StringIO
+
+from importlib.resources import files
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.QueuedLogging import DeferredQueueHandler
+from pyutv3.QueuedLogging import QueuedLogging
+
+from tests.TestBase import TestBase
+
+RECORD_COUNT: int = 50000
+
+QUEUED_CONFIGURATION = {
+    'version':                  1,
+    'disable_existing_loggers': False,
+    'queueHandlers':            True,
+    'handlers': {
+        'bufferingHandler': {
+            'class':    'logging.handlers.BufferingHandler',
+            'capacity': 100,
+        }
+    },
+    'root': {
+        'level':    'DEBUG',
+        'handlers': ['bufferingHandler'],
+    }
+}
+
+
+class TestQueuedLogging(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestQueuedLogging.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestQueuedLogging.clsLogger
+
+    def tearDown(self):
+        QueuedLogging.stop()
+        TestBase.setUpLogging()
+
+    def testRecordsGoThroughTheQueue(self):
+
+        QueuedLogging.configure(QUEUED_CONFIGURATION)
+
+        rootLogger: Logger = getLogger()
+        self.assertEqual(1, len(rootLogger.handlers), 'Only the queue handler should be left')
+        self.assertIsInstance(rootLogger.handlers[0], DeferredQueueHandler, 'Handlers were not queued')
+
+        bufferingHandler: BufferingHandler = cast(BufferingHandler, QueuedLogging._listeners[0].handlers[0])
+
+        getLogger('queuedLogging').debug('Deferred %s', 'formatting')
+        QueuedLogging.stop()
+
+        self.assertEqual(['Deferred formatting'], [record.getMessage() for record in bufferingHandler.buffer], 'The record did not arrive')
+
+    def testApplicationConfiguration(self):
+        """
+        The application configuration must load;  It once named a handler class that does not exist
+        """
+        configuration = json.loads(files('pyutv3.resources').joinpath('loggingConfiguration.json').read_text())
+
+        with TemporaryDirectory() as directory:
+            configuration['handlers']['rotatingFileHandler']['filename'] = osPath.join(directory, 'pyutv3.log')
+
+            QueuedLogging.configure(configuration)
+            self.assertIsInstance(getLogger().handlers[0], DeferredQueueHandler, 'Handlers were not queued')
+
+            queuedHandlers = QueuedLogging._listeners[0].handlers
+            QueuedLogging.stop()
+            for handler in queuedHandlers:
+                handler.close()
+
+    def testApplicationConfigurationKeepsEveryRecord(self):
+        """
+        The application configuration also lists the root logger under 'loggers';  It was
+        once queued twice and records were lost when the listeners stopped
+        """
+        configuration = json.loads(files('pyutv3.resources').joinpath('loggingConfiguration.json').read_text())
+
+        with TemporaryDirectory() as directory:
+            logFileName: str = osPath.join(directory, 'pyutv3.log')
+            configuration['handlers']['rotatingFileHandler']['filename'] = logFileName
+            configuration['handlers']['rotatingFileHandler']['maxBytes'] = 0
+            # Only on the console by default;  Attach the file as someone who wants it would
+            configuration['loggers']['root']['handlers'].append('rotatingFileHandler')
+
+            console: StringIO = StringIO()
+            with redirect_stdout(console):
+                QueuedLogging.configure(configuration)
+                self.assertEqual(1, len(QueuedLogging._listeners), 'The root logger should be queued once')
+
+                queuedHandlers = QueuedLogging._listeners[0].handlers
+                queuedLogger: Logger = getLogger('queuedLogging')
+                for recordNumber in range(RECORD_COUNT):
+                    queuedLogger.info('Record %s', recordNumber)
+                QueuedLogging.stop()
+
+            for handler in queuedHandlers:
+                handler.close()
+            with open(logFileName, 'r', encoding='utf-8') as logFile:
+                logLines: List[str] = logFile.read().splitlines()
+
+        self.assertEqual(RECORD_COUNT, len(logLines), 'Records were lost in the log file')
+        self.assertEqual(RECORD_COUNT, len(console.getvalue().splitlines()), 'Records were lost on the console')
+        self.assertTrue(logLines[-1].endswith(f'Record {RECORD_COUNT - 1}'), 'The last record is missing')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestQueuedLogging))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,83 @@
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+from os import cpu_count
+
+from time import perf_counter
+
+from pyutv3.encoders.BulkEncoder import BulkEncoder
+from pyutv3.encoders.BulkEncoder import serializeClassRecords
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelDiagramWriter import DEFAULT_INDENT
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+
+from tests.TestBase import TestBase
+from tests.benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+
+CLASS_COUNTS: List[int] = [1000, 10000]
+
+# The classes are written inside the document's class list
+CLASS_LEVEL: int = 2
+
+
+class BulkEncoderBenchmark:
+    """
+    Serializes synthetic diagrams of 1k and 10k classes serially and with a `BulkEncoder`
+    process pool.  Needs no wx.  The speedup depends on the number of cores;  On a single
+    core the pool only adds the cost of pickling the models to the workers
+    """
+    def __init__(self, classCounts: List[int] = None):
+
+        TestBase.setUpLogging()
+        self.logger: Logger = getLogger(__name__)
+
+        self._classCounts: List[int] = CLASS_COUNTS if classCounts is None else classCounts
+
+    def run(self):
+
+        self.logger.info(f'{cpu_count()} cpus')
+
+        bulkEncoder: BulkEncoder = BulkEncoder()
+        try:
+            for classCount in self._classCounts:
+                self._runOne(classCount=classCount, bulkEncoder=bulkEncoder)
+        finally:
+            bulkEncoder.shutdown()
+
+    def _runOne(self, classCount: int, bulkEncoder: BulkEncoder):
+
+        classRecords: List[ClassRecord] = SyntheticDiagramGenerator().generate(classCount=classCount)
+
+        serialSeconds, serialJson = self._timeSerialize(classRecords=classRecords, bulkEncoder=None)
+        # The first pool run pays for starting the workers;  Time the second
+        self._timeSerialize(classRecords=classRecords, bulkEncoder=bulkEncoder)
+        bulkSeconds, bulkJson = self._timeSerialize(classRecords=classRecords, bulkEncoder=bulkEncoder)
+
+        assert serialJson == bulkJson, 'Bulk output differs from the serial output'
+
+        self.logger.info(f'{classCount} classes serial: {serialSeconds:.3f} seconds')
+        self.logger.info(f'{classCount} classes bulk:   {bulkSeconds:.3f} seconds')
+        self.logger.info(f'{classCount} classes speedup: {serialSeconds / bulkSeconds:.2f}x')
+
+    def _timeSerialize(self, classRecords: List[ClassRecord], bulkEncoder: BulkEncoder = None) -> Tuple[float, List[str]]:
+
+        startTime: float = perf_counter()
+        if bulkEncoder is None:
+            serialized: List[str] = serializeClassRecords(classRecords, indent=DEFAULT_INDENT, level=CLASS_LEVEL, schemaVersion=SCHEMA_VERSION_COMPACT)
+        else:
+            serialized = bulkEncoder.serialize(classRecords, indent=DEFAULT_INDENT, level=CLASS_LEVEL, schemaVersion=SCHEMA_VERSION_COMPACT)
+
+        return perf_counter() - startTime, serialized
+
+
+def main():
+
+    benchmark: BulkEncoderBenchmark = BulkEncoderBenchmark()
+    benchmark.run()
+
+
+if __name__ == "__main__":
+    main()
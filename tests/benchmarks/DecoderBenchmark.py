@@ -0,0 +1,67 @@
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from timeit import timeit
+
+from xml.dom.minidom import parseString
+
+from pkg_resources import resource_filename
+
+from wx import App
+
+from pyutv3.encoders.OglDecoder import OglClassDecoder
+
+from tests.TestBase import TestBase
+
+JSON_TEST_FILENAME: str = 'Expected-OglClass.json'
+XML_TEST_FILENAME:  str = 'JsonTestClass.xml'
+
+ITERATIONS: int = 2000
+
+
+class DecoderBenchmark:
+    """
+    Compares decoding a class from json against parsing the equivalent xml.
+    The xml side only builds the DOM;  It does not create any model objects,  so
+    it is the lower bound of the cost of the current .put path
+    """
+    def __init__(self, iterations: int = ITERATIONS):
+
+        TestBase.setUpLogging()
+        self.logger: Logger = getLogger(__name__)
+
+        self._iterations: int = iterations
+
+    def run(self):
+
+        jsonText: str = self._readTestFile(JSON_TEST_FILENAME)
+        xmlText:  str = self._readTestFile(XML_TEST_FILENAME)
+
+        jsonSeconds: float = timeit(lambda: json.loads(jsonText, cls=OglClassDecoder), number=self._iterations)
+        xmlSeconds:  float = timeit(lambda: parseString(xmlText), number=self._iterations)
+
+        self.logger.info(f'{self._iterations} iterations')
+        self.logger.info(f'json decode to OglClass: {jsonSeconds:.3f} seconds')
+        self.logger.info(f'xml parse to DOM only:   {xmlSeconds:.3f} seconds')
+        self.logger.info(f'json speedup: {xmlSeconds / jsonSeconds:.2f}x')
+
+    def _readTestFile(self, testFileName: str) -> str:
+
+        fqFileName: str = resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, testFileName)
+        with open(fqFileName, 'r') as testFile:
+            return testFile.read()
+
+
+def main():
+    app: App = App()
+
+    benchmark: DecoderBenchmark = DecoderBenchmark()
+    benchmark.run()
+
+    app.OnExit()
+
+
+if __name__ == "__main__":
+    main()
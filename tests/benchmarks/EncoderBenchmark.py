@@ -0,0 +1,248 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from os import cpu_count
+from os import path as osPath
+
+from platform import platform
+from platform import python_version
+
+from datetime import datetime
+
+from gc import collect
+
+from time import perf_counter
+
+from tracemalloc import get_traced_memory
+from tracemalloc import start as traceMallocStart
+from tracemalloc import stop as traceMallocStop
+
+from tempfile import gettempdir
+
+from click import command
+from click import option
+from click import version_option
+
+from wx import App
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+from pyutv3.encoders.OglDecoder import OglClassDecoder
+
+from tests.TestBase import TestBase
+from tests.benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+
+RESULTS_FILENAME: str = 'EncoderBenchmark.json'
+
+CLASS_COUNTS: Tuple[int, ...] = (100, 1000, 10000, 100000)
+
+# Enough repetitions to smooth out the small diagrams;  The large ones run once
+TIMED_CLASSES: int = 20000
+
+# A metric that is this much worse than the baseline is reported as a regression
+REGRESSION_THRESHOLD: float = 0.10
+
+#
+# (format name, schema version, intern strings)
+#
+FORMATS: List[Tuple[str, int, bool]] = [
+    ('legacy',  SCHEMA_VERSION_LEGACY,  False),
+    ('compact', SCHEMA_VERSION_COMPACT, True),
+]
+
+# Lower is better for all of them
+COMPARED_METRICS: Tuple[str, ...] = ('encodeSeconds', 'decodeSeconds', 'outputBytes', 'encodePeakBytes', 'decodePeakBytes')
+
+BenchmarkResult = Dict[str, Any]
+
+
+class EncoderBenchmark:
+    """
+    Measures encoding and decoding synthetic diagrams of increasing size;  Throughput,
+    document size and the peak memory that tracemalloc sees.  Times are measured without
+    tracemalloc, since tracing slows every allocation down;  The peaks come from a
+    separate traced run.
+
+    The results go to a json file.  Given the results file of an earlier run, each metric
+    is compared with it and the ones that got worse are logged as regressions
+    """
+    def __init__(self, classCounts: Tuple[int, ...] = CLASS_COUNTS, generator: Optional[SyntheticDiagramGenerator] = None,
+                 resultsFileName: str = osPath.join(gettempdir(), RESULTS_FILENAME)):
+
+        TestBase.setUpLogging()
+        self.logger: Logger = getLogger(__name__)
+
+        self._classCounts:     Tuple[int, ...]           = classCounts
+        self._generator:       SyntheticDiagramGenerator = SyntheticDiagramGenerator() if generator is None else generator
+        self._resultsFileName: str                       = resultsFileName
+
+    def run(self, baselineFileName: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Args:
+            baselineFileName:   The results file of an earlier run to compare with
+
+        Returns:  What was written to the results file
+        """
+        results: List[BenchmarkResult] = []
+        for classCount in self._classCounts:
+            classRecords: List[ClassRecord] = self._generator.generate(classCount=classCount)
+            for formatName, schemaVersion, internStrings in FORMATS:
+                result: BenchmarkResult = self._runFormat(classRecords=classRecords, formatName=formatName, schemaVersion=schemaVersion, internStrings=internStrings)
+                results.append(result)
+                self._logResult(result)
+
+        document: Dict[str, Any] = {
+            'environment': {
+                'python':    python_version(),
+                'platform':  platform(),
+                'cpuCount':  cpu_count(),
+                'timestamp': datetime.now().isoformat(timespec='seconds'),
+            },
+            'generator': self._generator.parameters,
+            'results':   results,
+        }
+        with open(self._resultsFileName, 'w') as resultsFile:
+            json.dump(document, resultsFile, indent=4)
+        self.logger.info(f'Results in {self._resultsFileName}')
+
+        if baselineFileName is not None:
+            self._compare(results=results, baselineFileName=baselineFileName)
+
+        return document
+
+    def _runFormat(self, classRecords: List[ClassRecord], formatName: str, schemaVersion: int, internStrings: bool) -> BenchmarkResult:
+
+        classCount: int = len(classRecords)
+
+        def encode() -> str:
+            stream: StringIO = StringIO()
+            writer: ModelDiagramWriter = ModelDiagramWriter(stream=stream, internStrings=internStrings, schemaVersion=schemaVersion)
+            writer.writeClassRecords(classRecords)
+            return stream.getvalue()
+
+        document: str = encode()
+
+        def decode():
+            json.loads(document, cls=OglClassDecoder)
+
+        repetitions:   int   = max(1, TIMED_CLASSES // max(1, classCount))
+        encodeSeconds: float = self._bestTime(encode, repetitions=repetitions)
+        decodeSeconds: float = self._bestTime(decode, repetitions=repetitions)
+        outputBytes:   int   = len(document.encode('utf-8'))
+
+        return {
+            'format':                   formatName,
+            'classCount':               classCount,
+            'encodeSeconds':            encodeSeconds,
+            'decodeSeconds':            decodeSeconds,
+            'encodeClassesPerSecond':   classCount / encodeSeconds,
+            'decodeClassesPerSecond':   classCount / decodeSeconds,
+            'encodeMegabytesPerSecond': outputBytes / encodeSeconds / 1_000_000,
+            'decodeMegabytesPerSecond': outputBytes / decodeSeconds / 1_000_000,
+            'outputBytes':              outputBytes,
+            'encodePeakBytes':          self._peakMemory(encode),
+            'decodePeakBytes':          self._peakMemory(decode),
+        }
+
+    def _bestTime(self, function: Callable, repetitions: int) -> float:
+        """
+        The fastest run is the one least disturbed by everything else on the machine
+        """
+        times: List[float] = []
+        for _ in range(repetitions):
+            collect()
+            startTime: float = perf_counter()
+            function()
+            times.append(perf_counter() - startTime)
+
+        return min(times)
+
+    def _peakMemory(self, function: Callable) -> int:
+        """
+        Returns:  The most memory allocated at any one time while running the function;  What
+        the function returns is still alive when the peak is read, so it counts
+        """
+        collect()
+        traceMallocStart()
+        try:
+            function()
+            _, peakBytes = get_traced_memory()
+        finally:
+            traceMallocStop()
+
+        return peakBytes
+
+    def _compare(self, results: List[BenchmarkResult], baselineFileName: str):
+
+        with open(baselineFileName, 'r') as baselineFile:
+            baseline: Dict[str, Any] = json.load(baselineFile)
+
+        baselineResults: Dict[Tuple[str, int], BenchmarkResult] = {(result['format'], result['classCount']): result for result in baseline['results']}
+
+        regressionCount: int = 0
+        for result in results:
+            baselineResult: Optional[BenchmarkResult] = baselineResults.get((result['format'], result['classCount']))
+            if baselineResult is None:
+                continue
+            for metric in COMPARED_METRICS:
+                change: float = result[metric] / baselineResult[metric] - 1.0
+                if change > REGRESSION_THRESHOLD:
+                    regressionCount += 1
+                    self.logger.warning(f'{result["format"]:8} {result["classCount"]:>7} classes  {metric}: {change:+.0%} ({baselineResult[metric]:.4g} -> {result[metric]:.4g})')
+
+        self.logger.info(f'{regressionCount} regressions compared with {baselineFileName}')
+
+    def _logResult(self, result: BenchmarkResult):
+
+        self.logger.info(
+            f'{result["format"]:8} {result["classCount"]:>7} classes  '
+            f'encode: {result["encodeClassesPerSecond"]:>9.0f} classes/s {result["encodeMegabytesPerSecond"]:6.1f} MB/s  '
+            f'decode: {result["decodeClassesPerSecond"]:>9.0f} classes/s {result["decodeMegabytesPerSecond"]:6.1f} MB/s  '
+            f'size: {result["outputBytes"]:>11,}  '
+            f'peak: {result["encodePeakBytes"]:>11,} / {result["decodePeakBytes"]:>11,}'
+        )
+
+
+@command()
+@version_option(version='0.1', message='%(version)s')
+@option('-c', '--class-counts', 'classCountsText', default=','.join(str(classCount) for classCount in CLASS_COUNTS), help='Comma separated diagram sizes')
+@option('-b', '--baseline', 'baselineFileName', type=str, default=None, help='The results file of an earlier run to compare with')
+@option('-r', '--results', 'resultsFileName', type=str, default=osPath.join(gettempdir(), RESULTS_FILENAME), help='Where to write the results')
+@option('--fields', 'fieldsPerClass', default=5, help='Fields per class')
+@option('--methods', 'methodsPerClass', default=5, help='Methods per class')
+@option('--parameters', 'parametersPerMethod', default=2, help='Parameters per method')
+@option('--source-lines', 'sourceLinesPerMethod', default=3, help='Source code lines per method')
+def main(classCountsText: str, baselineFileName: Optional[str], resultsFileName: str, fieldsPerClass: int, methodsPerClass: int, parametersPerMethod: int, sourceLinesPerMethod: int):
+    """
+    Benchmarks encoding and decoding diagrams of CLASS_COUNTS classes
+    """
+    # The decoder creates OGL classes
+    app: App = App()
+
+    generator: SyntheticDiagramGenerator = SyntheticDiagramGenerator(fieldsPerClass=fieldsPerClass,
+                                                                     methodsPerClass=methodsPerClass,
+                                                                     parametersPerMethod=parametersPerMethod,
+                                                                     sourceLinesPerMethod=sourceLinesPerMethod)
+    classCounts: Tuple[int, ...] = tuple(int(classCount) for classCount in classCountsText.split(','))
+
+    benchmark: EncoderBenchmark = EncoderBenchmark(classCounts=classCounts, generator=generator, resultsFileName=resultsFileName)
+    benchmark.run(baselineFileName=baselineFileName)
+
+    app.OnExit()
+
+
+if __name__ == "__main__":
+    main()
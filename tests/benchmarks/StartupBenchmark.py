@@ -0,0 +1,128 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from os import path as osPath
+
+from subprocess import run
+from sys import executable
+
+from tempfile import gettempdir
+
+from time import perf_counter
+
+from tests.TestBase import TestBase
+
+RESULTS_FILENAME: str = 'StartupBenchmark.json'
+
+REPETITIONS: int = 5
+TOP_IMPORTS: int = 15
+
+HEAVY_PACKAGES: Tuple[str, ...] = ('wx', 'ogl', 'miniogl', 'pyutmodel', 'pkg_resources')
+
+#
+# (scenario name, the python arguments after `-X importtime`)
+#
+SCENARIOS: List[Tuple[str, List[str]]] = [
+    ('version',         ['-m', 'pyutv3.PyutV3', '--version']),
+    ('commandLine',     ['-c', 'import pyutv3.PyutV3']),
+    ('userInterface',   ['-c', 'import pyutv3.PyutV3App']),
+]
+
+# One `-X importtime` line:  (self microseconds, cumulative microseconds, indented module name)
+ImportTime = Tuple[int, int, str]
+
+
+class StartupBenchmark:
+    """
+    Records what `python -X importtime` says each way of starting pyutv3 costs.  Every
+    scenario runs in a fresh interpreter;  The median of a few runs is kept, since the
+    first run also pays for the disk cache.  The results go to a json file so that runs
+    before and after a change can be compared
+    """
+    def __init__(self, repetitions: int = REPETITIONS, resultsFileName: str = osPath.join(gettempdir(), RESULTS_FILENAME)):
+
+        TestBase.setUpLogging()
+        self.logger: Logger = getLogger(__name__)
+
+        self._repetitions:     int = repetitions
+        self._resultsFileName: str = resultsFileName
+
+    def run(self) -> Dict[str, Any]:
+
+        results: Dict[str, Any] = {scenarioName: self._runScenario(arguments) for scenarioName, arguments in SCENARIOS}
+
+        with open(self._resultsFileName, 'w') as resultsFile:
+            json.dump(results, resultsFile, indent=4)
+
+        for scenarioName, result in results.items():
+            self.logger.info(f'{scenarioName:14} wall: {result["wallSeconds"]:.3f}s  imports: {result["importSeconds"]:.3f}s  heavy: {result["heavyPackages"]}')
+        self.logger.info(f'Results in {self._resultsFileName}')
+
+        return results
+
+    def _runScenario(self, arguments: List[str]) -> Dict[str, Any]:
+
+        runs: List[Tuple[float, List[ImportTime]]] = sorted((self._runOnce(arguments) for _ in range(self._repetitions)), key=lambda timedRun: timedRun[0])
+
+        wallSeconds, importTimes = runs[len(runs) // 2]
+
+        topLevel:   List[ImportTime] = [importTime for importTime in importTimes if not importTime[2].startswith(' ')]
+        topImports: List[ImportTime] = sorted(importTimes, key=lambda importTime: importTime[1], reverse=True)[:TOP_IMPORTS]
+        imported:   List[str]        = [importTime[2].strip() for importTime in importTimes]
+
+        return {
+            'arguments':     arguments,
+            'wallSeconds':   wallSeconds,
+            'importSeconds': sum(importTime[1] for importTime in topLevel) / 1_000_000,
+            'moduleCount':   len(importTimes),
+            'heavyPackages': sorted({name.split('.')[0] for name in imported if name.split('.')[0] in HEAVY_PACKAGES}),
+            'topImports':    [{'module': name.strip(), 'cumulativeMicroseconds': cumulative} for _, cumulative, name in topImports],
+        }
+
+    def _runOnce(self, arguments: List[str]) -> Tuple[float, List[ImportTime]]:
+
+        startTime: float = perf_counter()
+        completed = run([executable, '-X', 'importtime'] + arguments, capture_output=True, text=True)
+        wallSeconds: float = perf_counter() - startTime
+
+        if completed.returncode != 0:
+            self.logger.warning(f'{" ".join(arguments)} exited with {completed.returncode}')
+
+        return wallSeconds, self._parseImportTimes(completed.stderr)
+
+    def _parseImportTimes(self, importTimeOutput: str) -> List[ImportTime]:
+        """
+        Lines look like `import time:       187 |        187 |   encodings.aliases`
+
+        Args:
+            importTimeOutput:   The interpreter's standard error
+
+        Returns:  The parsed lines;  The header and anything that is not a timing is skipped
+        """
+        importTimes: List[ImportTime] = []
+        for line in importTimeOutput.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            fields: List[str] = line[len('import time:'):].split('|')
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue
+            importTimes.append((int(fields[0]), int(fields[1]), fields[2][1:]))
+
+        return importTimes
+
+
+def main():
+
+    benchmark: StartupBenchmark = StartupBenchmark()
+    benchmark.run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from random import Random
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutModifiers
+from pyutmodel.PyutMethod import SourceCode
+from pyutmodel.PyutModifier import PyutModifier
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutStereotype import PyutStereotype
+from pyutmodel.PyutType import PyutType
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+DEFAULT_SEED: int = 42
+
+CLASS_WIDTH:   int = 120
+CLASS_HEIGHT:  int = 60
+GRID_SPACING:  int = 40
+GRID_COLUMNS:  int = 100
+
+TYPE_NAMES:     Tuple[str, ...] = ('int', 'str', 'float', 'bool', 'List[str]', 'Dict[str, int]', 'Optional[int]')
+MODIFIER_NAMES: Tuple[str, ...] = ('abstract', 'static', 'reentrant', 'final')
+VISIBILITIES:   Tuple[PyutVisibilityEnum, ...] = (PyutVisibilityEnum.PUBLIC, PyutVisibilityEnum.PRIVATE, PyutVisibilityEnum.PROTECTED)
+
+
+class SyntheticDiagramGenerator:
+    """
+    Makes diagrams of any size for the encoder and decoder benchmarks.  The classes are
+    `ClassRecord`s,  so no wx is needed to create or encode them.  The content is random
+    but repeatable;  The same seed and shape parameters always give the same diagram,
+    so runs on different days measure the same work
+    """
+    def __init__(self, fieldsPerClass: int = 5, methodsPerClass: int = 5, parametersPerMethod: int = 2, sourceLinesPerMethod: int = 3, seed: int = DEFAULT_SEED):
+        """
+
+        Args:
+            fieldsPerClass:         The number of fields in every class
+            methodsPerClass:        The number of methods in every class
+            parametersPerMethod:    The number of parameters of every method
+            sourceLinesPerMethod:   The number of source code lines in every method
+            seed:                   The random seed
+        """
+        self._fieldsPerClass:       int = fieldsPerClass
+        self._methodsPerClass:      int = methodsPerClass
+        self._parametersPerMethod:  int = parametersPerMethod
+        self._sourceLinesPerMethod: int = sourceLinesPerMethod
+        self._seed:                 int = seed
+
+    @property
+    def parameters(self) -> Dict[str, int]:
+        """
+        Returns:  What shapes the generated diagrams;  Recorded with the benchmark results
+        """
+        return {
+            'fieldsPerClass':       self._fieldsPerClass,
+            'methodsPerClass':      self._methodsPerClass,
+            'parametersPerMethod':  self._parametersPerMethod,
+            'sourceLinesPerMethod': self._sourceLinesPerMethod,
+            'seed':                 self._seed,
+        }
+
+    def generate(self, classCount: int) -> List[ClassRecord]:
+        """
+        Args:
+            classCount:  The number of classes in the diagram
+
+        Returns:  The diagram's classes laid out on a grid;  Class ids start at 1
+        """
+        random: Random = Random(self._seed)
+
+        return [self._generateClassRecord(random=random, classId=idx + 1) for idx in range(classCount)]
+
+    def _generateClassRecord(self, random: Random, classId: int) -> ClassRecord:
+
+        pyutClass: PyutClass = PyutClass(name=f'SyntheticClass{classId}')
+        pyutClass.id          = classId
+        pyutClass.description = f'Synthetic class number {classId}'
+        pyutClass.fileName    = f'/tmp/synthetic/SyntheticClass{classId}.py'
+        pyutClass.stereotype  = PyutStereotype(name='model')
+
+        for fieldNumber in range(self._fieldsPerClass):
+            pyutClass.addField(self._generateField(random=random, fieldNumber=fieldNumber))
+        for methodNumber in range(self._methodsPerClass):
+            pyutClass.addMethod(self._generateMethod(random=random, methodNumber=methodNumber))
+
+        row, column = divmod(classId - 1, GRID_COLUMNS)
+        geometry: ShapeGeometry = ShapeGeometry(x=column * (CLASS_WIDTH + GRID_SPACING),
+                                                y=row * (CLASS_HEIGHT + GRID_SPACING),
+                                                width=CLASS_WIDTH,
+                                                height=CLASS_HEIGHT)
+
+        return ClassRecord(pyutClass=pyutClass, geometry=geometry)
+
+    def _generateField(self, random: Random, fieldNumber: int) -> PyutField:
+
+        return PyutField(name=f'field{fieldNumber}',
+                         fieldType=PyutType(value=random.choice(TYPE_NAMES)),
+                         visibility=random.choice(VISIBILITIES),
+                         defaultValue=str(random.randint(0, 9999)))
+
+    def _generateMethod(self, random: Random, methodNumber: int) -> PyutMethod:
+
+        pyutMethod: PyutMethod = PyutMethod(name=f'method{methodNumber}',
+                                            visibility=random.choice(VISIBILITIES),
+                                            returnType=PyutType(value=random.choice(TYPE_NAMES)))
+        pyutMethod.modifiers = PyutModifiers([PyutModifier(name) for name in random.sample(MODIFIER_NAMES, k=random.randint(0, 2))])
+
+        for parameterNumber in range(self._parametersPerMethod):
+            pyutMethod.addParameter(PyutParameter(name=f'parameter{parameterNumber}',
+                                                  parameterType=PyutType(value=random.choice(TYPE_NAMES)),
+                                                  defaultValue=''))
+
+        pyutMethod.sourceCode = SourceCode([f'value{lineNumber}: int = {random.randint(0, 9999)}' for lineNumber in range(self._sourceLinesPerMethod)])
+
+        return pyutMethod
@@ -0,0 +1,79 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+
+from tests.TestBase import TestBase
+from tests.benchmarks.SyntheticDiagramGenerator import SyntheticDiagramGenerator
+
+
+class TestSyntheticDiagramGenerator(TestBase):
+    """
+    The benchmarks only compare between runs if the generated diagrams do not change
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSyntheticDiagramGenerator.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestSyntheticDiagramGenerator.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testDiagramShape(self):
+
+        generator:    SyntheticDiagramGenerator = SyntheticDiagramGenerator(fieldsPerClass=3, methodsPerClass=4, parametersPerMethod=2, sourceLinesPerMethod=5)
+        classRecords: List[ClassRecord]         = generator.generate(classCount=150)
+
+        self.assertEqual(150, len(classRecords), 'Wrong class count')
+        self.assertEqual(150, len({classRecord.geometry for classRecord in classRecords}), 'Classes overlap')
+
+        lastRecord: ClassRecord = classRecords[-1]
+        self.assertEqual(3, len(lastRecord.pyutClass.fields),                'Wrong field count')
+        self.assertEqual(4, len(lastRecord.pyutClass.methods),               'Wrong method count')
+        self.assertEqual(2, len(lastRecord.pyutClass.methods[0].parameters), 'Wrong parameter count')
+        self.assertEqual(5, len(lastRecord.pyutClass.methods[0].sourceCode), 'Wrong source line count')
+
+    def testRepeatable(self):
+
+        self.assertEqual(self._encode(SyntheticDiagramGenerator()), self._encode(SyntheticDiagramGenerator()), 'The same seed must give the same diagram')
+        self.assertNotEqual(self._encode(SyntheticDiagramGenerator()), self._encode(SyntheticDiagramGenerator(seed=7)), 'The seed is ignored')
+
+    def _encode(self, generator: SyntheticDiagramGenerator) -> str:
+
+        stream: StringIO = StringIO()
+        ModelDiagramWriter(stream=stream).writeClassRecords(generator.generate(classCount=20))
+
+        json.loads(stream.getvalue())
+
+        return stream.getvalue()
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSyntheticDiagramGenerator))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,71 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutField import PyutField
+
+from pyutv3.commands.ClassMemberCommand import ClassMemberCommand
+from pyutv3.commands.ClassMemberCommand import MemberKind
+from pyutv3.commands.CommandHistory import CommandHistory
+from pyutv3.commands.DiagramCommand import DiagramCommand
+
+from tests.TestBase import TestBase
+
+
+class TestClassMemberCommand(TestBase):
+    """
+    The command only touches the model;  No wx application
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestClassMemberCommand.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestClassMemberCommand.clsLogger
+
+        self._pyutClass: PyutClass = PyutClass(name='Ozzee')
+        self._pyutClass.fields = [PyutField(name='fran'), PyutField(name='gato')]
+
+    def tearDown(self):
+        pass
+
+    def testAddEditRemove(self):
+
+        commandHistory: CommandHistory = CommandHistory()
+        opie:           PyutField      = PyutField(name='opie')
+
+        commandHistory.submit(ClassMemberCommand(pyutClass=self._pyutClass, memberKind=MemberKind.FIELD, index=1, oldMember=None, newMember=opie))
+        commandHistory.submit(ClassMemberCommand(pyutClass=self._pyutClass, memberKind=MemberKind.FIELD, index=0, oldMember=self._pyutClass.fields[0], newMember=PyutField(name='francine')))
+        commandHistory.submit(ClassMemberCommand(pyutClass=self._pyutClass, memberKind=MemberKind.FIELD, index=2, oldMember=self._pyutClass.fields[2], newMember=None))
+
+        self.assertEqual(['francine', 'opie'], [field.name for field in self._pyutClass.fields], 'The edits were not made')
+        self.assertEqual('Remove Field', commandHistory.undoName, 'Wrong command name')
+
+        while commandHistory.canUndo:
+            command: DiagramCommand = cast(DiagramCommand, commandHistory.undo())
+            self.assertEqual([self._pyutClass], command.changedClasses, 'The command changes its class')
+
+        self.assertEqual(['fran', 'gato'], [field.name for field in self._pyutClass.fields], 'Undo restores the fields')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestClassMemberCommand))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
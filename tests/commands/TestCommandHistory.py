@@ -0,0 +1,147 @@
+from typing import List
+from typing import Tuple
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.commands.CommandHistory import CommandAction
+from pyutv3.commands.CommandHistory import CommandHistory
+from pyutv3.commands.DiagramCommand import DiagramCommand
+
+from tests.TestBase import TestBase
+
+
+class StepCommand(DiagramCommand):
+    """
+    Moves a counter;  Steps of the same drag merge like shape moves do
+    """
+    def __init__(self, position: List[int], step: int, dragId: int = 0, sizeInBytes: int = 100):
+
+        super().__init__(name='Step')
+
+        self._position:    List[int] = position
+        self._step:        int       = step
+        self._dragId:      int       = dragId
+        self._sizeInBytes: int       = sizeInBytes
+
+    @property
+    def mergeable(self) -> bool:
+        return self._dragId != 0
+
+    @property
+    def sizeInBytes(self) -> int:
+        return self._sizeInBytes
+
+    def doIt(self):
+        self._position[0] += self._step
+
+    def undo(self):
+        self._position[0] -= self._step
+
+    def mergeWith(self, command: DiagramCommand) -> bool:
+
+        if not isinstance(command, StepCommand) or self._dragId == 0 or command._dragId != self._dragId:
+            return False
+
+        self._step += command._step
+
+        return True
+
+
+class TestCommandHistory(TestBase):
+    """
+    No wx application;  The commands change a list instead of a diagram
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestCommandHistory.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestCommandHistory.clsLogger
+
+        self._position: List[int] = [0]
+
+    def tearDown(self):
+        pass
+
+    def testUndoRedo(self):
+
+        notifications:  List[Tuple[str, CommandAction]] = []
+        commandHistory: CommandHistory                  = CommandHistory()
+        commandHistory.addListener(lambda command, action: notifications.append((command.name, action)))
+
+        commandHistory.submit(StepCommand(self._position, step=5))
+        commandHistory.submit(StepCommand(self._position, step=7))
+
+        commandHistory.undo()
+        self.assertEqual([5], self._position, 'Undo reverses the last command')
+        commandHistory.redo()
+        self.assertEqual([12], self._position, 'Redo applies it again')
+
+        commandHistory.undo()
+        commandHistory.submit(StepCommand(self._position, step=1))
+        self.assertFalse(commandHistory.canRedo, 'A new command drops the redo history')
+        self.assertIsNone(commandHistory.redo(), 'Nothing to redo')
+
+        actions: List[CommandAction] = [action for _, action in notifications]
+        self.assertEqual([CommandAction.DONE, CommandAction.DONE, CommandAction.UNDONE, CommandAction.REDONE, CommandAction.UNDONE, CommandAction.DONE], actions, 'Wrong notifications')
+
+    def testDragStepsMerge(self):
+
+        notifications:  List[Tuple[int, CommandAction]] = []
+        commandHistory: CommandHistory                  = CommandHistory()
+        commandHistory.addListener(lambda command, action: notifications.append((cast(StepCommand, command)._step, action)))
+
+        for _ in range(50):
+            self._position[0] += 2
+            commandHistory.record(StepCommand(self._position, step=2, dragId=1))
+        self.assertEqual([], notifications, 'The drag is not over')
+
+        self._position[0] += 3
+        commandHistory.record(StepCommand(self._position, step=3, dragId=2))
+        commandHistory.endMerge()
+
+        self.assertEqual(2, commandHistory.undoCount, 'A drag is one undo step')
+        self.assertEqual([(100, CommandAction.DONE), (3, CommandAction.DONE)], notifications, 'Listeners are told about each whole drag once')
+
+        commandHistory.undo()
+        commandHistory.undo()
+        self.assertEqual([0], self._position, 'Undoing the drag undoes all its steps')
+
+    def testBudgets(self):
+
+        stepHistory: CommandHistory = CommandHistory(maximumSteps=3)
+        for _ in range(10):
+            stepHistory.submit(StepCommand(self._position, step=1))
+        self.assertEqual(3, stepHistory.undoCount, 'The oldest steps are forgotten')
+
+        byteHistory: CommandHistory = CommandHistory(maximumBytes=1000)
+        for _ in range(10):
+            byteHistory.submit(StepCommand(self._position, step=1, sizeInBytes=300))
+        self.assertEqual(3,   byteHistory.undoCount, 'Only what fits in the budget')
+        self.assertEqual(900, byteHistory.byteCount, 'Wrong byte count')
+
+        byteHistory.submit(StepCommand(self._position, step=1, sizeInBytes=5000))
+        self.assertEqual(1, byteHistory.undoCount, 'The last command is kept even when it is over the budget')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestCommandHistory))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
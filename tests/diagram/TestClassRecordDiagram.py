@@ -0,0 +1,103 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodel.PyutClass import PyutClass
+
+from pyutv3.commands.AddClassCommand import AddClassCommand
+from pyutv3.commands.CommandHistory import CommandHistory
+from pyutv3.commands.MoveClassesCommand import MoveClassesCommand
+from pyutv3.commands.RemoveClassCommand import RemoveClassCommand
+from pyutv3.commands.ResizeClassCommand import ResizeClassCommand
+from pyutv3.diagram.ClassRecordDiagram import ClassRecordDiagram
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+from pyutv3.persistence.PutProject import PutDocument
+
+from tests.TestBase import TestBase
+
+
+class TestClassRecordDiagram(TestBase):
+    """
+    The commands of an evicted page change the document's class records;  No wx application
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestClassRecordDiagram.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestClassRecordDiagram.clsLogger
+
+        self._classRecords: List[ClassRecord] = [self._classRecord(name, classId) for classId, name in enumerate(('Ozzee', 'Fran', 'Gato'), start=1)]
+        self._document:     PutDocument       = PutDocument(title='Opie', loaded=True, classRecords=self._classRecords)
+
+    def tearDown(self):
+        pass
+
+    def testMoveAndResizeSurviveNewRecords(self):
+
+        diagramClasses: ClassRecordDiagram = ClassRecordDiagram(self._document)
+        commandHistory: CommandHistory     = CommandHistory()
+
+        for _ in range(3):
+            diagramClasses.moveClasses(classIds=[1, 3], deltaX=10, deltaY=5)
+            commandHistory.record(MoveClassesCommand(diagramClasses=diagramClasses, classIds=[1, 3], deltaX=10, deltaY=5, dragId=1))
+        commandHistory.submit(ResizeClassCommand(diagramClasses=diagramClasses, classId=2, oldGeometry=ShapeGeometry(100, 100, 80, 40), newGeometry=ShapeGeometry(90, 100, 120, 60)))
+
+        self.assertEqual(2, commandHistory.undoCount, 'The drag steps merge')
+        self.assertEqual(ShapeGeometry(130, 115, 80, 40), diagramClasses.classGeometry(3), 'Gato moved')
+
+        # Evicting a canvas replaces the records with new ones
+        self._document.classRecords = [ClassRecord(pyutClass=classRecord.pyutClass, geometry=classRecord.geometry) for classRecord in self._classRecords]
+
+        commandHistory.undo()
+        commandHistory.undo()
+        self.assertEqual([ShapeGeometry(100, 100, 80, 40)] * 3, [classRecord.geometry for classRecord in self._document.classRecords], 'The history refers to the classes by id')
+
+    def testAddAndRemove(self):
+
+        diagramClasses: ClassRecordDiagram = ClassRecordDiagram(self._document)
+        commandHistory: CommandHistory     = CommandHistory()
+
+        commandHistory.submit(AddClassCommand(diagramClasses=diagramClasses, classRecord=self._classRecord('Opie', 4)))
+        commandHistory.submit(RemoveClassCommand(diagramClasses=diagramClasses, classRecord=self._classRecords[0]))
+        self.assertEqual(['Fran', 'Gato', 'Opie'], self._classNames(), 'Opie added and Ozzee removed')
+
+        commandHistory.undo()
+        self.assertEqual(['Fran', 'Gato', 'Opie', 'Ozzee'], self._classNames(), 'Ozzee is back')
+        commandHistory.undo()
+        self.assertEqual(['Fran', 'Gato', 'Ozzee'], self._classNames(), 'Opie is gone')
+        self.assertIsNone(diagramClasses.removeClass(4), 'Opie is not in the diagram')
+
+    def _classNames(self) -> List[str]:
+        return [classRecord.pyutClass.name for classRecord in self._document.classRecords]
+
+    def _classRecord(self, name: str, classId: int) -> ClassRecord:
+
+        pyutClass: PyutClass = PyutClass(name=name)
+        pyutClass.id = classId
+
+        return ClassRecord(pyutClass=pyutClass, geometry=ShapeGeometry(100, 100, 80, 40))
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestClassRecordDiagram))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
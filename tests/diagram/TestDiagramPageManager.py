@@ -0,0 +1,102 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import environ
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.diagram.DiagramPageManager import DEFAULT_PAGE_BUDGET
+from pyutv3.diagram.DiagramPageManager import DiagramPageManager
+from pyutv3.diagram.DiagramPageManager import PAGE_BUDGET_ENVIRONMENT_VARIABLE
+
+from tests.TestBase import TestBase
+
+
+class Page:
+    """
+    Counts what the manager does to it instead of creating a canvas
+    """
+    def __init__(self, title: str):
+
+        self.title:        str  = title
+        self.materialized: bool = False
+        self.materializes: int  = 0
+
+    def materialize(self):
+        self.materialized  = True
+        self.materializes += 1
+
+    def evict(self):
+        self.materialized = False
+
+
+class TestDiagramPageManager(TestBase):
+    """
+    No wx application;  The manager only decides which pages have a canvas
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagramPageManager.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestDiagramPageManager.clsLogger
+
+        self._pages: List[Page] = [Page(title) for title in ('Ozzee', 'Fran', 'Gato', 'Opie')]
+
+    def tearDown(self):
+        pass
+
+    def testLeastRecentlyUsedIsEvicted(self):
+
+        pageManager: DiagramPageManager[Page] = DiagramPageManager(budget=2)
+        ozzee, fran, gato, _ = self._pages
+
+        pageManager.activate(ozzee)
+        pageManager.activate(fran)
+        pageManager.activate(ozzee)
+        pageManager.activate(gato)
+
+        self.assertEqual([True, False, True, False], [page.materialized for page in self._pages], 'Fran was used least recently')
+        self.assertEqual(1, ozzee.materializes, 'Reactivating a materialized page reuses its canvas')
+
+        pageManager.activate(fran)
+        self.assertEqual(2, fran.materializes, 'An evicted page is rebuilt')
+        self.assertFalse(ozzee.materialized, 'Then Ozzee was used least recently')
+
+        pageManager.budget = 1
+        self.assertEqual([False, True, False, False], [page.materialized for page in self._pages], 'Only the active page is left')
+        self.assertEqual(1, pageManager.materializedCount, 'Wrong count')
+
+    def testBudgetFromEnvironment(self):
+
+        environ[PAGE_BUDGET_ENVIRONMENT_VARIABLE] = '3'
+        try:
+            self.assertEqual(3, DiagramPageManager().budget, 'The environment sets the budget')
+            self.assertEqual(5, DiagramPageManager(budget=5).budget, 'An explicit budget wins')
+
+            environ[PAGE_BUDGET_ENVIRONMENT_VARIABLE] = 'many'
+            self.assertEqual(DEFAULT_PAGE_BUDGET, DiagramPageManager().budget, 'Not a number')
+        finally:
+            del environ[PAGE_BUDGET_ENVIRONMENT_VARIABLE]
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagramPageManager))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
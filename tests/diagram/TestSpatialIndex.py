@@ -0,0 +1,98 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from random import Random
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.diagram.SpatialIndex import SpatialIndex
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+from tests.TestBase import TestBase
+
+
+class TestSpatialIndex(TestBase):
+    """
+    No wx application;  The index only knows rectangles
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestSpatialIndex.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestSpatialIndex.clsLogger
+
+        self._spatialIndex: SpatialIndex[str] = SpatialIndex(cellSize=100)
+
+        self._spatialIndex.update('Ozzee', ShapeGeometry(x=10,   y=10,   width=50,  height=50))
+        self._spatialIndex.update('Fran',  ShapeGeometry(x=40,   y=40,   width=300, height=30))
+        self._spatialIndex.update('Gato',  ShapeGeometry(x=-500, y=-500, width=-20, height=-20))
+
+    def tearDown(self):
+        pass
+
+    def testPointQueries(self):
+
+        self.assertEqual(['Ozzee', 'Fran'], self._spatialIndex.itemsAt(45, 45),     'Overlapping items in the order added')
+        self.assertEqual(['Fran'],          self._spatialIndex.itemsAt(330, 60),    'An item in several cells')
+        self.assertEqual(['Gato'],          self._spatialIndex.itemsAt(-510, -510), 'A negative size extends up and left')
+        self.assertEqual([],                self._spatialIndex.itemsAt(200, 200),   'Nothing there')
+
+    def testRectangleQueries(self):
+
+        self.assertEqual(['Ozzee', 'Fran'], self._spatialIndex.itemsIntersecting(0, 0, 1000, 1000), 'Visible items')
+        self.assertEqual(['Ozzee'],         self._spatialIndex.itemsInside(0, 0, 100, 100),       'Only the enclosed item is selected')
+        self.assertEqual(['Ozzee'],         self._spatialIndex.itemsInside(100, 100, -100, -100), 'A rubber band dragged up and left')
+
+    def testMoveAndRemove(self):
+
+        self._spatialIndex.update('Ozzee', ShapeGeometry(x=5000, y=5000, width=50, height=50))
+        self._spatialIndex.remove('Fran')
+
+        self.assertEqual([],        self._spatialIndex.itemsAt(45, 45),     'Moved and removed items are gone')
+        self.assertEqual(['Ozzee'], self._spatialIndex.itemsAt(5010, 5010), 'Not at its new position')
+        self.assertEqual(2, len(self._spatialIndex), 'Wrong item count')
+
+    def testMatchesLinearScan(self):
+
+        random:       Random              = Random(23)
+        spatialIndex: SpatialIndex[int]   = SpatialIndex(cellSize=64)
+        geometries:   List[ShapeGeometry] = []
+        for item in range(500):
+            geometry: ShapeGeometry = ShapeGeometry(x=random.randint(-2000, 2000), y=random.randint(-2000, 2000), width=random.randint(1, 300), height=random.randint(1, 300))
+            geometries.append(geometry)
+            spatialIndex.update(item, geometry)
+
+        for _ in range(50):
+            x, y = random.randint(-2000, 2000), random.randint(-2000, 2000)
+            width, height = random.randint(0, 1500), random.randint(0, 1500)
+
+            expectedAt:        List[int] = [item for item, g in enumerate(geometries) if g.x <= x <= g.x + g.width and g.y <= y <= g.y + g.height]
+            expectedInside:    List[int] = [item for item, g in enumerate(geometries) if x <= g.x and g.x + g.width <= x + width and y <= g.y and g.y + g.height <= y + height]
+            expectedIntersect: List[int] = [item for item, g in enumerate(geometries) if g.x <= x + width and x <= g.x + g.width and g.y <= y + height and y <= g.y + g.height]
+
+            self.assertEqual(expectedAt,        spatialIndex.itemsAt(x, y),                          'Point query differs from a scan')
+            self.assertEqual(expectedInside,    spatialIndex.itemsInside(x, y, width, height),       'Enclosure query differs from a scan')
+            self.assertEqual(expectedIntersect, spatialIndex.itemsIntersecting(x, y, width, height), 'Overlap query differs from a scan')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestSpatialIndex))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
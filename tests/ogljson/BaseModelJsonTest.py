@@ -0,0 +1,131 @@
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutMethod import PyutModifiers
+from pyutmodel.PyutMethod import SourceCode
+from pyutmodel.PyutModifier import PyutModifier
+from pyutmodel.PyutParameter import PyutParameter
+from pyutmodel.PyutStereotype import PyutStereotype
+from pyutmodel.PyutType import PyutType
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ClassRecord import ShapeGeometry
+
+from tests.TestBase import TestBase
+
+EXPECTED_OGL_CLASS_FILENAME: str = 'Expected-OglClass.json'
+
+
+class BaseModelJsonTest(TestBase):
+    """
+    Common code for the json encoder/decoder unit tests that need no wx;  Knows how
+    to build the model and geometry that `Expected-OglClass.json` describes
+    """
+
+    def _generateExpectedClassRecord(self) -> ClassRecord:
+        """
+        Returns:  The class record that serializes to the expected json test file
+        """
+        pyutClass: PyutClass = self._generateBasicPyutClass()
+        pyutClass = self._addFields(pyutClass=pyutClass)
+        pyutClass = self._addMethods(pyutClass=pyutClass)
+
+        return ClassRecord(pyutClass=pyutClass, geometry=ShapeGeometry(x=120, y=240, width=120, height=60))
+
+    def _readExpectedOglClassJson(self) -> str:
+
+        return self._readTestFile(testFileName=EXPECTED_OGL_CLASS_FILENAME)
+
+    def _generateBasicPyutClass(self) -> PyutClass:
+
+        pyutClass: PyutClass = PyutClass(name='Ozzee')
+        pyutClass.id          = 23
+        pyutClass.description = 'Soy Gato'
+        pyutClass.fileName    = '/tmp/TheBox.txt'
+        pyutClass.stereotype  = PyutStereotype(name='model')
+        pyutClass.showFields  = False
+        pyutClass.displayParameters = PyutDisplayParameters.DISPLAY
+
+        return pyutClass
+
+    def _addFields(self, pyutClass: PyutClass) -> PyutClass:
+
+        protectedField: PyutField = PyutField(name='protectedField',
+                                              fieldType=PyutType(value='str'),
+                                              visibility=PyutVisibilityEnum.PROTECTED,
+                                              defaultValue='gato')
+        privateField: PyutField = PyutField(name='privateField',
+                                            fieldType=PyutType(value='int'),
+                                            visibility=PyutVisibilityEnum.PRIVATE,
+                                            defaultValue='6666')
+        publicField: PyutField = PyutField(name='publicField',
+                                           fieldType=PyutType(value='float'),
+                                           visibility=PyutVisibilityEnum.PUBLIC,
+                                           defaultValue='23.0')
+
+        pyutClass.addField(field=protectedField)
+        pyutClass.addField(field=privateField)
+        pyutClass.addField(field=publicField)
+
+        return pyutClass
+
+    def _addMethods(self, pyutClass: PyutClass) -> PyutClass:
+
+        pyutClass = self._addPublicMethod(pyutClass)
+        pyutClass = self._addPrivateMethod(pyutClass)
+        pyutClass = self._addProtectedMethodWithSourceCode(pyutClass)
+
+        return pyutClass
+
+    def _addPublicMethod(self, pyutClass: PyutClass) -> PyutClass:
+        publicMethod: PyutMethod = PyutMethod(name='publicMethod',
+                                              visibility=PyutVisibilityEnum.PUBLIC,
+                                              returnType=PyutType(value='int'))
+        publicMethod.modifiers = (
+            PyutModifiers(
+                [
+                    PyutModifier('abstract'),
+                    PyutModifier('reentrant')
+                ]
+            )
+        )
+        publicMethod = self._addPublicMethodParameters(publicMethod)
+        pyutClass.addMethod(publicMethod)
+        return pyutClass
+
+    def _addPublicMethodParameters(self, pyutMethod: PyutMethod) -> PyutMethod:
+        """
+        <Param name="noDefaultValueParam" type="str" defaultValue=""/>
+
+        """
+        pyutParameter: PyutParameter = PyutParameter(name='noDefaultValueParam', parameterType=PyutType('str'))
+        pyutMethod.addParameter(pyutParameter)
+        return pyutMethod
+
+    def _addPrivateMethod(self, pyutClass: PyutClass) -> PyutClass:
+        privateMethod: PyutMethod = PyutMethod(name='privateMethod',
+                                               visibility=PyutVisibilityEnum.PRIVATE,
+                                               returnType=PyutType(value='str'))
+        privateMethod.modifiers = (PyutModifiers([PyutModifier('static')]))
+
+        pyutParameter: PyutParameter = PyutParameter(name='noDefaultValueParam', parameterType=PyutType('str'))
+        privateMethod.addParameter(pyutParameter)
+
+        pyutClass.addMethod(privateMethod)
+        return pyutClass
+
+    def _addProtectedMethodWithSourceCode(self, pyutClass: PyutClass) -> PyutClass:
+        protectedMethodWithSourceCode: PyutMethod = PyutMethod(name='protectedMethodWithSourceCode', visibility=PyutVisibilityEnum.PROTECTED)
+
+        sourceCode: SourceCode = SourceCode(
+            [
+                'i: int = 0',
+                'j: float = 0.0',
+                'k: str = ‘Ozzee, El Gato Malo’'
+            ]
+        )
+        protectedMethodWithSourceCode.sourceCode = sourceCode
+        pyutClass.addMethod(protectedMethodWithSourceCode)
+        return pyutClass
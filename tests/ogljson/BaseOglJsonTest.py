@@ -0,0 +1,23 @@
+from ogl.OglClass import OglClass
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+
+from tests.ogljson.BaseModelJsonTest import BaseModelJsonTest
+
+
+class BaseOglJsonTest(BaseModelJsonTest):
+    """
+    Common code for the json encoder/decoder unit tests;  Knows how to build
+    the OGL class that `Expected-OglClass.json` describes
+    """
+
+    def _generateExpectedOglClass(self) -> OglClass:
+        """
+        Returns:  The ogl class that serializes to the expected json test file
+        """
+        classRecord: ClassRecord = self._generateExpectedClassRecord()
+
+        oglClass: OglClass = OglClass(pyutClass=classRecord.pyutClass, w=classRecord.geometry.width, h=classRecord.geometry.height)
+        oglClass.SetPosition(x=classRecord.geometry.x, y=classRecord.geometry.y)
+
+        return oglClass
@@ -0,0 +1,108 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from io import StringIO
+
+from wx import App
+
+from ogl.OglClass import OglClass
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.BulkEncoder import BulkEncoder
+from pyutv3.encoders.EncoderCache import EncoderCache
+from pyutv3.encoders.OglDiagramWriter import OglDiagramWriter
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+CLASS_COUNT: int = 7
+
+
+class TestBulkEncoder(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestBulkEncoder.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestBulkEncoder.clsLogger
+
+        self._oglClasses: List[OglClass] = [self._generateExpectedOglClass() for _ in range(CLASS_COUNT)]
+        for idx, oglClass in enumerate(self._oglClasses):
+            oglClass.pyutObject.id = idx
+            oglClass.SetPosition(x=idx * 10, y=idx * 20)
+
+    def tearDown(self):
+        pass
+
+    def testInLineMatchesSerial(self):
+
+        bulkEncoder: BulkEncoder = BulkEncoder(minimumClasses=CLASS_COUNT + 1)
+
+        self.assertEqual(self._writeDiagram(), self._writeDiagram(bulkEncoder=bulkEncoder), 'In line bulk output differs')
+
+    def testThreadPoolMatchesSerial(self):
+
+        bulkEncoder: BulkEncoder = BulkEncoder(maxWorkers=3, chunkSize=2, minimumClasses=0, useProcesses=False)
+        try:
+            self.assertEqual(self._writeDiagram(), self._writeDiagram(bulkEncoder=bulkEncoder), 'Chunks are stitched out of order')
+        finally:
+            bulkEncoder.shutdown()
+
+    def testProcessPoolMatchesSerial(self):
+
+        bulkEncoder: BulkEncoder = BulkEncoder(maxWorkers=2, chunkSize=3, minimumClasses=0)
+        try:
+            self.assertEqual(self._writeDiagram(), self._writeDiagram(bulkEncoder=bulkEncoder), 'Process pool output differs')
+        finally:
+            bulkEncoder.shutdown()
+
+    def testOnlyMissesAreEncoded(self):
+
+        cache:       EncoderCache = EncoderCache()
+        bulkEncoder: BulkEncoder  = BulkEncoder(minimumClasses=0, useProcesses=False)
+        try:
+            self._writeDiagram(bulkEncoder=bulkEncoder, cache=cache)
+            cache.resetStatistics()
+
+            self._oglClasses[3].SetPosition(x=1000, y=2000)
+            cachedJson: str = self._writeDiagram(bulkEncoder=bulkEncoder, cache=cache)
+
+            self.assertEqual(1, cache.textMisses, 'Only the moved class should be encoded')
+            self.assertEqual(self._writeDiagram(), cachedJson, 'Cached bulk output is stale')
+        finally:
+            bulkEncoder.shutdown()
+
+    def _writeDiagram(self, bulkEncoder: BulkEncoder = None, cache: EncoderCache = None) -> str:
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream, cache=cache, bulkEncoder=bulkEncoder)
+        writer.writeDiagram(self._oglClasses)
+
+        return stream.getvalue()
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestBulkEncoder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,99 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import zlib
+
+from io import BytesIO
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from wx import App
+
+from ogl.OglClass import OglClass
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.CompressedTextStream import CompressedTextStream
+from pyutv3.encoders.DiagramFile import DiagramFile
+from pyutv3.encoders.DiagramFormat import DiagramFormat
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+
+class TestDiagramFile(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestDiagramFile.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestDiagramFile.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testSaveAndLoad(self):
+
+        with TemporaryDirectory() as directory:
+            for suffix in ['.json', '.pyutz']:
+                fileName: str = osPath.join(directory, f'Diagram{suffix}')
+                DiagramFile().save(fileName=fileName, oglObjects=[self._generateExpectedOglClass()])
+
+                oglClass: OglClass = DiagramFile().load(fileName)['oglClasses'][0]
+                self.assertIsInstance(oglClass, OglClass, f'{suffix} did not load an OGL class')
+                self.assertEqual('Ozzee', oglClass.pyutObject.name, f'{suffix} loaded the wrong class')
+
+    def testCompressedIsSmaller(self):
+
+        oglClasses = [self._generateExpectedOglClass() for _ in range(10)]
+        with TemporaryDirectory() as directory:
+            jsonFileName:       str = osPath.join(directory, 'Diagram.json')
+            compressedFileName: str = osPath.join(directory, 'Diagram.pyutz')
+            DiagramFile().save(fileName=jsonFileName,       oglObjects=oglClasses)
+            DiagramFile().save(fileName=compressedFileName, oglObjects=oglClasses)
+
+            self.assertLess(osPath.getsize(compressedFileName) * 4, osPath.getsize(jsonFileName), 'Compressed should be less than a quarter of the json')
+
+    def testCompressedStream(self):
+
+        pieces:     List[str] = ['{', '\n    "oglClasses": [', 'ü' * 1000, ']\n}']
+        binaryFile: BytesIO   = BytesIO()
+        with CompressedTextStream(binaryFile=binaryFile) as textStream:
+            for piece in pieces:
+                textStream.write(piece)
+
+        self.assertEqual(zlib.compress(''.join(pieces).encode('utf-8')), binaryFile.getvalue(), 'Streamed compression should match zlib.compress')
+
+    def testFormatFromFileName(self):
+
+        self.assertEqual(DiagramFormat.COMPRESSED, DiagramFormat.fromFileName('/tmp/Diagram.PYUTZ'), 'Suffix is case insensitive')
+        self.assertEqual(DiagramFormat.JSON,       DiagramFormat.fromFileName('Diagram.json'),       'Should be json')
+        self.assertEqual(DiagramFormat.JSON,       DiagramFormat.fromFileName('Diagram'),            'Default should be json')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestDiagramFile))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,158 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from wx import App
+
+from ogl.OglClass import OglClass
+
+from pyutmodel.PyutClass import PyutClass
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.EncoderCache import EncoderCache
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.OglDiagramWriter import OglDiagramWriter
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+CLASS_COUNT: int = 5
+
+
+class TestEncoderCache(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestEncoderCache.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestEncoderCache.clsLogger
+
+        self._oglClasses: List[OglClass] = [self._generateExpectedOglClass() for _ in range(CLASS_COUNT)]
+        self._cache:      EncoderCache   = EncoderCache()
+
+    def tearDown(self):
+        pass
+
+    def testFirstWriteAllMisses(self):
+
+        self._writeDiagram()
+
+        self.assertEqual(0,           self._cache.textHits,   'Nothing should be cached yet')
+        self.assertEqual(CLASS_COUNT, self._cache.textMisses, 'Every class should be a miss')
+
+    def testRewriteAllHits(self):
+
+        firstJson:  str = self._writeDiagram()
+        self._cache.resetStatistics()
+        secondJson: str = self._writeDiagram()
+
+        self.assertEqual(firstJson,   secondJson,             'Cached output differs')
+        self.assertEqual(CLASS_COUNT, self._cache.textHits,   'Every class should be a hit')
+        self.assertEqual(0,           self._cache.textMisses, 'Nothing changed')
+
+    def testMovedClassReusesModel(self):
+
+        self._writeDiagram()
+        self._cache.resetStatistics()
+
+        self._oglClasses[2].SetPosition(x=1000, y=2000)
+        cachedJson: str = self._writeDiagram()
+
+        self.assertEqual(CLASS_COUNT - 1, self._cache.textHits,   'Only the moved class should miss')
+        self.assertEqual(1,               self._cache.textMisses, 'The moved class should miss')
+        self.assertEqual(1,               self._cache.modelHits,  'The moved class model did not change')
+        self.assertEqual(self._uncachedJson(), cachedJson, 'Cached output is stale')
+
+    def testInvalidatedModel(self):
+
+        self._writeDiagram()
+        self._cache.resetStatistics()
+
+        pyutClass: PyutClass = self._oglClasses[0].pyutObject
+        pyutClass.description = 'Soy Gato Malo'
+        self._cache.invalidate(pyutClass)
+
+        cachedJson: str = self._writeDiagram()
+
+        self.assertEqual(1, self._cache.textMisses,  'The invalidated class should miss')
+        self.assertEqual(1, self._cache.modelMisses, 'The invalidated model should be re-encoded')
+        self.assertEqual(self._uncachedJson(), cachedJson, 'Cached output is stale')
+
+    def testEditedModelWithoutInvalidate(self):
+
+        self._writeDiagram()
+        self._cache.resetStatistics()
+
+        pyutClass: PyutClass = self._oglClasses[1].pyutObject
+        pyutClass.fields[0].name = 'renamedField'
+        pyutClass.methods[0].sourceCode.append('return None')
+
+        cachedJson: str = self._writeDiagram()
+
+        self.assertEqual(1, self._cache.textMisses,  'The edited class should miss')
+        self.assertEqual(1, self._cache.modelMisses, 'The edited model should be re-encoded')
+        self.assertEqual(self._uncachedJson(), cachedJson, 'Cached output is stale')
+
+    def testEncoderUsesCache(self):
+
+        json.dumps(self._oglClasses, cls=OglClassEncoder, cache=self._cache)
+        json.dumps(self._oglClasses, cls=OglClassEncoder, cache=self._cache)
+
+        self.assertEqual(CLASS_COUNT, self._cache.modelHits,   'Second encoding should reuse the models')
+        self.assertEqual(CLASS_COUNT, self._cache.modelMisses, 'First encoding should encode the models')
+
+    def testSchemaVersionMisses(self):
+
+        json.dumps(self._oglClasses, cls=OglClassEncoder, cache=self._cache)
+        compactJson: str = json.dumps(self._oglClasses, cls=OglClassEncoder, cache=self._cache, schemaVersion=SCHEMA_VERSION_COMPACT)
+
+        self.assertEqual(0,               self._cache.modelHits,   'A legacy model is not a compact model')
+        self.assertEqual(2 * CLASS_COUNT, self._cache.modelMisses, 'Both schemas should be encoded')
+        self.assertEqual(json.dumps(self._oglClasses, cls=OglClassEncoder, schemaVersion=SCHEMA_VERSION_COMPACT), compactJson, 'Cached output is stale')
+
+    def _writeDiagram(self) -> str:
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream, cache=self._cache)
+        writer.writeDiagram(self._oglClasses)
+
+        return stream.getvalue()
+
+    def _uncachedJson(self) -> str:
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeDiagram(self._oglClasses)
+
+        return stream.getvalue()
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestEncoderCache))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
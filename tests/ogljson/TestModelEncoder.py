@@ -0,0 +1,120 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from subprocess import run
+from sys import executable
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.encoders.ModelDecoder import ModelDecoder
+from pyutv3.encoders.ModelDiagramWriter import ModelDiagramWriter
+from pyutv3.encoders.ModelEncoder import ModelEncoder
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseModelJsonTest import BaseModelJsonTest
+from tests.ogljson.BaseModelJsonTest import EXPECTED_OGL_CLASS_FILENAME
+
+HEADLESS_IMPORTS: str = (
+    'import sys\n'
+    'import pyutv3.encoders.ModelDecoder\n'
+    'import pyutv3.encoders.ModelDiagramWriter\n'
+    'import pyutv3.persistence.AutosaveJournal\n'
+    'import pyutv3.persistence.ProjectConverter\n'
+    'print(",".join(sorted(name for name in sys.modules if name.split(".")[0] in ("wx", "ogl", "miniogl"))))\n'
+)
+
+
+class TestModelEncoder(BaseModelJsonTest):
+    """
+    No wx application;  Everything here must work without it
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestModelEncoder.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestModelEncoder.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testClassRecordJson(self):
+
+        classRecord: ClassRecord = self._generateExpectedClassRecord()
+
+        actualJson: str = json.dumps(classRecord, cls=ModelEncoder, indent=4)
+
+        self._assertSameAsTestFile(testFileName=EXPECTED_OGL_CLASS_FILENAME, actualContents=actualJson, structural=True)
+
+    def testClassRecordRoundTrip(self):
+
+        expectedJson: str = self._readExpectedOglClassJson()
+
+        classRecord:  ClassRecord = json.loads(expectedJson, cls=ModelDecoder)
+        roundTripped: str         = json.dumps(classRecord, cls=ModelEncoder, indent=4)
+
+        self.assertEqual(expectedJson, roundTripped, 'Decoded class record does not re-encode identically')
+
+    def testInternedStringDefinitions(self):
+
+        classRecords = [self._generateExpectedClassRecord(), self._generateExpectedClassRecord()]
+
+        plainStream:    StringIO = StringIO()
+        internedStream: StringIO = StringIO()
+        ModelDiagramWriter(stream=plainStream).writeClassRecords(classRecords)
+        ModelDiagramWriter(stream=internedStream, internStrings=True, schemaVersion=SCHEMA_VERSION_COMPACT).writeClassRecords(classRecords)
+
+        self.assertEqual(1, internedStream.getvalue().count('"string": "PUBLIC"'), 'A string is defined exactly once')
+
+        decoded = json.loads(internedStream.getvalue(), cls=ModelDecoder)
+
+        plainDocument: StringIO = StringIO()
+        ModelDiagramWriter(stream=plainDocument).writeClassRecords(decoded['oglClasses'])
+        self.assertEqual(plainStream.getvalue(), plainDocument.getvalue(), 'Interned diagram does not decode to the same classes')
+
+    def testDiagramDocument(self):
+
+        classRecords = [self._generateExpectedClassRecord(), self._generateExpectedClassRecord()]
+
+        stream: StringIO = StringIO()
+        ModelDiagramWriter(stream=stream, schemaVersion=SCHEMA_VERSION_COMPACT).writeClassRecords(classRecords)
+
+        expectedDocument = {
+            'schemaVersion': SCHEMA_VERSION_COMPACT,
+            'oglClasses':    classRecords, 'oglNotes': [], 'oglInterfaces': [], 'oglLinks': []
+        }
+        expectedJson: str = json.dumps(expectedDocument, cls=ModelEncoder, indent=4, schemaVersion=SCHEMA_VERSION_COMPACT)
+        self.assertEqual(expectedJson, stream.getvalue(), 'The streamed document differs')
+
+    def testNoWxImports(self):
+
+        importedModules: str = run([executable, '-c', HEADLESS_IMPORTS], capture_output=True, text=True, check=True).stdout.strip()
+
+        self.assertEqual('', importedModules, 'The headless encoders and decoders must not import wx')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestModelEncoder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
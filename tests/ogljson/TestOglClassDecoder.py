@@ -0,0 +1,154 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from wx import App
+
+from ogl.OglClass import OglClass
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutDisplayParameters import PyutDisplayParameters
+from pyutmodel.PyutField import PyutField
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_COMPACT
+from pyutv3.encoders.OglDecoder import OglClassDecoder
+from pyutv3.encoders.OglDiagramWriter import OglDiagramWriter
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+
+class TestOglClassDecoder(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestOglClassDecoder.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestOglClassDecoder.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testRoundTrip(self):
+
+        expectedJson: str = self._readExpectedOglClassJson()
+
+        oglClass:    OglClass = json.loads(expectedJson, cls=OglClassDecoder)
+        roundTripped: str     = json.dumps(oglClass, cls=OglClassEncoder, indent=4)
+
+        self.assertEqual(expectedJson, roundTripped, 'Decoded class does not re-encode identically')
+
+    def testGraphicAttributes(self):
+
+        oglClass: OglClass = json.loads(self._readExpectedOglClassJson(), cls=OglClassDecoder)
+
+        self.assertEqual((120, 60),  oglClass.GetSize(),     'Incorrect size')
+        self.assertEqual((120, 240), oglClass.GetPosition(), 'Incorrect position')
+
+    def testModelAttributes(self):
+
+        oglClass:  OglClass  = json.loads(self._readExpectedOglClassJson(), cls=OglClassDecoder)
+        pyutClass: PyutClass = oglClass.pyutObject
+
+        self.assertEqual(23, pyutClass.id, 'Incorrect id')
+        self.assertEqual('model', pyutClass.stereotype.name, 'Incorrect stereotype')
+        self.assertEqual(PyutDisplayParameters.DISPLAY, pyutClass.displayParameters, 'Incorrect display parameters')
+
+        protectedField: PyutField = pyutClass.fields[0]
+        self.assertEqual(PyutVisibilityEnum.PROTECTED, protectedField.visibility, 'Incorrect field visibility')
+        self.assertEqual('str', protectedField.type.value, 'Incorrect field type')
+
+        publicMethod: PyutMethod = pyutClass.methods[0]
+        self.assertEqual(PyutVisibilityEnum.PUBLIC, publicMethod.visibility, 'Incorrect method visibility')
+        self.assertEqual(['abstract', 'reentrant'], [modifier.name for modifier in publicMethod.modifiers], 'Incorrect modifiers')
+
+        sourceCodeMethod: PyutMethod = pyutClass.methods[2]
+        self.assertEqual(3, len(sourceCodeMethod.sourceCode), 'Incorrect source code length')
+
+    def testDiagramRoundTrip(self):
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeDiagram([self._generateExpectedOglClass(), self._generateExpectedOglClass()])
+
+        decoded = json.loads(stream.getvalue(), cls=OglClassDecoder)
+
+        self.assertEqual(2, len(decoded['oglClasses']), 'Incorrect number of decoded classes')
+        self.assertEqual(stream.getvalue(), json.dumps(decoded, cls=OglClassEncoder, indent=4), 'Diagram does not round trip')
+
+    def testInternedDiagramRoundTrip(self):
+        """
+        A string definition is longer than the string;  It takes a few classes for interning to pay off
+        """
+        oglClasses = [self._generateExpectedOglClass() for _ in range(20)]
+
+        plainStream:    StringIO = StringIO()
+        internedStream: StringIO = StringIO()
+        OglDiagramWriter(stream=plainStream).writeDiagram(oglClasses)
+        OglDiagramWriter(stream=internedStream, internStrings=True).writeDiagram(oglClasses)
+
+        decoded = json.loads(internedStream.getvalue(), cls=OglClassDecoder)
+
+        self.assertLess(len(internedStream.getvalue()), len(plainStream.getvalue()), 'Interning should shrink the document')
+        self.assertEqual(plainStream.getvalue(), json.dumps(decoded, cls=OglClassEncoder, indent=4), 'Interned diagram does not decode to the same classes')
+
+    def testCompactDiagramRoundTrip(self):
+
+        oglClasses = [self._generateExpectedOglClass(), self._generateExpectedOglClass()]
+
+        legacyStream:  StringIO = StringIO()
+        compactStream: StringIO = StringIO()
+        OglDiagramWriter(stream=legacyStream).writeDiagram(oglClasses)
+        OglDiagramWriter(stream=compactStream, internStrings=True, schemaVersion=SCHEMA_VERSION_COMPACT).writeDiagram(oglClasses)
+
+        decoded = json.loads(compactStream.getvalue(), cls=OglClassDecoder)
+
+        self.assertEqual(SCHEMA_VERSION_COMPACT, decoded['schemaVersion'], 'Compact diagrams are versioned')
+        self.assertNotIn('"code"', compactStream.getvalue(), 'Source lines should not be wrapped')
+        self.assertLess(len(compactStream.getvalue()), len(legacyStream.getvalue()), 'Compact should be smaller')
+
+        del decoded['schemaVersion']
+        self.assertEqual(legacyStream.getvalue(), json.dumps(decoded, cls=OglClassEncoder, indent=4), 'Compact diagram does not decode to the same classes')
+
+    def testSharedTypesAndModifiers(self):
+
+        decoded = json.loads(json.dumps([self._generateExpectedOglClass(), self._generateExpectedOglClass()], cls=OglClassEncoder), cls=OglClassDecoder)
+
+        firstClass:  PyutClass = decoded[0].pyutObject
+        secondClass: PyutClass = decoded[1].pyutObject
+
+        self.assertIs(firstClass.fields[0].type, secondClass.fields[0].type, 'Field types should be shared')
+        self.assertIs(firstClass.methods[0].modifiers[0], secondClass.methods[0].modifiers[0], 'Modifiers should be shared')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestOglClassDecoder))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -5,38 +5,33 @@ from logging import getLogger
 
 import json
 
-from pathlib import Path
-
-from pyutmodel.PyutClass import PyutClass
-from pyutmodel.PyutDisplayParameters import PyutDisplayParameters
-from pyutmodel.PyutField import PyutField
-from pyutmodel.PyutMethod import PyutMethod
-from pyutmodel.PyutMethod import PyutModifiers
-from pyutmodel.PyutMethod import SourceCode
-from pyutmodel.PyutModifier import PyutModifier
-from pyutmodel.PyutParameter import PyutParameter
-from pyutmodel.PyutStereotype import PyutStereotype
-from pyutmodel.PyutType import PyutType
-from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
-
 from wx import App
 
+from miniogl.AttachmentLocation import AttachmentLocation
+from miniogl.ControlPoint import ControlPoint
+from miniogl.SelectAnchorPoint import SelectAnchorPoint
+
 from ogl.OglClass import OglClass
+from ogl.OglInterface2 import OglInterface2
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutInterface import PyutInterface
+from pyutmodel.PyutLink import PyutLink
+from pyutmodel.PyutLinkType import PyutLinkType
+from pyutmodel.PyutNote import PyutNote
 
 from unittest import TestSuite
 from unittest import main as unitTestMain
 
 from pyutv3.encoders.OglEncoder import OglClassEncoder
 from tests.TestBase import TestBase
-
-BASE_NAME:  str = 'OglClass'
-SUFFIX:     str = 'json'
-
-GENERATED_OGL_CLASS_FILENAME: str = f'{BASE_NAME}.{SUFFIX}'
-EXPECTED__OGL_CLASS_FILENAME: str = f'Expected-{BASE_NAME}.{SUFFIX}'
+from tests.ogljson.BaseModelJsonTest import EXPECTED_OGL_CLASS_FILENAME
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
 
 
-class TestOglClassEncoder(TestBase):
+class TestOglClassEncoder(BaseOglJsonTest):
     """
     """
     clsLogger: Logger = cast(Logger, None)
@@ -56,118 +51,80 @@ class TestOglClassEncoder(TestBase):
 
     def testBasicOglJson(self):
 
-        pyutClass: PyutClass = self._generateBasicPyutClass()
-        pyutClass = self._addFields(pyutClass=pyutClass)
-        pyutClass = self._addMethods(pyutClass=pyutClass)
-
-        oglClass:  OglClass = OglClass(pyutClass=pyutClass, w=120, h=60)
-        oglClass.SetPosition(x=120, y=240)
+        oglClass: OglClass = self._generateExpectedOglClass()
 
         # Sort keys so we can verify them
         oglClassStr = json.dumps(oglClass, cls=OglClassEncoder, indent=4, sort_keys=False)
         self.logger.debug(f'{oglClassStr=}')
 
-        filePath: Path = Path(GENERATED_OGL_CLASS_FILENAME)
-        with filePath.open("w") as file:
-            file.write(oglClassStr)
-        # with open(GENERATED_OGL_CLASS_FILENAME, 'w') as f:
-        #     f.write(oglClassStr)
-
-        baseFileName: str = self._getFullyQualifiedTestFilePath(testFileName='Expected-OglClass.json')
-        status: int = self._runDiff(expectedContentsFileName=baseFileName, actualContentsFileName=GENERATED_OGL_CLASS_FILENAME)
-        self.assertEqual(0, status, 'Basic Ogl Class Encoding failed')
-
-    def _generateBasicPyutClass(self) -> PyutClass:
-
-        pyutClass: PyutClass = PyutClass(name='Ozzee')
-        pyutClass.id          = 23
-        pyutClass.description = 'Soy Gato'
-        pyutClass.fileName    = '/tmp/TheBox.txt'
-        pyutClass.stereotype  = PyutStereotype(name='model')
-        pyutClass.showFields  = False
-        pyutClass.displayParameters = PyutDisplayParameters.DISPLAY
-
-        return pyutClass
-
-    def _addFields(self, pyutClass: PyutClass) -> PyutClass:
-
-        protectedField: PyutField = PyutField(name='protectedField',
-                                              fieldType=PyutType(value='str'),
-                                              visibility=PyutVisibilityEnum.PROTECTED,
-                                              defaultValue='gato')
-        privateField: PyutField = PyutField(name='privateField',
-                                            fieldType=PyutType(value='int'),
-                                            visibility=PyutVisibilityEnum.PRIVATE,
-                                            defaultValue='6666')
-        publicField: PyutField = PyutField(name='publicField',
-                                           fieldType=PyutType(value='float'),
-                                           visibility=PyutVisibilityEnum.PUBLIC,
-                                           defaultValue='23.0')
-
-        pyutClass.addField(field=protectedField)
-        pyutClass.addField(field=privateField)
-        pyutClass.addField(field=publicField)
-
-        return pyutClass
-
-    def _addMethods(self, pyutClass: PyutClass) -> PyutClass:
-
-        pyutClass = self._addPublicMethod(pyutClass)
-        pyutClass = self._addPrivateMethod(pyutClass)
-        pyutClass = self._addProtectedMethodWithSourceCode(pyutClass)
-
-        return pyutClass
-
-    def _addPublicMethod(self, pyutClass: PyutClass) -> PyutClass:
-        publicMethod: PyutMethod = PyutMethod(name='publicMethod',
-                                              visibility=PyutVisibilityEnum.PUBLIC,
-                                              returnType=PyutType(value='int'))
-        publicMethod.modifiers = (
-            PyutModifiers(
-                [
-                    PyutModifier('abstract'),
-                    PyutModifier('reentrant')
-                ]
-            )
-        )
-        publicMethod = self._addPublicMethodParameters(publicMethod)
-        pyutClass.addMethod(publicMethod)
-        return pyutClass
-
-    def _addPublicMethodParameters(self, pyutMethod: PyutMethod) -> PyutMethod:
-        """
-        <Param name="noDefaultValueParam" type="str" defaultValue=""/>
-
-        """
-        pyutParameter: PyutParameter = PyutParameter(name='noDefaultValueParam', parameterType=PyutType('str'))
-        pyutMethod.addParameter(pyutParameter)
-        return pyutMethod
-
-    def _addPrivateMethod(self, pyutClass: PyutClass) -> PyutClass:
-        privateMethod: PyutMethod = PyutMethod(name='privateMethod',
-                                               visibility=PyutVisibilityEnum.PRIVATE,
-                                               returnType=PyutType(value='str'))
-        privateMethod.modifiers = (PyutModifiers([PyutModifier('static')]))
-
-        pyutParameter: PyutParameter = PyutParameter(name='noDefaultValueParam', parameterType=PyutType('str'))
-        privateMethod.addParameter(pyutParameter)
-
-        pyutClass.addMethod(privateMethod)
-        return pyutClass
-
-    def _addProtectedMethodWithSourceCode(self, pyutClass: PyutClass) -> PyutClass:
-        protectedMethodWithSourceCode: PyutMethod = PyutMethod(name='protectedMethodWithSourceCode', visibility=PyutVisibilityEnum.PROTECTED)
-
-        sourceCode: SourceCode = SourceCode(
-            [
-                'i: int = 0',
-                'j: float = 0.0',
-                'k: str = ‘Ozzee, El Gato Malo’'
-            ]
-        )
-        protectedMethodWithSourceCode.sourceCode = sourceCode
-        pyutClass.addMethod(protectedMethodWithSourceCode)
-        return pyutClass
+        self._assertSameAsTestFile(testFileName=EXPECTED_OGL_CLASS_FILENAME, actualContents=oglClassStr)
+
+    def testOglNote(self):
+
+        pyutNote: PyutNote = PyutNote(noteText='I am a note')
+        pyutNote.id = 42
+        oglNote: OglNote = OglNote(pyutNote=pyutNote, w=100, h=50)
+        oglNote.SetPosition(x=10, y=20)
+
+        encodedNote = json.loads(json.dumps(oglNote, cls=OglClassEncoder))
+
+        self.assertEqual({'width': 100, 'height': 50, 'x': 10, 'y': 20}, encodedNote['graphicNote'], 'Incorrect note geometry')
+        self.assertEqual({'id': 42, 'content': 'I am a note', 'fileName': ''}, encodedNote['modelNote'], 'Incorrect note model')
+
+    def testOglLink(self):
+
+        sourceClass:      OglClass = self._generateSimpleOglClass(name='Source', classId=1)
+        destinationClass: OglClass = self._generateSimpleOglClass(name='Destination', classId=2)
+
+        pyutLink: PyutLink = PyutLink(name='usesA', linkType=PyutLinkType.AGGREGATION, cardSrc='1', cardDest='*',
+                                      source=sourceClass.pyutObject, destination=destinationClass.pyutObject)
+        oglLink:  OglLink  = OglLink(srcShape=sourceClass, pyutLink=pyutLink, dstShape=destinationClass, srcPos=(50, 0), dstPos=(50, 100))
+        oglLink.AddControl(ControlPoint(300, 400), None)
+
+        encodedLink = json.loads(json.dumps(oglLink, cls=OglClassEncoder))
+
+        graphicLink = encodedLink['graphicLink']
+        self.assertEqual(1, graphicLink['sourceId'],      'Source should be referenced by id')
+        self.assertEqual(2, graphicLink['destinationId'], 'Destination should be referenced by id')
+        self.assertEqual({'x': 50, 'y': 0},   graphicLink['sourceAnchor'],      'Incorrect source anchor')
+        self.assertEqual({'x': 50, 'y': 100}, graphicLink['destinationAnchor'], 'Incorrect destination anchor')
+        self.assertEqual([{'x': 300, 'y': 400}], graphicLink['controlPoints'], 'Incorrect control points')
+
+        modelLink = encodedLink['modelLink']
+        self.assertEqual('AGGREGATION', modelLink['linkType'],               'Incorrect link type')
+        self.assertEqual('1',           modelLink['sourceCardinality'],      'Incorrect source cardinality')
+        self.assertEqual('*',           modelLink['destinationCardinality'], 'Incorrect destination cardinality')
+
+    def testOglInterfaceEncodedOnce(self):
+
+        pyutInterface: PyutInterface = PyutInterface(name='IGato')
+        pyutInterface.id = 77
+
+        implementors = [self._generateSimpleOglClass(name='Ozzee', classId=3), self._generateSimpleOglClass(name='Fran', classId=4)]
+        lollipops = []
+        for implementor in implementors:
+            anchor: SelectAnchorPoint = SelectAnchorPoint(x=0, y=30, attachmentPoint=AttachmentLocation.WEST, parent=implementor)
+            lollipops.append(OglInterface2(pyutInterface=pyutInterface, destinationAnchor=anchor))
+
+        encodedLollipops = json.loads(json.dumps(lollipops, cls=OglClassEncoder))
+
+        self.assertIn('modelInterface',    encodedLollipops[0], 'First lollipop should carry the interface')
+        self.assertNotIn('modelInterface', encodedLollipops[1], 'The interface should only be encoded once')
+        self.assertEqual(77, encodedLollipops[1]['graphicLollipop']['interfaceId'], 'Interface should be referenced by id')
+        self.assertEqual(4,  encodedLollipops[1]['graphicLollipop']['implementorId'], 'Implementor should be referenced by id')
+        self.assertEqual('WEST', encodedLollipops[0]['graphicLollipop']['attachmentPoint'], 'Incorrect attachment point')
+
+    def testUnsupportedObject(self):
+
+        self.assertRaises(TypeError, lambda: json.dumps(object(), cls=OglClassEncoder))
+
+    def _generateSimpleOglClass(self, name: str, classId: int) -> OglClass:
+
+        pyutClass: PyutClass = self._generateBasicPyutClass()
+        pyutClass.name = name
+        pyutClass.id   = classId
+
+        return OglClass(pyutClass=pyutClass, w=100, h=100)
 
 
 def suite() -> TestSuite:
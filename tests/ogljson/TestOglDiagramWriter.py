@@ -0,0 +1,110 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from io import StringIO
+
+from wx import App
+
+from ogl.OglClass import OglClass
+from ogl.OglLink import OglLink
+from ogl.OglNote import OglNote
+
+from pyutmodel.PyutLink import PyutLink
+from pyutmodel.PyutNote import PyutNote
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.OglDiagramWriter import OglDiagramWriter
+from pyutv3.encoders.OglEncoder import OglClassEncoder
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseModelJsonTest import EXPECTED_OGL_CLASS_FILENAME
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+
+class TestOglDiagramWriter(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestOglDiagramWriter.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestOglDiagramWriter.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testSingleClassMatchesExpected(self):
+
+        oglClass: OglClass = self._generateExpectedOglClass()
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeOglClass(oglClass)
+
+        self._assertSameAsTestFile(testFileName=EXPECTED_OGL_CLASS_FILENAME, actualContents=stream.getvalue())
+
+    def testDiagramMatchesDumps(self):
+
+        oglClasses = [self._generateExpectedOglClass(), self._generateExpectedOglClass()]
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeDiagram(oglClasses)
+
+        expectedJson: str = json.dumps({'oglClasses': oglClasses, 'oglNotes': [], 'oglInterfaces': [], 'oglLinks': []}, cls=OglClassEncoder, indent=4)
+
+        self.assertEqual(expectedJson, stream.getvalue(), 'Streamed diagram does not match json.dumps')
+
+    def testMixedDiagram(self):
+
+        sourceClass:      OglClass = self._generateExpectedOglClass()
+        destinationClass: OglClass = self._generateExpectedOglClass()
+        destinationClass.pyutObject.id = 24
+
+        oglLink: OglLink = OglLink(srcShape=sourceClass, pyutLink=PyutLink(), dstShape=destinationClass, srcPos=(0, 0), dstPos=(0, 0))
+        oglNote: OglNote = OglNote(pyutNote=PyutNote(noteText='Soy Gato'), w=100, h=50)
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeDiagram([oglLink, sourceClass, oglNote, destinationClass])
+
+        expectedDiagram = {'oglClasses': [sourceClass, destinationClass], 'oglNotes': [oglNote], 'oglInterfaces': [], 'oglLinks': [oglLink]}
+        expectedJson: str = json.dumps(expectedDiagram, cls=OglClassEncoder, indent=4)
+
+        self.assertEqual(expectedJson, stream.getvalue(), 'Links should be written after the objects they connect')
+
+    def testEmptyDiagram(self):
+
+        stream: StringIO = StringIO()
+        writer: OglDiagramWriter = OglDiagramWriter(stream=stream)
+        writer.writeDiagram([])
+
+        expectedDiagram = {'oglClasses': [], 'oglNotes': [], 'oglInterfaces': [], 'oglLinks': []}
+        self.assertEqual(expectedDiagram, json.loads(stream.getvalue()), 'Empty diagram is incorrectly streamed')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestOglDiagramWriter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
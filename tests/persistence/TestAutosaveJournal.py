@@ -0,0 +1,228 @@
+from typing import List
+from typing import Optional
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import path as osPath
+from os import remove
+
+from shutil import copy
+
+from tempfile import TemporaryDirectory
+
+import json
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutmodel.PyutField import PyutField
+
+from pyutv3.commands.ClassMemberCommand import ClassMemberCommand
+from pyutv3.commands.ClassMemberCommand import MemberKind
+from pyutv3.commands.CommandHistory import CommandAction
+from pyutv3.commands.DiagramCommand import DiagramCommand
+from pyutv3.commands.DiagramCommand import JOURNAL_RECORD_TYPE_KEY
+from pyutv3.commands.DiagramCommand import JournalRecord
+from pyutv3.commands.DiagramCommand import JournalRecordType
+from pyutv3.encoders.ClassRecord import ClassRecord
+from pyutv3.persistence.AutosaveJournal import AutosaveJournal
+from pyutv3.persistence.AutosaveJournal import JOURNAL_FILE_NAME
+from pyutv3.persistence.AutosaveJournal import SEQUENCE_KEY
+from pyutv3.persistence.AutosaveJournal import SNAPSHOT_FILE_NAME
+from pyutv3.persistence.AutosaveJournal import TAIL_BLOCK_SIZE
+from pyutv3.persistence.PutLoader import PutLoader
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+from tests.TestBase import TestBase
+
+PUT_TEST_FILENAME: str = 'JsonTestClass.put'
+
+CLASS_ID: int = 24
+
+
+class MoveRecordCommand(DiagramCommand):
+    """
+    The record a shape move makes;  Without the shape
+    """
+    def __init__(self, deltaX: int, deltaY: int):
+        super().__init__(name='Move')
+        self._deltaX: int = deltaX
+        self._deltaY: int = deltaY
+
+    def journalRecord(self, undone: bool) -> Optional[JournalRecord]:
+
+        sign: int = -1 if undone is True else 1
+
+        return {JOURNAL_RECORD_TYPE_KEY: JournalRecordType.MOVE.value, 'classIds': [CLASS_ID], 'deltaX': sign * self._deltaX, 'deltaY': sign * self._deltaY}
+
+
+class TestAutosaveJournal(TestBase):
+    """
+    The journal replays onto class records;  No wx application
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestAutosaveJournal.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestAutosaveJournal.clsLogger
+
+        self._project:  PutProject  = PutLoader().loadIndex(self._getFullyQualifiedTestFilePath(PUT_TEST_FILENAME))
+        self._document: PutDocument = self._project.documents[0]
+
+    def tearDown(self):
+        pass
+
+    def testRecoverWithCompaction(self):
+
+        with TemporaryDirectory() as directory:
+            autosaveJournal: AutosaveJournal = AutosaveJournal(directory=directory, compactAfter=3)
+
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=10, deltaY=5))
+            self._record(autosaveJournal, ClassMemberCommand(pyutClass=self._pyutClass(), memberKind=MemberKind.FIELD, index=0, oldMember=None, newMember=PyutField(name='ozzee')))
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=10, deltaY=5), action=CommandAction.UNDONE)
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=1, deltaY=2))
+            autosaveJournal.close(discardSession=False)
+
+            sessionDirectory: str = autosaveJournal.sessionDirectory
+            self.assertTrue(osPath.exists(osPath.join(sessionDirectory, SNAPSHOT_FILE_NAME)), 'The journal was not compacted')
+
+            # A crash while appending
+            with open(osPath.join(sessionDirectory, JOURNAL_FILE_NAME), 'a') as journalFile:
+                journalFile.write('{"record": "mo')
+
+            self._assertRecovered(AutosaveJournal(directory=directory))
+
+    def testCompactionIsNotReplayedTwice(self):
+
+        with TemporaryDirectory() as directory:
+            autosaveJournal: AutosaveJournal = AutosaveJournal(directory=directory, compactAfter=100)
+
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=1, deltaY=2))
+            self._record(autosaveJournal, ClassMemberCommand(pyutClass=self._pyutClass(), memberKind=MemberKind.FIELD, index=0, oldMember=None, newMember=PyutField(name='ozzee')))
+            autosaveJournal.compact().result()
+            autosaveJournal.close(discardSession=False)
+
+            # A crash after writing the snapshot but before emptying the journal
+            with open(osPath.join(autosaveJournal.sessionDirectory, JOURNAL_FILE_NAME), 'w') as journalFile:
+                journalFile.write('{"record": "move", "classIds": [24], "deltaX": 1, "deltaY": 2, "sequence": 1, "project": "%s", "documentIndex": 0}\n' % self._project.fileName)
+
+            recoveredJournal: AutosaveJournal = self._assertRecovered(AutosaveJournal(directory=directory))
+            recoveredJournal.close(discardSession=True)
+
+            self.assertFalse(AutosaveJournal(directory=directory).hasSession, 'A normal exit leaves nothing to recover')
+
+    def testCompactionKeepsTheSessionInMemory(self):
+
+        with TemporaryDirectory() as directory:
+            fqFileName: str = osPath.join(directory, PUT_TEST_FILENAME)
+            copy(self._getFullyQualifiedTestFilePath(PUT_TEST_FILENAME), fqFileName)
+
+            self._project  = PutLoader().loadIndex(fqFileName)
+            self._document = self._project.documents[0]
+
+            autosaveJournal: AutosaveJournal = AutosaveJournal(directory=osPath.join(directory, 'autosave'), compactAfter=100)
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=1, deltaY=1))
+            autosaveJournal.compact().result()
+
+            # Later compactions must not read the project again
+            remove(fqFileName)
+            self._record(autosaveJournal, MoveRecordCommand(deltaX=0, deltaY=1))
+            autosaveJournal.compact().result()
+            autosaveJournal.close(discardSession=False)
+
+            self.assertEqual(0, osPath.getsize(osPath.join(autosaveJournal.sessionDirectory, JOURNAL_FILE_NAME)), 'The second compaction failed')
+
+            copy(self._getFullyQualifiedTestFilePath(PUT_TEST_FILENAME), fqFileName)
+            projects: List[PutProject] = AutosaveJournal(directory=osPath.join(directory, 'autosave')).recover()
+
+            self.assertEqual((475 + 1, 158 + 2), projects[0].documents[0].classRecords[0].geometry[:2], 'Both moves should be in the snapshot')
+
+    def testRunningSessionsAreNotRecovered(self):
+
+        with TemporaryDirectory() as directory:
+            runningJournal: AutosaveJournal = AutosaveJournal(directory=directory)
+            self._record(runningJournal, MoveRecordCommand(deltaX=1, deltaY=2))
+            runningJournal.compact().result()
+
+            otherJournal: AutosaveJournal = AutosaveJournal(directory=directory)
+            self.assertFalse(otherJournal.hasSession, 'The session is still running')
+            otherJournal.close(discardSession=True)
+
+            runningJournal.close(discardSession=False)
+
+            offeringJournal: AutosaveJournal = AutosaveJournal(directory=directory)
+            self.assertTrue(offeringJournal.hasSession, 'The session is over')
+            self.assertFalse(AutosaveJournal(directory=directory).hasSession, 'Only one instance offers it')
+            offeringJournal.close(discardSession=True)
+
+            projects: List[PutProject] = AutosaveJournal(directory=directory).recover()
+            self.assertEqual((475 + 1, 158 + 2), projects[0].documents[0].classRecords[0].geometry[:2], 'The move was not recovered')
+
+    def testRecoveredSessionContinuesItsNumbering(self):
+
+        with TemporaryDirectory() as directory:
+            autosaveJournal: AutosaveJournal = AutosaveJournal(directory=directory, compactAfter=1000)
+            for _ in range(100):
+                self._record(autosaveJournal, MoveRecordCommand(deltaX=1, deltaY=0))
+            autosaveJournal.close(discardSession=False)
+
+            journalFileName: str = osPath.join(autosaveJournal.sessionDirectory, JOURNAL_FILE_NAME)
+            self.assertGreater(osPath.getsize(journalFileName), TAIL_BLOCK_SIZE, 'The last record should be found past the first block')
+            # A crash while appending
+            with open(journalFileName, 'a') as journalFile:
+                journalFile.write('{"record": "mo')
+
+            recoveredJournal: AutosaveJournal = AutosaveJournal(directory=directory)
+            recoveredJournal.recover()
+            self._record(recoveredJournal, MoveRecordCommand(deltaX=1, deltaY=0))
+            recoveredJournal.close(discardSession=False)
+
+            with open(journalFileName) as journalFile:
+                lastLine: str = journalFile.readlines()[-1]
+
+            self.assertEqual(101, json.loads(lastLine)[SEQUENCE_KEY], 'The numbering did not continue')
+
+    def _record(self, autosaveJournal: AutosaveJournal, command: DiagramCommand, action: CommandAction = CommandAction.DONE):
+        autosaveJournal.record(project=self._project, document=self._document, command=command, action=action)
+
+    def _pyutClass(self):
+        """
+        The document is loaded when it is first edited
+        """
+        PutLoader().loadDocument(project=self._project, document=self._document)
+        return self._document.classRecords[0].pyutClass
+
+    def _assertRecovered(self, autosaveJournal: AutosaveJournal) -> AutosaveJournal:
+
+        self.assertTrue(autosaveJournal.hasSession, 'There is a session to recover')
+
+        projects:    List[PutProject] = autosaveJournal.recover()
+        classRecord: ClassRecord      = projects[0].documents[0].classRecords[0]
+
+        self.assertEqual((475 + 1, 158 + 2), classRecord.geometry[:2], 'The moves were not replayed once each')
+        self.assertEqual(['ozzee'], [field.name for field in classRecord.pyutClass.fields][:1], 'The field was not added')
+        self.assertEqual(4, len(classRecord.pyutClass.fields), 'Wrong number of fields')
+
+        return autosaveJournal
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestAutosaveJournal))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,121 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+from os import chmod
+from os import listdir
+from os import path as osPath
+from os import stat
+
+from tempfile import TemporaryDirectory
+
+from wx import App
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.encoders.DiagramFile import DiagramFile
+from pyutv3.persistence.AtomicFileWriter import AtomicFileWriter
+from pyutv3.persistence.AtomicFileWriter import NEW_FILE_MODE
+from pyutv3.persistence.BackgroundSaver import BackgroundSaver
+from pyutv3.persistence.DiagramSnapshot import DiagramSnapshot
+
+from tests.TestBase import TestBase
+from tests.ogljson.BaseOglJsonTest import BaseOglJsonTest
+
+
+class TestBackgroundSaver(BaseOglJsonTest):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestBackgroundSaver.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.app: App = App()
+
+        self.logger: Logger = TestBackgroundSaver.clsLogger
+
+        self._statusMessages: List[str] = []
+
+    def tearDown(self):
+        pass
+
+    def testSnapshotMatchesDiagramFile(self):
+
+        oglClasses = [self._generateExpectedOglClass(), self._generateExpectedOglClass()]
+
+        saver: BackgroundSaver = BackgroundSaver(statusListener=self._statusMessages.append)
+        try:
+            with TemporaryDirectory() as directory:
+                for suffix in ['.json', '.pyutz']:
+                    diagramFileName: str = osPath.join(directory, f'Diagram{suffix}')
+                    snapshotName:    str = osPath.join(directory, f'Snapshot{suffix}')
+                    DiagramFile().save(fileName=diagramFileName, oglObjects=oglClasses)
+                    saver.writeSnapshot(DiagramSnapshot.create(fileName=snapshotName, oglObjects=oglClasses))
+
+                    with open(diagramFileName, 'rb') as savedFile, open(snapshotName, 'rb') as snapshotFile:
+                        self.assertEqual(savedFile.read(), snapshotFile.read(), f'{suffix} snapshot differs from the saved file')
+        finally:
+            saver.shutdown()
+
+    def testBackgroundSave(self):
+
+        saver: BackgroundSaver = BackgroundSaver(statusListener=self._statusMessages.append)
+        try:
+            with TemporaryDirectory() as directory:
+                fileName: str = osPath.join(directory, 'Diagram.pyutz')
+                saver.save(fileName=fileName, oglObjects=[self._generateExpectedOglClass()]).result()
+
+                self.assertEqual(['Diagram.pyutz'], listdir(directory), 'Temporary files should not be left behind')
+
+                loaded = DiagramFile().load(fileName)
+                self.assertEqual(1, len(loaded['oglClasses']), 'The saved diagram does not load')
+        finally:
+            saver.shutdown()
+
+    def testAtomicWriteReplaces(self):
+
+        with TemporaryDirectory() as directory:
+            fileName: str = osPath.join(directory, 'Diagram.json')
+            writer:   AtomicFileWriter = AtomicFileWriter()
+
+            writer.write(fileName=fileName, data=b'old')
+            writer.write(fileName=fileName, data=b'new')
+
+            with open(fileName, 'rb') as writtenFile:
+                self.assertEqual(b'new', writtenFile.read(), 'File was not replaced')
+            self.assertEqual(['Diagram.json'], listdir(directory), 'Temporary files should not be left behind')
+
+    def testAtomicWriteKeepsPermissions(self):
+
+        with TemporaryDirectory() as directory:
+            fileName: str = osPath.join(directory, 'Diagram.json')
+            writer:   AtomicFileWriter = AtomicFileWriter()
+
+            writer.write(fileName=fileName, data=b'new')
+            self.assertEqual(NEW_FILE_MODE, stat(fileName).st_mode & 0o777, 'A new file gets the default permissions')
+
+            chmod(fileName, 0o640)
+            writer.write(fileName=fileName, data=b'replaced')
+            self.assertEqual(0o640, stat(fileName).st_mode & 0o777, 'A replaced file keeps its permissions')
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestBackgroundSaver))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
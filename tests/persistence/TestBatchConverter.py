@@ -0,0 +1,179 @@
+from typing import List
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import json
+
+from os import listdir
+from os import makedirs
+from os import path as osPath
+from os import utime
+
+from shutil import copy
+
+from tempfile import TemporaryDirectory
+
+from pkg_resources import resource_filename
+
+from click.testing import CliRunner
+from click.testing import Result
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.BatchConverter import BatchConverter
+from pyutv3.BatchConverter import BatchStatistics
+from pyutv3.BatchConverter import batchConverter
+from pyutv3.encoders.ModelEncoder import SCHEMA_VERSION_LEGACY
+
+from tests.TestBase import TestBase
+
+PUT_TEST_FILENAME: str = 'JsonTestClass.put'
+XML_TEST_FILENAME: str = 'JsonTestClass.xml'
+
+
+class TestBatchConverter(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestBatchConverter.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestBatchConverter.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testConvertDirectory(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            runner: CliRunner = CliRunner()
+            result: Result    = runner.invoke(batchConverter, [inputDirectory, '--output-directory', outputDirectory, '--workers', '2'])
+
+            self.assertEqual(0, result.exit_code, result.output)
+            self.assertIn('Converted 2, skipped 0, failed 0', result.output, 'Incorrect statistics')
+
+            with open(osPath.join(outputDirectory, 'nested', 'Second.put.json'), 'r', encoding='utf-8') as diagramFile:
+                diagram = json.load(diagramFile)
+            self.assertEqual(1, len(diagram['oglClasses']), 'Incorrect converted diagram')
+            self.assertEqual('JsonClass', diagram['oglClasses'][0]['modelClass']['name'], 'Incorrect converted class')
+
+    def testUpToDateProjectsAreSkipped(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert([inputDirectory])
+
+            # Only touched;  The content hash still matches
+            utime(osPath.join(inputDirectory, 'First.put'), (1, 1))
+
+            statistics: BatchStatistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert([inputDirectory])
+            self.assertEqual(0, statistics.converted, 'Nothing should be converted')
+            self.assertEqual(2, statistics.skipped, 'Everything should be skipped')
+
+            statistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1, force=True).convert([inputDirectory])
+            self.assertEqual(2, statistics.converted, 'Force should convert everything')
+            self.assertIn('First.put.json', listdir(outputDirectory), 'Missing output')
+
+    def testSchemaChangeConvertsAgain(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert([inputDirectory])
+
+            statistics: BatchStatistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1, schemaVersion=SCHEMA_VERSION_LEGACY).convert([inputDirectory])
+            self.assertEqual(2, statistics.converted, 'Diagrams in another schema are not up to date')
+
+    def testProjectWithLinksFails(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            xmlText: str = self._readXmlTestFile()
+            with open(osPath.join(inputDirectory, 'linked.xml'), 'w', encoding='utf-8') as linkedFile:
+                linkedFile.write(xmlText.replace('<GraphicClass ', '<GraphicNote width="10" height="10" x="0" y="0"/><GraphicClass ', 1).replace('iso-8859-1', 'utf-8'))
+
+            statistics: BatchStatistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert([inputDirectory])
+            self.assertEqual(2, statistics.converted, 'The projects with only classes should be converted')
+            self.assertEqual(1, statistics.failed,    'Converting the note would lose it')
+            self.assertNotIn('linked.xml.json', listdir(outputDirectory), 'Nothing should be written for the failed project')
+
+    def testMalformedProjectFails(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            xmlText: str = self._readXmlTestFile()
+            with open(osPath.join(inputDirectory, 'bad.xml'), 'w', encoding='utf-8') as badFile:
+                badFile.write(xmlText.replace('<GraphicClass width="', '<GraphicClass width="abc', 1).replace('iso-8859-1', 'utf-8'))
+
+            statistics: BatchStatistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=2).convert([inputDirectory])
+            self.assertEqual(2, statistics.converted, 'The good projects should be converted')
+            self.assertEqual(1, statistics.failed,    'The malformed project should fail')
+
+            statistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert([inputDirectory])
+            self.assertEqual(2, statistics.skipped, 'The manifest should have been saved')
+            self.assertEqual(1, statistics.failed,  'The malformed project should be retried')
+
+    def testOutputNamesDoNotCollide(self):
+
+        with TemporaryDirectory() as directory:
+            inputDirectory:  str = self._createArchive(directory)
+            outputDirectory: str = osPath.join(directory, 'output')
+
+            copy(osPath.join(inputDirectory, 'First.put'), osPath.join(inputDirectory, 'nested', 'First.put'))
+            copy(resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, XML_TEST_FILENAME), osPath.join(inputDirectory, 'First.xml'))
+
+            inputs: List[str] = [osPath.join(inputDirectory, 'First.put'), osPath.join(inputDirectory, 'First.xml'), osPath.join(inputDirectory, 'nested', 'First.put')]
+
+            statistics: BatchStatistics = BatchConverter(outputDirectory=outputDirectory, maxWorkers=1).convert(inputs)
+            self.assertEqual(3, statistics.converted, 'Everything should be converted')
+
+            expectedNames: List[str] = ['First (2).put.json', 'First.put.json', 'First.xml.json']
+            self.assertEqual(expectedNames, sorted(name for name in listdir(outputDirectory) if name.endswith('.json') and not name.startswith('.')), 'Diagrams were overwritten')
+
+    def _readXmlTestFile(self) -> str:
+
+        with open(resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, XML_TEST_FILENAME), 'r', encoding='utf-8') as xmlFile:
+            return xmlFile.read()
+
+    def _createArchive(self, directory: str) -> str:
+
+        testFileName:   str = resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, PUT_TEST_FILENAME)
+        inputDirectory: str = osPath.join(directory, 'archive')
+
+        makedirs(osPath.join(inputDirectory, 'nested'))
+        copy(testFileName, osPath.join(inputDirectory, 'First.put'))
+        copy(testFileName, osPath.join(inputDirectory, 'nested', 'Second.put'))
+
+        return inputDirectory
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestBatchConverter))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()
@@ -0,0 +1,194 @@
+from typing import cast
+
+from logging import Logger
+from logging import getLogger
+
+import zlib
+
+from os import path as osPath
+
+from tempfile import TemporaryDirectory
+
+from pkg_resources import resource_filename
+
+from pyutmodel.PyutClass import PyutClass
+from pyutmodel.PyutMethod import PyutMethod
+from pyutmodel.PyutVisibilityEnum import PyutVisibilityEnum
+
+from unittest import TestSuite
+from unittest import main as unitTestMain
+
+from pyutv3.persistence.PutLoader import PutLoader
+from pyutv3.persistence.PutLoader import PutLoaderException
+from pyutv3.persistence.PutProject import PutDocument
+from pyutv3.persistence.PutProject import PutProject
+
+from tests.TestBase import TestBase
+
+PUT_TEST_FILENAME: str = 'JsonTestClass.put'
+XML_TEST_FILENAME: str = 'JsonTestClass.xml'
+
+
+class TestPutLoader(TestBase):
+    """
+    """
+    clsLogger: Logger = cast(Logger, None)
+
+    @classmethod
+    def setUpClass(cls):
+        TestBase.setUpLogging()
+        TestPutLoader.clsLogger = getLogger(__name__)
+
+    def setUp(self):
+        self.logger: Logger = TestPutLoader.clsLogger
+
+    def tearDown(self):
+        pass
+
+    def testLoadCompressedProject(self):
+
+        project: PutProject = PutLoader().load(self._testFile(PUT_TEST_FILENAME))
+
+        self.assertEqual('10', project.version, 'Incorrect project version')
+        self.assertEqual(1, len(project.documents), 'Incorrect number of documents')
+
+        document: PutDocument = project.documents[0]
+        self.assertEqual('CLASS_DIAGRAM', document.documentType, 'Incorrect document type')
+        self.assertEqual(1, len(document.classRecords), 'Incorrect number of classes')
+        self.assertEqual((475, 158), document.classRecords[0].geometry[:2], 'Incorrect class position')
+
+        pyutClass: PyutClass = document.classRecords[0].pyutClass
+        self.assertEqual(24, pyutClass.id, 'Incorrect class id')
+        self.assertEqual(4, len(pyutClass.methods), 'Incorrect number of methods')
+        self.assertEqual(3, len(pyutClass.fields), 'Incorrect number of fields')
+        self.assertEqual(PyutVisibilityEnum.PROTECTED, pyutClass.fields[0].visibility, 'Incorrect field visibility')
+
+        publicMethod: PyutMethod = pyutClass.methods[0]
+        self.assertEqual(['abstract', 'static'], [modifier.name for modifier in publicMethod.modifiers], 'Joined modifiers are not split')
+        self.assertEqual(3, len(pyutClass.methods[3].sourceCode), 'Incorrect source code length')
+
+    def testSmallChunksMatchPlainXml(self):
+
+        compressed: PutProject = PutLoader(chunkSize=7).load(self._testFile(PUT_TEST_FILENAME))
+        plain:      PutProject = PutLoader(chunkSize=7).load(self._testFile(XML_TEST_FILENAME))
+
+        compressedClass: PyutClass = compressed.documents[0].classRecords[0].pyutClass
+        plainClass:      PyutClass = plain.documents[0].classRecords[0].pyutClass
+
+        self.assertEqual([method.name for method in plainClass.methods], [method.name for method in compressedClass.methods], 'Methods differ')
+        self.assertEqual([field.name for field in plainClass.fields], [field.name for field in compressedClass.fields], 'Fields differ')
+
+    def testIndexThenLoadDocument(self):
+
+        with TemporaryDirectory() as directory:
+            fileName: str = self._writeMultiDocumentProject(directory=directory, documentCount=3)
+
+            loader:  PutLoader  = PutLoader()
+            project: PutProject = loader.loadIndex(fileName)
+
+            self.assertEqual(['Diagram 0', 'Diagram 1', 'Diagram 2'], [document.title for document in project.documents], 'Incorrect document index')
+            self.assertEqual(0, sum(len(document.classRecords) for document in project.documents), 'The index should not build classes')
+
+            secondDocument: PutDocument = project.documents[1]
+            loader.loadDocument(project=project, document=secondDocument)
+
+            self.assertTrue(secondDocument.loaded, 'Document should be loaded')
+            self.assertEqual(1, len(secondDocument.classRecords), 'Incorrect number of classes')
+            self.assertFalse(project.documents[2].loaded, 'Only the requested document is loaded')
+            self.assertEqual(0, len(project.documents[2].classRecords), 'Only the requested document is loaded')
+
+    def testLoadDocumentsFromTheirLocation(self):
+
+        with TemporaryDirectory() as directory:
+            fileName: str = self._writeMultiDocumentProject(directory=directory, documentCount=5, compress=True)
+
+            loader:  PutLoader  = PutLoader(chunkSize=97)
+            project: PutProject = loader.loadIndex(fileName)
+
+            self.assertEqual([f'Diagram {idx} & <more>' for idx in range(5)], [document.title for document in project.documents], 'Incorrect document index')
+            self.assertEqual('7.0.0+.1309', project.version, 'Incorrect project version')
+
+            for idx in [3, 0, 4]:
+                loader.loadDocument(project=project, document=project.documents[idx])
+
+                classNames = [classRecord.pyutClass.name for classRecord in project.documents[idx].classRecords]
+                self.assertEqual([f'JsonClass{idx}'], classNames, f'Document {idx} loaded the wrong classes')
+
+            fullProject: PutProject = PutLoader().load(fileName)
+            self.assertEqual(fullProject.documents[4].classRecords[0].geometry, project.documents[4].classRecords[0].geometry, 'Geometry differs from a full load')
+
+    def testNotAProject(self):
+
+        with TemporaryDirectory() as directory:
+            fileName: str = osPath.join(directory, 'Bogus.put')
+            with open(fileName, 'wb') as bogusFile:
+                bogusFile.write(b'\x00\x01 Soy Gato Malo')
+
+            self.assertRaises(PutLoaderException, lambda: PutLoader().load(fileName))
+
+    def testMalformedClass(self):
+
+        with open(self._testFile(XML_TEST_FILENAME), 'r', encoding='utf-8') as xmlFile:
+            xmlText: str = xmlFile.read()
+
+        malformedTexts = [
+            xmlText.replace('<GraphicClass width="', '<GraphicClass width="abc', 1),
+            xmlText.replace('visibility="PUBLIC"', 'visibility="MAYBE"', 1),
+            xmlText.replace('<Class ', '<NotAClass ', 1).replace('</Class>', '</NotAClass>', 1),
+        ]
+        with TemporaryDirectory() as directory:
+            for idx, malformedText in enumerate(malformedTexts):
+                fileName: str = osPath.join(directory, f'Malformed{idx}.xml')
+                with open(fileName, 'w', encoding='utf-8') as malformedFile:
+                    malformedFile.write(malformedText.replace('iso-8859-1', 'utf-8'))
+
+                self.assertRaises(PutLoaderException, lambda: PutLoader().load(fileName))
+
+    def _writeMultiDocumentProject(self, directory: str, documentCount: int, compress: bool = False) -> str:
+        """
+        Repeats the test file's document with different titles;  When compressed, also with
+        different class names and a comment that looks like a document
+        """
+        with open(self._testFile(XML_TEST_FILENAME), 'r', encoding='utf-8') as xmlFile:
+            xmlText: str = xmlFile.read()
+
+        documentStart: int = xmlText.index('<PyutDocument')
+        documentEnd:   int = xmlText.index('</PyutDocument>') + len('</PyutDocument>')
+        documentText:  str = xmlText[documentStart:documentEnd]
+
+        if compress is False:
+            documents: str = '\n'.join(documentText.replace('title="Class Diagram"', f'title="Diagram {idx}"') for idx in range(documentCount))
+
+            fileName: str = osPath.join(directory, 'MultiDocument.xml')
+            with open(fileName, 'w', encoding='utf-8') as projectFile:
+                projectFile.write(f'{xmlText[:documentStart]}{documents}{xmlText[documentEnd:]}'.replace('iso-8859-1', 'utf-8'))
+
+            return fileName
+
+        documents = '<!-- <PyutDocument title="Not a document"> -->\n' + '\n'.join(
+            documentText.replace('title="Class Diagram"', f'title="Diagram {idx} &amp; &lt;more>"').replace('name="JsonClass"', f'name="JsonClass{idx}"')
+            for idx in range(documentCount)
+        )
+        fileName = osPath.join(directory, 'MultiDocument.put')
+        with open(fileName, 'wb') as compressedFile:
+            compressedFile.write(zlib.compress(f'{xmlText[:documentStart]}{documents}{xmlText[documentEnd:]}'.encode('iso-8859-1', errors='xmlcharrefreplace')))
+
+        return fileName
+
+    def _testFile(self, testFileName: str) -> str:
+        return resource_filename(TestBase.RESOURCES_TEST_FILES_PACKAGE_NAME, testFileName)
+
+
+def suite() -> TestSuite:
+    """You need to change the name of the test class here also."""
+    import unittest
+
+    testSuite: TestSuite = TestSuite()
+    # noinspection PyUnresolvedReferences
+    testSuite.addTest(unittest.makeSuite(TestPutLoader))
+
+    return testSuite
+
+
+if __name__ == '__main__':
+    unitTestMain()